@@ -0,0 +1,241 @@
+import asyncio
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+# Answer cache settings
+LLM_CACHE_SIZE = int(os.getenv('LLM_CACHE_SIZE', '2048'))  # answers kept in memory
+LLM_CACHE_TTL = float(os.getenv('LLM_CACHE_TTL', '3600'))  # seconds an answer stays fresh
+LLM_CACHE_PATH = os.getenv('LLM_CACHE_PATH', 'llm_cache.sqlite3')  # empty to keep the cache in memory only
+LLM_CACHE_PRUNE_EVERY = int(os.getenv('LLM_CACHE_PRUNE_EVERY', '1000'))  # writes between purges of expired answers
+
+
+@dataclass
+class Entry:
+    value: str
+    created_at: float
+    expires_at: float
+
+    @property
+    def fresh(self):
+        return time.time() < self.expires_at
+
+
+def normalize(prompt: str) -> str:
+    """Case and whitespace don't change the answer, so they don't change the key"""
+    return re.sub(r'\s+', ' ', prompt).strip().lower()
+
+
+def cache_key(context_type: str, prompt: str) -> str:
+    digest = hashlib.sha256(normalize(prompt).encode()).hexdigest()
+    return f"{context_type}:{digest}"
+
+
+class AnswerCache:
+    """
+    LLM answers keyed by (context type, normalized prompt) with a TTL.
+
+    The hot set lives in an in-process LRU; every answer is also written to a
+    local SQLite file so the cache survives restarts and is shared by all
+    workers on the host. Concurrent misses for the same key share one upstream
+    call (see get_or_compute). Expired answers are purged from SQLite every
+    `prune_every` writes.
+
+    get and set query SQLite on the calling thread; from the event loop use
+    aget and aset, which do that part in a worker thread. The LRU and the
+    SQLite connection have separate locks, so the event loop never waits on
+    a worker thread's SQLite I/O.
+    """
+
+    def __init__(self, maxsize=LLM_CACHE_SIZE, ttl=LLM_CACHE_TTL, path=LLM_CACHE_PATH,
+                 prune_every=LLM_CACHE_PRUNE_EVERY):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.prune_every = prune_every
+        self._memory = OrderedDict()
+        self._inflight = {}
+        self._lock = threading.Lock()  # guards _memory
+        self._db_lock = threading.Lock()  # guards _db and _writes
+        self._writes = 0
+        self.hits = self.misses = 0
+
+        self._db = None
+        if path:
+            self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS answers ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self.prune()
+
+    def _get_memory(self, key):
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if entry.fresh:
+                    self._memory.move_to_end(key)
+                    return entry
+                del self._memory[key]
+        return None
+
+    def _get_db(self, key):
+        with self._db_lock:
+            row = self._db.execute(
+                "SELECT value, created_at, expires_at FROM answers WHERE key = ? AND expires_at > ?",
+                (key, time.time()),
+            ).fetchone()
+        if row is None:
+            return None
+        entry = Entry(*row)
+        with self._lock:
+            self._remember(key, entry)
+        return entry
+
+    def get(self, key):
+        """The fresh entry for key, or None"""
+        entry = self._get_memory(key)
+        if entry is None and self._db is not None:
+            entry = self._get_db(key)
+        return entry
+
+    async def aget(self, key):
+        """get, with the SQLite lookup off the event loop"""
+        entry = self._get_memory(key)
+        if entry is None and self._db is not None:
+            entry = await asyncio.to_thread(self._get_db, key)
+        return entry
+
+    def _entry(self, value, ttl):
+        now = time.time()
+        return Entry(value, now, now + (self.ttl if ttl is None else ttl))
+
+    def _set_db(self, key, entry):
+        with self._db_lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO answers (key, value, created_at, expires_at) VALUES (?, ?, ?, ?)",
+                (key, entry.value, entry.created_at, entry.expires_at),
+            )
+            self._writes += 1
+            due = self._writes % self.prune_every == 0
+        if due:
+            self.prune()
+
+    def set(self, key, value, ttl=None):
+        entry = self._entry(value, ttl)
+        with self._lock:
+            self._remember(key, entry)
+        if self._db is not None:
+            self._set_db(key, entry)
+        return entry
+
+    async def aset(self, key, value, ttl=None):
+        """set, with the SQLite write off the event loop"""
+        entry = self._entry(value, ttl)
+        with self._lock:
+            self._remember(key, entry)
+        if self._db is not None:
+            await asyncio.to_thread(self._set_db, key, entry)
+        return entry
+
+    def _remember(self, key, entry):
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+
+    def prune(self):
+        """Drop expired answers from the persistent backend"""
+        if self._db is not None:
+            with self._db_lock:
+                self._db.execute("DELETE FROM answers WHERE expires_at <= ?", (time.time(),))
+
+    def pending(self, key):
+        """The future of the computation of key in flight, or None"""
+        return self._inflight.get(key)
+
+    def claim(self, key):
+        """
+        Register the caller as computing key, so other callers wait for it
+        instead of starting their own computation. The caller must settle the
+        claim with resolve() or release().
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        return future
+
+    async def resolve(self, key, value, ttl=None):
+        """Cache value for a claimed key and hand the entry to everyone waiting for it"""
+        try:
+            entry = await self.aset(key, value, ttl)
+        except BaseException:
+            self.release(key)
+            raise
+        future = self._inflight.pop(key, None)
+        if future is not None and not future.done():
+            future.set_result(entry)
+        return entry
+
+    def release(self, key, error=None):
+        """
+        Give up a claim on key without an answer. Callers waiting for it get
+        `error` raised, or without one None, and compute the answer themselves.
+        """
+        future = self._inflight.pop(key, None)
+        if future is None or future.done():
+            return
+        if error is None:
+            future.set_result(None)
+        else:
+            future.set_exception(error)
+            # Nobody else may be waiting; don't warn about an unretrieved exception
+            future.exception()
+
+    async def get_or_compute(self, key, compute, ttl=None):
+        """
+        Return the cached entry for key, or await compute() once and cache its
+        result. Callers that miss while the same key is being computed wait for
+        that call instead of starting their own.
+        """
+        entry = await self.aget(key)
+        if entry is not None:
+            self.hits += 1
+            return entry
+
+        future = self.pending(key)
+        if future is not None:
+            entry = await asyncio.shield(future)
+            if entry is None:
+                # Released without an answer (e.g. its caller went away)
+                return await self.get_or_compute(key, compute, ttl)
+            self.hits += 1
+            return entry
+
+        self.misses += 1
+        self.claim(key)
+        try:
+            value = await compute()
+        except asyncio.CancelledError:
+            self.release(key)
+            raise
+        except Exception as e:
+            self.release(key, e)
+            raise
+        return await self.resolve(key, value, ttl)
+
+    def stats(self):
+        return {
+            "size": len(self._memory),
+            "maxsize": self.maxsize,
+            "inflight": len(self._inflight),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+answer_cache = AnswerCache()
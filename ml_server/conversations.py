@@ -0,0 +1,175 @@
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+
+# Conversation store settings
+CONVERSATION_MEMORY_LIMIT = int(os.getenv('CONVERSATION_MEMORY_LIMIT', str(64 * 1024 * 1024)))  # characters of history kept in memory
+CONVERSATION_TOKEN_BUDGET = int(os.getenv('CONVERSATION_TOKEN_BUDGET', '4000'))  # tokens of history kept per user
+PROMPT_HISTORY_TOKENS = int(os.getenv('PROMPT_HISTORY_TOKENS', '1000'))  # tokens of history sent with a prompt
+CONVERSATION_STORE_PATH = os.getenv('CONVERSATION_STORE_PATH', '')  # SQLite file; empty keeps history in memory only
+
+# Rough Gemini tokenizer ratio for English text; good enough for budgeting
+CHARS_PER_TOKEN = 4
+
+
+def count_tokens(text: str) -> int:
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def _size(exchange):
+    return len(exchange["user"]) + len(exchange["assistant"])
+
+
+class ConversationStore:
+    """
+    Per-user conversation history with bounded memory.
+
+    Every user has a separate history per context type, so long news and
+    portfolio reports never crowd the chat turns out of a "general" prompt.
+    Each history is trimmed from the oldest exchange to fit `token_budget`.
+    All histories together are capped at `memory_limit` characters; when that
+    is exceeded the ones idle the longest are evicted (LRU). With a SQLite
+    `path` every history is written through, so evictions and restarts lose
+    nothing: a history not in memory is loaded back on first access.
+
+    history, append and context query SQLite on the calling thread; from the
+    event loop use ahistory, aappend and acontext, which do that part in a
+    worker thread. The in-memory histories and the SQLite connection have
+    separate locks, so the event loop never waits on a worker's SQLite I/O.
+    """
+
+    def __init__(self, memory_limit=CONVERSATION_MEMORY_LIMIT, token_budget=CONVERSATION_TOKEN_BUDGET,
+                 path=CONVERSATION_STORE_PATH):
+        self.memory_limit = memory_limit
+        self.token_budget = token_budget
+        self._histories = OrderedDict()  # (user id, context type) -> list of exchanges, least recently used first
+        self._sizes = {}
+        self._size = 0
+        self._lock = threading.Lock()  # guards _histories, _sizes and _size
+        self._db_lock = threading.Lock()  # guards _db
+        self.evictions = 0
+
+        self._db = None
+        if path:
+            self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS histories ("
+                "user_id TEXT NOT NULL, context_type TEXT NOT NULL, history TEXT NOT NULL, "
+                "PRIMARY KEY (user_id, context_type))"
+            )
+
+    def _cached(self, key):
+        # Caller holds _lock
+        conversation = self._histories.get(key)
+        if conversation is not None:
+            self._histories.move_to_end(key)
+        return conversation
+
+    def _load(self, key):
+        with self._lock:
+            conversation = self._cached(key)
+        if conversation is not None:
+            return conversation
+
+        conversation = []
+        if self._db is not None:
+            with self._db_lock:
+                row = self._db.execute(
+                    "SELECT history FROM histories WHERE user_id = ? AND context_type = ?", key
+                ).fetchone()
+            if row is not None:
+                conversation = json.loads(row[0])
+        with self._lock:
+            # Another thread may have loaded or appended to it meanwhile
+            current = self._cached(key)
+            if current is not None:
+                return current
+            if conversation:
+                # Empty histories aren't kept, so lookups alone can't grow the store
+                self._put(key, conversation)
+        return conversation
+
+    def _put(self, key, conversation):
+        self._size += sum(map(_size, conversation)) - self._sizes.get(key, 0)
+        self._sizes[key] = sum(map(_size, conversation))
+        self._histories[key] = conversation
+        self._histories.move_to_end(key)
+        while self._size > self.memory_limit and len(self._histories) > 1:
+            evicted, _ = self._histories.popitem(last=False)
+            self._size -= self._sizes.pop(evicted)
+            self.evictions += 1
+
+    def history(self, user_id, context_type="general"):
+        """A copy of the user's stored exchanges of context_type, oldest first"""
+        return list(self._load((user_id, context_type)))
+
+    async def ahistory(self, user_id, context_type="general"):
+        """history, with the SQLite lookup off the event loop"""
+        with self._lock:
+            conversation = self._cached((user_id, context_type))
+            if conversation is not None:
+                return list(conversation)
+        if self._db is None:
+            return []
+        return await asyncio.to_thread(self.history, user_id, context_type)
+
+    def append(self, user_id, query, answer, context_type="general"):
+        key = (user_id, context_type)
+        loaded = self._load(key)
+        with self._lock:
+            conversation = (self._cached(key) or loaded) + [{"user": query, "assistant": answer}]
+            # Drop the oldest exchanges that don't fit the budget
+            tokens = [count_tokens(exchange["user"]) + count_tokens(exchange["assistant"]) for exchange in conversation]
+            while len(conversation) > 1 and sum(tokens) > self.token_budget:
+                conversation.pop(0)
+                tokens.pop(0)
+            self._put(key, conversation)
+        if self._db is not None:
+            with self._db_lock:
+                with self._lock:
+                    # A later append may have got here first: persist the newest history
+                    conversation = self._histories.get(key, conversation)
+                self._db.execute(
+                    "INSERT OR REPLACE INTO histories (user_id, context_type, history) VALUES (?, ?, ?)",
+                    (user_id, context_type, json.dumps(conversation)),
+                )
+
+    async def aappend(self, user_id, query, answer, context_type="general"):
+        """append, with the SQLite write off the event loop"""
+        if self._db is None:
+            self.append(user_id, query, answer, context_type)
+        else:
+            await asyncio.to_thread(self.append, user_id, query, answer, context_type)
+
+    @staticmethod
+    def _recent(history, budget):
+        selected = []
+        for exchange in reversed(history):
+            budget -= count_tokens(exchange["user"]) + count_tokens(exchange["assistant"])
+            if budget < 0:
+                break
+            selected.append(exchange)
+        return selected[::-1]
+
+    def context(self, user_id, context_type="general", budget=PROMPT_HISTORY_TOKENS):
+        """The most recent exchanges of context_type that together fit in `budget` tokens, oldest first"""
+        return self._recent(self.history(user_id, context_type), budget)
+
+    async def acontext(self, user_id, context_type="general", budget=PROMPT_HISTORY_TOKENS):
+        """context, with the SQLite lookup off the event loop"""
+        return self._recent(await self.ahistory(user_id, context_type), budget)
+
+    def stats(self):
+        return {
+            "histories": len(self._histories),
+            "chars": self._size,
+            "memory_limit": self.memory_limit,
+            "evictions": self.evictions,
+        }
+
+
+conversations = ConversationStore()
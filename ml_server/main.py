@@ -1,12 +1,31 @@
 from fastapi import FastAPI, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from langchain_community.tools import YouTubeSearchTool
 import ast
+import asyncio
+import json
+from contextlib import asynccontextmanager
 
-from models import QueryRequest, ChatResponse, StocksQueryRequest, NewsChatResponse, YouTubeResponse, AnalysisResponse
-from utils import send_query
+from models import (QueryRequest, ChatResponse, StocksQueryRequest, NewsChatResponse, MultiStocksQueryRequest,
+                    MultiNewsChatResponse, YouTubeResponse, AnalysisResponse)
+from news import NEWS_MAX_TICKERS, news_for_tickers, news_query, normalize_tickers, record_requests, split_news
+import precompute
+from cache import answer_cache
+from conversations import conversations
+from utils import model_pool, send_cached_query, send_query_async, stream_query
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app):
+    # Connect to Gemini before the first request instead of during it
+    await model_pool.warm()
+    # Keep the news of popular tickers in the cache ahead of requests
+    scheduler = asyncio.create_task(precompute.run_scheduler())
+    yield
+    scheduler.cancel()
+
+app = FastAPI(lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -16,32 +35,72 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+def sse_response(chunks):
+    """
+    Forward text chunks as server-sent events: a `data: {"token": ...}` event
+    per chunk, then `event: done` (or `event: error` with the detail).
+    """
+    async def events():
+        try:
+            async for chunk in chunks:
+                yield f"data: {json.dumps({'token': chunk})}\n\n"
+            yield "event: done\ndata: {}\n\n"
+        except asyncio.TimeoutError:
+            yield f"event: error\ndata: {json.dumps({'detail': 'The language model took too long to answer'})}\n\n"
+        except Exception as e:
+            yield f"event: error\ndata: {json.dumps({'detail': str(e)})}\n\n"
+
+    # No proxy buffering, or the events arrive all at once at the end
+    return StreamingResponse(events(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
 @app.post("/chat", response_model=ChatResponse)
 async def chatbot(request: QueryRequest):
     try:
         query = request.query + " Answer only if the question is from stocks, commodities, and trading, otherwise don't answer."
-        answer = send_query(request.external_user_id, query, "general")
+        answer = await send_query_async(request.external_user_id, query, "general")
         return ChatResponse(answer=answer)
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=504, detail="The language model took too long to answer")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/chat/stream")
+async def chatbot_stream(request: QueryRequest):
+    query = request.query + " Answer only if the question is from stocks, commodities, and trading, otherwise don't answer."
+    return sse_response(stream_query(request.external_user_id, query, "general"))
+
 @app.post("/stock-news", response_model=NewsChatResponse)
 async def stock_news(request: StocksQueryRequest):
     try:
-        query = f"Provide news summary and sentiment analysis for {request.stocks_name} stocks"
+        record_requests(normalize_tickers([request.stocks_name]))
+        query = news_query(request.stocks_name)
         
-        answer = send_query(request.external_user_id, query, "news_analysis")
+        answer = await send_cached_query(request.external_user_id, query, "news_analysis")
         
         # Split the response into summary and sentiment
-        lines = answer.strip().split('\n')
-        if len(lines) >= 2:
-            summary = lines[0].strip()
-            sentiment = lines[-1].strip().lower()
-        else:
-            summary = answer.strip()
-            sentiment = "neutral"
+        summary, sentiment = split_news(answer)
 
         return NewsChatResponse(summary=summary, sentiment=sentiment)
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=504, detail="The language model took too long to answer")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/stock-news/batch", response_model=MultiNewsChatResponse)
+async def stock_news_batch(request: MultiStocksQueryRequest):
+    if not request.stocks:
+        raise HTTPException(status_code=400, detail="No stocks given")
+    if len(request.stocks) > NEWS_MAX_TICKERS:
+        raise HTTPException(status_code=400, detail=f"At most {NEWS_MAX_TICKERS} stocks per request")
+    try:
+        news = await news_for_tickers(request.external_user_id, request.stocks)
+        return MultiNewsChatResponse(news={
+            ticker: NewsChatResponse(summary=summary, sentiment=sentiment)
+            for ticker, (summary, sentiment) in news.items()
+        })
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=504, detail="The language model took too long to answer")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -49,7 +108,8 @@ async def stock_news(request: StocksQueryRequest):
 async def videos(request: StocksQueryRequest):
     try:
         tool = YouTubeSearchTool()
-        results = tool.run(request.stocks_name + ", 5")
+        # The search tool is blocking, keep it off the event loop
+        results = await run_in_threadpool(tool.run, request.stocks_name + ", 5")
         videos = ast.literal_eval(results)
         return YouTubeResponse(videos=videos)
     except Exception as e:
@@ -60,12 +120,28 @@ async def portfolio_analyser(request: StocksQueryRequest):
     try:
         query = f"Analyze the following portfolio and provide insights: {request.stocks_name}"
         
-        answer = send_query(request.external_user_id, query, "portfolio_analysis")
+        answer = await send_cached_query(request.external_user_id, query, "portfolio_analysis")
 
         return AnalysisResponse(report=answer)
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=504, detail="The language model took too long to answer")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/portfolio-analyser/stream")
+async def portfolio_analyser_stream(request: StocksQueryRequest):
+    query = f"Analyze the following portfolio and provide insights: {request.stocks_name}"
+    return sse_response(stream_query(request.external_user_id, query, "portfolio_analysis", cached=True))
+
+@app.get("/cache-stats")
+async def cache_stats():
+    return {
+        **answer_cache.stats(),
+        "conversations": conversations.stats(),
+        "models": model_pool.stats(),
+        "news_precompute": precompute.stats(),
+    }
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="localhost", port=8001)
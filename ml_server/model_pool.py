@@ -0,0 +1,72 @@
+import asyncio
+import itertools
+import os
+import threading
+
+import google.generativeai as genai
+
+# Model pool settings
+LLM_MODEL = os.getenv('LLM_MODEL', 'gemini-1.5-flash')
+LLM_POOL_SIZE = int(os.getenv('LLM_POOL_SIZE', '2'))  # models per context type
+LLM_POOL_WARMUP = os.getenv('LLM_POOL_WARMUP', '1') == '1'  # open upstream connections at startup
+
+
+class ModelPool:
+    """
+    Pre-built Gemini models, LLM_POOL_SIZE per context type, each with its
+    system prompt set as the system instruction. Requests take one round-robin
+    instead of constructing a model and re-rendering the prompt every call;
+    the models share the library's gRPC client, so its connections stay open
+    across requests.
+    """
+
+    def __init__(self, system_prompt, size=LLM_POOL_SIZE, model_name=LLM_MODEL):
+        self.system_prompt = system_prompt
+        self.size = size
+        self.model_name = model_name
+        self._models = {}
+        self._cycles = {}
+        self._lock = threading.Lock()
+        self.hits = self.misses = 0
+
+    def _build(self, context_type):
+        models = [
+            genai.GenerativeModel(self.model_name, system_instruction=self.system_prompt(context_type))
+            for _ in range(self.size)
+        ]
+        self._models[context_type] = models
+        self._cycles[context_type] = itertools.cycle(models)
+
+    def prepare(self, context_types):
+        with self._lock:
+            for context_type in context_types:
+                if context_type not in self._models:
+                    self._build(context_type)
+
+    def get(self, context_type: str = "general"):
+        with self._lock:
+            if context_type in self._cycles:
+                self.hits += 1
+            else:
+                self.misses += 1
+                self._build(context_type)
+            return next(self._cycles[context_type])
+
+    async def warm(self):
+        """Open the upstream connections with a cheap token count per context type"""
+        if not LLM_POOL_WARMUP:
+            return
+        models = [models[0] for models in self._models.values()]
+        results = await asyncio.gather(*(model.count_tokens_async("ping") for model in models), return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                print(f"Model pool warm-up failed: {result!r}")
+
+    def stats(self):
+        return {
+            "model": self.model_name,
+            "context_types": sorted(self._models),
+            "size": sum(len(models) for models in self._models.values()),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
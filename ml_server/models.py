@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import List
+from typing import Dict, List
 
 class QueryRequest(BaseModel):
     external_user_id: str
@@ -16,6 +16,13 @@ class NewsChatResponse(BaseModel):
     summary: str
     sentiment: str
 
+class MultiStocksQueryRequest(BaseModel):
+    external_user_id: str
+    stocks: List[str]
+
+class MultiNewsChatResponse(BaseModel):
+    news: Dict[str, NewsChatResponse]
+
 class YouTubeResponse(BaseModel):
     videos: List[str]
 
@@ -0,0 +1,248 @@
+import asyncio
+import json
+import os
+import re
+import sqlite3
+import threading
+from collections import Counter
+
+from cache import LLM_CACHE_PATH, answer_cache, cache_key
+from conversations import conversations
+from utils import generate_async
+
+# Multi-ticker news settings
+NEWS_BATCH_SIZE = int(os.getenv('NEWS_BATCH_SIZE', '5'))  # tickers packed into one Gemini prompt
+NEWS_MAX_PARALLEL = int(os.getenv('NEWS_MAX_PARALLEL', '8'))  # batch prompts in flight per request
+NEWS_MAX_TICKERS = int(os.getenv('NEWS_MAX_TICKERS', '50'))
+NEWS_TRACKED_TICKERS = 10000  # distinct tickers counted before the rarest are dropped
+
+
+class RequestCounts:
+    """
+    How often each ticker's news was asked for, summed over all workers on the
+    host in the answer cache's SQLite file (or kept in this process without
+    one). Requests are counted in memory and added to the shared table by
+    flush(), which the precompute scheduler calls in every worker.
+    """
+
+    def __init__(self, path=LLM_CACHE_PATH, limit=NEWS_TRACKED_TICKERS):
+        self.limit = limit
+        self._pending = Counter()
+        self._lock = threading.Lock()
+        self._db = None
+        self._db_lock = threading.Lock()
+        if path:
+            self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS news_requests (ticker TEXT PRIMARY KEY, count INTEGER NOT NULL)"
+            )
+        else:
+            self._counts = Counter()
+
+    def update(self, tickers):
+        with self._lock:
+            self._pending.update(tickers)
+            if len(self._pending) > self.limit:
+                # Tickers are user input; don't let unflushed ones grow without bound
+                kept = self._pending.most_common(self.limit // 2)
+                self._pending = Counter(dict(kept))
+
+    def flush(self):
+        """Add the counts of this process to the shared ones (blocks on SQLite)"""
+        with self._lock:
+            pending, self._pending = self._pending, Counter()
+        if not pending:
+            return
+        with self._db_lock:
+            if self._db is None:
+                self._counts.update(pending)
+                if len(self._counts) > self.limit:
+                    self._counts = Counter(dict(self._counts.most_common(self.limit // 2)))
+                return
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                self._db.executemany(
+                    "INSERT INTO news_requests (ticker, count) VALUES (?, ?) "
+                    "ON CONFLICT(ticker) DO UPDATE SET count = count + excluded.count",
+                    pending.items(),
+                )
+                (tracked,) = self._db.execute("SELECT COUNT(*) FROM news_requests").fetchone()
+                if tracked > self.limit:
+                    self._db.execute(
+                        "DELETE FROM news_requests WHERE ticker NOT IN "
+                        "(SELECT ticker FROM news_requests ORDER BY count DESC LIMIT ?)",
+                        (self.limit // 2,),
+                    )
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+
+    def most_common(self, n):
+        """[(ticker, count)] of the n most requested tickers (blocks on SQLite)"""
+        self.flush()
+        with self._db_lock:
+            if self._db is None:
+                return self._counts.most_common(n)
+            return self._db.execute(
+                "SELECT ticker, count FROM news_requests ORDER BY count DESC, ticker LIMIT ?", (n,)
+            ).fetchall()
+
+
+# The precompute job keeps the news of the most requested tickers warm
+request_counts = RequestCounts()
+
+
+def news_query(ticker: str) -> str:
+    """The /stock-news question for one ticker; batch answers are cached under it too"""
+    return f"Provide news summary and sentiment analysis for {ticker} stocks"
+
+
+def split_news(answer: str):
+    """Split a news_analysis answer into (summary, sentiment)"""
+    lines = answer.strip().split('\n')
+    if len(lines) >= 2:
+        return lines[0].strip(), lines[-1].strip().lower()
+    return answer.strip(), "neutral"
+
+
+def normalize_tickers(tickers):
+    """Upper-cased, stripped and de-duplicated, in the order given"""
+    return list(dict.fromkeys(ticker.strip().upper() for ticker in tickers if ticker.strip()))
+
+
+def record_requests(tickers):
+    request_counts.update(tickers)
+
+
+def _parse_batch(answer: str):
+    # Tolerate a ```json fence around the object
+    text = re.sub(r'^```(?:json)?\s*|\s*```$', '', answer.strip())
+    data = json.loads(text)
+    return {str(ticker).strip().upper(): item for ticker, item in data.items() if isinstance(item, dict)}
+
+
+async def fetch_batch(tickers):
+    """
+    News for several tickers from one structured prompt. Returns
+    {ticker: answer} for the tickers the model answered; nothing is cached.
+    """
+    try:
+        answer = await generate_async(
+            "Tickers: " + ", ".join(tickers), "news_batch",
+            generation_config={"response_mime_type": "application/json"},
+        )
+        items = _parse_batch(answer)
+    except (ValueError, AttributeError) as e:
+        print(f"Unusable batch news answer for {tickers}: {e!r}")
+        return {}
+
+    answers = {}
+    for ticker in tickers:
+        item = items.get(ticker)
+        if item and item.get("summary"):
+            sentiment = str(item.get("sentiment", "neutral")).strip().lower()
+            # Same "summary line, sentiment line" shape as a news_analysis answer
+            summary = " ".join(str(item["summary"]).split())
+            answers[ticker] = f"{summary}\n{sentiment}"
+    return answers
+
+
+def news_key(ticker: str) -> str:
+    return cache_key("news_analysis", news_query(ticker))
+
+
+async def cached_news(tickers, ttl=None, fallback=True):
+    """
+    Compute the news answers of `tickers` into the cache, under the same keys
+    /stock-news uses, and return {ticker: answer}. A ticker another request
+    is already computing is waited for rather than asked again; the others are
+    claimed in the cache (so /stock-news waits for them in turn), packed
+    NEWS_BATCH_SIZE to a prompt and run concurrently, at most
+    NEWS_MAX_PARALLEL at once. Tickers a batch answer leaves out fall back to
+    the single-ticker query, or with fallback=False are left out.
+    """
+    waiting = {}
+    owned = []
+    for ticker in tickers:
+        future = answer_cache.pending(news_key(ticker))
+        if future is not None:
+            waiting[ticker] = future
+        else:
+            answer_cache.claim(news_key(ticker))
+            owned.append(ticker)
+
+    slots = asyncio.Semaphore(NEWS_MAX_PARALLEL)
+
+    async def bounded(call, *args):
+        async with slots:
+            return await call(*args)
+
+    answers = {}
+    try:
+        batches = [owned[i:i + NEWS_BATCH_SIZE] for i in range(0, len(owned), NEWS_BATCH_SIZE)]
+        for found in await asyncio.gather(*(bounded(fetch_batch, batch) for batch in batches)):
+            for ticker, answer in found.items():
+                answers[ticker] = (await answer_cache.resolve(news_key(ticker), answer, ttl)).value
+
+        left = [ticker for ticker in owned if ticker not in answers]
+        if fallback:
+            singles = await asyncio.gather(*(
+                bounded(generate_async, news_query(ticker), "news_analysis") for ticker in left
+            ))
+            for ticker, answer in zip(left, singles):
+                answers[ticker] = (await answer_cache.resolve(news_key(ticker), answer, ttl)).value
+    except Exception as e:
+        for ticker in owned:
+            if ticker not in answers:
+                answer_cache.release(news_key(ticker), e)
+        raise
+    finally:
+        # Left unanswered (fallback=False, or this request was cancelled):
+        # whoever waits for them computes them instead
+        for ticker in owned:
+            if ticker not in answers:
+                answer_cache.release(news_key(ticker))
+
+    for ticker, future in waiting.items():
+        entry = await asyncio.shield(future)
+        if entry is not None:
+            answers[ticker] = entry.value
+        elif fallback:
+            entry = await answer_cache.get_or_compute(
+                news_key(ticker), lambda ticker=ticker: generate_async(news_query(ticker), "news_analysis"), ttl
+            )
+            answers[ticker] = entry.value
+    return answers
+
+
+async def news_for_tickers(external_user_id: str, tickers):
+    """
+    {ticker: (summary, sentiment)} for every ticker. Cached answers are used
+    as-is; the rest come from cached_news, so a whole portfolio costs about
+    one LLM latency and a ticker /stock-news is already asking about isn't
+    asked again. The request goes into the history as one exchange.
+    """
+    tickers = normalize_tickers(tickers)
+    record_requests(tickers)
+    answers = {}
+    misses = []
+    for ticker in tickers:
+        entry = await answer_cache.aget(news_key(ticker))
+        if entry is not None:
+            answers[ticker] = entry.value
+        else:
+            misses.append(ticker)
+
+    if misses:
+        answers.update(await cached_news(misses))
+
+    news = {ticker: split_news(answers[ticker]) for ticker in tickers}
+    await conversations.aappend(
+        external_user_id,
+        news_query(", ".join(tickers)),
+        "\n".join(f"{ticker}: {summary} ({sentiment})" for ticker, (summary, sentiment) in news.items()),
+        "news_analysis",
+    )
+    return news
@@ -0,0 +1,147 @@
+import asyncio
+import csv
+import os
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows: every worker runs the job
+    fcntl = None
+
+from cache import answer_cache
+from news import NEWS_BATCH_SIZE, cached_news, news_key, request_counts
+
+# News precompute settings
+NEWS_PRECOMPUTE_ENABLED = os.getenv('NEWS_PRECOMPUTE_ENABLED', '1') == '1'
+NEWS_PRECOMPUTE_TOP_N = int(os.getenv('NEWS_PRECOMPUTE_TOP_N', '300'))
+NEWS_PRECOMPUTE_INTERVAL = float(os.getenv('NEWS_PRECOMPUTE_INTERVAL', '3600'))  # seconds between runs
+NEWS_PRECOMPUTE_RATE = float(os.getenv('NEWS_PRECOMPUTE_RATE', '10'))  # Gemini calls per minute at most
+NEWS_PRECOMPUTE_LOCK = os.getenv('NEWS_PRECOMPUTE_LOCK', 'news_precompute.lock')  # one worker per host runs the job
+NEWS_PRECOMPUTE_POLL = float(os.getenv('NEWS_PRECOMPUTE_POLL', '60'))  # seconds between count flushes and lock attempts
+SCREENER_CSV_PATH = os.getenv(
+    'SCREENER_CSV_PATH',
+    os.path.join(os.path.dirname(__file__), '..', 'server', 'Stock_pulse', 'Stock_pulse', 'ticker.csv'),
+)
+
+# Answers written by a run have to outlive the gap until the next one
+PRECOMPUTE_TTL = NEWS_PRECOMPUTE_INTERVAL * 1.5
+
+last_run = {}
+
+
+def market_cap_leaders(path=SCREENER_CSV_PATH, n=NEWS_PRECOMPUTE_TOP_N):
+    """The n largest symbols by market cap in the NASDAQ screener CSV"""
+    caps = []
+    with open(path, newline='') as handle:
+        for row in csv.DictReader(handle):
+            try:
+                cap = float(row.get('Market Cap') or 0)
+            except ValueError:
+                continue
+            symbol = (row.get('Symbol') or '').strip().upper()
+            # Preferred shares and units ('ABR^D', 'BRK/A') have no news of their own
+            if cap > 0 and symbol and not any(char in symbol for char in '^/ '):
+                caps.append((cap, symbol))
+    return [symbol for _, symbol in sorted(caps, reverse=True)[:n]]
+
+
+def popular_tickers(n=NEWS_PRECOMPUTE_TOP_N):
+    """
+    The tickers to keep warm: the most requested ones first, then the largest
+    by market cap, n in total.
+    """
+    requested = [ticker for ticker, _ in request_counts.most_common(n)]
+    try:
+        leaders = market_cap_leaders(n=n)
+    except FileNotFoundError:
+        print(f"Screener CSV not found at {SCREENER_CSV_PATH}, precomputing requested tickers only")
+        leaders = []
+    return list(dict.fromkeys(requested + leaders))[:n]
+
+
+async def _needs_refresh(ticker, now):
+    entry = await answer_cache.aget(news_key(ticker))
+    # Refresh what would go stale before the next run
+    return entry is None or entry.expires_at < now + NEWS_PRECOMPUTE_INTERVAL
+
+
+async def precompute_news(tickers=None):
+    """
+    Refresh the cached news answers of `tickers` (default popular_tickers())
+    that would expire before the next run, NEWS_BATCH_SIZE tickers per
+    Gemini call and no more than NEWS_PRECOMPUTE_RATE calls a minute.
+    """
+    started = time.time()
+    # Reads the shared counts and the screener CSV, so off the event loop
+    tickers = await asyncio.to_thread(popular_tickers) if tickers is None else tickers
+    stale = [ticker for ticker in tickers if await _needs_refresh(ticker, started)]
+    batches = [stale[i:i + NEWS_BATCH_SIZE] for i in range(0, len(stale), NEWS_BATCH_SIZE)]
+
+    refreshed = 0
+    for index, batch in enumerate(batches):
+        if index:
+            await asyncio.sleep(60 / NEWS_PRECOMPUTE_RATE)
+        try:
+            refreshed += len(await cached_news(batch, ttl=PRECOMPUTE_TTL, fallback=False))
+        except Exception as e:
+            # A failing batch shouldn't stop the rest of the run
+            print(f"News precompute failed for {batch}: {e!r}")
+
+    last_run.update({
+        "started_at": started,
+        "finished_at": time.time(),
+        "tickers": len(tickers),
+        "stale": len(stale),
+        "refreshed": refreshed,
+        "calls": len(batches),
+    })
+    return last_run
+
+
+def _acquire_lock():
+    """Whether this process holds the lock that makes it the one to run the job (kept until it exits)"""
+    if fcntl is None:
+        return True
+    if getattr(_acquire_lock, 'handle', None) is not None:
+        return True
+    handle = open(NEWS_PRECOMPUTE_LOCK, 'a')
+    try:
+        fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        handle.close()
+        return False
+    _acquire_lock.handle = handle  # keep the lock alive
+    return True
+
+
+async def run_scheduler():
+    """
+    Runs in every worker. Each NEWS_PRECOMPUTE_POLL seconds the worker adds
+    its request counts to the shared ones and tries for the lock. The holder
+    precomputes on startup and then every NEWS_PRECOMPUTE_INTERVAL seconds;
+    the others keep trying, so one takes over if the holder exits.
+    """
+    if not NEWS_PRECOMPUTE_ENABLED:
+        return
+    next_run = 0.0
+    while True:
+        try:
+            await asyncio.to_thread(request_counts.flush)
+        except Exception as e:
+            print(f"Saving news request counts failed: {e!r}")
+        if _acquire_lock() and time.monotonic() >= next_run:
+            next_run = time.monotonic() + NEWS_PRECOMPUTE_INTERVAL
+            try:
+                await precompute_news()
+            except Exception as e:
+                print(f"News precompute run failed: {e!r}")
+        await asyncio.sleep(NEWS_PRECOMPUTE_POLL)
+
+
+def stats():
+    return {
+        "enabled": NEWS_PRECOMPUTE_ENABLED,
+        "interval": NEWS_PRECOMPUTE_INTERVAL,
+        "runs_here": fcntl is None or getattr(_acquire_lock, 'handle', None) is not None,
+        "last_run": last_run,
+    }
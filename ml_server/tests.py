@@ -0,0 +1,202 @@
+import os
+
+# Keep the module-level cache and request counts in memory while testing
+os.environ['LLM_CACHE_PATH'] = ''
+os.environ['CONVERSATION_STORE_PATH'] = ''
+os.environ['NEWS_PRECOMPUTE_ENABLED'] = '0'
+
+import asyncio
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import cache
+import model_pool
+import news
+import precompute
+from cache import AnswerCache
+from conversations import ConversationStore, count_tokens
+from model_pool import ModelPool
+
+
+class AnswerCacheTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.calls = 0
+
+    async def compute(self):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return f"answer {self.calls}"
+
+    async def test_concurrent_misses_share_one_call(self):
+        answer_cache = AnswerCache(path='')
+        entries = await asyncio.gather(*(answer_cache.get_or_compute('k', self.compute) for _ in range(20)))
+        self.assertEqual(self.calls, 1)
+        self.assertEqual({entry.value for entry in entries}, {"answer 1"})
+        self.assertEqual(answer_cache.stats()["inflight"], 0)
+
+    async def test_expired_answers_are_recomputed(self):
+        answer_cache = AnswerCache(path='')
+        await answer_cache.get_or_compute('k', self.compute, ttl=0.01)
+        self.assertEqual((await answer_cache.get_or_compute('k', self.compute)).value, "answer 1")
+        await asyncio.sleep(0.02)
+        self.assertEqual((await answer_cache.get_or_compute('k', self.compute)).value, "answer 2")
+
+    async def test_failures_are_shared_but_not_cached(self):
+        answer_cache = AnswerCache(path='')
+
+        async def fail():
+            self.calls += 1
+            await asyncio.sleep(0.01)
+            raise RuntimeError("upstream down")
+
+        results = await asyncio.gather(*(answer_cache.get_or_compute('k', fail) for _ in range(5)), return_exceptions=True)
+        self.assertEqual(self.calls, 1)
+        self.assertTrue(all(isinstance(result, RuntimeError) for result in results))
+        self.assertEqual((await answer_cache.get_or_compute('k', self.compute)).value, "answer 2")
+
+    async def test_released_claims_are_computed_by_the_waiters(self):
+        answer_cache = AnswerCache(path='')
+        answer_cache.claim('k')
+        waiter = asyncio.ensure_future(answer_cache.get_or_compute('k', self.compute))
+        await asyncio.sleep(0)
+        answer_cache.release('k')
+        self.assertEqual((await waiter).value, "answer 1")
+
+    async def test_expired_answers_are_pruned(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'cache.sqlite3')
+            answer_cache = AnswerCache(path=path, prune_every=2)
+            await answer_cache.aset('old', 'stale', ttl=-1)
+            await answer_cache.aset('new', 'fresh')
+            with sqlite3.connect(path) as db:
+                self.assertEqual(db.execute("SELECT key FROM answers").fetchall(), [('new',)])
+            # Persisted answers survive a restart
+            self.assertEqual((await AnswerCache(path=path).aget('new')).value, 'fresh')
+
+
+class ParseBatchTests(unittest.IsolatedAsyncioTestCase):
+    def test_fenced_json(self):
+        answer = '```json\n{"aapl": {"summary": "Up", "sentiment": "positive"}, "MSFT": "not an object"}\n```'
+        self.assertEqual(news._parse_batch(answer), {"AAPL": {"summary": "Up", "sentiment": "positive"}})
+
+    def test_malformed_json(self):
+        for answer in ('', 'not json', '{"AAPL": {"summary": "cut off'):
+            with self.assertRaises(ValueError):
+                news._parse_batch(answer)
+        with self.assertRaises(AttributeError):
+            news._parse_batch('["AAPL"]')
+
+    async def test_unusable_batch_answers_are_skipped(self):
+        with mock.patch.object(news, 'generate_async', return_value='{"AAPL": '), \
+                mock.patch('builtins.print'):
+            self.assertEqual(await news.fetch_batch(['AAPL', 'MSFT']), {})
+
+
+class ConversationStoreTests(unittest.TestCase):
+    def test_history_is_trimmed_to_the_budget(self):
+        store = ConversationStore(path='', token_budget=30)
+        for i in range(10):
+            store.append('u', f'question {i}', 'x' * 40)
+        history = store.history('u')
+        self.assertLessEqual(sum(count_tokens(e['user']) + count_tokens(e['assistant']) for e in history), 30)
+        self.assertEqual(history[-1]['user'], 'question 9')
+
+    def test_histories_are_kept_per_context_type(self):
+        store = ConversationStore(path='')
+        store.append('u', 'hi', 'hello')
+        store.append('u', 'news?', 'report', 'news_analysis')
+        store.append('v', 'hey', 'hi there')
+        self.assertEqual([e['user'] for e in store.history('u')], ['hi'])
+        self.assertEqual([e['user'] for e in store.history('u', 'news_analysis')], ['news?'])
+        self.assertEqual(store.history('u', 'portfolio_analysis'), [])
+
+    def test_context_takes_the_most_recent_exchanges(self):
+        store = ConversationStore(path='')
+        for i in range(5):
+            store.append('u', f'q{i}', 'a' * 20)
+        self.assertEqual([e['user'] for e in store.context('u', budget=20)], ['q3', 'q4'])
+
+    def test_evicted_histories_are_reloaded(self):
+        with tempfile.TemporaryDirectory() as directory:
+            store = ConversationStore(path=os.path.join(directory, 'c.sqlite3'), memory_limit=100)
+            store.append('u', 'first', 'x' * 80)
+            store.append('v', 'second', 'y' * 80)
+            self.assertEqual(store.stats()['histories'], 1)
+            self.assertEqual([e['user'] for e in asyncio.run(store.ahistory('u'))], ['first'])
+
+
+class FakeModel:
+    def __init__(self, name, system_instruction=None):
+        self.system_instruction = system_instruction
+
+
+class ModelPoolTests(unittest.TestCase):
+    def test_models_rotate_per_context_type(self):
+        with mock.patch.object(model_pool.genai, 'GenerativeModel', FakeModel):
+            pool = ModelPool(lambda context_type: f"prompt for {context_type}", size=2)
+            first, second, third = (pool.get('general') for _ in range(3))
+            news_model = pool.get('news_analysis')
+        self.assertIsNot(first, second)
+        self.assertIs(first, third)
+        self.assertEqual(news_model.system_instruction, "prompt for news_analysis")
+        self.assertEqual((pool.hits, pool.misses), (2, 2))
+
+
+# Another worker: takes the lock, reports, holds it a moment and exits
+LOCK_HOLDER = """
+import fcntl, sys, time
+handle = open(sys.argv[1], 'a')
+fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+print('locked', flush=True)
+time.sleep(float(sys.argv[2]))
+"""
+
+
+class PrecomputeTests(unittest.IsolatedAsyncioTestCase):
+    def test_one_process_holds_the_lock(self):
+        if precompute.fcntl is None:
+            self.skipTest("no fcntl: every worker runs the job")
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'precompute.lock')
+            holder = subprocess.Popen([sys.executable, '-c', LOCK_HOLDER, path, '1'], stdout=subprocess.PIPE, text=True)
+            self.assertEqual(holder.stdout.readline().strip(), 'locked')
+            with mock.patch.object(precompute, 'NEWS_PRECOMPUTE_LOCK', path), \
+                    mock.patch.object(precompute._acquire_lock, 'handle', None, create=True):
+                self.assertFalse(precompute._acquire_lock())
+                holder.wait()
+                holder.stdout.close()
+                # Taken over once the holder exits
+                self.assertTrue(precompute._acquire_lock())
+                precompute._acquire_lock.handle.close()
+
+    async def test_calls_are_rate_limited(self):
+        batches = []
+
+        async def cached_news(batch, ttl=None, fallback=True):
+            batches.append(list(batch))
+            return {ticker: 'answer' for ticker in batch}
+
+        tickers = [f'T{i}' for i in range(12)]
+        with mock.patch.object(precompute, 'cached_news', cached_news), \
+                mock.patch.object(precompute, 'NEWS_BATCH_SIZE', 5), \
+                mock.patch.object(precompute, 'NEWS_PRECOMPUTE_RATE', 10), \
+                mock.patch.object(precompute.asyncio, 'sleep') as sleep:
+            run = await precompute.precompute_news(tickers)
+        self.assertEqual([len(batch) for batch in batches], [5, 5, 2])
+        self.assertEqual([call.args for call in sleep.call_args_list], [(6.0,), (6.0,)])
+        self.assertEqual((run['calls'], run['refreshed']), (3, 12))
+
+    async def test_fresh_answers_are_skipped(self):
+        await cache.answer_cache.aset(news.news_key('FRESH'), 'answer', ttl=precompute.NEWS_PRECOMPUTE_INTERVAL * 2)
+        with mock.patch.object(precompute, 'cached_news', return_value={}) as cached_news:
+            run = await precompute.precompute_news(['FRESH', 'STALE'])
+        cached_news.assert_called_once_with(['STALE'], ttl=precompute.PRECOMPUTE_TTL, fallback=False)
+        self.assertEqual(run['stale'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,54 +1,118 @@
+import asyncio
 import os
 import google.generativeai as genai
 from dotenv import load_dotenv
 
+from cache import answer_cache, cache_key
+from conversations import conversations
+from model_pool import ModelPool
+
 load_dotenv()
 GEMINI_API_KEY = os.getenv('GEMINI_API_KEY')
 
 # Configure Gemini API
 genai.configure(api_key=GEMINI_API_KEY)
 
-# User conversation history for maintaining context
-user_conversations = {}
+# Upstream LLM limits
+LLM_MAX_CONCURRENCY = int(os.getenv('LLM_MAX_CONCURRENCY', '200'))  # Gemini calls in flight per worker
+LLM_TIMEOUT = float(os.getenv('LLM_TIMEOUT', '60'))  # seconds per Gemini call
 
-def get_or_create_conversation(external_user_id: str):
-    """Get or create a conversation history for a user"""
-    if external_user_id not in user_conversations:
-        print("Creating new conversation")
-        user_conversations[external_user_id] = []
-    else:
-        print("Using existing conversation")
-    return user_conversations[external_user_id]
+_llm_slots = asyncio.Semaphore(LLM_MAX_CONCURRENCY)
 
-def send_query(external_user_id: str, query: str, context_type: str = "general"):
-    """Send a query to Gemini API with conversation context"""
+async def send_query_async(external_user_id: str, query: str, context_type: str = "general"):
+    """
+    Send a query to Gemini with the user's recent conversation, without
+    blocking the event loop. At most LLM_MAX_CONCURRENCY calls run at once
+    (the rest wait for a slot) and each one is cancelled after LLM_TIMEOUT
+    seconds with asyncio.TimeoutError.
+    """
     try:
-        # Get conversation history
-        conversation = get_or_create_conversation(external_user_id)
-        
-        # Create the model
-        model = genai.GenerativeModel('gemini-1.5-flash')
-        
-        # Add context based on the type of query
-        system_prompt = get_system_prompt(context_type)
-        full_query = f"{system_prompt}\n\nUser Query: {query}"
-        
-        # Generate response
-        response = model.generate_content(full_query)
-        
-        # Store conversation history
-        conversation.append({"user": query, "assistant": response.text})
+        answer = await generate_async(query, context_type, await conversations.acontext(external_user_id, context_type))
         
-        # Keep only last 10 exchanges to manage memory
-        if len(conversation) > 10:
-            conversation = conversation[-10:]
-            user_conversations[external_user_id] = conversation
+        await conversations.aappend(external_user_id, query, answer, context_type)
         
-        return response.text
+        return answer
         
     except Exception as e:
-        print(f"Error in send_query: {str(e)}")
-        raise e
+        print(f"Error in send_query_async: {e!r}")
+        raise
+
+async def send_cached_query(external_user_id: str, query: str, context_type: str = "general"):
+    """
+    send_query_async for answers that don't depend on the user: the answer is
+    shared by everyone asking the same thing until it expires, and concurrent
+    identical questions cost one Gemini call. The user's history is therefore
+    not part of the prompt.
+    """
+    entry = await answer_cache.get_or_compute(
+        cache_key(context_type, query), lambda: generate_async(query, context_type)
+    )
+    await conversations.aappend(external_user_id, query, entry.value, context_type)
+    return entry.value
+
+async def stream_query(external_user_id: str, query: str, context_type: str = "general", cached: bool = False):
+    """
+    Async generator over the answer's text as Gemini produces it. The full
+    answer goes into the conversation history (and, with cached=True, the
+    answer cache) once the stream completes. LLM_TIMEOUT applies to the wait
+    for each chunk.
+    """
+    key = cache_key(context_type, query)
+    if cached:
+        entry = await answer_cache.aget(key)
+        if entry is not None:
+            await conversations.aappend(external_user_id, query, entry.value, context_type)
+            yield entry.value
+            return
+
+    model = model_pool.get(context_type)
+    
+    # Cached answers are shared between users, so only uncached ones see the history
+    history = () if cached else await conversations.acontext(external_user_id, context_type)
+    full_query = build_prompt(query, context_type, history)
+    
+    parts = []
+    async with _llm_slots:
+        response = await asyncio.wait_for(model.generate_content_async(full_query, stream=True), timeout=LLM_TIMEOUT)
+        chunks = response.__aiter__()
+        while True:
+            try:
+                chunk = await asyncio.wait_for(chunks.__anext__(), timeout=LLM_TIMEOUT)
+            except StopAsyncIteration:
+                break
+            if chunk.text:
+                parts.append(chunk.text)
+                yield chunk.text
+    
+    answer = "".join(parts)
+    await conversations.aappend(external_user_id, query, answer, context_type)
+    if cached:
+        await answer_cache.aset(key, answer)
+
+async def generate_async(query: str, context_type: str = "general", history=(), generation_config=None):
+    """One Gemini call for query; history is included in the prompt but not updated"""
+    model = model_pool.get(context_type)
+    
+    full_query = build_prompt(query, context_type, history)
+    
+    async with _llm_slots:
+        response = await asyncio.wait_for(
+            model.generate_content_async(full_query, generation_config=generation_config), timeout=LLM_TIMEOUT
+        )
+    return response.text
+
+def build_prompt(query: str, context_type: str = "general", history=()) -> str:
+    """
+    The given earlier exchanges, then the query. The system prompt for
+    context_type is the pooled model's system instruction.
+    """
+    if not history:
+        return f"User Query: {query}"
+    
+    transcript = "\n".join(
+        f"User: {exchange['user']}\nAssistant: {exchange['assistant']}" for exchange in history
+    )
+    return f"Conversation so far:\n{transcript}\n\nUser Query: {query}"
 
 def get_system_prompt(context_type: str) -> str:
     """Get system prompt based on context type"""
@@ -66,6 +130,14 @@ def get_system_prompt(context_type: str) -> str:
         [Summary paragraph]
         [Sentiment word]""",
         
+        "news_batch": """You are a financial news analyst. For every stock ticker you are given:
+        1. Provide a concise summary of recent news for that stock in exactly one paragraph
+        2. Perform sentiment analysis on the summary
+        3. Give the sentiment as exactly one word: positive, negative, or neutral
+        
+        Respond with a JSON object only, with one key per given ticker, exactly as given:
+        {"TICKER": {"summary": "[Summary paragraph]", "sentiment": "[Sentiment word]"}}""",
+        
         "portfolio_analysis": """You are a portfolio analysis expert. Analyze the given stocks and provide:
         1. Strengths and weaknesses of the current portfolio
         2. Risk assessment
@@ -77,3 +149,7 @@ def get_system_prompt(context_type: str) -> str:
     }
     
     return prompts.get(context_type, prompts["general"])
+
+# Models are built once per context type and shared by all requests
+model_pool = ModelPool(get_system_prompt)
+model_pool.prepare(["general", "news_analysis", "news_batch", "portfolio_analysis"])
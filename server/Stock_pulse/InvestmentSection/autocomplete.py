@@ -0,0 +1,165 @@
+"""
+Type-ahead search over screener symbols and company names.
+
+`SearchIndex` is built once per screener table from sorted arrays: the
+symbols, and every significant word of every company name, each with the
+table positions they point to. A prefix query is two binary searches per
+array. Typos are handled with a one-edit deletion index (each symbol and word
+is also filed under every variant with one character removed; the query's own
+variants are looked up in it), so fuzzy matches are dictionary lookups too.
+Matches are ranked by market cap.
+
+`get_index` follows `screener.get_table`: when the screener is reloaded the
+index for the new table is built on a background thread while queries keep
+being answered from the previous one.
+"""
+import re
+import threading
+from collections import defaultdict
+
+import numpy as np
+
+from InvestmentSection import screener
+
+# Words in nearly every listing name; indexing them would make 'co' or 'in'
+# match everything
+STOPWORDS = {
+    'INC', 'CORP', 'CORPORATION', 'CO', 'COMPANY', 'LTD', 'LIMITED', 'PLC', 'LLC', 'LP', 'NV', 'SA', 'AG',
+    'THE', 'OF', 'AND', 'CLASS', 'COMMON', 'STOCK', 'SHARES', 'ORDINARY', 'DEPOSITARY', 'AMERICAN',
+    'ADS', 'ADR', 'EACH', 'REPRESENTING', 'ONE', 'SHARE', 'PAR', 'VALUE', 'WARRANT', 'WARRANTS', 'UNIT', 'UNITS',
+}
+MIN_FUZZY_LENGTH = 3
+_WORD = re.compile(r'[A-Z0-9]+')
+
+
+def tokenize(text):
+    return _WORD.findall(text.upper())
+
+
+def _deletes(word):
+    return {word[:i] + word[i + 1:] for i in range(len(word))}
+
+
+def _sorted_keys(keys, positions):
+    keys = np.array(keys, dtype=str)
+    positions = np.array(positions, dtype=np.int64)
+    order = np.argsort(keys, kind='stable')
+    return keys[order], positions[order]
+
+
+def _prefix(keys, positions, prefix):
+    lo = np.searchsorted(keys, prefix, 'left')
+    hi = np.searchsorted(keys, prefix + '\uffff', 'left')
+    return positions[lo:hi]
+
+
+class SearchIndex:
+    def __init__(self, table):
+        self.table = table
+        symbols = [str(symbol).upper() for symbol in table.symbol]
+        self.symbol_keys, self.symbol_positions = _sorted_keys(symbols, range(len(symbols)))
+
+        words, word_positions = [], []
+        for position, name in enumerate(table.name):
+            for word in set(tokenize(name)) - STOPWORDS:
+                words.append(word)
+                word_positions.append(position)
+        self.word_keys, self.word_positions = _sorted_keys(words, word_positions)
+
+        # One-edit neighbourhood of every symbol and name word
+        fuzzy = defaultdict(set)
+        for key, position in zip(symbols + words, list(range(len(symbols))) + word_positions):
+            if len(key) >= MIN_FUZZY_LENGTH:
+                fuzzy[key].add(position)
+                for variant in _deletes(key):
+                    fuzzy[variant].add(position)
+        self.fuzzy = {variant: np.fromiter(positions, dtype=np.int64) for variant, positions in fuzzy.items()}
+
+        # Larger companies first; listings without a market cap go last
+        self.rank = np.nan_to_num(table.market_cap, nan=-1.0)
+        self.sectors = table.sector_names[table.sector_codes]
+
+    def _top(self, positions, limit):
+        """Unique `positions` ordered by market cap, at most `limit` of them."""
+        positions = np.unique(positions)
+        if len(positions) > limit:
+            positions = positions[np.argpartition(-self.rank[positions], limit - 1)[:limit]]
+        return positions[np.argsort(-self.rank[positions], kind='stable')]
+
+    def _prefix_matches(self, query, tokens):
+        symbol_matches = _prefix(self.symbol_keys, self.symbol_positions, query)
+        words = [token for token in tokens if token not in STOPWORDS] or tokens
+        name_matches = None
+        for word in words:
+            matches = _prefix(self.word_keys, self.word_positions, word)
+            name_matches = matches if name_matches is None else np.intersect1d(name_matches, matches)
+        return np.concatenate((symbol_matches, name_matches))
+
+    def _fuzzy_matches(self, tokens):
+        word = max(tokens, key=len)
+        if len(word) < MIN_FUZZY_LENGTH:
+            return np.empty(0, dtype=np.int64)
+        found = [self.fuzzy[variant] for variant in _deletes(word) | {word} if variant in self.fuzzy]
+        return np.concatenate(found) if found else np.empty(0, dtype=np.int64)
+
+    def search(self, query, limit=10):
+        """
+        Positions in the screener table matching `query`: the exact symbol
+        first, then symbol and name-word prefix matches, then (to fill up to
+        `limit`) matches within one typo, each group by market cap.
+        """
+        query = query.strip().upper()
+        tokens = tokenize(query)
+        if not tokens:
+            return np.empty(0, dtype=np.int64)
+
+        lo, hi = np.searchsorted(self.symbol_keys, query, 'left'), np.searchsorted(self.symbol_keys, query, 'right')
+        exact = self.symbol_positions[lo:hi]
+        groups = [exact, self._top(self._prefix_matches(query, tokens), limit)]
+        if sum(len(group) for group in groups) < limit:
+            groups.append(self._top(self._fuzzy_matches(tokens), limit))
+
+        results = list(dict.fromkeys(np.concatenate(groups).tolist()))
+        return np.array(results[:limit], dtype=np.int64)
+
+    def records(self, positions):
+        rows = self.table.records(positions, ('symbol', 'name', 'market_cap'))
+        for row, position in zip(rows, positions):
+            row['Sector'] = str(self.sectors[position]) or None
+        return rows
+
+
+_index = None
+_building = None  # table an index is being built for in the background
+_lock = threading.Lock()
+_first_build_lock = threading.Lock()
+
+
+def _build(table):
+    global _index, _building
+    try:
+        index = SearchIndex(table)
+        with _lock:
+            _index = index
+    finally:
+        with _lock:
+            _building = None
+
+
+def get_index():
+    """The search index of the current screener table."""
+    global _building
+    table = screener.get_table()
+    index = _index
+    if index is None:
+        # Nothing to serve yet: build in the foreground, once
+        with _first_build_lock:
+            if _index is None:
+                _build(table)
+        return _index
+    if index.table is not table:
+        with _lock:
+            if _building is None:
+                _building = table
+                threading.Thread(target=_build, args=(table,), daemon=True).start()
+    return index
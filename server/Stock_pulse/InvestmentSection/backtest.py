@@ -0,0 +1,69 @@
+"""
+Vectorized portfolio backtesting.
+
+All portfolios over one ticker set share a single daily-returns matrix, so
+evaluating N weight vectors is one (days x tickers) @ (tickers x N) product
+followed by a column-wise cumulative product.
+"""
+import numpy as np
+
+
+def returns_matrix(prices):
+    """
+    Daily simple returns of a (days x tickers) price frame as a float64 array.
+
+    Prices are forward-filled across gaps like `pct_change` does, and returns
+    that still can't be computed (the first day, before a ticker listed) count
+    as zero, the same as `(daily_returns * weights).sum(axis=1)` did.
+    """
+    values = prices.ffill().to_numpy(dtype=np.float64)
+    returns = np.zeros_like(values)
+    if len(values) > 1:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            returns[1:] = values[1:] / values[:-1] - 1.0
+    returns[~np.isfinite(returns)] = 0.0
+    return returns
+
+
+def normalize_amounts(amounts):
+    """
+    Turn a (portfolios x tickers) array of investment amounts into weights.
+
+    Returns `(weights, totals)` where `weights` is (tickers x portfolios) and
+    `totals` holds the total investment of each portfolio.
+    """
+    amounts = np.atleast_2d(np.asarray(amounts, dtype=np.float64))
+    totals = amounts.sum(axis=1)
+    if np.any(totals <= 0):
+        raise ValueError("Every portfolio needs a positive total investment.")
+    return (amounts / totals[:, None]).T, totals
+
+
+def run(returns, weights, totals):
+    """
+    Evaluate every portfolio at once.
+
+    `returns` is (days x tickers), `weights` is (tickers x portfolios) and
+    `totals` is (portfolios,). Returns `(daily, cumulative, value)`, each a
+    (days x portfolios) array.
+    """
+    daily = returns @ weights
+    cumulative = np.cumprod(1.0 + daily, axis=0) - 1.0
+    value = totals * (1.0 + cumulative)
+    return daily, cumulative, value
+
+
+def batch_payload(prices, tickers, weights, totals):
+    """
+    Run every portfolio over `prices` and lay the result out column-wise.
+    Series stay NumPy arrays, one row per portfolio, for the renderers.
+    """
+    daily, cumulative, value = run(returns_matrix(prices), weights, totals)
+    return {
+        "dates": prices.index.values.astype('datetime64[D]'),
+        "tickers": list(tickers),
+        "total_investment": totals,
+        "portfolio_value": value.T,
+        "daily_return": daily.T,
+        "cumulative_return": cumulative.T,
+    }
@@ -0,0 +1,249 @@
+"""
+Persisted backtest results that grow with the price history.
+
+A (tickers, weights, start) key owns a directory under
+`settings.BACKTEST_CACHE_DIR` with raw appendable columns for the date, daily
+return and cumulative return, plus a `state.json` holding the terminal state
+of the run: the last cumulative return and the last known price of every
+ticker. Extending a result to a later end date only needs the prices of the
+new days, so a refresh costs O(new days) instead of O(full history).
+
+Keys are canonical: tickers are upper-cased, duplicates merged and the
+positions sorted, so the same portfolio maps to one entry however its tickers
+are ordered. At most `settings.BACKTEST_CACHE_MAX_ENTRIES` results are kept;
+the least recently used ones are evicted. A result is recomputed from scratch
+when the price store has rewritten one of its tickers since (a split or
+dividend re-based the prices it was computed from).
+"""
+import hashlib
+import json
+import os
+import shutil
+from datetime import date
+
+import numpy as np
+import pandas as pd
+from django.conf import settings
+
+from InvestmentSection import backtest, price_store
+from InvestmentSection.price_store import ITEM_SIZE, file_lock, from_day, shared_lock, to_day
+
+COLUMNS = ('date', 'daily', 'cumulative')
+STATE_FILE = 'state.json'
+
+_DTYPES = {
+    'date': np.dtype('<i8'),
+    'daily': np.dtype('<f8'),
+    'cumulative': np.dtype('<f8'),
+}
+
+
+def canonical(tickers, weights):
+    """Upper-cased, sorted tickers with the weights of duplicates summed."""
+    merged = {}
+    for ticker, weight in zip(tickers, weights):
+        ticker = ticker.upper()
+        merged[ticker] = merged.get(ticker, 0.0) + float(weight)
+    tickers = sorted(merged)
+    return tickers, [merged[ticker] for ticker in tickers]
+
+
+class BacktestCache:
+    def __init__(self, root=None, max_entries=None):
+        self.root = os.fspath(root or settings.BACKTEST_CACHE_DIR)
+        self.max_entries = max_entries or settings.BACKTEST_CACHE_MAX_ENTRIES
+
+    @staticmethod
+    def key(tickers, weights, start):
+        tickers, weights = canonical(tickers, weights)
+        # Round weights so float noise from normalisation maps to the same key
+        payload = json.dumps({
+            'tickers': tickers,
+            'weights': [round(weight, 10) for weight in weights],
+            'start': to_day(start),
+        })
+        return hashlib.sha1(payload.encode()).hexdigest()
+
+    def _path(self, key, name):
+        return os.path.join(self.root, key, name)
+
+    # ------------------------------------------------------------------ state
+
+    def state(self, key):
+        try:
+            with open(self._path(key, STATE_FILE)) as handle:
+                return json.load(handle)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _write_state(self, key, state):
+        path = self._path(key, STATE_FILE)
+        with open(f'{path}.tmp', 'w') as handle:
+            json.dump(state, handle)
+        os.replace(f'{path}.tmp', path)
+
+    # --------------------------------------------------------------- eviction
+
+    def _touch(self, key):
+        # The state file's mtime doubles as the entry's last use
+        try:
+            os.utime(self._path(key, STATE_FILE))
+        except FileNotFoundError:
+            pass
+
+    def _evict(self, keep):
+        """Remove the least recently used entries beyond `max_entries`."""
+        used = []
+        for key in os.listdir(self.root):
+            try:
+                used.append((os.path.getmtime(self._path(key, STATE_FILE)), key))
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+        used.sort()
+        for _, key in used[:max(len(used) - self.max_entries, 0)]:
+            if key != keep:
+                with file_lock(os.path.join(self.root, key)):
+                    shutil.rmtree(os.path.join(self.root, key), ignore_errors=True)
+
+    # ------------------------------------------------------------------- read
+
+    def _length(self, key):
+        sizes = []
+        for name in COLUMNS:
+            try:
+                sizes.append(os.path.getsize(self._path(key, name)))
+            except FileNotFoundError:
+                return 0
+        return min(sizes) // ITEM_SIZE
+
+    def read(self, key, end=None):
+        """Return `(dates, daily, cumulative)` for the stored days before `end`."""
+        # Keeps `extend` from resetting and `_evict` from removing the entry mid-read
+        with shared_lock(os.path.join(self.root, key)):
+            length = self._length(key)
+            if length == 0:
+                return (np.empty(0, dtype='datetime64[D]'), np.empty(0), np.empty(0))
+
+            columns = {
+                name: np.memmap(self._path(key, name), dtype=_DTYPES[name], mode='r', shape=(length,))
+                for name in COLUMNS
+            }
+            hi = length if end is None else int(np.searchsorted(columns['date'], to_day(end), 'left'))
+            return (
+                np.asarray(columns['date'][:hi]).astype('datetime64[D]'),
+                np.array(columns['daily'][:hi]),
+                np.array(columns['cumulative'][:hi]),
+            )
+
+    # ------------------------------------------------------------------ write
+
+    def _append(self, key, days, daily, cumulative):
+        length = self._length(key)
+        for name in COLUMNS:
+            path = self._path(key, name)
+            # Drop any partial row left behind by an interrupted append
+            if os.path.exists(path) and os.path.getsize(path) != length * ITEM_SIZE:
+                with open(path, 'r+b') as handle:
+                    handle.truncate(length * ITEM_SIZE)
+
+        values = {'date': days, 'daily': daily, 'cumulative': cumulative}
+        for name in COLUMNS:
+            with open(self._path(key, name), 'ab') as handle:
+                handle.write(np.ascontiguousarray(values[name], dtype=_DTYPES[name]).tobytes())
+
+    def _reset(self, key):
+        for name in COLUMNS + (STATE_FILE,):
+            path = self._path(key, name)
+            if os.path.exists(path):
+                os.remove(path)
+
+    def extend(self, tickers, weights, start, end):
+        """
+        Make sure the result for (tickers, weights, start) covers every closed
+        trading day before `end`, computing only the days not stored yet.
+        Returns the key to `read` the result with.
+        """
+        key = self.key(tickers, weights, start)
+        tickers, weights = canonical(tickers, weights)
+        # Today's bar is still forming, so only closed days are persisted
+        end_day = min(to_day(end), to_day(date.today()))
+        weights = np.asarray(weights, dtype=np.float64)[:, None]
+        store = price_store.get_store()
+
+        with file_lock(os.path.join(self.root, key)):
+            state = self.state(key)
+            created = not state
+            generations = [store.generation(ticker) for ticker in tickers]
+            if state.get('checked_through', -1) >= end_day and state.get('generations') == generations:
+                self._touch(key)
+                return key
+
+            # Bring the prices up to date first: the update may rewrite re-based tickers
+            store.refresh(tickers, start, from_day(end_day))
+            generations = [store.generation(ticker) for ticker in tickers]
+            if state.get('generations') != generations:
+                state = {}
+
+            if state.get('last_day') is None:
+                self._reset(key)
+                prices = price_store.load_field(tickers, start, from_day(end_day), 'Adj Close')
+                returns = backtest.returns_matrix(prices)
+                last_cumulative = 0.0
+                last_prices = [np.nan] * len(tickers)
+            else:
+                prices = price_store.load_field(tickers, from_day(state['last_day'] + 1), from_day(end_day), 'Adj Close')
+                last_cumulative = state['last_cumulative']
+                last_prices = [np.nan if price is None else price for price in state['last_prices']]
+                if not prices.empty:
+                    # Anchor the new days on the terminal prices of the previous run
+                    anchor = pd.DataFrame(
+                        [last_prices],
+                        columns=prices.columns,
+                        index=[pd.Timestamp(from_day(state['last_day']))],
+                    )
+                    returns = backtest.returns_matrix(pd.concat([anchor, prices]))[1:]
+
+            if not prices.empty:
+                daily, _, _ = backtest.run(returns, weights, np.ones(1))
+                daily = daily[:, 0]
+                cumulative = (1.0 + last_cumulative) * np.cumprod(1.0 + daily) - 1.0
+                days = price_store.index_days(prices.index)
+                self._append(key, days, daily, cumulative)
+
+                # Carry forward the last known price of tickers with no new quote
+                latest = prices.ffill().iloc[-1].to_numpy(dtype=np.float64)
+                last_prices = np.where(np.isnan(latest), np.asarray(last_prices, dtype=np.float64), latest)
+                state.update({
+                    'last_day': int(days[-1]),
+                    'last_cumulative': float(cumulative[-1]),
+                    'last_prices': [None if np.isnan(price) else float(price) for price in last_prices],
+                })
+
+            state.setdefault('tickers', list(tickers))
+            state.setdefault('last_day', None)
+            state.setdefault('last_cumulative', 0.0)
+            state.setdefault('last_prices', [None] * len(tickers))
+            state['generations'] = generations
+            state['checked_through'] = end_day
+            self._write_state(key, state)
+
+        if created:
+            self._evict(keep=key)
+        return key
+
+
+_default_cache = None
+
+
+def get_cache():
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = BacktestCache()
+    return _default_cache
+
+
+def load(tickers, weights, start, end):
+    """Stored-or-extended `(dates, daily, cumulative)` for one portfolio."""
+    cache = get_cache()
+    key = cache.extend(tickers, weights, start, end)
+    return cache.read(key, end)
@@ -0,0 +1,113 @@
+"""
+Indicators for many tickers at once.
+
+The parent refreshes the price store for every ticker (one batched download
+for whatever is missing), then splits the tickers into chunks that a process
+pool evaluates straight from the memory-mapped store. Batches smaller than
+`settings.INDICATOR_POOL_MIN_TICKERS` (or a single CPU) don't pay for the
+pool's round trips and are evaluated in-process. The per-ticker results
+are aligned on one shared date axis, so the response is a single column-
+oriented payload: every indicator is a (tickers x dates) array.
+"""
+import atexit
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from django.conf import settings
+
+from InvestmentSection import indicators, price_store
+
+_pool = None
+_pool_lock = threading.Lock()
+
+# The pool is started from a request thread; forking a multi-threaded server
+# can deadlock on locks another thread held at fork time, so workers start
+# from a clean process instead
+START_METHOD = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+
+
+def _workers():
+    return settings.INDICATOR_POOL_WORKERS or os.cpu_count() or 1
+
+
+def get_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=_workers(),
+                mp_context=multiprocessing.get_context(START_METHOD),
+            )
+            atexit.register(_pool.shutdown, wait=False)
+        return _pool
+
+
+def compute_chunk(root, tickers, specs, start, end):
+    """
+    Worker: read each ticker from the store at `root` and evaluate `specs`.
+    Only takes plain arguments, as the pool doesn't fork (see START_METHOD).
+    """
+    store = price_store.PriceStore(root)
+    results = {}
+    for ticker in tickers:
+        bars = store.read(ticker, start, end)
+        if bars.empty:
+            continue
+        values = indicators.compute(bars, specs)
+        values['Adj Close'] = bars['Adj Close'].to_numpy()
+        results[ticker] = (price_store.index_days(bars.index), values)
+    return results
+
+
+def compute(tickers, specs, start, end):
+    """
+    Evaluate `specs` for every ticker over [start, end) and return the
+    column-oriented payload.
+    """
+    tickers = list(dict.fromkeys(tickers))
+    # Validate up front so a bad spec fails the request, not a worker
+    for spec in specs:
+        indicators.parse_spec(spec)
+
+    store = price_store.get_store()
+    store.refresh(tickers, start, end)
+
+    if len(tickers) < settings.INDICATOR_POOL_MIN_TICKERS or _workers() == 1:
+        # Not worth the inter-process round trip
+        parts = [compute_chunk(store.root, tickers, specs, start, end)]
+    else:
+        chunk_size = settings.INDICATOR_CHUNK_SIZE
+        chunks = [tickers[i:i + chunk_size] for i in range(0, len(tickers), chunk_size)]
+        futures = [get_pool().submit(compute_chunk, store.root, chunk, specs, start, end) for chunk in chunks]
+        parts = [future.result() for future in futures]
+
+    results = {}
+    for part in parts:
+        results.update(part)
+
+    # One date axis for everybody; tickers without a bar on a date get NaN
+    days = np.empty(0, dtype=np.int64)
+    keys = []
+    if results:
+        days = np.unique(np.concatenate([ticker_days for ticker_days, _ in results.values()]))
+        first = next(iter(results.values()))[1]
+        keys = ['Adj Close'] + [key for key in first if key != 'Adj Close']
+    columns = {key: np.full((len(tickers), len(days)), np.nan) for key in keys}
+    for row, ticker in enumerate(tickers):
+        if ticker not in results:
+            continue
+        ticker_days, values = results[ticker]
+        positions = np.searchsorted(days, ticker_days)
+        for key in keys:
+            columns[key][row, positions] = values[key]
+
+    payload = {
+        'tickers': tickers,
+        'missing': [ticker for ticker in tickers if ticker not in results],
+        'dates': days.astype('datetime64[D]'),
+    }
+    payload.update(columns)
+    return payload
@@ -0,0 +1,98 @@
+"""
+Shape-preserving downsampling for chart series.
+
+Both methods return the sorted positions of the points to keep, so the same
+selection can be applied to every series that shares the x axis (dates,
+value, returns, moving averages...).
+"""
+import numpy as np
+
+METHODS = ('lttb', 'minmax')
+
+
+def lttb(x, y, max_points):
+    """
+    Largest-Triangle-Three-Buckets: keep the first and last point and, from
+    each of `max_points - 2` buckets in between, the point forming the largest
+    triangle with the previously kept point and the next bucket's average.
+    """
+    n = len(y)
+    if max_points >= n or max_points < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.nan_to_num(np.asarray(y, dtype=np.float64))
+
+    buckets = max_points - 2
+    edges = np.linspace(1, n - 1, buckets + 1).astype(np.int64)
+    counts = np.diff(edges)
+
+    # Average point of every bucket, computed in one pass
+    avg_x = np.add.reduceat(x[:n - 1], edges[:-1]) / counts
+    avg_y = np.add.reduceat(y[:n - 1], edges[:-1]) / counts
+    # The "next bucket" of the last bucket is the final point
+    next_x = np.append(avg_x[1:], x[-1])
+    next_y = np.append(avg_y[1:], y[-1])
+
+    selected = np.empty(max_points, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for bucket in range(buckets):
+        lo, hi = edges[bucket], edges[bucket + 1]
+        area = np.abs(
+            (x[a] - next_x[bucket]) * (y[lo:hi] - y[a])
+            - (x[a] - x[lo:hi]) * (next_y[bucket] - y[a])
+        )
+        a = lo + int(np.argmax(area))
+        selected[bucket + 1] = a
+    return selected
+
+
+def minmax(y, max_points):
+    """
+    Keep the minimum and maximum of each of `max_points // 2` equal buckets,
+    plus the first and last point. Fully vectorized.
+    """
+    n = len(y)
+    if max_points >= n or max_points < 4:
+        return np.arange(n)
+
+    y = np.asarray(y, dtype=np.float64)
+    buckets = (max_points - 2) // 2
+    size = -(-n // buckets)  # ceil
+    padded = np.full(buckets * size, np.nan)
+    padded[:n] = y
+    padded = padded.reshape(buckets, size)
+
+    offsets = np.arange(buckets) * size
+    lows = offsets + np.argmin(np.where(np.isnan(padded), np.inf, padded), axis=1)
+    highs = offsets + np.argmax(np.where(np.isnan(padded), -np.inf, padded), axis=1)
+
+    selected = np.concatenate(([0, n - 1], lows, highs))
+    return np.unique(selected[selected < n])
+
+
+def select(x, y, max_points, method='lttb'):
+    """Positions to keep so that at most `max_points` points are returned."""
+    if method == 'minmax':
+        return minmax(y, max_points)
+    if method == 'lttb':
+        return lttb(x, y, max_points)
+    raise ValueError(f"Unknown downsampling method '{method}'. Use one of: {', '.join(METHODS)}.")
+
+
+def parse_params(query_params):
+    """
+    Read the optional `max_points` and `downsample` query parameters.
+    Returns `(max_points, method)`; `max_points` is None when not requested.
+    """
+    max_points = query_params.get('max_points')
+    method = query_params.get('downsample', 'lttb')
+    if max_points is None:
+        return None, method
+    max_points = int(max_points)
+    if max_points < 4:
+        raise ValueError("'max_points' must be at least 4.")
+    if method not in METHODS:
+        raise ValueError(f"Unknown downsampling method '{method}'. Use one of: {', '.join(METHODS)}.")
+    return max_points, method
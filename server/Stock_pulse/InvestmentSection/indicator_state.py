@@ -0,0 +1,381 @@
+"""
+Incremental indicator state.
+
+Every indicator from `InvestmentSection.indicators` has a state object here
+that can be advanced one bar at a time in O(1) and serialized to a plain dict.
+Fed the same bars, the states produce the same values as the vectorized
+engine (up to float rounding), so the nightly refresh (or a live price feed)
+can keep indicators for thousands of tickers current without re-running
+rolling windows over the whole history. Missing prices are where they can
+differ: the window indicators (SMA, Bollinger bands) have no value while a
+missing bar is in the window, like the engine, but the recursive ones (EMA,
+MACD, RSI, ATR) skip the bar where the engine's pandas smoothing decays over
+it.
+
+`IndicatorStateStore` persists the states of a ticker next to its bars in the
+price store and advances them by whatever bars were appended since. States
+saved before the price store rewrote the ticker's history (see
+`PriceStore.generation`) or merged older bars in front of it are discarded and
+replayed from the new bars.
+"""
+import copy
+import json
+import math
+import os
+from collections import deque
+
+from InvestmentSection import price_store
+from InvestmentSection.indicators import parse_spec
+
+STATE_FILE = 'indicators.json'
+NAN = float('nan')
+
+
+def _price(bar, column='Adj Close'):
+    value = bar.get(column)
+    if value is None or math.isnan(value):
+        return None
+    return float(value)
+
+
+def _window(buffer, window):
+    # Missing prices are kept as NaN (None once serialized) so they leave the
+    # window at the right time
+    return deque((NAN if price is None else price for price in buffer), maxlen=window)
+
+
+def _serialize(buffer):
+    return [None if math.isnan(price) else price for price in buffer]
+
+
+class SMAState:
+    def __init__(self, window=10, buffer=(), total=0.0):
+        self.window = int(window)
+        self.buffer = _window(buffer, self.window)
+        self.missing = sum(math.isnan(price) for price in self.buffer)
+        self.total = total
+
+    def update(self, bar):
+        price = _price(bar)
+        if len(self.buffer) == self.window:
+            oldest = self.buffer[0]
+            if math.isnan(oldest):
+                self.missing -= 1
+            else:
+                self.total -= oldest
+        if price is None:
+            self.buffer.append(NAN)
+            self.missing += 1
+        else:
+            self.buffer.append(price)
+            self.total += price
+        return self.value
+
+    @property
+    def value(self):
+        # Like the engine, a window with a missing price has no value
+        if len(self.buffer) < self.window or self.missing:
+            return NAN
+        return self.total / self.window
+
+    def to_dict(self):
+        return {'window': self.window, 'buffer': _serialize(self.buffer), 'total': self.total}
+
+
+class EMAState:
+    def __init__(self, span=10, last=None):
+        self.span = int(span)
+        self.alpha = 2.0 / (self.span + 1)
+        self.last = last
+
+    def push(self, price):
+        if price is not None:
+            self.last = price if self.last is None else self.last + self.alpha * (price - self.last)
+        return self.value
+
+    def update(self, bar):
+        return self.push(_price(bar))
+
+    @property
+    def value(self):
+        return NAN if self.last is None else self.last
+
+    def to_dict(self):
+        return {'span': self.span, 'last': self.last}
+
+
+class WilderState:
+    """Wilder smoothing: an EMA with alpha = 1 / period."""
+
+    def __init__(self, period=14, last=None):
+        self.period = int(period)
+        self.last = last
+
+    def push(self, value):
+        self.last = value if self.last is None else self.last + (value - self.last) / self.period
+        return self.last
+
+    def to_dict(self):
+        return {'period': self.period, 'last': self.last}
+
+
+class RSIState:
+    def __init__(self, period=14, previous=None, gain=None, loss=None, count=0):
+        self.period = int(period)
+        self.previous = previous
+        self.gain = WilderState(self.period, gain)
+        self.loss = WilderState(self.period, loss)
+        self.count = count
+
+    def update(self, bar):
+        price = _price(bar)
+        if price is None:
+            return self.value
+        change = 0.0 if self.previous is None else price - self.previous
+        self.gain.push(max(change, 0.0))
+        self.loss.push(max(-change, 0.0))
+        self.previous = price
+        self.count += 1
+        return self.value
+
+    @property
+    def value(self):
+        if self.count <= self.period:
+            return NAN
+        if self.loss.last == 0:
+            return 100.0
+        return 100.0 - 100.0 / (1.0 + self.gain.last / self.loss.last)
+
+    def to_dict(self):
+        return {
+            'period': self.period,
+            'previous': self.previous,
+            'gain': self.gain.last,
+            'loss': self.loss.last,
+            'count': self.count,
+        }
+
+
+class MACDState:
+    def __init__(self, fast=12, slow=26, signal=9, fast_last=None, slow_last=None, signal_last=None):
+        self.fast = EMAState(fast, fast_last)
+        self.slow = EMAState(slow, slow_last)
+        self.signal = EMAState(signal, signal_last)
+
+    def update(self, bar):
+        price = _price(bar)
+        if price is not None:
+            self.fast.push(price)
+            self.slow.push(price)
+            self.signal.push(self.fast.last - self.slow.last)
+        return self.value
+
+    @property
+    def value(self):
+        if self.signal.last is None:
+            return {'macd': NAN, 'signal': NAN, 'histogram': NAN}
+        line = self.fast.last - self.slow.last
+        return {'macd': line, 'signal': self.signal.last, 'histogram': line - self.signal.last}
+
+    def to_dict(self):
+        return {
+            'fast': self.fast.span,
+            'slow': self.slow.span,
+            'signal': self.signal.span,
+            'fast_last': self.fast.last,
+            'slow_last': self.slow.last,
+            'signal_last': self.signal.last,
+        }
+
+
+class BBandsState:
+    def __init__(self, window=20, width=2, buffer=(), total=0.0, total_sq=0.0):
+        self.window = int(window)
+        self.width = float(width)
+        self.buffer = _window(buffer, self.window)
+        self.missing = sum(math.isnan(price) for price in self.buffer)
+        self.total = total
+        self.total_sq = total_sq
+
+    def update(self, bar):
+        price = _price(bar)
+        if len(self.buffer) == self.window:
+            oldest = self.buffer[0]
+            if math.isnan(oldest):
+                self.missing -= 1
+            else:
+                self.total -= oldest
+                self.total_sq -= oldest * oldest
+        if price is None:
+            self.buffer.append(NAN)
+            self.missing += 1
+        else:
+            self.buffer.append(price)
+            self.total += price
+            self.total_sq += price * price
+        return self.value
+
+    @property
+    def value(self):
+        if len(self.buffer) < self.window or self.missing:
+            return {'middle': NAN, 'upper': NAN, 'lower': NAN}
+        mean = self.total / self.window
+        variance = max(self.total_sq / self.window - mean * mean, 0.0) * self.window / (self.window - 1)
+        spread = self.width * math.sqrt(variance)
+        return {'middle': mean, 'upper': mean + spread, 'lower': mean - spread}
+
+    def to_dict(self):
+        return {
+            'window': self.window,
+            'width': self.width,
+            'buffer': _serialize(self.buffer),
+            'total': self.total,
+            'total_sq': self.total_sq,
+        }
+
+
+class ATRState:
+    def __init__(self, period=14, previous=None, average=None, count=0):
+        self.period = int(period)
+        self.previous = previous
+        self.average = WilderState(self.period, average)
+        self.count = count
+
+    def update(self, bar):
+        high, low, close = _price(bar, 'High'), _price(bar, 'Low'), _price(bar, 'Close')
+        if high is None or low is None:
+            return self.value
+        true_range = high - low
+        if self.previous is not None:
+            true_range = max(true_range, abs(high - self.previous), abs(low - self.previous))
+        self.average.push(true_range)
+        if close is not None:
+            self.previous = close
+        self.count += 1
+        return self.value
+
+    @property
+    def value(self):
+        return self.average.last if self.count > self.period else NAN
+
+    def to_dict(self):
+        return {
+            'period': self.period,
+            'previous': self.previous,
+            'average': self.average.last,
+            'count': self.count,
+        }
+
+
+STATES = {
+    'sma': SMAState,
+    'ema': EMAState,
+    'rsi': RSIState,
+    'macd': MACDState,
+    'bbands': BBandsState,
+    'atr': ATRState,
+}
+
+
+def make_state(spec):
+    """Fresh state for an indicator spec such as `'rsi:14'`."""
+    name, params = parse_spec(spec)
+    return STATES[name](*params)
+
+
+def load_state(spec, data):
+    name, _ = parse_spec(spec)
+    return STATES[name](**data)
+
+
+def flatten(spec, value):
+    """Key a state's value the same way `indicators.compute` keys its output."""
+    name, params = parse_spec(spec)
+    key = ':'.join([name, *params])
+    if isinstance(value, dict):
+        return {f'{key}.{component}': item for component, item in value.items()}
+    return {key: value}
+
+
+class IndicatorStateStore:
+    """Per-ticker indicator states kept next to the bars in the price store."""
+
+    def __init__(self, store=None):
+        self.store = store or price_store.get_store()
+
+    def _path(self, ticker):
+        return os.path.join(self.store._dir(ticker), STATE_FILE)
+
+    def load(self, ticker):
+        try:
+            with open(self._path(ticker)) as handle:
+                data = json.load(handle)
+        except (FileNotFoundError, ValueError):
+            return None, {}
+        if (data.get('generation', 0) != self.store.generation(ticker)
+                or data.get('first_day') != self.store.first_day(ticker)):
+            # Built from bars that have since been re-based or backfilled
+            return None, {}
+        states = {spec: load_state(spec, state) for spec, state in data['states'].items()}
+        return data['last_day'], states
+
+    def save(self, ticker, last_day, states):
+        path = self._path(ticker)
+        data = {
+            'last_day': last_day,
+            'generation': self.store.generation(ticker),
+            'first_day': self.store.first_day(ticker),
+            'states': {spec: state.to_dict() for spec, state in states.items()},
+        }
+        with open(f'{path}.tmp', 'w') as handle:
+            json.dump(data, handle)
+        os.replace(f'{path}.tmp', path)
+
+    def advance(self, ticker, specs):
+        """
+        Bring the states of `specs` for `ticker` up to the last stored bar and
+        return their current values. Existing states only consume the bars
+        appended since the last call; new specs replay the stored history once.
+        """
+        if not self.store.has(ticker):
+            return {}
+
+        with self.store.lock(ticker):
+            last_day, states = self.load(ticker)
+            new_specs = [spec for spec in dict.fromkeys(specs) if spec not in states]
+            if new_specs:
+                replay = {spec: make_state(spec) for spec in new_specs}
+                if last_day is not None:
+                    # Catch new indicators up to where the existing ones are
+                    self._feed(replay, self.store.read(ticker, end=price_store.from_day(last_day + 1)))
+                states.update(replay)
+
+            start = None if last_day is None else price_store.from_day(last_day + 1)
+            bars = self.store.read(ticker, start=start)
+            self._feed(states, bars)
+            if len(bars):
+                last_day = int(price_store.index_days(bars.index)[-1])
+            self.save(ticker, last_day, states)
+
+        values = {}
+        for spec in specs:
+            values.update(flatten(spec, states[spec].value))
+        return values
+
+    @staticmethod
+    def _feed(states, bars):
+        for bar in bars.to_dict(orient='records'):
+            for state in states.values():
+                state.update(bar)
+
+    def peek(self, ticker, specs, bar):
+        """
+        Values the indicators would have after one more (e.g. live, intraday)
+        bar, without persisting anything.
+        """
+        _, states = self.load(ticker)
+        values = {}
+        for spec in specs:
+            state = copy.deepcopy(states[spec]) if spec in states else make_state(spec)
+            values.update(flatten(spec, state.update(bar)))
+        return values
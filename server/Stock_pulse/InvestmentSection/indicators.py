@@ -0,0 +1,192 @@
+"""
+Technical indicator engine.
+
+Indicators are requested as spec strings, `name[:param[:param...]]`, e.g.
+`sma:20`, `ema:10`, `rsi:14`, `macd:12:26:9`, `bbands:20:2`, `atr:14`.
+`compute` evaluates any set of specs over one bar frame: the price arrays
+are pulled out once and the building blocks (cumulative sums, EMAs, true
+range...) are memoized, so `ema:12` and `macd:12:26:9` share the same EMA and
+extra indicators never trigger another pass over the data or another fetch.
+
+Results are keyed by the normalized spec. Indicators with several outputs
+(MACD, Bollinger bands) produce `spec.component` keys.
+"""
+import numpy as np
+import pandas as pd
+
+
+class Context:
+    """Shared price arrays plus a memo of intermediate series."""
+
+    def __init__(self, bars):
+        self.bars = bars
+        self._memo = {}
+
+    def _cached(self, key, build):
+        if key not in self._memo:
+            self._memo[key] = build()
+        return self._memo[key]
+
+    def column(self, name):
+        return self._cached(('column', name), lambda: self.bars[name].to_numpy(dtype=np.float64))
+
+    @property
+    def close(self):
+        return self.column('Adj Close')
+
+    def cumsum(self, power=1):
+        # Prefix sums of close and close**2 give every rolling mean/std in O(n);
+        # missing prices count as zero here and are tracked in `valid_count`
+        return self._cached(
+            ('cumsum', power),
+            lambda: np.concatenate(([0.0], np.cumsum(np.nan_to_num(self.close ** power)))),
+        )
+
+    def valid_count(self):
+        return self._cached(
+            ('valid_count',),
+            lambda: np.concatenate(([0], np.cumsum(~np.isnan(self.close)))),
+        )
+
+    def rolling_mean(self, window, power=1):
+        def build():
+            sums, counts = self.cumsum(power), self.valid_count()
+            out = np.full(len(self.close), np.nan)
+            if window <= len(self.close):
+                full = (counts[window:] - counts[:-window]) == window
+                # Like pandas, a window with a missing price has no value
+                out[window - 1:] = np.where(full, (sums[window:] - sums[:-window]) / window, np.nan)
+            return out
+        return self._cached(('rolling_mean', window, power), build)
+
+    def rolling_std(self, window):
+        def build():
+            mean = self.rolling_mean(window)
+            variance = self.rolling_mean(window, power=2) - mean ** 2
+            # Sample std like pandas' rolling().std()
+            variance = np.clip(variance, 0.0, None) * window / (window - 1)
+            return np.sqrt(variance)
+        return self._cached(('rolling_std', window), build)
+
+    def ema(self, span, values=None, key='close'):
+        values = self.close if values is None else values
+        return self._cached(
+            ('ema', key, span),
+            lambda: pd.Series(values).ewm(span=span, adjust=False).mean().to_numpy(),
+        )
+
+    def wilder(self, values, period, key):
+        # Wilder's smoothing is an EMA with alpha = 1 / period
+        return self._cached(
+            ('wilder', key, period),
+            lambda: pd.Series(values).ewm(alpha=1.0 / period, adjust=False).mean().to_numpy(),
+        )
+
+    def diff(self):
+        return self._cached(('diff',), lambda: np.diff(self.close, prepend=np.nan))
+
+    def true_range(self):
+        def build():
+            high, low, close = self.column('High'), self.column('Low'), self.column('Close')
+            previous = np.concatenate(([np.nan], close[:-1]))
+            return np.fmax(high - low, np.fmax(np.abs(high - previous), np.abs(low - previous)))
+        return self._cached(('true_range',), build)
+
+
+def sma(ctx, window=10):
+    return ctx.rolling_mean(int(window))
+
+
+def ema(ctx, span=10):
+    return ctx.ema(int(span))
+
+
+def rsi(ctx, period=14):
+    period = int(period)
+    change = ctx.diff()
+    gains = ctx.wilder(np.where(change > 0, change, 0.0), period, 'gain')
+    losses = ctx.wilder(np.where(change < 0, -change, 0.0), period, 'loss')
+    with np.errstate(divide='ignore', invalid='ignore'):
+        out = 100.0 - 100.0 / (1.0 + gains / losses)
+    out[losses == 0] = 100.0
+    out[:period] = np.nan
+    return out
+
+
+def macd(ctx, fast=12, slow=26, signal=9):
+    line = ctx.ema(int(fast)) - ctx.ema(int(slow))
+    signal_line = ctx.ema(int(signal), values=line, key=('macd', int(fast), int(slow)))
+    return {'macd': line, 'signal': signal_line, 'histogram': line - signal_line}
+
+
+def bbands(ctx, window=20, width=2):
+    window, width = int(window), float(width)
+    middle = ctx.rolling_mean(window)
+    spread = width * ctx.rolling_std(window)
+    return {'middle': middle, 'upper': middle + spread, 'lower': middle - spread}
+
+
+def atr(ctx, period=14):
+    period = int(period)
+    out = ctx.wilder(np.nan_to_num(ctx.true_range()), period, 'true_range').copy()
+    out[:period] = np.nan
+    return out
+
+
+INDICATORS = {
+    'sma': sma,
+    'ema': ema,
+    'rsi': rsi,
+    'macd': macd,
+    'bbands': bbands,
+    'atr': atr,
+}
+
+
+# Parameter types of every indicator, in order; all parameters are optional
+# and must be positive
+PARAMETERS = {
+    'sma': (int,),
+    'ema': (int,),
+    'rsi': (int,),
+    'macd': (int, int, int),
+    'bbands': (int, float),
+    'atr': (int,),
+}
+
+
+def parse_spec(spec):
+    """Split `'macd:12:26:9'` into `('macd', ['12', '26', '9'])`, validating the name and parameters."""
+    name, *params = spec.strip().lower().split(':')
+    if name not in INDICATORS:
+        raise ValueError(f"Unknown indicator '{name}'. Available: {', '.join(INDICATORS)}.")
+    types = PARAMETERS[name]
+    if len(params) > len(types):
+        raise ValueError(f"Too many parameters in indicator '{spec}': '{name}' takes at most {len(types)}.")
+    for param, kind in zip(params, types):
+        try:
+            if kind(param) <= 0:
+                raise ValueError
+        except ValueError:
+            expected = 'a positive integer' if kind is int else 'a positive number'
+            raise ValueError(f"Invalid parameter '{param}' in indicator '{spec}': expected {expected}.")
+    return name, params
+
+
+def compute(bars, specs):
+    """
+    Evaluate every indicator in `specs` over `bars` (a frame with the
+    yfinance OHLCV columns). Returns a dict of spec key -> NumPy array.
+    """
+    ctx = Context(bars)
+    results = {}
+    for spec in dict.fromkeys(specs):
+        name, params = parse_spec(spec)
+        key = ':'.join([name, *params])
+        output = INDICATORS[name](ctx, *params)
+        if isinstance(output, dict):
+            for component, values in output.items():
+                results[f'{key}.{component}'] = values
+        else:
+            results[key] = output
+    return results
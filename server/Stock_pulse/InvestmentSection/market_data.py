@@ -0,0 +1,219 @@
+"""
+Market-data fetch layer in front of `yf.download`.
+
+Identical requests that are already in flight share one download, misses for
+the same date range that arrive within a short batch window are merged into a
+single multi-ticker download, and results are kept in a size-bounded TTL cache
+with LRU eviction. Upstream calls therefore scale with unique tickers rather
+than with request count.
+"""
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+
+import pandas as pd
+import yfinance as yf
+from django.conf import settings
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries also expire after `ttl` seconds."""
+
+    def __init__(self, maxsize=512, ttl=300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING or entry[0] < time.monotonic():
+                if entry is not _MISSING:
+                    del self._data[key]
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+class MarketDataFetcher:
+    """
+    Coalescing, caching front for `_download_bars`.
+
+    Frames handed out are shared between callers and must be treated as
+    read-only.
+    """
+
+    def __init__(self, cache=None, batch_window=0.05, timeout=600):
+        self.cache = cache if cache is not None else TTLCache()
+        self.batch_window = batch_window
+        self.timeout = timeout  # seconds a caller waits for a download another caller leads
+        self.upstream_calls = 0
+        self._lock = threading.Lock()
+        self._inflight = {}  # (ticker, start, end) -> Future
+        self._pending = {}  # (start, end) -> tickers waiting for the next batch
+
+    def fetch(self, tickers, start, end):
+        start, end = str(start), str(end)
+        result = {}
+        waiting = {}
+        lead = False
+
+        with self._lock:
+            for ticker in dict.fromkeys(tickers):
+                key = (ticker, start, end)
+                cached = self.cache.get(key, _MISSING)
+                if cached is not _MISSING:
+                    if cached is not None:
+                        result[ticker] = cached
+                    continue
+
+                future = self._inflight.get(key)
+                if future is None:
+                    future = self._inflight[key] = Future()
+                    batch = self._pending.setdefault((start, end), [])
+                    # The caller that opens a batch is the one that downloads it
+                    lead = lead or not batch
+                    batch.append(ticker)
+                waiting[ticker] = future
+
+        if lead:
+            # Give concurrent requests for the same range a moment to join
+            if self.batch_window:
+                time.sleep(self.batch_window)
+            with self._lock:
+                batch = self._pending.pop((start, end), [])
+            self._run_batch(batch, start, end)
+
+        for ticker, future in waiting.items():
+            frame = future.result(timeout=self.timeout)
+            if frame is not None:
+                result[ticker] = frame
+        return result
+
+    def _run_batch(self, tickers, start, end):
+        if not tickers:
+            return
+        with self._lock:
+            self.upstream_calls += 1
+        try:
+            frames = _download_bars(tickers, start, end)
+        except BaseException as e:
+            # Waiters must never be left hanging, whatever went wrong
+            with self._lock:
+                futures = [self._inflight.pop((ticker, start, end)) for ticker in tickers]
+            for future in futures:
+                future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+            return
+
+        with self._lock:
+            futures = []
+            for ticker in tickers:
+                frame = frames.get(ticker)
+                # Empty results are cached too so unknown symbols don't hammer upstream
+                self.cache.set((ticker, start, end), frame)
+                futures.append((self._inflight.pop((ticker, start, end)), frame))
+        for future, frame in futures:
+            future.set_result(frame)
+
+    def stats(self):
+        return {
+            'cache_entries': len(self.cache),
+            'cache_hits': self.cache.hits,
+            'cache_misses': self.cache.misses,
+            'upstream_calls': self.upstream_calls,
+        }
+
+
+_default_fetcher = None
+_default_fetcher_lock = threading.Lock()
+
+
+def get_fetcher():
+    global _default_fetcher
+    with _default_fetcher_lock:
+        if _default_fetcher is None:
+            _default_fetcher = MarketDataFetcher(
+                cache=TTLCache(
+                    maxsize=getattr(settings, 'MARKET_DATA_CACHE_SIZE', 512),
+                    ttl=getattr(settings, 'MARKET_DATA_CACHE_TTL', 300),
+                ),
+                batch_window=getattr(settings, 'MARKET_DATA_BATCH_WINDOW', 0.05),
+                timeout=getattr(settings, 'MARKET_DATA_WAIT_TIMEOUT', 600),
+            )
+        return _default_fetcher
+
+
+def download_bars(tickers, start, end):
+    """
+    Daily OHLCV bars for several tickers, served from the cache where possible.
+
+    Returns a dict of ticker -> DataFrame with the usual yfinance columns
+    ('Open', 'High', 'Low', 'Close', 'Adj Close', 'Volume'). Tickers with no
+    data are left out. `end` is exclusive, like `yf.download`.
+    """
+    return get_fetcher().fetch(tickers, start, end)
+
+
+def _download_bars(tickers, start, end):
+    """Download daily OHLCV bars for several tickers in one upstream request."""
+    tickers = list(dict.fromkeys(tickers))
+    if not tickers:
+        return {}
+
+    data = yf.download(
+        tickers,
+        start=start,
+        end=end,
+        group_by='ticker',
+        auto_adjust=False,  # keep the 'Adj Close' column the views rely on
+        progress=False,
+        threads=True,
+    )
+    return split_download(data, tickers)
+
+
+def split_download(data, tickers):
+    """Split a (possibly multi-ticker) `yf.download` frame into one frame per ticker."""
+    frames = {}
+    if data is None or data.empty:
+        return frames
+
+    for ticker in tickers:
+        if isinstance(data.columns, pd.MultiIndex):
+            # group_by='ticker' puts the ticker on the first column level
+            if ticker not in data.columns.get_level_values(0):
+                continue
+            frame = data[ticker]
+        else:
+            # Older yfinance versions return flat columns for a single ticker
+            frame = data
+
+        frame = frame.dropna(how='all')
+        if not frame.empty:
+            frames[ticker] = frame
+
+    return frames
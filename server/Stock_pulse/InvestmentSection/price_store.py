@@ -0,0 +1,461 @@
+"""
+Local on-disk store of daily OHLCV bars.
+
+Every ticker gets its own directory under `settings.PRICE_STORE_DIR` holding
+one raw little-endian binary file per column (dates as int64 days since the
+epoch, prices and volume as float64) plus a small `meta.json`. Raw column files
+can be memory-mapped directly and grown by appending, so reads never parse
+anything and updates only write the missing days.
+
+Yahoo re-bases 'Close' and 'Adj Close' retroactively after every split and
+dividend, so each update re-fetches the last stored bar as well. If upstream
+no longer agrees with the stored value the ticker's history is downloaded
+again and rewritten, and its `generation` in `meta.json` is bumped so anything
+derived from the old bars (indicator states, stored backtests) knows to start
+over. Requests reaching further back than the stored history merge the older
+bars in and only bump the generation if the days already stored changed.
+"""
+import json
+import os
+import threading
+from contextlib import contextmanager
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+from django.conf import settings
+
+try:
+    import fcntl
+except ImportError:  # Windows: fall back to the in-process lock only
+    fcntl = None
+
+from InvestmentSection import market_data
+
+# yfinance column -> file name in the ticker directory
+COLUMNS = {
+    'Open': 'open',
+    'High': 'high',
+    'Low': 'low',
+    'Close': 'close',
+    'Adj Close': 'adj_close',
+    'Volume': 'volume',
+}
+DATE_FILE = 'date'
+META_FILE = 'meta.json'
+LOCK_FILE = '.lock'
+ITEM_SIZE = 8  # every column is 8 bytes wide
+REBASE_COLUMNS = ('Close', 'Adj Close')
+REBASE_TOLERANCE = 1e-6  # relative change of the overlap bar that counts as a re-basing
+
+_DATE_DTYPE = np.dtype('<i8')
+_VALUE_DTYPE = np.dtype('<f8')
+
+
+def to_day(value):
+    """Convert a date-like value to int64 days since 1970-01-01."""
+    return int(np.datetime64(pd.Timestamp(value).date(), 'D').astype(np.int64))
+
+
+def from_day(day):
+    return date(1970, 1, 1) + timedelta(days=int(day))
+
+
+_thread_locks = {}
+_thread_locks_guard = threading.Lock()
+_held = threading.local()  # directories whose exclusive lock this thread holds
+
+
+def _held_locks():
+    if not hasattr(_held, 'directories'):
+        _held.directories = set()
+    return _held.directories
+
+
+@contextmanager
+def file_lock(directory):
+    """
+    Exclusive lock on `directory` (created if needed), held across threads of
+    this process and, where `fcntl` exists, across processes too.
+    """
+    with _thread_locks_guard:
+        thread_lock = _thread_locks.setdefault(directory, threading.Lock())
+
+    with thread_lock:
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, LOCK_FILE), 'a') as handle:
+            if fcntl is not None:
+                fcntl.flock(handle, fcntl.LOCK_EX)
+            _held_locks().add(directory)
+            try:
+                yield
+            finally:
+                _held_locks().discard(directory)
+                if fcntl is not None:
+                    fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+@contextmanager
+def shared_lock(directory):
+    """
+    Shared lock on `directory` for readers: waits for a writer holding
+    `file_lock` to finish, but not for other readers. Nothing to wait for if
+    the directory doesn't exist or this thread already holds the exclusive
+    lock. Without `fcntl` readers aren't locked out of rewrites.
+    """
+    if fcntl is None or directory in _held_locks() or not os.path.isdir(directory):
+        yield
+        return
+    try:
+        handle = open(os.path.join(directory, LOCK_FILE), 'a')
+    except FileNotFoundError:
+        # Removed in the meantime, so there is nothing left to read either
+        yield
+        return
+    with handle:
+        fcntl.flock(handle, fcntl.LOCK_SH)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+def index_days(index):
+    """Int64 day numbers of a DatetimeIndex (tz-aware indexes use their local date)."""
+    index = pd.DatetimeIndex(index)
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return index.values.astype('datetime64[D]').astype(_DATE_DTYPE)
+
+
+class PriceStore:
+    def __init__(self, root=None):
+        self.root = os.fspath(root or settings.PRICE_STORE_DIR)
+
+    # ------------------------------------------------------------------ paths
+
+    def _dir(self, ticker):
+        return os.path.join(self.root, ticker.upper().replace('/', '_'))
+
+    def _path(self, ticker, name):
+        return os.path.join(self._dir(ticker), name)
+
+    def _files(self):
+        return [DATE_FILE] + list(COLUMNS.values())
+
+    def has(self, ticker):
+        return os.path.isdir(self._dir(ticker))
+
+    # --------------------------------------------------------------- locking
+
+    def lock(self, ticker):
+        """Serialize writers to one ticker across threads and processes."""
+        return file_lock(self._dir(ticker))
+
+    def read_lock(self, ticker):
+        """Keep writers from rewriting `ticker` while its columns are read."""
+        return shared_lock(self._dir(ticker))
+
+    # ------------------------------------------------------------------ meta
+
+    def meta(self, ticker):
+        try:
+            with open(self._path(ticker, META_FILE)) as handle:
+                return json.load(handle)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def generation(self, ticker):
+        """How many times the ticker's history has been (re)written from scratch."""
+        return self.meta(ticker).get('generation', 0)
+
+    def _write_meta(self, ticker, meta):
+        path = self._path(ticker, META_FILE)
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'w') as handle:
+            json.dump(meta, handle)
+        os.replace(tmp_path, path)
+
+    # ------------------------------------------------------------------ read
+
+    def length(self, ticker):
+        """Number of complete rows, i.e. rows present in every column file."""
+        sizes = []
+        for name in self._files():
+            try:
+                sizes.append(os.path.getsize(self._path(ticker, name)))
+            except FileNotFoundError:
+                return 0
+        return min(sizes) // ITEM_SIZE
+
+    def _column(self, ticker, name, dtype, length):
+        if length == 0:
+            return np.empty(0, dtype=dtype)
+        return np.memmap(self._path(ticker, name), dtype=dtype, mode='r', shape=(length,))
+
+    def dates(self, ticker):
+        return self._column(ticker, DATE_FILE, _DATE_DTYPE, self.length(ticker))
+
+    def first_day(self, ticker):
+        with self.read_lock(ticker):
+            dates = self.dates(ticker)
+            return int(dates[0]) if len(dates) else None
+
+    def last_day(self, ticker):
+        with self.read_lock(ticker):
+            dates = self.dates(ticker)
+            return int(dates[-1]) if len(dates) else None
+
+    def read(self, ticker, start=None, end=None, columns=None):
+        """
+        Return stored bars for `ticker` between `start` (inclusive) and `end`
+        (exclusive) as a DataFrame indexed by 'Date'.
+        """
+        columns = list(columns or COLUMNS)
+        with self.read_lock(ticker):
+            length = self.length(ticker)
+            dates = self._column(ticker, DATE_FILE, _DATE_DTYPE, length)
+
+            lo = 0 if start is None else int(np.searchsorted(dates, to_day(start), 'left'))
+            hi = length if end is None else int(np.searchsorted(dates, to_day(end), 'left'))
+
+            index = pd.DatetimeIndex(np.asarray(dates[lo:hi]).astype('datetime64[D]'), name='Date')
+            data = {
+                column: np.array(self._column(ticker, COLUMNS[column], _VALUE_DTYPE, length)[lo:hi])
+                for column in columns
+            }
+        return pd.DataFrame(data, index=index, columns=columns)
+
+    # ----------------------------------------------------------------- write
+
+    def _truncate(self, ticker, length):
+        # Drop any partial row left behind by an interrupted append
+        for name in self._files():
+            path = self._path(ticker, name)
+            if os.path.exists(path) and os.path.getsize(path) != length * ITEM_SIZE:
+                with open(path, 'r+b') as handle:
+                    handle.truncate(length * ITEM_SIZE)
+
+    def _encode(self, frame):
+        days = index_days(frame.index)
+        columns = {DATE_FILE: days}
+        for column, name in COLUMNS.items():
+            if column in frame:
+                values = pd.to_numeric(frame[column], errors='coerce')
+            else:
+                values = pd.Series(np.nan, index=frame.index)
+            columns[name] = values.to_numpy(dtype=_VALUE_DTYPE, na_value=np.nan)
+        return days, columns
+
+    def append(self, ticker, frame):
+        """
+        Append the rows of `frame` that are newer than the last stored day.
+        Caller must hold `lock(ticker)`. Returns the number of bytes written.
+        """
+        if frame is None or frame.empty:
+            return 0
+
+        frame = frame.sort_index()
+        days, columns = self._encode(frame)
+
+        length = self.length(ticker)
+        self._truncate(ticker, length)
+        last_day = self.last_day(ticker)
+        keep = days > last_day if last_day is not None else np.ones(len(days), dtype=bool)
+        keep &= np.concatenate(([True], days[1:] != days[:-1]))  # no duplicate days
+        if not keep.any():
+            return 0
+
+        written = 0
+        for name, values in columns.items():
+            payload = np.ascontiguousarray(values[keep]).tobytes()
+            with open(self._path(ticker, name), 'ab') as handle:
+                handle.write(payload)
+            written += len(payload)
+        return written
+
+    def _remove(self, ticker):
+        for name in self._files():
+            path = self._path(ticker, name)
+            if os.path.exists(path):
+                os.remove(path)
+
+    def replace(self, ticker, frame):
+        """Rewrite every column of `ticker` from `frame`. Caller must hold the lock."""
+        self._remove(ticker)
+        return self.append(ticker, frame)
+
+    def merge(self, ticker, frame):
+        """
+        Add the days of `frame` that aren't stored yet, wherever they fall.
+        Stored days keep their bars unless upstream's close for one of them
+        differs, in which case the history has been re-based and is replaced
+        by `frame`. Caller must hold the lock. Returns `(bytes_written, rewritten)`.
+        """
+        length = self.length(ticker)
+        if length == 0:
+            return self.replace(ticker, frame), True
+
+        days, columns = self._encode(frame.sort_index())
+        days, first = np.unique(days, return_index=True)
+        columns = {name: values[first] for name, values in columns.items()}
+        stored = {
+            name: np.array(self._column(ticker, name, _DATE_DTYPE if name == DATE_FILE else _VALUE_DTYPE, length))
+            for name in self._files()
+        }
+
+        _, fresh_at, stored_at = np.intersect1d(days, stored[DATE_FILE], assume_unique=True, return_indices=True)
+        for column in REBASE_COLUMNS:
+            name = COLUMNS[column]
+            if not np.allclose(stored[name][stored_at], columns[name][fresh_at], rtol=REBASE_TOLERANCE, atol=0, equal_nan=True):
+                return self.replace(ticker, frame), True
+
+        new = ~np.isin(days, stored[DATE_FILE])
+        if not new.any():
+            return 0, False
+        if days[new][0] > stored[DATE_FILE][-1]:
+            return self.append(ticker, frame), False
+
+        order = np.argsort(np.concatenate((stored[DATE_FILE], days[new])), kind='stable')
+        self._remove(ticker)
+        written = 0
+        for name in self._files():
+            payload = np.ascontiguousarray(np.concatenate((stored[name], columns[name][new]))[order]).tobytes()
+            with open(self._path(ticker, name), 'ab') as handle:
+                handle.write(payload)
+            written += len(payload)
+        return written, False
+
+    # ---------------------------------------------------------------- update
+
+    def missing_range(self, ticker, start, end):
+        """
+        Work out which days have to be fetched so that [start, end) is covered.
+        Returns `(fetch_start, fetch_end, merge)` or None if nothing is missing.
+        An update starts at the last stored day, so that bar can be compared
+        with upstream (see `rebased`). A request reaching back before the
+        stored history fetches everything from `start` on and is merged in.
+        """
+        start_day, end_day = to_day(start), to_day(end)
+        meta = self.meta(ticker)
+        covered_from = meta.get('start')
+        checked_through = meta.get('checked_through')
+
+        if covered_from is None or start_day < covered_from:
+            # Re-fetch the stored days as well so `merge` can check they
+            # haven't been re-based since
+            fetch_end = max(end_day, checked_through or end_day)
+            return start_day, fetch_end, True
+
+        if checked_through is not None and end_day <= checked_through:
+            return None
+
+        last_day = self.last_day(ticker)
+        fetch_start = last_day if last_day is not None else covered_from
+        return fetch_start, end_day, False
+
+    def rebased(self, ticker, frame):
+        """
+        Whether upstream's bar for the last stored day differs from the stored
+        one, i.e. a split or dividend has re-based the history since.
+        """
+        last_day = self.last_day(ticker)
+        if last_day is None or frame is None or frame.empty:
+            return False
+        days, columns = self._encode(frame)
+        overlap = np.flatnonzero(days == last_day)
+        if not len(overlap):
+            return False
+        stored = self.read(ticker, from_day(last_day), from_day(last_day + 1), columns=REBASE_COLUMNS)
+        for column in REBASE_COLUMNS:
+            fresh = columns[COLUMNS[column]][overlap[0]]
+            if not np.isclose(stored[column].iloc[0], fresh, rtol=REBASE_TOLERANCE, atol=0, equal_nan=True):
+                return True
+        return False
+
+    def store(self, ticker, frame, fetch_start, fetch_end, merge):
+        """Write downloaded bars and record how far the ticker has been checked."""
+        if frame is None or frame.empty:
+            # Every fetch for a stored ticker includes at least one stored day,
+            # so nothing back means the download failed (or the ticker is
+            # unknown): keep what is stored and try again next time
+            return 0
+
+        with self.lock(ticker):
+            if merge:
+                written, rewritten = self.merge(ticker, frame)
+            else:
+                written, rewritten = self.append(ticker, frame), False
+
+            meta = self.meta(ticker)
+            if rewritten:
+                meta['generation'] = meta.get('generation', 0) + 1
+            meta['start'] = min(fetch_start, meta.get('start', fetch_start))
+            meta['checked_through'] = max(fetch_end, meta.get('checked_through') or fetch_end)
+            self._write_meta(ticker, meta)
+        return written
+
+    def refresh(self, tickers, start, end):
+        """
+        Fetch whatever is missing for `tickers` over [start, end). Tickers that
+        need the same range are downloaded together in one batched request.
+        Returns the number of bytes written.
+        """
+        # Today's bar is still forming, so the store only ever holds closed days
+        end = min(to_day(end), to_day(date.today()))
+
+        plans = {}
+        for ticker in dict.fromkeys(tickers):
+            missing = self.missing_range(ticker, start, from_day(end))
+            if missing is not None:
+                plans.setdefault(missing, []).append(ticker)
+
+        written = 0
+        rebuilds = {}
+        for (fetch_start, fetch_end, merge), group in plans.items():
+            if fetch_start >= fetch_end:
+                continue
+            bars = market_data.download_bars(group, from_day(fetch_start), from_day(fetch_end))
+            for ticker in group:
+                frame = bars.get(ticker)
+                if not merge and self.rebased(ticker, frame):
+                    # The stored history is on the old basis: fetch all of it again
+                    rebuilds.setdefault((self.meta(ticker)['start'], fetch_end), []).append(ticker)
+                    continue
+                written += self.store(ticker, frame, fetch_start, fetch_end, merge)
+
+        for (fetch_start, fetch_end), group in rebuilds.items():
+            bars = market_data.download_bars(group, from_day(fetch_start), from_day(fetch_end))
+            for ticker in group:
+                written += self.store(ticker, bars.get(ticker), fetch_start, fetch_end, True)
+        return written
+
+
+_default_store = None
+
+
+def get_store():
+    global _default_store
+    if _default_store is None:
+        _default_store = PriceStore()
+    return _default_store
+
+
+def load_bars(ticker, start, end, columns=None):
+    """Bars for one ticker over [start, end), fetching missing days first."""
+    store = get_store()
+    store.refresh([ticker], start, end)
+    return store.read(ticker, start, end, columns=columns)
+
+
+def load_field(tickers, start, end, field='Adj Close'):
+    """
+    One price field for several tickers over [start, end) as a DataFrame with
+    one column per ticker, in the order requested, outer-joined on date.
+    """
+    store = get_store()
+    store.refresh(tickers, start, end)
+    series = [store.read(ticker, start, end, columns=[field])[field] for ticker in tickers]
+    if not series:
+        return pd.DataFrame()
+    return pd.concat(series, axis=1, keys=tickers)
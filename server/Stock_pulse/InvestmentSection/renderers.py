@@ -0,0 +1,156 @@
+"""
+Column-oriented renderers for the InvestmentSection time-series views.
+
+The views hand back a dict whose series are NumPy arrays. Each renderer
+encodes those arrays straight from their buffers instead of building one
+Python object per trading day:
+
+- `ColumnarJSONRenderer` (application/json) uses orjson's native NumPy support
+  when it is installed and falls back to the standard library otherwise.
+- `ArrowRenderer` (application/vnd.apache.arrow.stream) writes an Arrow IPC
+  stream; needs `pyarrow`.
+- `MessagePackRenderer` (application/msgpack) writes every array as
+  `{"dtype", "shape", "data"}` with the raw bytes in `data`; needs `msgpack`.
+
+Renderers whose library is missing are simply not offered during content
+negotiation (see `available`).
+"""
+import json
+
+import numpy as np
+from rest_framework.renderers import BaseRenderer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+def _date_strings(values):
+    return np.datetime_as_string(values, unit='D').tolist()
+
+
+def _json_default(obj):
+    if isinstance(obj, np.ndarray):
+        if np.issubdtype(obj.dtype, np.datetime64):
+            return _date_strings(obj)
+        if np.issubdtype(obj.dtype, np.floating):
+            # NaN is not valid JSON, send null like orjson does
+            return np.where(np.isnan(obj), None, obj).tolist()
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _orjson_default(obj):
+    # orjson falls through to here for arrays it can't take as-is
+    if isinstance(obj, np.ndarray) and not obj.flags.c_contiguous:
+        return np.ascontiguousarray(obj)
+    return _json_default(obj)
+
+
+def dumps(data):
+    """Encode a payload of NumPy columns to JSON bytes."""
+    if orjson is not None:
+        if isinstance(data, dict):
+            # orjson would write datetime64 as full timestamps; keep 'YYYY-MM-DD'
+            data = {
+                key: _date_strings(value)
+                if isinstance(value, np.ndarray) and np.issubdtype(value.dtype, np.datetime64) else value
+                for key, value in data.items()
+            }
+        return orjson.dumps(data, default=_orjson_default, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(data, default=_json_default).encode()
+
+
+class ColumnarJSONRenderer(BaseRenderer):
+    media_type = 'application/json'
+    format = 'json'
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return dumps(data)
+
+
+class ArrowRenderer(BaseRenderer):
+    """
+    One Arrow record batch: every 1-D array whose length matches the dates
+    becomes a column, every 2-D array becomes one column per row (`name[i]`),
+    and everything else travels as JSON in the schema metadata.
+    """
+    media_type = 'application/vnd.apache.arrow.stream'
+    format = 'arrow'
+    charset = None
+    render_style = 'binary'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        arrays = [value for value in data.values() if isinstance(value, np.ndarray)] if isinstance(data, dict) else []
+        if not arrays:
+            # Errors and other non-tabular payloads
+            data, length = {'payload': data}, 0
+        else:
+            length = max(array.shape[-1] for array in arrays)
+
+        columns, metadata = {}, {}
+        for name, value in data.items():
+            if isinstance(value, np.ndarray) and value.ndim == 1 and len(value) == length:
+                columns[name] = self._array(value)
+            elif isinstance(value, np.ndarray) and value.ndim == 2 and value.shape[1] == length:
+                for i, row in enumerate(value):
+                    columns[f'{name}[{i}]'] = self._array(row)
+            else:
+                metadata[name] = dumps(value)
+
+        table = pa.table(columns).replace_schema_metadata(metadata)
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes()
+
+    @staticmethod
+    def _array(values):
+        if np.issubdtype(values.dtype, np.datetime64):
+            return pa.array(values.astype('datetime64[D]'), type=pa.date32())
+        return pa.array(values, from_pandas=True)  # NaN -> null
+
+
+class MessagePackRenderer(BaseRenderer):
+    media_type = 'application/msgpack'
+    format = 'msgpack'
+    charset = None
+    render_style = 'binary'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return msgpack.packb(data, default=self._default, use_bin_type=True)
+
+    @staticmethod
+    def _default(obj):
+        if isinstance(obj, np.ndarray):
+            obj = np.ascontiguousarray(obj)
+            return {'dtype': obj.dtype.str, 'shape': list(obj.shape), 'data': obj.tobytes()}
+        if isinstance(obj, np.generic):
+            return obj.item()
+        raise TypeError(f"Object of type {type(obj).__name__} is not MessagePack serializable")
+
+
+def available():
+    """Renderer classes usable in this environment, JSON first (the default)."""
+    renderers = [ColumnarJSONRenderer]
+    if pa is not None:
+        renderers.append(ArrowRenderer)
+    if msgpack is not None:
+        renderers.append(MessagePackRenderer)
+    return renderers
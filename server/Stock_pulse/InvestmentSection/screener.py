@@ -0,0 +1,273 @@
+"""
+In-memory NASDAQ screener table.
+
+The screener CSV written by `Stock_pulse.tasks.download_nasdaq_data` is parsed
+once into typed NumPy columns with the '%'/'$' formatting stripped and the
+sort orders the views need precomputed. The task also publishes those columns
+as a binary `.npz` snapshot next to the CSV; when it exists, readers load it
+instead of parsing the CSV. `get_table` hands out the current table and, at
+most every `settings.SCREENER_RELOAD_INTERVAL` seconds, stats the
+file; when it changed, a new table is built and swapped in with a single
+reference assignment, so readers always see either the old or the new table
+and never a half-built one.
+"""
+import os
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+from django.conf import settings
+
+# CSV column -> (attribute, kind)
+COLUMNS = {
+    'Symbol': ('symbol', 'text'),
+    'Name': ('name', 'text'),
+    'Last Sale': ('last_sale', 'number'),
+    'Net Change': ('net_change', 'number'),
+    '% Change': ('pct_change', 'number'),
+    'Market Cap': ('market_cap', 'number'),
+    'Country': ('country', 'text'),
+    'IPO Year': ('ipo_year', 'number'),
+    'Volume': ('volume', 'number'),
+    'Sector': ('sector', 'text'),
+    'Industry': ('industry', 'text'),
+}
+
+
+# Market cap bands (USD), lower bound inclusive
+MARKET_CAP_BANDS = {
+    'mega': (200e9, np.inf),
+    'large': (10e9, 200e9),
+    'mid': (2e9, 10e9),
+    'small': (300e6, 2e9),
+    'micro': (50e6, 300e6),
+    'nano': (0.0, 50e6),
+}
+
+# Query parameter name -> numeric column that can be range-filtered and sorted on
+RANGE_FIELDS = {
+    'price': 'last_sale',
+    'change': 'pct_change',
+    'net_change': 'net_change',
+    'market_cap': 'market_cap',
+    'volume': 'volume',
+}
+
+
+def _numeric(series):
+    # '$130.69', '-1.759%', '1,234' -> float; blanks become NaN
+    cleaned = series.astype(str).str.replace(r'[$%,]', '', regex=True).str.strip()
+    return pd.to_numeric(cleaned, errors='coerce').to_numpy(dtype=np.float64)
+
+
+def _descending_order(values):
+    """Positions sorted by value, largest first, NaN left out."""
+    valid = np.flatnonzero(~np.isnan(values))
+    return valid[np.argsort(-values[valid], kind='stable')]
+
+
+class ScreenerTable:
+    def __init__(self, columns, source=None, signature=None):
+        self.source = source
+        self.signature = signature
+        for attribute, values in columns.items():
+            setattr(self, attribute, values)
+        self.size = len(self.symbol)
+        self.index = {symbol: position for position, symbol in enumerate(self.symbol)}
+
+        # Sort orders used on every request, computed once per snapshot
+        self.by_pct_change = _descending_order(self.pct_change)
+        self.by_market_cap = _descending_order(self.market_cap)
+
+        # Ascending order and the matching sorted values of every range field,
+        # so a range filter is two binary searches (NaN sorts last and is cut off)
+        self.sorted = {}
+        for column in RANGE_FIELDS.values():
+            values = getattr(self, column)
+            order = np.argsort(values, kind='stable')
+            valid = int(np.count_nonzero(~np.isnan(values)))
+            self.sorted[column] = (order[:valid], values[order[:valid]])
+
+        self._build_bitmaps()
+
+    def _build_bitmaps(self):
+        # Sector: the screener's own column, falling back to the sector index
+        from InvestmentSection import sectors as sector_index
+        index = sector_index.get_index()
+        sectors = np.array([
+            sector if sector and sector != 'nan' else index.lookup(symbol) or ''
+            for symbol, sector in zip(self.symbol, self.sector)
+        ], dtype=object)
+        self.sector_names, self.sector_codes = np.unique(sectors.astype(str), return_inverse=True)
+        self.sector_bitmaps = {
+            name: self.sector_codes == code
+            for code, name in enumerate(self.sector_names.tolist()) if name
+        }
+
+        self.band_bitmaps = {}
+        for band, (low, high) in MARKET_CAP_BANDS.items():
+            with np.errstate(invalid='ignore'):
+                self.band_bitmaps[band] = (self.market_cap >= low) & (self.market_cap < high)
+
+    def _range_mask(self, column, low=None, high=None):
+        order, values = self.sorted[column]
+        lo = 0 if low is None else int(np.searchsorted(values, low, 'left'))
+        hi = len(values) if high is None else int(np.searchsorted(values, high, 'right'))
+        mask = np.zeros(self.size, dtype=bool)
+        mask[order[lo:hi]] = True
+        return mask
+
+    def query(self, sectors=(), bands=(), ranges=None, sort='market_cap', descending=True, offset=0, limit=50):
+        """
+        Filter and page the table. `sectors` and `bands` are OR-ed within
+        themselves, everything else is AND-ed, all as boolean mask operations.
+        `ranges` maps a column to `(low, high)` (either may be None).
+        Returns `(total matches, positions of the requested page)`.
+        """
+        mask = np.ones(self.size, dtype=bool)
+        if sectors:
+            unknown = [sector for sector in sectors if sector not in self.sector_bitmaps]
+            if unknown:
+                raise ValueError(f"Unknown sector(s): {', '.join(unknown)}.")
+            mask &= np.logical_or.reduce([self.sector_bitmaps[sector] for sector in sectors])
+        if bands:
+            unknown = [band for band in bands if band not in self.band_bitmaps]
+            if unknown:
+                raise ValueError(f"Unknown market cap band(s): {', '.join(unknown)}.")
+            mask &= np.logical_or.reduce([self.band_bitmaps[band] for band in bands])
+        for column, (low, high) in (ranges or {}).items():
+            mask &= self._range_mask(column, low, high)
+
+        if sort not in self.sorted:
+            raise ValueError(f"Cannot sort by '{sort}'.")
+        order = self.sorted[sort][0]
+        if descending:
+            order = order[::-1]
+        # Rows without a value for the sort column go last
+        missing = np.flatnonzero(np.isnan(getattr(self, sort)))
+        order = np.concatenate((order, missing))
+
+        matches = order[mask[order]]
+        return len(matches), matches[offset:offset + limit]
+
+    @classmethod
+    def from_frame(cls, df, source=None, signature=None):
+        columns = {}
+        for column, (attribute, kind) in COLUMNS.items():
+            if column not in df:
+                values = pd.Series([None] * len(df))
+            else:
+                values = df[column]
+            if kind == 'number':
+                columns[attribute] = _numeric(values)
+            else:
+                columns[attribute] = values.fillna('').astype(str).str.strip().to_numpy(dtype=object)
+        return cls(columns, source=source, signature=signature)
+
+    @classmethod
+    def from_csv(cls, path):
+        signature = _signature(path)
+        df = pd.read_csv(path, dtype=str, keep_default_na=False)
+        return cls.from_frame(df, source=os.fspath(path), signature=signature)
+
+    @classmethod
+    def from_snapshot(cls, path):
+        signature = _signature(path)
+        columns = {}
+        with np.load(path, allow_pickle=False) as data:
+            for attribute, kind in COLUMNS.values():
+                values = data[attribute]
+                columns[attribute] = values.astype(object) if kind == 'text' else values
+        return cls(columns, source=os.fspath(path), signature=signature)
+
+    def save(self, path):
+        """Write the typed columns as an `.npz` snapshot, atomically."""
+        columns = {}
+        for attribute, kind in COLUMNS.values():
+            values = getattr(self, attribute)
+            # Text as fixed-width unicode so the snapshot loads without pickle
+            columns[attribute] = values.astype(str) if kind == 'text' else values
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'wb') as handle:
+            np.savez(handle, **columns)
+        os.replace(tmp_path, path)
+
+    def records(self, positions, fields=('symbol', 'name', 'pct_change')):
+        """Rows at `positions` as dicts keyed by the original CSV column names."""
+        names = {attribute: column for column, (attribute, _) in COLUMNS.items()}
+        rows = []
+        for position in positions:
+            row = {}
+            for field in fields:
+                value = getattr(self, field)[position]
+                if isinstance(value, np.generic):
+                    value = value.item()
+                    value = None if value != value else value  # NaN -> null
+                row[names[field]] = value
+            rows.append(row)
+        return rows
+
+    def top_gainers(self, n):
+        return self.by_pct_change[:n]
+
+    def top_losers(self, n):
+        return self.by_pct_change[::-1][:n]
+
+
+def _signature(path):
+    stat = os.stat(path)
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+_table = None
+_checked_at = 0.0
+_reload_lock = threading.Lock()
+
+
+def load(path):
+    path = os.fspath(path)
+    if path.endswith('.npz'):
+        return ScreenerTable.from_snapshot(path)
+    return ScreenerTable.from_csv(path)
+
+
+def write_snapshot(csv_path=None, snapshot_path=None):
+    """Parse the screener CSV once and publish it as the binary snapshot."""
+    table = ScreenerTable.from_csv(csv_path or settings.SCREENER_CSV_PATH)
+    table.save(snapshot_path or settings.SCREENER_SNAPSHOT_PATH)
+    return table
+
+
+def _default_path():
+    snapshot = os.fspath(settings.SCREENER_SNAPSHOT_PATH)
+    return snapshot if os.path.exists(snapshot) else os.fspath(settings.SCREENER_CSV_PATH)
+
+
+def get_table(path=None):
+    """
+    The current screener table, reloaded when the screener file has changed.
+    Reads the binary snapshot when there is one, else the CSV.
+    Raises FileNotFoundError if there is neither.
+    """
+    global _table, _checked_at
+    table = _table
+    if path is None and table is not None and time.monotonic() - _checked_at < settings.SCREENER_RELOAD_INTERVAL:
+        return table
+
+    with _reload_lock:
+        path = os.fspath(path or _default_path())
+        table = _table
+        if table is not None and table.source == path and time.monotonic() - _checked_at < settings.SCREENER_RELOAD_INTERVAL:
+            return table  # another thread just checked
+        try:
+            changed = table is None or table.source != path or _signature(path) != table.signature
+        except FileNotFoundError:
+            if table is None or table.source != path:
+                raise
+            changed = False  # keep serving the last good snapshot
+        if changed:
+            table = load(path)
+            _table = table
+        _checked_at = time.monotonic()
+    return table
@@ -0,0 +1,183 @@
+"""
+Daily history of the NASDAQ screener.
+
+Every screener download is also recorded as an immutable version under
+`settings.SCREENER_HISTORY_DIR`:
+
+    symbols.txt               interned symbols, one per line; the line number is the id
+    versions/YYYY-MM-DD.npz   compressed columns of that day: `id` plus the numeric fields
+    manifest.json             the versions recorded so far, oldest first
+
+Symbols are stored once as ids and the numeric columns as float32, so a day of
+~7000 listings is around 100 KB. Queries pull only the columns they need out
+of the versions they touch (each column is its own member of the `.npz`) and
+align the days on the symbol ids.
+"""
+import functools
+import json
+import os
+from datetime import date
+
+import numpy as np
+from django.conf import settings
+
+from InvestmentSection.price_store import file_lock
+
+SYMBOLS_FILE = 'symbols.txt'
+MANIFEST_FILE = 'manifest.json'
+VERSIONS_DIR = 'versions'
+
+# Screener attribute -> stored dtype
+FIELDS = {
+    'last_sale': np.float32,
+    'net_change': np.float32,
+    'pct_change': np.float32,
+    'market_cap': np.float32,
+    'volume': np.float32,
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _read_column(path, name):
+    # Versions never change once written, so a column can be cached by path
+    with np.load(path, allow_pickle=False) as data:
+        return data[name]
+
+
+class ScreenerHistory:
+    def __init__(self, root):
+        self.root = os.fspath(root)
+        self._symbols = None
+        self._symbols_size = -1
+
+    def _path(self, *parts):
+        return os.path.join(self.root, *parts)
+
+    def manifest(self):
+        try:
+            with open(self._path(MANIFEST_FILE)) as handle:
+                return json.load(handle)
+        except FileNotFoundError:
+            return {'versions': []}
+
+    def _write_manifest(self, manifest):
+        path = self._path(MANIFEST_FILE)
+        with open(f'{path}.tmp', 'w') as handle:
+            json.dump(manifest, handle, indent=1)
+        os.replace(f'{path}.tmp', path)
+
+    def versions(self):
+        return [entry['date'] for entry in self.manifest()['versions']]
+
+    def symbols(self):
+        """All interned symbols as an array indexed by id."""
+        path = self._path(SYMBOLS_FILE)
+        try:
+            size = os.path.getsize(path)
+        except FileNotFoundError:
+            return np.empty(0, dtype=object)
+        # The file only ever grows, so its size tells whether it changed
+        if size != self._symbols_size:
+            with open(path) as handle:
+                self._symbols = np.array(handle.read().splitlines(), dtype=object)
+            self._symbols_size = size
+        return self._symbols
+
+    def record(self, table, day=None):
+        """
+        Store `table` (a `screener.ScreenerTable`) as the version of `day`
+        (default today). Versions are immutable: recording a day twice keeps
+        the first one. Returns the manifest entry.
+        """
+        day = (day or date.today()).isoformat()
+        with file_lock(self.root):
+            manifest = self.manifest()
+            for entry in manifest['versions']:
+                if entry['date'] == day:
+                    return entry
+
+            known = self.symbols()
+            ids = {symbol: position for position, symbol in enumerate(known)}
+            new = [symbol for symbol in dict.fromkeys(table.symbol) if symbol not in ids]
+            if new:
+                with open(self._path(SYMBOLS_FILE), 'a') as handle:
+                    handle.write(''.join(f'{symbol}\n' for symbol in new))
+                ids.update((symbol, len(known) + offset) for offset, symbol in enumerate(new))
+
+            # Duplicate symbols in a download keep their first row
+            _, rows = np.unique(table.symbol.astype(str), return_index=True)
+            columns = {'id': np.array([ids[symbol] for symbol in table.symbol[rows]], dtype=np.uint32)}
+            for field, dtype in FIELDS.items():
+                columns[field] = getattr(table, field)[rows].astype(dtype)
+
+            os.makedirs(self._path(VERSIONS_DIR), exist_ok=True)
+            path = self._path(VERSIONS_DIR, f'{day}.npz')
+            with open(f'{path}.tmp', 'wb') as handle:
+                np.savez_compressed(handle, **columns)
+            os.replace(f'{path}.tmp', path)
+
+            entry = {'date': day, 'rows': len(rows), 'bytes': os.path.getsize(path)}
+            manifest['versions'] = sorted(manifest['versions'] + [entry], key=lambda item: item['date'])
+            manifest['symbols'] = len(ids)
+            self._write_manifest(manifest)
+        return entry
+
+    def column(self, day, name):
+        """`(ids, values)` of one field on one day."""
+        path = self._path(VERSIONS_DIR, f'{day}.npz')
+        return _read_column(path, 'id'), _read_column(path, name)
+
+    def dense(self, day, name, size):
+        """One field on one day as an array indexed by symbol id (NaN where unlisted)."""
+        ids, values = self.column(day, name)
+        out = np.full(size, np.nan)
+        out[ids] = values
+        return out
+
+    def _latest(self, count):
+        versions = self.versions()
+        if len(versions) < count:
+            raise ValueError(f"Need {count} daily snapshots, only {len(versions)} recorded.")
+        return versions
+
+    def change_over(self, days, limit=20, descending=True):
+        """
+        % change of the last sale over the last `days` recorded snapshots.
+        Returns `(from, to, [(symbol, change), ...])`, biggest gainers first
+        (or losers with `descending=False`).
+        """
+        versions = self._latest(days + 1)
+        start, end = versions[-1 - days], versions[-1]
+        symbols = self.symbols()
+        before = self.dense(start, 'last_sale', len(symbols))
+        after = self.dense(end, 'last_sale', len(symbols))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            change = (after / before - 1.0) * 100.0
+        change[~np.isfinite(change)] = np.nan
+
+        valid = np.flatnonzero(~np.isnan(change))
+        order = valid[np.argsort(-change[valid] if descending else change[valid], kind='stable')][:limit]
+        return start, end, [(symbols[i], float(change[i])) for i in order]
+
+    def _top(self, day, n, descending):
+        ids, values = self.column(day, 'pct_change')
+        valid = np.flatnonzero(~np.isnan(values))
+        order = valid[np.argsort(-values[valid] if descending else values[valid], kind='stable')][:n]
+        return ids[order], values[order]
+
+    def new_entrants(self, n=20, lookback=1, descending=True):
+        """
+        Symbols in today's top `n` movers (by daily % change; gainers, or
+        losers with `descending=False`) that were in none of the previous
+        `lookback` days' top `n`. Returns `(day, [(symbol, pct_change), ...])`.
+        """
+        versions = self._latest(lookback + 1)
+        ids, values = self._top(versions[-1], n, descending)
+        previous = [self._top(day, n, descending)[0] for day in versions[-1 - lookback:-1]]
+        fresh = ~np.isin(ids, np.concatenate(previous))
+        symbols = self.symbols()
+        return versions[-1], [(symbols[i], float(value)) for i, value in zip(ids[fresh], values[fresh])]
+
+
+def get_history():
+    return ScreenerHistory(settings.SCREENER_HISTORY_DIR)
@@ -0,0 +1,156 @@
+"""
+Symbol -> sector lookup.
+
+The mapping lives in a generated data file, not in code: an `.npz` holding
+the sorted symbols, one small integer code per symbol and the list of sector
+names the codes point into. Nothing is read at import time; `get_index` loads
+the file on first use, keeps it for the life of the process and, at most every
+`settings.SECTOR_INDEX_RELOAD_INTERVAL` seconds, checks whether it has been
+regenerated. `Stock_pulse.tasks.download_nasdaq_data` regenerates it from
+every screener download into `settings.SECTOR_INDEX_PATH`; until then the
+read-only seed shipped with the app (`settings.SECTOR_INDEX_SEED_PATH`) is used.
+"""
+import os
+import threading
+import time
+
+import numpy as np
+from django.conf import settings
+
+# Code of symbols without a known sector; names[0] is always ''
+UNKNOWN = 0
+
+
+class SectorIndex:
+    def __init__(self, symbols, codes, names, signature=None):
+        self.symbols = symbols  # sorted unicode array
+        self.codes = codes  # uint8, one per symbol
+        self.names = names  # unicode array, names[UNKNOWN] == ''
+        self.signature = signature
+
+    def __len__(self):
+        return len(self.symbols)
+
+    def lookup(self, symbol):
+        """Sector name of `symbol`, or None if it is not known."""
+        position = int(np.searchsorted(self.symbols, symbol))
+        if position < len(self.symbols) and self.symbols[position] == symbol:
+            code = self.codes[position]
+            return str(self.names[code]) if code != UNKNOWN else None
+        return None
+
+    def codes_for(self, symbols):
+        """Sector codes of many symbols at once (UNKNOWN where not known)."""
+        symbols = np.asarray(symbols, dtype=str)
+        if not len(self.symbols):
+            return np.full(len(symbols), UNKNOWN, dtype=np.uint8)
+        positions = np.searchsorted(self.symbols, symbols)
+        positions[positions == len(self.symbols)] = 0
+        found = self.symbols[positions] == symbols
+        return np.where(found, self.codes[positions], UNKNOWN).astype(np.uint8)
+
+    def lookup_many(self, symbols):
+        """`{symbol: sector name or None}` for many symbols in one pass."""
+        codes = self.codes_for(symbols)
+        return {
+            symbol: str(self.names[code]) if code != UNKNOWN else None
+            for symbol, code in zip(symbols, codes.tolist())
+        }
+
+    def exposure(self, symbols, amounts):
+        """
+        Total of `amounts` per sector, largest first, as
+        `[(sector name or None, amount, weight), ...]`.
+        """
+        amounts = np.asarray(amounts, dtype=np.float64)
+        totals = np.bincount(self.codes_for(symbols), weights=amounts, minlength=len(self.names))
+        grand_total = amounts.sum()
+        rows = []
+        for code in np.argsort(-totals, kind='stable'):
+            if totals[code] > 0:
+                name = str(self.names[code]) if code != UNKNOWN else None
+                rows.append((name, float(totals[code]), float(totals[code] / grand_total)))
+        return rows
+
+    def to_dict(self):
+        return {
+            str(symbol): str(self.names[code])
+            for symbol, code in zip(self.symbols, self.codes) if code != UNKNOWN
+        }
+
+    @classmethod
+    def from_mapping(cls, mapping):
+        """Build from a `{symbol: sector}` dict; blank and 'nan' sectors are left out."""
+        items = sorted(
+            (str(symbol).strip(), str(sector).strip())
+            for symbol, sector in mapping.items()
+            if symbol and sector and str(sector).strip() not in ('', 'nan')
+        )
+        names = [''] + sorted({sector for _, sector in items})
+        code_of = {name: code for code, name in enumerate(names)}
+        symbols = np.array([symbol for symbol, _ in items], dtype=str)
+        codes = np.array([code_of[sector] for _, sector in items], dtype=np.uint8)
+        return cls(symbols, codes, np.array(names, dtype=str))
+
+    @classmethod
+    def load(cls, path):
+        path = os.fspath(path)
+        stat = os.stat(path)
+        with np.load(path, allow_pickle=False) as data:
+            return cls(data['symbols'], data['codes'], data['names'], signature=(path, stat.st_mtime_ns))
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'wb') as handle:
+            np.savez_compressed(handle, symbols=self.symbols, codes=self.codes, names=self.names)
+        os.replace(tmp_path, path)
+
+
+_index = None
+_checked_at = 0.0
+_index_lock = threading.Lock()
+
+
+def _path():
+    path = os.fspath(settings.SECTOR_INDEX_PATH)
+    return path if os.path.exists(path) else os.fspath(settings.SECTOR_INDEX_SEED_PATH)
+
+
+def get_index():
+    """The symbol -> sector index, loaded on first use and reloaded when regenerated."""
+    global _index, _checked_at
+    index = _index
+    if index is not None and time.monotonic() - _checked_at < settings.SECTOR_INDEX_RELOAD_INTERVAL:
+        return index
+    with _index_lock:
+        if _index is not None and time.monotonic() - _checked_at < settings.SECTOR_INDEX_RELOAD_INTERVAL:
+            return _index  # another thread just checked
+        path = _path()
+        if _index is None or (path, os.stat(path).st_mtime_ns) != _index.signature:
+            _index = SectorIndex.load(path)
+        _checked_at = time.monotonic()
+        return _index
+
+
+def lookup(symbol):
+    return get_index().lookup(symbol)
+
+
+def regenerate(table, path=None):
+    """
+    Rebuild the index from a screener table (`screener.ScreenerTable`) and
+    write it to `path` (default `settings.SECTOR_INDEX_PATH`, never the seed).
+    Sectors from the screener win; symbols the screener leaves blank or no
+    longer lists keep their previous sector.
+    """
+    path = path or settings.SECTOR_INDEX_PATH
+    previous = path if os.path.exists(path) else settings.SECTOR_INDEX_SEED_PATH
+    mapping = SectorIndex.load(previous).to_dict() if os.path.exists(previous) else {}
+    mapping.update(
+        (symbol, sector) for symbol, sector in zip(table.symbol, table.sector)
+        if sector and sector != 'nan'
+    )
+    index = SectorIndex.from_mapping(mapping)
+    index.save(path)
+    return index
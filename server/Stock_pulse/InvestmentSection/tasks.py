@@ -0,0 +1,98 @@
+import os
+import time
+from collections import defaultdict
+from datetime import date
+
+from celery import shared_task
+from celery.utils.log import get_task_logger
+from django.conf import settings
+
+from InvestmentSection import backtest, backtest_cache, price_store, renderers
+
+logger = get_task_logger(__name__)
+
+
+@shared_task
+def refresh_saved_backtests(end_date=None):
+    """Extend the stored backtest of every user's saved portfolio by the new days."""
+    from NewsSection.models import Portfolio
+
+    end_date = end_date or date.today().isoformat()
+    holdings = defaultdict(list)
+    rows = Portfolio.objects.order_by('user_id', 'ticker_name').values_list('user_id', 'ticker_name', 'investment_amount')
+    for user_id, ticker, amount in rows:
+        holdings[user_id].append((ticker, amount))
+
+    cache = backtest_cache.get_cache()
+    refreshed = 0
+    for user_id, positions in holdings.items():
+        tickers = [ticker for ticker, _ in positions]
+        try:
+            weights, _ = backtest.normalize_amounts([[amount for _, amount in positions]])
+            cache.extend(tickers, weights[:, 0], settings.PRICE_HISTORY_START, end_date)
+            refreshed += 1
+        except Exception as e:
+            logger.warning("Could not refresh backtest for user %s: %s", user_id, e)
+
+    logger.info("Refreshed %d saved portfolio backtests", refreshed)
+    return refreshed
+
+
+def job_result_path(job_id):
+    return os.path.join(settings.BACKTEST_JOB_DIR, f'{job_id}.json')
+
+
+@shared_task(bind=True)
+def run_backtest_job(self, tickers, amounts, end_date=None):
+    """
+    Backtest one or more allocations of `tickers` off the request thread.
+
+    Progress is published through the task state ('PROGRESS' with a stage and
+    done/total counters). The full result is written to a JSON file under
+    `settings.BACKTEST_JOB_DIR`; only its path and size go to the result backend.
+    """
+    start_date = settings.PRICE_HISTORY_START
+    end_date = end_date or date.today().isoformat()
+    weights, totals = backtest.normalize_amounts(amounts)
+
+    # Fill the price store in small groups so progress moves while downloading
+    store = price_store.get_store()
+    unique = list(dict.fromkeys(tickers))
+    step = settings.BACKTEST_JOB_PROGRESS_CHUNK
+    for done in range(0, len(unique), step):
+        self.update_state(state='PROGRESS', meta={'stage': 'loading prices', 'done': done, 'total': len(unique)})
+        store.refresh(unique[done:done + step], start_date, end_date)
+
+    self.update_state(state='PROGRESS', meta={'stage': 'computing', 'done': len(unique), 'total': len(unique)})
+    data = price_store.load_field(tickers, start_date, end_date, 'Adj Close')
+    result = backtest.batch_payload(data, tickers, weights, totals)
+
+    self.update_state(state='PROGRESS', meta={'stage': 'writing result', 'done': len(unique), 'total': len(unique)})
+    os.makedirs(settings.BACKTEST_JOB_DIR, exist_ok=True)
+    path = job_result_path(self.request.id)
+    with open(f'{path}.tmp', 'wb') as handle:
+        handle.write(renderers.dumps(result))
+    os.replace(f'{path}.tmp', path)
+    return {'path': path, 'bytes': os.path.getsize(path)}
+
+
+@shared_task
+def purge_backtest_jobs(max_age=None):
+    """Delete job result files older than `settings.BACKTEST_JOB_RESULT_TTL` seconds."""
+    max_age = max_age or settings.BACKTEST_JOB_RESULT_TTL
+    cutoff = time.time() - max_age
+    removed = 0
+    try:
+        names = os.listdir(settings.BACKTEST_JOB_DIR)
+    except FileNotFoundError:
+        return 0
+    for name in names:
+        path = os.path.join(settings.BACKTEST_JOB_DIR, name)
+        try:
+            if os.path.getmtime(path) < cutoff:
+                os.remove(path)
+                removed += 1
+        except FileNotFoundError:
+            continue
+    logger.info("Removed %d expired backtest job results", removed)
+    return removed
@@ -1,3 +1,593 @@
-from django.test import TestCase
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent import futures
+from datetime import date, timedelta
+from unittest import mock
 
-# Create your tests here.
+import numpy as np
+import pandas as pd
+from django.conf import settings
+from django.test import RequestFactory, SimpleTestCase
+
+from InvestmentSection import (
+    autocomplete, backtest_cache, downsample, indicator_state, indicators, market_data, price_store, screener,
+    screener_history, sectors,
+)
+
+# Imports the views the way a worker does on startup and reports whether the
+# sector index got loaded along the way
+IMPORT_CHECK = """
+import django
+django.setup()
+import InvestmentSection.views
+from InvestmentSection import sectors
+print(sectors._index is None)
+"""
+
+
+class SectorIndexTests(SimpleTestCase):
+    def test_importing_views_does_not_load_sectors(self):
+        env = dict(os.environ, DJANGO_SETTINGS_MODULE='Stock_pulse.settings')
+        result = subprocess.run(
+            [sys.executable, '-c', IMPORT_CHECK],
+            cwd=settings.BASE_DIR, env=env, capture_output=True, text=True, check=True,
+        )
+        self.assertEqual(result.stdout.strip(), 'True')
+
+    def test_views_module_stays_small(self):
+        # The symbol -> sector mapping belongs in the generated data file
+        from InvestmentSection import views
+        self.assertFalse(hasattr(views, 'Sector'))
+        self.assertLess(os.path.getsize(views.__file__), 100_000)
+
+    def test_lookup(self):
+        self.assertEqual(sectors.lookup('AAPL'), 'Technology')
+        self.assertIsNone(sectors.lookup('AAM'))  # no sector in the screener
+        self.assertIsNone(sectors.lookup('NOT-A-SYMBOL'))
+
+    def test_get_sector_view(self):
+        from InvestmentSection.views import get_sector
+        request = RequestFactory().get('/sector/aapl/')
+        self.assertEqual(get_sector(request, 'aapl').content, b'"Technology"')
+        self.assertEqual(get_sector(request, 'NOT-A-SYMBOL').status_code, 404)
+
+    def test_lookup_many(self):
+        self.assertEqual(
+            sectors.get_index().lookup_many(['AAPL', 'ZYXI', 'NOT-A-SYMBOL']),
+            {'AAPL': 'Technology', 'ZYXI': 'Health Care', 'NOT-A-SYMBOL': None},
+        )
+
+    def test_exposure(self):
+        rows = sectors.get_index().exposure(['AAPL', 'MSFT', 'ZYXI', 'NOT-A-SYMBOL'], [300, 300, 300, 100])
+        self.assertEqual(rows, [('Technology', 600.0, 0.6), ('Health Care', 300.0, 0.3), (None, 100.0, 0.1)])
+
+    def test_regenerate_leaves_the_seed_alone(self):
+        seed = os.fspath(settings.SECTOR_INDEX_SEED_PATH)
+        seed_mtime = os.stat(seed).st_mtime_ns
+        table = mock.Mock(symbol=['AAPL', 'ZZZZ'], sector=['Energy', 'Utilities'])
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'data', 'sectors.npz')
+            with self.settings(SECTOR_INDEX_PATH=path, SECTOR_INDEX_RELOAD_INTERVAL=0), \
+                    mock.patch.object(sectors, '_index', None):
+                self.assertEqual(sectors.lookup('AAPL'), 'Technology')  # from the seed
+                sectors.regenerate(table)
+                self.assertEqual(sectors.lookup('AAPL'), 'Energy')
+                self.assertEqual(sectors.lookup('ZYXI'), 'Health Care')  # kept from the seed
+        self.assertEqual(os.stat(seed).st_mtime_ns, seed_mtime)
+
+
+class MarketDataFetcherTests(SimpleTestCase):
+    def setUp(self):
+        self.calls = []
+        self.fetcher = market_data.MarketDataFetcher(batch_window=0.1)
+        patch = mock.patch.object(market_data, '_download_bars', side_effect=self.download)
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def download(self, tickers, start, end):
+        self.calls.append(sorted(tickers))
+        time.sleep(0.2)
+        return {ticker: pd.DataFrame({'Close': [1.0]}) for ticker in tickers if ticker != 'NONE'}
+
+    def fetch_concurrently(self, requests):
+        results = [None] * len(requests)
+
+        def fetch(position, tickers):
+            results[position] = self.fetcher.fetch(tickers, '2024-01-01', '2024-02-01')
+
+        threads = [threading.Thread(target=fetch, args=(i, tickers)) for i, tickers in enumerate(requests)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_concurrent_requests_share_one_download(self):
+        results = self.fetch_concurrently([['AAA']] * 20)
+        self.assertEqual(self.calls, [['AAA']])
+        self.assertEqual(self.fetcher.upstream_calls, 1)
+        self.assertTrue(all(result['AAA'] is results[0]['AAA'] for result in results))
+
+    def test_requests_in_the_batch_window_are_merged(self):
+        results = self.fetch_concurrently([['AAA'], ['BBB'], ['AAA', 'CCC']])
+        self.assertEqual(self.calls, [['AAA', 'BBB', 'CCC']])
+        self.assertEqual([sorted(result) for result in results], [['AAA'], ['BBB'], ['AAA', 'CCC']])
+
+    def test_empty_results_are_cached(self):
+        self.assertEqual(self.fetcher.fetch(['NONE'], '2024-01-01', '2024-02-01'), {})
+        self.assertEqual(self.fetcher.fetch(['NONE'], '2024-01-01', '2024-02-01'), {})
+        self.assertEqual(self.fetcher.upstream_calls, 1)
+
+    def test_wait_timeout_is_configurable(self):
+        self.fetcher.timeout = 0.05
+        errors = []
+
+        def join():
+            time.sleep(0.02)  # once the lead has opened the batch
+            try:
+                self.fetcher.fetch(['AAA'], '2024-01-01', '2024-02-01')
+            except futures.TimeoutError as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=join)
+        thread.start()
+        self.assertIn('AAA', self.fetcher.fetch(['AAA'], '2024-01-01', '2024-02-01'))
+        thread.join()
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(self.fetcher.upstream_calls, 1)
+
+
+def _flat_bars(tickers, start, end, price):
+    index = pd.bdate_range(start, pd.Timestamp(end) - pd.Timedelta(days=1))
+    bars = pd.DataFrame({column: price for column in price_store.COLUMNS}, index=index)
+    return {ticker: bars for ticker in tickers}
+
+
+def _wavy_bars(tickers, start, end):
+    # Deterministic per-ticker prices, so overlapping downloads agree
+    index = pd.bdate_range(start, pd.Timestamp(end) - pd.Timedelta(days=1))
+    days = index.values.astype('datetime64[D]').astype(np.int64)
+    bars = {}
+    for ticker in tickers:
+        price = 100 + 10 * np.sin(days / 3 + ord(ticker[0]))
+        bars[ticker] = pd.DataFrame({column: price for column in price_store.COLUMNS}, index=index)
+    return bars
+
+
+class PriceStoreTests(SimpleTestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.store = price_store.PriceStore(directory.name)
+        self.start = date.today() - timedelta(days=30)
+
+    def refresh(self, end, price, start=None):
+        download = lambda tickers, start, end: _flat_bars(tickers, start, end, price)
+        with mock.patch.object(price_store.market_data, 'download_bars', side_effect=download):
+            self.store.refresh(['AAA'], start or self.start, end)
+
+    def test_update_appends_new_days_only(self):
+        self.refresh(date.today() - timedelta(days=10), 400.0)
+        before = len(self.store.read('AAA'))
+        self.refresh(date.today(), 400.0)
+        self.assertGreater(len(self.store.read('AAA')), before)
+        self.assertEqual(self.store.generation('AAA'), 1)
+
+    def test_rebased_history_is_rewritten(self):
+        self.refresh(date.today() - timedelta(days=10), 400.0)
+        # A 4:1 split re-bases every past close upstream
+        self.refresh(date.today(), 100.0)
+        closes = self.store.read('AAA')['Adj Close'].to_numpy()
+        np.testing.assert_array_equal(closes, np.full(len(closes), 100.0))
+        self.assertEqual(self.store.generation('AAA'), 2)
+
+    def test_earlier_start_merges_without_new_generation(self):
+        self.refresh(date.today(), 400.0)
+        before = self.store.read('AAA')
+        self.refresh(date.today(), 400.0, start=self.start - timedelta(days=30))
+        after = self.store.read('AAA')
+        self.assertGreater(len(after), len(before))
+        pd.testing.assert_frame_equal(after.loc[before.index[0]:], before)
+        self.assertTrue(after.index.is_monotonic_increasing)
+        self.assertEqual(self.store.generation('AAA'), 1)
+
+    def test_empty_download_keeps_history(self):
+        self.refresh(date.today() - timedelta(days=10), 400.0)
+        before, meta = self.store.read('AAA'), self.store.meta('AAA')
+        with mock.patch.object(price_store.market_data, 'download_bars', return_value={}):
+            self.store.refresh(['AAA'], self.start - timedelta(days=30), date.today())
+        pd.testing.assert_frame_equal(self.store.read('AAA'), before)
+        self.assertEqual(self.store.meta('AAA'), meta)
+        # Nothing was marked as checked, so the next request fetches again
+        self.refresh(date.today(), 400.0)
+        self.assertGreater(len(self.store.read('AAA')), len(before))
+
+
+class BacktestCacheTests(SimpleTestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        store = price_store.PriceStore(os.path.join(directory.name, 'prices'))
+        self.cache = backtest_cache.BacktestCache(os.path.join(directory.name, 'backtests'), max_entries=2)
+        self.start = date.today() - timedelta(days=60)
+        for patch in (
+            mock.patch.object(price_store, '_default_store', store),
+            mock.patch.object(price_store.market_data, 'download_bars', side_effect=_wavy_bars),
+        ):
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def test_key_ignores_ticker_order_and_case(self):
+        key = backtest_cache.BacktestCache.key
+        self.assertEqual(key(['AAA', 'bbb'], [0.25, 0.75], self.start), key(['BBB', 'AAA'], [0.75, 0.25], self.start))
+        self.assertEqual(key(['AAA', 'BBB', 'AAA'], [0.25, 0.5, 0.25], self.start), key(['AAA', 'BBB'], [0.5, 0.5], self.start))
+
+    def test_extended_result_matches_full_run(self):
+        middle, end = date.today() - timedelta(days=20), date.today()
+        key = self.cache.extend(['AAA', 'BBB'], [0.4, 0.6], self.start, middle)
+        self.cache.extend(['AAA', 'BBB'], [0.4, 0.6], self.start, end)
+        extended = self.cache.read(key)
+
+        full_cache = backtest_cache.BacktestCache(os.path.join(os.path.dirname(self.cache.root), 'full'))
+        full = full_cache.read(full_cache.extend(['BBB', 'AAA'], [0.6, 0.4], self.start, end))
+        np.testing.assert_array_equal(extended[0], full[0])
+        np.testing.assert_allclose(extended[1], full[1])
+        np.testing.assert_allclose(extended[2], full[2])
+
+    def test_split_recomputes_the_result(self):
+        key = self.cache.extend(['AAA'], [1.0], self.start, date.today() - timedelta(days=20))
+        split = lambda tickers, start, end: {
+            ticker: bars / 4 for ticker, bars in _wavy_bars(tickers, start, end).items()
+        }
+        with mock.patch.object(price_store.market_data, 'download_bars', side_effect=split):
+            self.cache.extend(['AAA'], [1.0], self.start, date.today())
+        _, daily, _ = self.cache.read(key)
+        self.assertGreater(daily.min(), -0.5)
+
+    def test_read_waits_for_a_reset(self):
+        key = self.cache.extend(['AAA'], [1.0], self.start, date.today())
+        expected = self.cache.read(key)
+        reset = threading.Event()
+
+        def recompute():
+            with price_store.file_lock(os.path.join(self.cache.root, key)):
+                self.cache._reset(key)
+                reset.set()
+                time.sleep(0.2)
+                self.cache._append(key, price_store.index_days(expected[0]), expected[1], expected[2])
+
+        thread = threading.Thread(target=recompute)
+        thread.start()
+        reset.wait()
+        dates, daily, cumulative = self.cache.read(key)
+        thread.join()
+        np.testing.assert_array_equal(dates, expected[0])
+        np.testing.assert_array_equal(cumulative, expected[2])
+
+    def test_least_recently_used_results_are_evicted(self):
+        keys = [self.cache.extend(['AAA', 'BBB'], [weight, 1 - weight], self.start, date.today()) for weight in (0.1, 0.2)]
+        os.utime(self.cache._path(keys[0], backtest_cache.STATE_FILE), (0, 0))
+        self.cache.extend(['AAA', 'BBB'], [0.3, 0.7], self.start, date.today())
+        self.assertEqual(self.cache.state(keys[0]), {})
+        self.assertNotEqual(self.cache.state(keys[1]), {})
+
+
+class IndicatorSpecTests(SimpleTestCase):
+    def test_parse_spec(self):
+        self.assertEqual(indicators.parse_spec('MACD:12:26:9'), ('macd', ['12', '26', '9']))
+        self.assertEqual(indicators.parse_spec('bbands:20:2.5'), ('bbands', ['20', '2.5']))
+
+    def test_invalid_specs(self):
+        for spec in ('sma:2.5', 'sma:10:3', 'rsi:0', 'ema:abc', 'vwap'):
+            with self.subTest(spec=spec), self.assertRaises(ValueError):
+                indicators.parse_spec(spec)
+
+
+class PortfolioPerformanceViewTests(SimpleTestCase):
+    def get(self, params):
+        from InvestmentSection.views import PortfolioPerformanceView
+        return PortfolioPerformanceView.as_view()(RequestFactory().get('/backtesting/', params))
+
+    def test_invalid_amounts_and_dates(self):
+        for params in (
+            {'companies': ['AAA', 'BBB'], 'amounts': ['0', '0']},
+            {'companies': ['AAA'], 'amounts': ['lots']},
+            {'companies': ['AAA'], 'amounts': ['-5']},
+            {'companies': ['AAA'], 'amounts': ['100'], 'end_date': 'yesterday-ish'},
+        ):
+            response = self.get(params)
+            self.assertEqual(response.status_code, 400, params)
+            self.assertIn('error', response.data)
+
+
+class MovingAveragesViewTests(SimpleTestCase):
+    def get(self, params):
+        # The route has no path converters, so everything comes in the query string
+        from InvestmentSection.views import MovingAveragesView
+        return MovingAveragesView.as_view()(RequestFactory().get('/Movingaverages/', params))
+
+    def test_reads_the_query_string(self):
+        start = date.today() - timedelta(days=40)
+        with tempfile.TemporaryDirectory() as root, \
+                mock.patch.object(price_store, '_default_store', price_store.PriceStore(root)), \
+                mock.patch.object(price_store.market_data, 'download_bars', side_effect=_wavy_bars):
+            response = self.get({
+                'ticker': 'AAA', 'start_date': str(start), 'end_date': str(date.today()), 'indicators': 'rsi:5',
+            })
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('rsi:5', response.data)
+
+    def test_missing_parameters(self):
+        self.assertEqual(self.get({'ticker': 'AAA'}).status_code, 400)
+
+
+class BatchIndicatorsViewTests(SimpleTestCase):
+    def post(self, body):
+        from rest_framework.test import APIRequestFactory
+        from InvestmentSection.views import BatchIndicatorsView
+        request = APIRequestFactory().post('/batch-indicators/', body, format='json')
+        return BatchIndicatorsView.as_view()(request)
+
+    def test_rejects_non_list_payloads(self):
+        self.assertEqual(self.post({'tickers': 'AAPL'}).status_code, 400)
+        self.assertEqual(self.post({'tickers': ['AAPL', 7]}).status_code, 400)
+        self.assertEqual(self.post({'tickers': ['AAPL'], 'indicators': ['sma:10', 5]}).status_code, 400)
+
+    def test_small_batches_skip_the_pool(self):
+        start = date.today() - timedelta(days=40)
+        with tempfile.TemporaryDirectory() as root, \
+                mock.patch.object(price_store, '_default_store', price_store.PriceStore(root)), \
+                mock.patch.object(price_store.market_data, 'download_bars', side_effect=_wavy_bars), \
+                mock.patch('InvestmentSection.batch_indicators.get_pool') as get_pool:
+            response = self.post({'tickers': ['AAA', 'BBB'], 'indicators': ['sma:5'], 'start_date': str(start)})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['sma:5'].shape[0], 2)
+        get_pool.assert_not_called()
+
+
+def _random_bars(days=300, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, days)))
+    spread = close * rng.uniform(0.005, 0.03, days)
+    return pd.DataFrame(
+        {'Open': close, 'High': close + spread, 'Low': close - spread, 'Close': close, 'Adj Close': close, 'Volume': 1.0},
+        index=pd.bdate_range('2020-01-01', periods=days),
+    )
+
+
+class IndicatorStateTests(SimpleTestCase):
+    SPECS = ['sma:10', 'ema:10', 'rsi:14', 'macd:12:26:9', 'bbands:20:2', 'atr:14']
+
+    def assertMatchesEngine(self, bars, specs):
+        states = {spec: indicator_state.make_state(spec) for spec in specs}
+        incremental = {}
+        for bar in bars.to_dict(orient='records'):
+            for spec, state in states.items():
+                for key, value in indicator_state.flatten(spec, state.update(bar)).items():
+                    incremental.setdefault(key, []).append(value)
+
+        expected = indicators.compute(bars, specs)
+        self.assertEqual(set(incremental), set(expected))
+        for key, values in expected.items():
+            np.testing.assert_allclose(incremental[key], values, rtol=1e-9, equal_nan=True, err_msg=key)
+
+    def test_states_match_engine(self):
+        self.assertMatchesEngine(_random_bars(), self.SPECS)
+
+    def test_window_states_match_engine_around_missing_bars(self):
+        bars = _random_bars()
+        bars.iloc[100, bars.columns.get_loc('Adj Close')] = np.nan
+        self.assertMatchesEngine(bars, ['sma:10', 'bbands:20:2'])
+
+    def test_serialized_states_resume(self):
+        bars = _random_bars().to_dict(orient='records')
+        for spec in self.SPECS:
+            state = indicator_state.make_state(spec)
+            for bar in bars[:150]:
+                state.update(bar)
+            resumed = indicator_state.load_state(spec, state.to_dict())
+            for bar in bars[150:]:
+                self.assertEqual(resumed.update(bar), state.update(bar))
+
+    def test_advance_matches_full_history(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        store = price_store.PriceStore(directory.name)
+        states = indicator_state.IndicatorStateStore(store)
+        start = date.today() - timedelta(days=120)
+        with mock.patch.object(price_store.market_data, 'download_bars', side_effect=_wavy_bars):
+            store.refresh(['AAA'], start, date.today() - timedelta(days=30))
+            states.advance('AAA', self.SPECS)
+            store.refresh(['AAA'], start, date.today())
+            values = states.advance('AAA', self.SPECS)
+
+        expected = indicators.compute(store.read('AAA'), self.SPECS)
+        for key, series in expected.items():
+            np.testing.assert_allclose(values[key], series[-1], rtol=1e-9, err_msg=key)
+
+
+def _reference_lttb(x, y, threshold):
+    # The textbook loop, one bucket at a time
+    n = len(y)
+    every = (n - 2) / (threshold - 2)
+    selected = [0]
+    a = 0
+    for i in range(threshold - 2):
+        lo, hi = int(i * every) + 1, int((i + 1) * every) + 1
+        next_lo, next_hi = hi, min(int((i + 2) * every) + 1, n)
+        if i == threshold - 3:
+            next_lo, next_hi = n - 1, n
+        avg_x, avg_y = np.mean(x[next_lo:next_hi]), np.mean(y[next_lo:next_hi])
+        areas = [abs((x[a] - avg_x) * (y[j] - y[a]) - (x[a] - x[j]) * (avg_y - y[a])) for j in range(lo, hi)]
+        a = lo + int(np.argmax(areas))
+        selected.append(a)
+    return selected + [n - 1]
+
+
+class DownsampleTests(SimpleTestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.x = np.arange(1000, dtype=np.float64)
+        self.y = np.cumsum(rng.normal(0, 1, 1000))
+        self.y[537] = self.y.max() + 50  # a spike the chart must keep
+
+    def test_lttb_matches_reference(self):
+        selected = downsample.lttb(self.x, self.y, 100)
+        self.assertEqual(selected.tolist(), _reference_lttb(self.x, self.y, 100))
+        self.assertEqual((selected[0], selected[-1]), (0, 999))
+        self.assertIn(537, selected)
+
+    def test_minmax_keeps_endpoints_and_extremes(self):
+        selected = downsample.minmax(self.y, 100)
+        self.assertLessEqual(len(selected), 100)
+        self.assertEqual((selected[0], selected[-1]), (0, 999))
+        self.assertTrue(np.all(np.diff(selected) > 0))
+        self.assertIn(int(np.argmin(self.y)), selected)
+        self.assertIn(537, selected)
+
+    def test_short_series_are_kept_whole(self):
+        for method in downsample.METHODS:
+            np.testing.assert_array_equal(downsample.select(self.x[:50], self.y[:50], 100, method), np.arange(50))
+
+    def test_params(self):
+        self.assertEqual(downsample.parse_params({}), (None, 'lttb'))
+        self.assertEqual(downsample.parse_params({'max_points': '500', 'downsample': 'minmax'}), (500, 'minmax'))
+        for params in ({'max_points': '2'}, {'max_points': '500', 'downsample': 'every-nth'}):
+            with self.assertRaises(ValueError):
+                downsample.parse_params(params)
+
+
+SCREENER_CSV = """Symbol,Name,Last Sale,Net Change,% Change,Market Cap,Country,IPO Year,Volume,Sector,Industry
+AAPL,Apple Inc. Common Stock,$227.52,1.20,0.53%,3450000000000.00,United States,1980,41000000,Technology,Computer Manufacturing
+MSFT,Microsoft Corporation Common Stock,$415.10,-2.30,-0.551%,3090000000000.00,United States,1986,18000000,Technology,Computer Software
+NVDA,NVIDIA Corporation Common Stock,$135.40,3.10,2.343%,3320000000000.00,United States,1999,250000000,Technology,Semiconductors
+JPM,JP Morgan Chase & Co. Common Stock,$222.00,0.80,0.362%,630000000000.00,United States,,9000000,Finance,Major Banks
+SOFI,SoFi Technologies Inc. Common Stock,$11.20,-0.40,-3.448%,12100000000.00,United States,2020,52000000,Finance,Finance: Consumer Services
+APPN,Appian Corporation Class A Common Stock,$33.80,0.25,0.745%,2480000000.00,United States,2017,600000,Technology,Computer Software
+ACME,Acme United Corporation. Common Stock,$40.10,-0.15,-0.373%,150000000.00,United States,,20000,Industrials,Industrial Machinery
+ZZZT,Zeta Test Holdings Common Stock,$5.05,,,,United States,,,Technology,Computer Software
+MBLY,Mobileye Global Inc. Class A Common Stock,$14.90,0.95,6.81%,12000000000.00,United States,2022,7000000,Technology,Auto Parts
+BAC,Bank of America Corporation Common Stock,$43.50,-0.60,-1.36%,335000000000.00,United States,,35000000,Finance,Major Banks
+"""
+
+
+def _screener_fixture(test):
+    directory = tempfile.TemporaryDirectory()
+    test.addCleanup(directory.cleanup)
+    path = os.path.join(directory.name, 'ticker.csv')
+    with open(path, 'w') as handle:
+        handle.write(SCREENER_CSV)
+    return path
+
+
+class ScreenerTableTests(SimpleTestCase):
+    def setUp(self):
+        path = _screener_fixture(self)
+        self.table = screener.ScreenerTable.from_csv(path)
+        self.frame = pd.read_csv(path)
+        for column in ('Last Sale', '% Change'):
+            self.frame[column] = pd.to_numeric(self.frame[column].str.strip('$%'))
+
+    def symbols(self, positions):
+        return self.table.symbol[positions].tolist()
+
+    def test_query_matches_pandas(self):
+        total, positions = self.table.query(
+            sectors=['Technology', 'Finance'], bands=['mega', 'large'], ranges={'last_sale': (12.0, 300.0)},
+            sort='pct_change', offset=1, limit=3,
+        )
+        frame = self.frame
+        expected = frame[
+            frame['Sector'].isin(['Technology', 'Finance'])
+            & (frame['Market Cap'] >= 10e9)
+            & frame['Last Sale'].between(12.0, 300.0)
+        ].sort_values('% Change', ascending=False)
+        self.assertEqual(total, len(expected))
+        self.assertEqual(self.symbols(positions), expected['Symbol'].tolist()[1:4])
+
+    def test_rows_without_a_value_sort_last(self):
+        total, positions = self.table.query(sectors=['Technology'], sort='pct_change', descending=False, limit=10)
+        expected = self.frame[self.frame['Sector'] == 'Technology'].sort_values('% Change', na_position='last')
+        self.assertEqual(self.symbols(positions), expected['Symbol'].tolist())
+        self.assertEqual(self.symbols(positions)[-1], 'ZZZT')
+
+    def test_unknown_filters(self):
+        with self.assertRaises(ValueError):
+            self.table.query(sectors=['Astrology'])
+        with self.assertRaises(ValueError):
+            self.table.query(bands=['giga'])
+        with self.assertRaises(ValueError):
+            self.table.query(sort='name')
+
+    def test_snapshot_round_trip(self):
+        path = os.path.join(os.path.dirname(self.table.source), 'ticker.npz')
+        self.table.save(path)
+        loaded = screener.load(path)
+        self.assertEqual(loaded.symbol.tolist(), self.table.symbol.tolist())
+        np.testing.assert_array_equal(loaded.market_cap, self.table.market_cap)
+        self.assertEqual(loaded.query(bands=['large'])[0], self.table.query(bands=['large'])[0])
+
+
+class ScreenerHistoryTests(SimpleTestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.history = screener_history.ScreenerHistory(directory.name)
+        self.table = screener.ScreenerTable.from_csv(_screener_fixture(self))
+
+    def test_change_over(self):
+        day = date(2024, 6, 3)
+        self.history.record(self.table, day)
+        later = pd.read_csv(self.table.source, dtype=str, keep_default_na=False)
+        later['Last Sale'] = ['$250.00', '$415.10', '$121.86', '$222.00', '$11.20', '$33.80', '$40.10', '$5.05', '$14.90', '$43.50']
+        # A new listing has no earlier price to compare with
+        later.loc[len(later)] = ['NEWCO', 'New Co', '$10.00', '', '', '', '', '', '', 'Technology', '']
+        self.history.record(screener.ScreenerTable.from_frame(later), day + timedelta(days=1))
+
+        start, end, changes = self.history.change_over(1)
+        self.assertEqual((start, end), ('2024-06-03', '2024-06-04'))
+        self.assertEqual(len(changes), self.table.size)
+        self.assertEqual((changes[0][0], changes[-1][0]), ('AAPL', 'NVDA'))
+        self.assertAlmostEqual(changes[0][1], (250.00 / 227.52 - 1) * 100, places=3)
+        _, _, losers = self.history.change_over(1, limit=1, descending=False)
+        self.assertEqual(losers[0][0], 'NVDA')
+        self.assertAlmostEqual(losers[0][1], -10.0, places=3)
+
+    def test_versions_are_immutable(self):
+        day = date(2024, 6, 3)
+        first = self.history.record(self.table, day)
+        self.assertEqual(self.history.record(screener.ScreenerTable.from_frame(pd.DataFrame({'Symbol': ['X']})), day), first)
+        self.assertEqual(self.history.versions(), ['2024-06-03'])
+        self.assertEqual(len(self.history.symbols()), self.table.size)
+        with self.assertRaises(ValueError):
+            self.history.change_over(1)
+
+
+class AutocompleteTests(SimpleTestCase):
+    def setUp(self):
+        self.index = autocomplete.SearchIndex(screener.ScreenerTable.from_csv(_screener_fixture(self)))
+
+    def search(self, query, limit=10):
+        return self.index.table.symbol[self.index.search(query, limit)].tolist()
+
+    def test_exact_symbol_first(self):
+        self.assertEqual(self.search('appn')[0], 'APPN')
+
+    def test_prefix_matches_by_market_cap(self):
+        # Symbols and name words, larger companies first
+        self.assertEqual(self.search('ap', limit=2), ['AAPL', 'APPN'])
+        self.assertEqual(self.search('bank of')[0], 'BAC')
+
+    def test_one_typo(self):
+        self.assertEqual(self.search('microsft'), ['MSFT'])
+        self.assertEqual(self.search('nvida')[0], 'NVDA')
+        self.assertEqual(self.search('mobxlexe'), [])
+
+    def test_records_include_the_sector(self):
+        rows = self.index.records(self.index.search('jpm'))
+        self.assertEqual(rows[0]['Symbol'], 'JPM')
+        self.assertEqual(rows[0]['Sector'], 'Finance')
@@ -1,13 +1,26 @@
 import os
+import json
+import time
+import asyncio
+from asgiref.sync import sync_to_async
 from django.shortcuts import render
 from datetime import datetime
+from celery.result import AsyncResult
+from django.http import FileResponse, StreamingHttpResponse
 from rest_framework.response import Response
 from rest_framework.views import APIView
-import yfinance as yf
+import numpy as np
 import pandas as pd
-from rest_framework import status
+from rest_framework import permissions, status
+from django.conf import settings
+from NewsSection.models import Portfolio
+from InvestmentSection import autocomplete, backtest, backtest_cache, batch_indicators, downsample, indicators, price_store, renderers, screener, screener_history, sectors
+from InvestmentSection.price_store import index_days
+from InvestmentSection.tasks import job_result_path, run_backtest_job
 
 class PortfolioPerformanceView(APIView):
+    renderer_classes = renderers.available()
+
     def get(self, request):
         # Retrieve company names and their individual investment amounts
         companies = request.query_params.getlist('companies')  # List of company names
@@ -17,68 +30,250 @@ class PortfolioPerformanceView(APIView):
         if len(companies) != len(amounts):
             return Response({"error": "Each company must have a corresponding investment amount."}, status=400)
 
-        # Convert amounts to floats and calculate total investment
-        amounts = list(map(float, amounts))
-        total_investment = sum(amounts)
-
-        # Calculate weights for each company based on individual investment amount
-        weights = [amount / total_investment for amount in amounts]
-
         # Generate tickers for each company (assuming `companies` contains tickers for simplicity)
-        tickers = companies
+        # and validate them as a one-portfolio batch
+        try:
+            tickers, (amounts,) = _allocations({'tickers': companies, 'amounts': [amounts]})
+            end_date = _end_date(request.query_params.get('end_date'))  # Default to today's date
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
-        # Define start and end dates
-        start_date = '2015-01-01'  # Fixed start date
-        end_date = request.query_params.get('end_date', datetime.today().strftime('%Y-%m-%d'))  # Default to today's date
+        # Calculate weights and total investment
+        weights, totals = backtest.normalize_amounts([amounts])
+        total_investment = totals[0]
 
-        # Download data
-        data = yf.download(tickers, start=start_date, end=end_date)['Adj Close']
+        # Define start date
+        start_date = settings.PRICE_HISTORY_START  # Fixed start date
 
-        # Calculate portfolio performance
-        daily_returns = data.pct_change()
-        portfolio_returns = (daily_returns * weights).sum(axis=1)
-        cumulative_returns = (1 + portfolio_returns).cumprod() - 1
+        # Calculate portfolio performance; stored results are only extended by the new days
+        dates, daily_returns, cumulative_returns = backtest_cache.load(tickers, weights[:, 0], start_date, end_date)
 
         # Calculate portfolio value based on total investment amount
         portfolio_value = total_investment * (1 + cumulative_returns)
 
-        # Prepare the performance data as JSON serializable
+        # Optionally reduce the series to a chart-sized number of points
+        try:
+            max_points, method = downsample.parse_params(request.query_params)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        if max_points is not None:
+            keep = downsample.select(dates.astype(np.int64), portfolio_value, max_points, method)
+            dates, portfolio_value = dates[keep], portfolio_value[keep]
+            daily_returns, cumulative_returns = daily_returns[keep], cumulative_returns[keep]
+
+        # Prepare the performance data as columns, encoded by the negotiated renderer
         performance_data = {
-            "dates": portfolio_value.index.strftime('%Y-%m-%d').tolist(),
-            "portfolio_value": portfolio_value.tolist(),
-            "daily_return": portfolio_returns.tolist(),
-            "cumulative_return": cumulative_returns.tolist(),
+            "dates": dates,
+            "portfolio_value": portfolio_value,
+            "daily_return": daily_returns,
+            "cumulative_return": cumulative_returns,
         }
 
         return Response(performance_data)
 
 
+def _allocations(data):
+    """
+    The `tickers` and `amounts` of a batch backtest body, amounts as floats.
+    Raises ValueError with a message for the client if they don't describe
+    valid portfolios.
+    """
+    tickers = data.get('tickers') or []
+    amounts = data.get('amounts') or []
+
+    if not tickers or not amounts:
+        raise ValueError("Both 'tickers' and 'amounts' are required.")
+    if not all(isinstance(ticker, str) and ticker for ticker in tickers):
+        raise ValueError("Tickers must be non-empty strings.")
+    if any(not isinstance(row, list) or len(row) != len(tickers) for row in amounts):
+        raise ValueError("Each portfolio must have one investment amount per ticker.")
+    try:
+        amounts = [[float(amount) for amount in row] for row in amounts]
+    except (TypeError, ValueError):
+        raise ValueError("Investment amounts must be numbers.")
+    if not all(np.isfinite(amount) and amount >= 0 for row in amounts for amount in row):
+        raise ValueError("Investment amounts must be finite and not negative.")
+    # Checks every portfolio has a positive total
+    backtest.normalize_amounts(amounts)
+    return tickers, amounts
+
+
+def _end_date(value):
+    """
+    `value` as 'YYYY-MM-DD', today if it is not given. Raises ValueError with
+    a message for the client if it is not a date.
+    """
+    if value is None:
+        return datetime.today().strftime('%Y-%m-%d')
+    try:
+        return pd.Timestamp(value).strftime('%Y-%m-%d')
+    except (TypeError, ValueError):
+        raise ValueError("'end_date' must be a date in the format 'YYYY-MM-DD'.")
+
+
+class PortfolioBatchPerformanceView(APIView):
+    renderer_classes = renderers.available()
+
+    def post(self, request):
+        """
+        Backtest many allocations of the same ticker set in one pass.
+
+        Body:
+        - tickers: list of ticker symbols.
+        - amounts: list of portfolios, each a list of investment amounts in
+          the same order as `tickers`.
+        - end_date (optional): 'YYYY-MM-DD', defaults to today.
+
+        The response is column-oriented: every series is a list with one
+        entry per portfolio, each entry a list aligned with `dates`.
+        """
+        try:
+            tickers, amounts = _allocations(request.data)
+            end_date = _end_date(request.data.get('end_date'))
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        weights, totals = backtest.normalize_amounts(amounts)
+
+        start_date = settings.PRICE_HISTORY_START
+
+        # One returns matrix shared by every portfolio, one matrix multiply for all of them
+        data = price_store.load_field(tickers, start_date, end_date, 'Adj Close')
+        performance_data = backtest.batch_payload(data, tickers, weights, totals)
+
+        return Response(performance_data)
+
+
+
+def _job_status(result):
+    # Summarise a Celery result for the job endpoints
+    data = {"job_id": result.id, "status": result.state}
+    if result.state == 'PROGRESS' and isinstance(result.info, dict):
+        data["progress"] = result.info
+    elif result.state == 'SUCCESS':
+        data["result_url"] = f"/backtesting/jobs/{result.id}/result/"
+    elif result.state == 'FAILURE':
+        data["error"] = str(result.info)
+    return data
+
+
+class BacktestJobView(APIView):
+    def post(self, request):
+        """
+        Submit a backtest to the 'backtests' Celery queue and return its job id
+        straight away. Takes the same body as `/backtesting/batch/`.
+        """
+        try:
+            tickers, amounts = _allocations(request.data)
+            end_date = _end_date(request.data.get('end_date'))
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        result = run_backtest_job.apply_async(
+            args=(tickers, amounts, end_date),
+            queue='backtests',
+        )
+        return Response(_job_status(result), status=status.HTTP_202_ACCEPTED)
+
+
+class BacktestJobStatusView(APIView):
+    def get(self, request, job_id):
+        # Poll the state and progress of a submitted job
+        return Response(_job_status(AsyncResult(str(job_id))))
+
+
+class BacktestJobEventsView(APIView):
+    def get(self, request, job_id):
+        """Stream job status as server-sent events until the job finishes."""
+        job_id = str(job_id)
+
+        def poll():
+            result = AsyncResult(job_id)
+            return _job_status(result), result.ready()
+
+        # An async generator, so under ASGI each event is sent as it happens and
+        # no thread is held while waiting between polls
+        async def events():
+            deadline = time.monotonic() + settings.BACKTEST_JOB_STREAM_TIMEOUT
+            last = None
+            while time.monotonic() < deadline:
+                data, ready = await sync_to_async(poll, thread_sensitive=False)()
+                if data != last:
+                    yield f"data: {json.dumps(data)}\n\n"
+                    last = data
+                if ready:
+                    return
+                await asyncio.sleep(1)
+
+        response = StreamingHttpResponse(events(), content_type='text/event-stream')
+        response['Cache-Control'] = 'no-cache'
+        return response
+
+
+class BacktestJobResultView(APIView):
+    def get(self, request, job_id):
+        # The result lives in a file, not in the Redis result backend
+        result = AsyncResult(str(job_id))
+        if result.state != 'SUCCESS':
+            return Response(_job_status(result), status=status.HTTP_202_ACCEPTED if not result.ready() else status.HTTP_409_CONFLICT)
+
+        path = job_result_path(result.id)
+        if not os.path.exists(path):
+            return Response({"error": "Result file is no longer available."}, status=status.HTTP_410_GONE)
+        return FileResponse(open(path, 'rb'), content_type='application/json')
+
+
 
 class MovingAveragesView(APIView):
-    def get(self, request, ticker, start_date, end_date, sma_window=10, ema_window=10):
+    renderer_classes = renderers.available()
+
+    def get(self, request):
         """
-        Retrieve historical price data for a stock and calculate SMA and EMA.
+        Retrieve historical price data for a stock and calculate indicators.
         
-        Parameters:
+        Query parameters:
         - ticker: Stock ticker symbol.
         - start_date: Start date in the format 'YYYY-MM-DD'.
         - end_date: End date in the format 'YYYY-MM-DD'.
-        - sma_window: Window for Simple Moving Average (SMA).
-        - ema_window: Window for Exponential Moving Average (EMA).
+        - sma_window (optional): Window for Simple Moving Average (SMA), default 10.
+        - ema_window (optional): Window for Exponential Moving Average (EMA), default 10.
+
+        Any set of indicators can be requested with repeated `indicators`
+        query parameters (e.g. `?indicators=rsi:14&indicators=macd:12:26:9`,
+        see `InvestmentSection.indicators`); without them the view returns
+        the SMA and EMA for the given windows.
         """
+        ticker = request.query_params.get('ticker')
+        start_date = request.query_params.get('start_date')
+        end_date = request.query_params.get('end_date')
+        if not ticker or not start_date or not end_date:
+            return Response({'error': "'ticker', 'start_date' and 'end_date' are required."}, status=status.HTTP_400_BAD_REQUEST)
+        sma_window = request.query_params.get('sma_window', 10)
+        ema_window = request.query_params.get('ema_window', 10)
+
         try:
-            # Download the historical price data
-            data = yf.download(ticker, start=start_date, end=end_date)
+            # Read the historical price data from the local store
+            data = price_store.load_bars(ticker, start_date, end_date)
             
             if data.empty:
                 return Response({'error': 'No data found for the given ticker and date range.'}, status=status.HTTP_404_NOT_FOUND)
 
-            # Calculate Simple and Exponential Moving Averages
-            data[f'{sma_window}-day SMA'] = data['Adj Close'].rolling(window=sma_window).mean()
-            data[f'{ema_window}-day EMA'] = data['Adj Close'].ewm(span=ema_window, adjust=False).mean()
+            # Calculate every requested indicator in one pass over the shared price arrays
+            specs = request.query_params.getlist('indicators') or [f'sma:{sma_window}', f'ema:{ema_window}']
+            results = indicators.compute(data, specs)
+
+            # Optionally reduce to a chart-sized number of points (after the indicators are computed)
+            keep = slice(None)
+            max_points, method = downsample.parse_params(request.query_params)
+            if max_points is not None:
+                keep = downsample.select(index_days(data.index), data['Adj Close'].to_numpy(), max_points, method)
 
-            # Prepare response data
-            response_data = data[['Adj Close', f'{sma_window}-day SMA', f'{ema_window}-day EMA']].reset_index().to_dict(orient='records')
+            # Prepare response data as columns, encoded by the negotiated renderer
+            response_data = {
+                'Date': data.index.values.astype('datetime64[D]')[keep],
+                'Adj Close': data['Adj Close'].to_numpy()[keep],
+            }
+            for key, values in results.items():
+                response_data[key] = values[keep]
             
             return Response(response_data, status=status.HTTP_200_OK)
 
@@ -88,6 +283,42 @@ class MovingAveragesView(APIView):
 
 
 
+class BatchIndicatorsView(APIView):
+    renderer_classes = renderers.available()
+
+    def post(self, request):
+        """
+        Indicators for a whole watchlist in one call.
+
+        Body:
+        - tickers: list of ticker symbols.
+        - indicators: list of indicator specs (see `InvestmentSection.indicators`).
+        - start_date / end_date: 'YYYY-MM-DD'; the end date is exclusive.
+
+        Every series in the response is a (tickers x dates) array on one shared
+        date axis; tickers without data are listed in `missing`.
+        """
+        tickers = request.data.get('tickers') or []
+        specs = request.data.get('indicators') or ['sma:10', 'ema:10']
+        start_date = request.data.get('start_date', settings.PRICE_HISTORY_START)
+        end_date = request.data.get('end_date', datetime.today().strftime('%Y-%m-%d'))
+
+        if not tickers:
+            return Response({'error': "'tickers' is required."}, status=status.HTTP_400_BAD_REQUEST)
+        for name, values in (('tickers', tickers), ('indicators', specs)):
+            if not isinstance(values, list) or not all(isinstance(value, str) and value for value in values):
+                return Response({'error': f"'{name}' must be a list of non-empty strings."}, status=status.HTTP_400_BAD_REQUEST)
+        if len(tickers) > settings.INDICATOR_BATCH_MAX_TICKERS:
+            return Response({'error': f'At most {settings.INDICATOR_BATCH_MAX_TICKERS} tickers per request.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            response_data = batch_indicators.compute(tickers, specs, start_date, end_date)
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(response_data, status=status.HTTP_200_OK)
+
+
 from rest_framework.views import APIView
 from rest_framework.response import Response
 import pandas as pd
@@ -105,27 +336,14 @@ from django.http import JsonResponse
 
 class TopStocksView(APIView):
     def get(self, request):
-        # Define the path to the CSV file dynamically
-        file_path = os.path.join(settings.BASE_DIR, 'tickers.csv')  # Update this to your actual CSV file path
-
         try:
-            # Load the data from the CSV file
-            df = pd.read_csv('tickerss.csv')
-
-            # Clean the '% Change' column by removing '%' and converting it to numeric
-            df['% Change'] = pd.to_numeric(df['% Change'].str.replace('%', ''), errors='coerce')
+            # Parsed, typed screener snapshot kept in memory (reloaded when the file changes)
+            table = screener.get_table()
 
-            # Drop rows with NaN values in '% Change' column
-            df_cleaned = df.dropna(subset=['% Change'])
-
-            # Get top 4 stocks with the highest and lowest percentage changes
-            top_4_high = df_cleaned.nlargest(4, '% Change')[['Symbol', 'Name', '% Change']]
-            top_4_low = df_cleaned.nsmallest(4, '% Change')[['Symbol', 'Name', '% Change']]
-
-            # Convert the result to a list of dictionaries
+            # Get top 4 stocks with the highest and lowest percentage changes from the precomputed order
             response_data = {
-                "top_4_high": top_4_high.to_dict(orient='records'),
-                "top_4_low": top_4_low.to_dict(orient='records')
+                "top_4_high": table.records(table.top_gainers(4)),
+                "top_4_low": table.records(table.top_losers(4))
             }
 
             return Response(response_data, status=status.HTTP_200_OK)
@@ -136,6 +354,141 @@ class TopStocksView(APIView):
             return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+class ScreenerQueryView(APIView):
+    def get(self, request):
+        """
+        Filter, sort and page the NASDAQ screener.
+
+        Query parameters (all optional, repeatable where it makes sense):
+        - sector: one or more sectors, e.g. `?sector=Technology&sector=Finance`.
+        - cap: one or more market cap bands (mega, large, mid, small, micro, nano).
+        - min_<field> / max_<field>: range on price, change, net_change,
+          market_cap or volume, e.g. `?min_volume=1000000&max_price=50`.
+        - sort: field to sort by, prefix with '-' for descending (default '-market_cap').
+        - page / page_size: 1-based page number and size (default 1 / 50, max 500).
+        """
+        params = request.query_params
+        try:
+            ranges = {}
+            for name, column in screener.RANGE_FIELDS.items():
+                low, high = params.get(f'min_{name}'), params.get(f'max_{name}')
+                if low is not None or high is not None:
+                    ranges[column] = (
+                        float(low) if low is not None else None,
+                        float(high) if high is not None else None,
+                    )
+
+            sort = params.get('sort', '-market_cap')
+            descending = sort.startswith('-')
+            sort = sort.lstrip('-')
+            if sort not in screener.RANGE_FIELDS:
+                raise ValueError(f"Cannot sort by '{sort}'. Use one of: {', '.join(screener.RANGE_FIELDS)}.")
+
+            page = max(int(params.get('page', 1)), 1)
+            page_size = min(max(int(params.get('page_size', 50)), 1), 500)
+
+            table = screener.get_table()
+            total, positions = table.query(
+                sectors=params.getlist('sector'),
+                bands=params.getlist('cap'),
+                ranges=ranges,
+                sort=screener.RANGE_FIELDS[sort],
+                descending=descending,
+                offset=(page - 1) * page_size,
+                limit=page_size,
+            )
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except FileNotFoundError:
+            return Response({"error": "CSV file not found. Please check the file path."}, status=status.HTTP_404_NOT_FOUND)
+
+        fields = [attribute for attribute, _ in screener.COLUMNS.values()]
+        response_data = {
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+            "results": table.records(positions, fields),
+        }
+        return Response(response_data, status=status.HTTP_200_OK)
+
+
+class SymbolSearchView(APIView):
+    def get(self, request):
+        """
+        Type-ahead over symbols and company names, `?q=appl&limit=10`.
+        Prefix matches first, then near misses, each ranked by market cap.
+        """
+        query = request.query_params.get('q', '')
+        try:
+            limit = min(max(int(request.query_params.get('limit', 10)), 1), 50)
+            index = autocomplete.get_index()
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except FileNotFoundError:
+            return Response({"error": "CSV file not found. Please check the file path."}, status=status.HTTP_404_NOT_FOUND)
+
+        return Response({"results": index.records(index.search(query, limit))}, status=status.HTTP_200_OK)
+
+
+class ScreenerChangeView(APIView):
+    def get(self, request):
+        """
+        Biggest movers over several days from the recorded screener history.
+
+        Query parameters:
+        - days: number of daily snapshots to look back over (default 5).
+        - limit: number of symbols to return (default 20, max 500).
+        - order: 'desc' for gainers (default) or 'asc' for losers.
+        """
+        params = request.query_params
+        try:
+            days = int(params.get('days', 5))
+            limit = min(max(int(params.get('limit', 20)), 1), 500)
+            if days < 1:
+                raise ValueError("'days' must be at least 1.")
+            start, end, rows = screener_history.get_history().change_over(
+                days, limit=limit, descending=params.get('order', 'desc') != 'asc'
+            )
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        response_data = {
+            "from": start,
+            "to": end,
+            "results": [{"Symbol": symbol, "% Change": change} for symbol, change in rows],
+        }
+        return Response(response_data, status=status.HTTP_200_OK)
+
+
+class ScreenerEntrantsView(APIView):
+    def get(self, request):
+        """
+        Symbols that made today's top movers but were not there before.
+
+        Query parameters:
+        - n: size of the top movers list (default 20, max 500).
+        - lookback: number of previous snapshots to compare against (default 1).
+        - order: 'desc' for gainers (default) or 'asc' for losers.
+        """
+        params = request.query_params
+        try:
+            n = min(max(int(params.get('n', 20)), 1), 500)
+            lookback = int(params.get('lookback', 1))
+            if lookback < 1:
+                raise ValueError("'lookback' must be at least 1.")
+            day, rows = screener_history.get_history().new_entrants(
+                n, lookback=lookback, descending=params.get('order', 'desc') != 'asc'
+            )
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        response_data = {
+            "date": day,
+            "results": [{"Symbol": symbol, "% Change": change} for symbol, change in rows],
+        }
+        return Response(response_data, status=status.HTTP_200_OK)
+
+
 class Top(APIView):
     def get(self, request):
         # Define top high and low stocks as dictionaries
@@ -163,7043 +516,59 @@ class Top(APIView):
         return Response(response_data, status=status.HTTP_200_OK)
     
 
-class Sector:
-         dict = {'A': 'Industrials',
-'AA': 'Industrials',
-'AACG': 'Real Estate',
-'AACT': 'Finance',
-'AADI': 'Health Care',
-'AAL': 'Consumer Discretionary',
-'AAM': 'nan',
-'AAME': 'Finance',
-'AAOI': 'Technology',
-'AAON': 'Industrials',
-'AAP': 'Consumer Discretionary',
-'AAPL': 'Technology',
-'AAT': 'Real Estate',
-'AB': 'Finance',
-'ABAT': 'Basic Materials',
-'ABBV': 'Health Care',
-'ABCB': 'Finance',
-'ABCL': 'Health Care',
-'ABEO': 'Health Care',
-'ABEV': 'Consumer Staples',
-'ABG': 'Consumer Discretionary',
-'ABL': 'Finance',
-'ABLLL': 'Finance',
-'ABLLW': 'Finance',
-'ABLV': 'Consumer Discretionary',
-'ABLVW': 'Consumer Discretionary',
-'ABM': 'Finance',
-'ABNB': 'Finance',
-'ABOS': 'Health Care',
-'ABR': 'Real Estate',
-'ABR^D': 'nan',
-'ABR^E': 'nan',
-'ABR^F': 'nan',
-'ABSI': 'Health Care',
-'ABT': 'Health Care',
-'ABTS': 'Technology',
-'ABUS': 'Health Care',
-'ABVC': 'Health Care',
-'ABVE': 'Consumer Staples',
-'ABVEW': 'Consumer Staples',
-'ABVX': 'Health Care',
-'AC': 'Finance',
-'ACA': 'Industrials',
-'ACAB': 'Finance',
-'ACABU': 'Finance',
-'ACABW': 'Finance',
-'ACAD': 'Health Care',
-'ACB': 'Health Care',
-'ACCD': 'Consumer Discretionary',
-'ACCO': 'Consumer Discretionary',
-'ACDC': 'Energy',
-'ACEL': 'Consumer Discretionary',
-'ACET': 'Health Care',
-'ACGL': 'Finance',
-'ACGLN': 'Finance',
-'ACGLO': 'Finance',
-'ACHC': 'Health Care',
-'ACHL': 'Health Care',
-'ACHR': 'Industrials',
-'ACHV': 'Health Care',
-'ACI': 'Consumer Staples',
-'ACIC': 'Finance',
-'ACIU': 'Health Care',
-'ACIW': 'Technology',
-'ACLS': 'Technology',
-'ACLX': 'Health Care',
-'ACM': 'Consumer Discretionary',
-'ACMR': 'Technology',
-'ACN': 'Consumer Discretionary',
-'ACNB': 'Finance',
-'ACNT': 'Industrials',
-'ACON': 'Health Care',
-'ACONW': 'Health Care',
-'ACP': 'Finance',
-'ACP^A': 'nan',
-'ACR': 'Real Estate',
-'ACR^C': 'nan',
-'ACR^D': 'nan',
-'ACRE': 'Real Estate',
-'ACRS': 'Health Care',
-'ACRV': 'Health Care',
-'ACST': 'Health Care',
-'ACT': 'Finance',
-'ACTG': 'Miscellaneous',
-'ACTU': 'Health Care',
-'ACU': 'Consumer Discretionary',
-'ACV': 'Finance',
-'ACVA': 'Consumer Discretionary',
-'ACXP': 'Health Care',
-'ADAG': 'Health Care',
-'ADAP': 'Health Care',
-'ADBE': 'Technology',
-'ADC': 'Real Estate',
-'ADC^A': 'nan',
-'ADCT': 'Health Care',
-'ADD': 'Consumer Discretionary',
-'ADEA': 'Technology',
-'ADGM': 'Health Care',
-'ADI': 'Technology',
-'ADIL': 'Health Care',
-'ADM': 'Consumer Staples',
-'ADMA': 'Health Care',
-'ADN': 'Miscellaneous',
-'ADNT': 'Consumer Discretionary',
-'ADNWW': 'Miscellaneous',
-'ADP': 'Technology',
-'ADPT': 'Health Care',
-'ADSE': 'Consumer Discretionary',
-'ADSEW': 'Consumer Discretionary',
-'ADSK': 'Technology',
-'ADT': 'Consumer Discretionary',
-'ADTN': 'Utilities',
-'ADTX': 'Health Care',
-'ADUS': 'Health Care',
-'ADV': 'Consumer Discretionary',
-'ADVM': 'Health Care',
-'ADVWW': 'Consumer Discretionary',
-'ADX': 'Finance',
-'ADXN': 'Health Care',
-'AE': 'Energy',
-'AEAE': 'Finance',
-'AEAEW': 'Finance',
-'AEE': 'Utilities',
-'AEF': 'Finance',
-'AEFC': 'nan',
-'AEG': 'Finance',
-'AEHL': 'Industrials',
-'AEHR': 'Industrials',
-'AEI': 'Finance',
-'AEIS': 'Technology',
-'AEM': 'Basic Materials',
-'AEMD': 'Health Care',
-'AENT': 'Consumer Discretionary',
-'AENTW': 'Consumer Discretionary',
-'AEO': 'Consumer Discretionary',
-'AEON': 'Health Care',
-'AEP': 'Utilities',
-'AER': 'Consumer Discretionary',
-'AERT': 'Consumer Discretionary',
-'AERTW': 'Consumer Discretionary',
-'AES': 'Utilities',
-'AESI': 'Industrials',
-'AEVA': 'Consumer Discretionary',
-'AEYE': 'Technology',
-'AFB': 'Finance',
-'AFBI': 'Finance',
-'AFCG': 'Finance',
-'AFG': 'Finance',
-'AFGB': 'Finance',
-'AFGC': 'Finance',
-'AFGD': 'Finance',
-'AFGE': 'Finance',
-'AFJK': 'nan',
-'AFJKR': 'nan',
-'AFJKU': 'nan',
-'AFL': 'Finance',
-'AFMD': 'Health Care',
-'AFRI': 'Consumer Staples',
-'AFRM': 'Finance',
-'AFYA': 'Real Estate',
-'AG': 'Basic Materials',
-'AGAE': 'Consumer Discretionary',
-'AGCO': 'Industrials',
-'AGD': 'Finance',
-'AGEN': 'Health Care',
-'AGFY': 'Consumer Staples',
-'AGI': 'Basic Materials',
-'AGIO': 'Health Care',
-'AGL': 'Health Care',
-'AGM': 'Finance',
-'AGM^D': 'nan',
-'AGM^E': 'nan',
-'AGM^F': 'nan',
-'AGM^G': 'nan',
-'AGMH': 'Technology',
-'AGNC': 'Real Estate',
-'AGNCL': 'Real Estate',
-'AGNCM': 'Real Estate',
-'AGNCN': 'Real Estate',
-'AGNCO': 'Real Estate',
-'AGNCP': 'Real Estate',
-'AGO': 'Finance',
-'AGR': 'Utilities',
-'AGRI': 'Industrials',
-'AGRO': 'Consumer Staples',
-'AGS': 'Consumer Discretionary',
-'AGX': 'Consumer Discretionary',
-'AGYS': 'Technology',
-'AHCO': 'Health Care',
-'AHG': 'Consumer Discretionary',
-'AHH': 'Finance',
-'AHH^A': 'nan',
-'AHL^C': 'nan',
-'AHL^D': 'nan',
-'AHL^E': 'nan',
-'AHR': 'Real Estate',
-'AHT': 'Real Estate',
-'AHT^D': 'nan',
-'AHT^F': 'nan',
-'AHT^G': 'nan',
-'AHT^H': 'nan',
-'AHT^I': 'nan',
-'AI': 'Technology',
-'AIEV': 'Consumer Discretionary',
-'AIFF': 'Technology',
-'AIFU': 'Finance',
-'AIG': 'Finance',
-'AIHS': 'Finance',
-'AILE': 'Technology',
-'AILEW': 'Technology',
-'AIM': 'Health Care',
-'AIMAU': 'Finance',
-'AIMD': 'Health Care',
-'AIN': 'Consumer Discretionary',
-'AIO': 'Finance',
-'AIOT': 'Telecommunications',
-'AIP': 'Technology',
-'AIR': 'Industrials',
-'AIRE': 'Finance',
-'AIRG': 'Technology',
-'AIRI': 'Industrials',
-'AIRJ': 'Industrials',
-'AIRJW': 'Industrials',
-'AIRS': 'Health Care',
-'AIRT': 'Consumer Discretionary',
-'AIRTP': 'Consumer Discretionary',
-'AISP': 'Technology',
-'AISPW': 'Technology',
-'AIT': 'Consumer Discretionary',
-'AITR': 'nan',
-'AITRU': 'nan',
-'AIV': 'Real Estate',
-'AIXI': 'Technology',
-'AIZ': 'Finance',
-'AIZN': 'Finance',
-'AJG': 'Finance',
-'AJX': 'Real Estate',
-'AKA': 'Consumer Discretionary',
-'AKAM': 'Consumer Discretionary',
-'AKAN': 'Health Care',
-'AKBA': 'Health Care',
-'AKO/A': 'nan',
-'AKO/B': 'nan',
-'AKR': 'Real Estate',
-'AKRO': 'Health Care',
-'AKTS': 'Utilities',
-'AKTX': 'Health Care',
-'AKYA': 'Industrials',
-'AL': 'Consumer Discretionary',
-'ALAB': 'Technology',
-'ALAR': 'Technology',
-'ALB': 'Industrials',
-'ALB^A': 'nan',
-'ALBT': 'Health Care',
-'ALC': 'Health Care',
-'ALCE': 'Utilities',
-'ALCO': 'nan',
-'ALCYU': 'Finance',
-'ALDFU': 'Finance',
-'ALDX': 'Health Care',
-'ALE': 'Utilities',
-'ALEC': 'Health Care',
-'ALEX': 'Real Estate',
-'ALF': 'nan',
-'ALFUU': 'nan',
-'ALFUW': 'Finance',
-'ALG': 'Industrials',
-'ALGM': 'Technology',
-'ALGN': 'Health Care',
-'ALGS': 'Health Care',
-'ALGT': 'Consumer Discretionary',
-'ALHC': 'Health Care',
-'ALIT': 'Consumer Discretionary',
-'ALK': 'Consumer Discretionary',
-'ALKS': 'Health Care',
-'ALKT': 'Technology',
-'ALL': 'Finance',
-'ALL^B': 'nan',
-'ALL^H': 'nan',
-'ALL^I': 'nan',
-'ALL^J': 'nan',
-'ALLE': 'Consumer Discretionary',
-'ALLK': 'Health Care',
-'ALLO': 'Health Care',
-'ALLR': 'Health Care',
-'ALLT': 'Telecommunications',
-'ALLY': 'Finance',
-'ALMS': 'Health Care',
-'ALNT': 'Industrials',
-'ALNY': 'Health Care',
-'ALOT': 'Technology',
-'ALRM': 'Technology',
-'ALRN': 'Health Care',
-'ALRS': 'Finance',
-'ALSA': 'Finance',
-'ALSAR': 'Finance',
-'ALSN': 'Consumer Discretionary',
-'ALT': 'Health Care',
-'ALTG': 'Industrials',
-'ALTG^A': 'nan',
-'ALTI': 'Finance',
-'ALTM': 'Industrials',
-'ALTO': 'Industrials',
-'ALTR': 'Technology',
-'ALTS': 'Consumer Discretionary',
-'ALUR': 'Health Care',
-'ALV': 'Consumer Discretionary',
-'ALVO': 'Health Care',
-'ALVOW': 'Health Care',
-'ALVR': 'Health Care',
-'ALX': 'Real Estate',
-'ALXO': 'Health Care',
-'ALZN': 'Health Care',
-'AM': 'Utilities',
-'AMAL': 'Finance',
-'AMAT': 'Technology',
-'AMBA': 'Technology',
-'AMBC': 'Finance',
-'AMBI': 'Industrials',
-'AMBO': 'Real Estate',
-'AMBP': 'Industrials',
-'AMC': 'Consumer Discretionary',
-'AMCR': 'Consumer Discretionary',
-'AMCX': 'Telecommunications',
-'AMD': 'Technology',
-'AME': 'Industrials',
-'AMED': 'Health Care',
-'AMG': 'Finance',
-'AMGN': 'Health Care',
-'AMH': 'Real Estate',
-'AMH^G': 'nan',
-'AMH^H': 'nan',
-'AMIX': 'Health Care',
-'AMKR': 'Technology',
-'AMLI': 'Basic Materials',
-'AMLX': 'Health Care',
-'AMN': 'Consumer Discretionary',
-'AMP': 'Finance',
-'AMPG': 'Telecommunications',
-'AMPGW': 'Telecommunications',
-'AMPH': 'Health Care',
-'AMPL': 'Technology',
-'AMPS': 'Utilities',
-'AMPX': 'Miscellaneous',
-'AMPY': 'Energy',
-'AMR': 'Energy',
-'AMRC': 'Consumer Discretionary',
-'AMRK': 'Industrials',
-'AMRN': 'Health Care',
-'AMRX': 'Health Care',
-'AMS': 'Health Care',
-'AMSC': 'Consumer Discretionary',
-'AMSF': 'Finance',
-'AMST': 'Technology',
-'AMT': 'Real Estate',
-'AMTB': 'Finance',
-'AMTD': 'Finance',
-'AMTM': 'nan',
-'AMTX': 'Industrials',
-'AMWD': 'Basic Materials',
-'AMWL': 'Consumer Discretionary',
-'AMX': 'Telecommunications',
-'AMZN': 'Consumer Discretionary',
-'AN': 'Consumer Discretionary',
-'ANAB': 'Health Care',
-'ANDE': 'Industrials',
-'ANEB': 'Health Care',
-'ANET': 'Telecommunications',
-'ANF': 'Consumer Discretionary',
-'ANG^A': 'nan',
-'ANG^B': 'nan',
-'ANGH': 'Consumer Discretionary',
-'ANGHW': 'Consumer Discretionary',
-'ANGI': 'Consumer Discretionary',
-'ANGO': 'Health Care',
-'ANIK': 'Health Care',
-'ANIP': 'Health Care',
-'ANIX': 'Health Care',
-'ANL': 'Health Care',
-'ANNX': 'Health Care',
-'ANRO': 'Health Care',
-'ANSC': 'nan',
-'ANSCW': 'nan',
-'ANSS': 'Technology',
-'ANTE': 'Consumer Discretionary',
-'ANTX': 'Health Care',
-'ANVS': 'Health Care',
-'ANY': 'Finance',
-'AOD': 'Finance',
-'AOMN': 'Finance',
-'AOMR': 'Finance',
-'AON': 'Finance',
-'AORT': 'Health Care',
-'AOS': 'Consumer Discretionary',
-'AOSL': 'Technology',
-'AOUT': 'Consumer Discretionary',
-'AP': 'Industrials',
-'APA': 'Energy',
-'APAM': 'Finance',
-'APCX': 'Technology',
-'APCXW': 'Technology',
-'APD': 'Industrials',
-'APDN': 'Consumer Discretionary',
-'APEI': 'Real Estate',
-'APG': 'Consumer Discretionary',
-'APGE': 'Health Care',
-'APH': 'Technology',
-'API': 'Technology',
-'APLD': 'Finance',
-'APLE': 'Real Estate',
-'APLM': 'Health Care',
-'APLMW': 'Health Care',
-'APLS': 'Health Care',
-'APLT': 'Health Care',
-'APM': 'Health Care',
-'APO': 'Finance',
-'APO^A': 'nan',
-'APOG': 'Consumer Discretionary',
-'APOS': 'Finance',
-'APP': 'Technology',
-'APPF': 'Technology',
-'APPN': 'Technology',
-'APPS': 'Miscellaneous',
-'APRE': 'Health Care',
-'APT': 'Health Care',
-'APTO': 'Health Care',
-'APTV': 'Consumer Discretionary',
-'APVO': 'Health Care',
-'APWC': 'Industrials',
-'APXI': 'Finance',
-'APXIU': 'Finance',
-'APXIW': 'Finance',
-'APYX': 'Health Care',
-'AQB': 'Consumer Staples',
-'AQMS': 'Industrials',
-'AQN': 'Utilities',
-'AQNB': 'Utilities',
-'AQST': 'Health Care',
-'AQU': 'Finance',
-'AQUNU': 'Finance',
-'AR': 'Energy',
-'ARAY': 'Health Care',
-'ARBB': 'Technology',
-'ARBE': 'Technology',
-'ARBEW': 'Technology',
-'ARBK': 'Finance',
-'ARBKL': 'Finance',
-'ARC': 'Consumer Discretionary',
-'ARCB': 'Industrials',
-'ARCC': 'Finance',
-'ARCH': 'Energy',
-'ARCO': 'Consumer Discretionary',
-'ARCT': 'Health Care',
-'ARDC': 'Finance',
-'ARDT': 'Health Care',
-'ARDX': 'Health Care',
-'ARE': 'Real Estate',
-'AREB': 'Industrials',
-'AREBW': 'Industrials',
-'AREC': 'Energy',
-'AREN': 'Technology',
-'ARES': 'Finance',
-'ARES^B': 'nan',
-'ARGD': 'Finance',
-'ARGO^A': 'nan',
-'ARGX': 'Health Care',
-'ARHS': 'Consumer Discretionary',
-'ARI': 'Real Estate',
-'ARIS': 'Energy',
-'ARKO': 'Consumer Staples',
-'ARKOW': 'Consumer Staples',
-'ARKR': 'Consumer Discretionary',
-'ARL': 'Real Estate',
-'ARLO': 'Consumer Staples',
-'ARLP': 'Energy',
-'ARM': 'Technology',
-'ARMK': 'Consumer Discretionary',
-'ARMN': 'nan',
-'ARMP': 'Health Care',
-'AROC': 'Utilities',
-'AROW': 'Finance',
-'ARQ': 'Industrials',
-'ARQQ': 'Technology',
-'ARQQW': 'Technology',
-'ARQT': 'Health Care',
-'ARR': 'Real Estate',
-'ARR^C': 'nan',
-'ARRY': 'Consumer Discretionary',
-'ARTL': 'Health Care',
-'ARTNA': 'Utilities',
-'ARTV': 'Health Care',
-'ARTW': 'Industrials',
-'ARVN': 'Health Care',
-'ARW': 'Technology',
-'ARWR': 'Health Care',
-'AS': 'Consumer Discretionary',
-'ASA': 'Industrials',
-'ASAI': 'Consumer Staples',
-'ASAN': 'Technology',
-'ASB': 'Finance',
-'ASB^E': 'nan',
-'ASB^F': 'nan',
-'ASBA': 'Finance',
-'ASC': 'Consumer Discretionary',
-'ASG': 'Finance',
-'ASGI': 'Finance',
-'ASGN': 'Consumer Discretionary',
-'ASH': 'Consumer Discretionary',
-'ASIX': 'Industrials',
-'ASLE': 'Consumer Discretionary',
-'ASM': 'Basic Materials',
-'ASMB': 'Health Care',
-'ASML': 'Technology',
-'ASND': 'Health Care',
-'ASNS': 'Telecommunications',
-'ASO': 'Consumer Discretionary',
-'ASPI': 'Industrials',
-'ASPN': 'Consumer Discretionary',
-'ASPS': 'Consumer Discretionary',
-'ASR': 'Consumer Discretionary',
-'ASRT': 'Health Care',
-'ASRV': 'Finance',
-'ASST': 'Technology',
-'ASTC': 'Industrials',
-'ASTE': 'Industrials',
-'ASTH': 'Consumer Discretionary',
-'ASTI': 'Technology',
-'ASTL': 'Industrials',
-'ASTLW': 'Industrials',
-'ASTS': 'Consumer Discretionary',
-'ASUR': 'Technology',
-'ASX': 'Technology',
-'ASYS': 'Technology',
-'ATAI': 'Health Care',
-'ATAT': 'Consumer Discretionary',
-'ATCH': 'Finance',
-'ATCO^D': 'nan',
-'ATCO^H': 'nan',
-'ATCOL': 'Consumer Discretionary',
-'ATEC': 'Health Care',
-'ATEK': 'Finance',
-'ATEN': 'Telecommunications',
-'ATER': 'Consumer Discretionary',
-'ATEX': 'Telecommunications',
-'ATGE': 'Real Estate',
-'ATGL': 'Technology',
-'ATH^A': 'nan',
-'ATH^B': 'nan',
-'ATH^C': 'nan',
-'ATH^D': 'nan',
-'ATH^E': 'nan',
-'ATHA': 'Health Care',
-'ATHE': 'Health Care',
-'ATHM': 'Technology',
-'ATHS': 'nan',
-'ATI': 'Industrials',
-'ATIF': 'Consumer Discretionary',
-'ATIP': 'Health Care',
-'ATKR': 'Miscellaneous',
-'ATLC': 'Finance',
-'ATLCL': 'Finance',
-'ATLCP': 'Finance',
-'ATLCZ': 'Finance',
-'ATLO': 'Finance',
-'ATLX': 'Industrials',
-'ATMC': 'Finance',
-'ATMCR': 'Finance',
-'ATMCU': 'Finance',
-'ATMU': 'Consumer Discretionary',
-'ATMV': 'Finance',
-'ATMVR': 'Finance',
-'ATMVU': 'Finance',
-'ATNF': 'Health Care',
-'ATNFW': 'Health Care',
-'ATNI': 'Telecommunications',
-'ATNM': 'Health Care',
-'ATO': 'Utilities',
-'ATOM': 'Technology',
-'ATOS': 'Health Care',
-'ATPC': 'Health Care',
-'ATR': 'Industrials',
-'ATRA': 'Health Care',
-'ATRC': 'Health Care',
-'ATRO': 'Industrials',
-'ATS': 'Industrials',
-'ATSG': 'Consumer Discretionary',
-'ATUS': 'Telecommunications',
-'ATXG': 'Consumer Discretionary',
-'ATXI': 'Health Care',
-'ATXS': 'Health Care',
-'ATYR': 'Health Care',
-'AU': 'Basic Materials',
-'AUB': 'Finance',
-'AUB^A': 'nan',
-'AUBN': 'Finance',
-'AUDC': 'Utilities',
-'AUID': 'Technology',
-'AUMN': 'Basic Materials',
-'AUNA': 'Health Care',
-'AUPH': 'Health Care',
-'AUR': 'Technology',
-'AURA': 'Health Care',
-'AUROW': 'Technology',
-'AUST': 'Basic Materials',
-'AUTL': 'Health Care',
-'AUUD': 'Technology',
-'AUUDW': 'Technology',
-'AVA': 'Utilities',
-'AVAH': 'Health Care',
-'AVAL': 'Finance',
-'AVAV': 'Industrials',
-'AVB': 'Real Estate',
-'AVBP': 'Health Care',
-'AVD': 'Industrials',
-'AVDL': 'Health Care',
-'AVDX': 'Technology',
-'AVGO': 'Technology',
-'AVGR': 'Health Care',
-'AVIR': 'Health Care',
-'AVK': 'Finance',
-'AVNS': 'Health Care',
-'AVNT': 'Industrials',
-'AVNW': 'Technology',
-'AVO': 'Consumer Staples',
-'AVPT': 'Technology',
-'AVPTW': 'Technology',
-'AVT': 'Technology',
-'AVTE': 'Health Care',
-'AVTR': 'Industrials',
-'AVTX': 'Health Care',
-'AVXL': 'Health Care',
-'AVY': 'Consumer Discretionary',
-'AWF': 'Finance',
-'AWH': 'Health Care',
-'AWI': 'Industrials',
-'AWK': 'Utilities',
-'AWP': 'Finance',
-'AWR': 'Utilities',
-'AWRE': 'Technology',
-'AWX': 'Utilities',
-'AX': 'Finance',
-'AXDX': 'Industrials',
-'AXGN': 'Health Care',
-'AXIL': 'Consumer Discretionary',
-'AXL': 'Consumer Discretionary',
-'AXNX': 'Health Care',
-'AXON': 'Industrials',
-'AXP': 'Finance',
-'AXR': 'Real Estate',
-'AXS': 'Finance',
-'AXS^E': 'nan',
-'AXSM': 'Health Care',
-'AXTA': 'Consumer Discretionary',
-'AXTI': 'Technology',
-'AY': 'Utilities',
-'AYI': 'Consumer Discretionary',
-'AYRO': 'Consumer Discretionary',
-'AYTU': 'Health Care',
-'AZ': 'Industrials',
-'AZEK': 'Industrials',
-'AZI': 'Consumer Discretionary',
-'AZN': 'Health Care',
-'AZO': 'Consumer Discretionary',
-'AZPN': 'Technology',
-'AZTA': 'Technology',
-'AZTR': 'Health Care',
-'AZUL': 'Consumer Discretionary',
-'AZZ': 'Industrials',
-'B': 'Industrials',
-'BA': 'Industrials',
-'BABA': 'Consumer Discretionary',
-'BAC': 'Finance',
-'BAC^B': 'nan',
-'BAC^E': 'nan',
-'BAC^K': 'nan',
-'BAC^L': 'nan',
-'BAC^M': 'nan',
-'BAC^N': 'nan',
-'BAC^O': 'nan',
-'BAC^P': 'nan',
-'BAC^Q': 'nan',
-'BAC^S': 'nan',
-'BACK': 'Health Care',
-'BAER': 'Consumer Discretionary',
-'BAERW': 'Consumer Discretionary',
-'BAFN': 'Finance',
-'BAH': 'Consumer Discretionary',
-'BAK': 'Industrials',
-'BALL': 'Industrials',
-'BALY': 'Consumer Discretionary',
-'BAM': 'Consumer Discretionary',
-'BANC': 'Finance',
-'BANC^F': 'nan',
-'BAND': 'Technology',
-'BANF': 'Finance',
-'BANFP': 'Finance',
-'BANL': 'Energy',
-'BANR': 'Finance',
-'BANX': 'Finance',
-'BAOS': 'Consumer Discretionary',
-'BAP': 'Finance',
-'BARK': 'Consumer Discretionary',
-'BASE': 'Technology',
-'BATL': 'Energy',
-'BATRA': 'Consumer Discretionary',
-'BATRK': 'Consumer Discretionary',
-'BAX': 'Health Care',
-'BAYA': 'nan',
-'BAYAR': 'nan',
-'BAYAU': 'nan',
-'BB': 'Technology',
-'BBAI': 'Technology',
-'BBAR': 'Finance',
-'BBCP': 'Consumer Discretionary',
-'BBD': 'Finance',
-'BBDC': 'Finance',
-'BBDO': 'Finance',
-'BBGI': 'Consumer Discretionary',
-'BBIO': 'Health Care',
-'BBLG': 'Health Care',
-'BBLGW': 'Health Care',
-'BBN': 'Finance',
-'BBSI': 'Consumer Discretionary',
-'BBU': 'Consumer Discretionary',
-'BBUC': 'Consumer Discretionary',
-'BBVA': 'Finance',
-'BBW': 'Consumer Discretionary',
-'BBWI': 'Consumer Discretionary',
-'BBY': 'Consumer Discretionary',
-'BC': 'Industrials',
-'BC^A': 'nan',
-'BC^B': 'nan',
-'BC^C': 'nan',
-'BCAB': 'Health Care',
-'BCAL': 'Finance',
-'BCAN': 'Technology',
-'BCAT': 'Finance',
-'BCAX': 'Health Care',
-'BCBP': 'Finance',
-'BCC': 'Consumer Discretionary',
-'BCDA': 'Health Care',
-'BCE': 'Telecommunications',
-'BCG': 'Finance',
-'BCGWW': 'Finance',
-'BCH': 'Finance',
-'BCLI': 'Health Care',
-'BCML': 'Finance',
-'BCO': 'Consumer Discretionary',
-'BCOV': 'Technology',
-'BCOW': 'Finance',
-'BCPC': 'Industrials',
-'BCRX': 'Health Care',
-'BCS': 'Finance',
-'BCSA': 'Finance',
-'BCSAU': 'Finance',
-'BCSAW': 'Finance',
-'BCSF': 'Finance',
-'BCTX': 'Health Care',
-'BCTXW': 'Health Care',
-'BCV': 'Finance',
-'BCV^A': 'nan',
-'BCX': 'Finance',
-'BCYC': 'Health Care',
-'BDC': 'Industrials',
-'BDJ': 'Finance',
-'BDL': 'Consumer Discretionary',
-'BDMD': 'Health Care',
-'BDMDW': 'Health Care',
-'BDN': 'Real Estate',
-'BDRX': 'Health Care',
-'BDSX': 'Health Care',
-'BDTX': 'Health Care',
-'BDX': 'Health Care',
-'BE': 'Energy',
-'BEAGU': 'nan',
-'BEAM': 'Health Care',
-'BEAT': 'Health Care',
-'BEATW': 'Health Care',
-'BECN': 'Consumer Discretionary',
-'BEDU': 'Real Estate',
-'BEEM': 'Technology',
-'BEEP': 'Finance',
-'BEKE': 'Finance',
-'BELFA': 'nan',
-'BELFB': 'nan',
-'BEN': 'Finance',
-'BENF': 'Finance',
-'BENFW': 'Finance',
-'BEP': 'Utilities',
-'BEP^A': 'nan',
-'BEPC': 'Utilities',
-'BEPH': 'Utilities',
-'BEPI': 'Utilities',
-'BEPJ': 'Utilities',
-'BERY': 'Industrials',
-'BEST': 'Industrials',
-'BETR': 'Finance',
-'BETRW': 'Finance',
-'BF/A': 'nan',
-'BF/B': 'nan',
-'BFAC': 'Finance',
-'BFAM': 'Consumer Discretionary',
-'BFC': 'Finance',
-'BFH': 'Consumer Discretionary',
-'BFIN': 'Finance',
-'BFK': 'Finance',
-'BFLY': 'Health Care',
-'BFRG': 'Health Care',
-'BFRGW': 'Health Care',
-'BFRI': 'Health Care',
-'BFRIW': 'Health Care',
-'BFS': 'Real Estate',
-'BFS^D': 'nan',
-'BFS^E': 'nan',
-'BFST': 'Finance',
-'BFZ': 'Finance',
-'BG': 'Consumer Staples',
-'BGB': 'Finance',
-'BGC': 'Finance',
-'BGFV': 'Consumer Discretionary',
-'BGH': 'Finance',
-'BGI': 'Consumer Discretionary',
-'BGLC': 'Health Care',
-'BGM': 'Health Care',
-'BGNE': 'Health Care',
-'BGR': 'Finance',
-'BGS': 'Consumer Staples',
-'BGSF': 'Consumer Discretionary',
-'BGT': 'Finance',
-'BGX': 'Finance',
-'BGY': 'Finance',
-'BH': 'Consumer Discretionary',
-'BHAT': 'Consumer Discretionary',
-'BHB': 'Finance',
-'BHC': 'Health Care',
-'BHE': 'Technology',
-'BHF': 'Finance',
-'BHFAL': 'Finance',
-'BHFAM': 'Finance',
-'BHFAN': 'Finance',
-'BHFAO': 'Finance',
-'BHFAP': 'Finance',
-'BHIL': 'Consumer Staples',
-'BHK': 'Finance',
-'BHLB': 'Finance',
-'BHM': 'Real Estate',
-'BHP': 'Energy',
-'BHR': 'Real Estate',
-'BHR^B': 'nan',
-'BHR^D': 'nan',
-'BHRB': 'Finance',
-'BHV': 'Finance',
-'BHVN': 'Health Care',
-'BIAF': 'Health Care',
-'BIAFW': 'Health Care',
-'BIDU': 'Technology',
-'BIGC': 'Technology',
-'BIGZ': 'nan',
-'BIIB': 'Health Care',
-'BILI': 'Technology',
-'BILL': 'Technology',
-'BIO': 'Industrials',
-'BIO/B': 'nan',
-'BIOA': 'Health Care',
-'BIOR': 'Health Care',
-'BIOX': 'Industrials',
-'BIP': 'Consumer Discretionary',
-'BIP^A': 'nan',
-'BIP^B': 'nan',
-'BIPC': 'Consumer Discretionary',
-'BIPH': 'Utilities',
-'BIPI': 'Consumer Discretionary',
-'BIPJ': 'Utilities',
-'BIRD': 'Consumer Discretionary',
-'BIRK': 'Consumer Discretionary',
-'BIT': 'Finance',
-'BITF': 'Finance',
-'BIVI': 'Health Care',
-'BJ': 'Consumer Discretionary',
-'BJDX': 'Health Care',
-'BJRI': 'Consumer Discretionary',
-'BK': 'Finance',
-'BKD': 'Health Care',
-'BKDT': 'Health Care',
-'BKE': 'Consumer Discretionary',
-'BKH': 'Utilities',
-'BKHAR': 'nan',
-'BKKT': 'Finance',
-'BKN': 'Finance',
-'BKNG': 'Consumer Discretionary',
-'BKR': 'Industrials',
-'BKSY': 'Technology',
-'BKT': 'Finance',
-'BKTI': 'Technology',
-'BKU': 'Finance',
-'BKV': 'Energy',
-'BKYI': 'Technology',
-'BL': 'Technology',
-'BLAC': 'Finance',
-'BLBD': 'Consumer Discretionary',
-'BLBX': 'Technology',
-'BLCO': 'Health Care',
-'BLD': 'Consumer Discretionary',
-'BLDE': 'Consumer Discretionary',
-'BLDEW': 'Consumer Discretionary',
-'BLDP': 'Energy',
-'BLDR': 'Consumer Discretionary',
-'BLE': 'Finance',
-'BLEU': 'Finance',
-'BLEUR': 'Finance',
-'BLEUU': 'Finance',
-'BLFS': 'Health Care',
-'BLFY': 'Finance',
-'BLIN': 'Technology',
-'BLK': 'Finance',
-'BLKB': 'Technology',
-'BLMN': 'Consumer Discretionary',
-'BLMZ': 'Consumer Discretionary',
-'BLND': 'Technology',
-'BLNK': 'Consumer Discretionary',
-'BLRX': 'Health Care',
-'BLTE': 'Health Care',
-'BLUE': 'Health Care',
-'BLW': 'Consumer Discretionary',
-'BLX': 'Finance',
-'BLZE': 'Technology',
-'BMA': 'Finance',
-'BMBL': 'Technology',
-'BME': 'Finance',
-'BMEA': 'Health Care',
-'BMEZ': 'Finance',
-'BMI': 'Industrials',
-'BML^G': 'nan',
-'BML^H': 'nan',
-'BML^J': 'nan',
-'BML^L': 'nan',
-'BMN': 'Finance',
-'BMO': 'Finance',
-'BMR': 'Technology',
-'BMRA': 'Health Care',
-'BMRC': 'Finance',
-'BMRN': 'Health Care',
-'BMTX': 'Finance',
-'BMY': 'Health Care',
-'BN': 'Real Estate',
-'BNAI': 'Technology',
-'BNAIW': 'Technology',
-'BNED': 'Consumer Discretionary',
-'BNGO': 'Industrials',
-'BNH': 'Real Estate',
-'BNIX': 'Finance',
-'BNIXR': 'Finance',
-'BNJ': 'Real Estate',
-'BNL': 'Real Estate',
-'BNOX': 'Health Care',
-'BNR': 'Health Care',
-'BNRG': 'Industrials',
-'BNS': 'Finance',
-'BNT': 'Finance',
-'BNTC': 'Health Care',
-'BNTX': 'Health Care',
-'BNY': 'Finance',
-'BNZI': 'Technology',
-'BNZIW': 'Technology',
-'BOC': 'Finance',
-'BOCN': 'Finance',
-'BODI': 'Consumer Discretionary',
-'BOE': 'Finance',
-'BOF': 'Consumer Staples',
-'BOH': 'Finance',
-'BOH^A': 'nan',
-'BOH^B': 'nan',
-'BOKF': 'Finance',
-'BOLD': 'Health Care',
-'BOLT': 'Health Care',
-'BON': 'Health Care',
-'BOOM': 'Industrials',
-'BOOT': 'Consumer Discretionary',
-'BORR': 'Energy',
-'BOSC': 'Telecommunications',
-'BOTJ': 'Finance',
-'BOW': 'Finance',
-'BOWL': 'Consumer Discretionary',
-'BOWN': 'nan',
-'BOWNR': 'nan',
-'BOWNU': 'nan',
-'BOX': 'Technology',
-'BOXL': 'Real Estate',
-'BP': 'Energy',
-'BPMC': 'Health Care',
-'BPOP': 'Finance',
-'BPOPM': 'Finance',
-'BPRN': 'Finance',
-'BPT': 'Energy',
-'BPTH': 'Health Care',
-'BPYPM': 'Finance',
-'BPYPN': 'Finance',
-'BPYPO': 'Finance',
-'BPYPP': 'Finance',
-'BQ': 'Consumer Discretionary',
-'BR': 'Consumer Discretionary',
-'BRAC': 'Finance',
-'BRAG': 'Technology',
-'BRBR': 'Consumer Staples',
-'BRBS': 'Finance',
-'BRC': 'Consumer Discretionary',
-'BRCC': 'Consumer Staples',
-'BRDG': 'Finance',
-'BREA': 'Consumer Discretionary',
-'BRFH': 'Consumer Staples',
-'BRFS': 'Consumer Staples',
-'BRID': 'Consumer Staples',
-'BRK/A': 'nan',
-'BRK/B': 'nan',
-'BRKH': 'Finance',
-'BRKHU': 'Finance',
-'BRKHW': 'Finance',
-'BRKL': 'Finance',
-'BRKR': 'Industrials',
-'BRLS': 'Consumer Staples',
-'BRLSW': 'Consumer Staples',
-'BRLT': 'Consumer Discretionary',
-'BRN': 'Energy',
-'BRNS': 'Health Care',
-'BRO': 'Finance',
-'BROG': 'Energy',
-'BROGW': 'Energy',
-'BROS': 'Consumer Discretionary',
-'BRSP': 'Real Estate',
-'BRT': 'Real Estate',
-'BRTX': 'Health Care',
-'BRW': 'Finance',
-'BRX': 'Real Estate',
-'BRY': 'Energy',
-'BRZE': 'Technology',
-'BSAC': 'Finance',
-'BSBK': 'Finance',
-'BSBR': 'Finance',
-'BSET': 'Consumer Discretionary',
-'BSFC': 'nan',
-'BSGM': 'nan',
-'BSIG': 'Finance',
-'BSII': 'nan',
-'BSIIU': 'Finance',
-'BSIIW': 'Finance',
-'BSL': 'Finance',
-'BSLK': 'Industrials',
-'BSLKW': 'Industrials',
-'BSM': 'Energy',
-'BSRR': 'Finance',
-'BST': 'Finance',
-'BSTZ': 'Finance',
-'BSVN': 'Finance',
-'BSX': 'Health Care',
-'BSY': 'Technology',
-'BTA': 'Finance',
-'BTAI': 'Health Care',
-'BTBD': 'Consumer Discretionary',
-'BTBDW': 'Consumer Discretionary',
-'BTBT': 'Finance',
-'BTCM': 'Technology',
-'BTCS': 'Finance',
-'BTCT': 'Real Estate',
-'BTCTW': 'Real Estate',
-'BTDR': 'Finance',
-'BTE': 'Energy',
-'BTG': 'Basic Materials',
-'BTI': 'Health Care',
-'BTM': 'Finance',
-'BTMD': 'Health Care',
-'BTMWW': 'Finance',
-'BTO': 'Finance',
-'BTOC': 'Consumer Discretionary',
-'BTOG': 'Finance',
-'BTSG': 'Health Care',
-'BTSGU': 'Health Care',
-'BTT': 'Finance',
-'BTTR': 'Consumer Staples',
-'BTU': 'Energy',
-'BTZ': 'Finance',
-'BUD': 'Consumer Staples',
-'BUI': 'Finance',
-'BUJA': 'Finance',
-'BUJAR': 'Finance',
-'BUJAU': 'Finance',
-'BUJAW': 'Finance',
-'BUR': 'Finance',
-'BURL': 'Consumer Discretionary',
-'BURU': 'Miscellaneous',
-'BUSE': 'Finance',
-'BV': 'Consumer Discretionary',
-'BVFL': 'Finance',
-'BVN': 'Basic Materials',
-'BVS': 'Health Care',
-'BW': 'Industrials',
-'BW^A': 'nan',
-'BWA': 'Consumer Discretionary',
-'BWAY': 'Health Care',
-'BWB': 'Finance',
-'BWBBP': 'Finance',
-'BWEN': 'Telecommunications',
-'BWFG': 'Finance',
-'BWG': 'Finance',
-'BWIN': 'Finance',
-'BWLP': 'Consumer Discretionary',
-'BWMN': 'Consumer Discretionary',
-'BWMX': 'Consumer Discretionary',
-'BWNB': 'Industrials',
-'BWSN': 'Industrials',
-'BWXT': 'Industrials',
-'BX': 'Finance',
-'BXC': 'Consumer Discretionary',
-'BXMT': 'Real Estate',
-'BXMX': 'Finance',
-'BXP': 'Real Estate',
-'BXSL': 'Finance',
-'BY': 'Finance',
-'BYD': 'Consumer Discretionary',
-'BYFC': 'Finance',
-'BYM': 'Finance',
-'BYND': 'Consumer Staples',
-'BYNO': 'Finance',
-'BYNOW': 'Finance',
-'BYON': 'Consumer Discretionary',
-'BYRN': 'Miscellaneous',
-'BYSI': 'Health Care',
-'BYU': 'Industrials',
-'BZ': 'Technology',
-'BZFD': 'Consumer Discretionary',
-'BZFDW': 'Consumer Discretionary',
-'BZH': 'Consumer Discretionary',
-'BZUN': 'Consumer Discretionary',
-'C': 'Finance',
-'C^N': 'nan',
-'CAAP': 'Consumer Discretionary',
-'CAAS': 'Consumer Discretionary',
-'CABA': 'Health Care',
-'CABO': 'Telecommunications',
-'CAC': 'Finance',
-'CACC': 'Finance',
-'CACI': 'Technology',
-'CADE': 'Finance',
-'CADE^A': 'nan',
-'CADL': 'Health Care',
-'CAE': 'Miscellaneous',
-'CAF': 'Finance',
-'CAG': 'Consumer Staples',
-'CAH': 'Health Care',
-'CAKE': 'Consumer Discretionary',
-'CAL': 'Consumer Discretionary',
-'CALC': 'Health Care',
-'CALM': 'Consumer Staples',
-'CALX': 'Consumer Discretionary',
-'CAMP': 'nan',
-'CAMT': 'Technology',
-'CAN': 'Technology',
-'CANF': 'Health Care',
-'CANG': 'Technology',
-'CAPL': 'Energy',
-'CAPN': 'nan',
-'CAPNR': 'nan',
-'CAPNU': 'nan',
-'CAPR': 'Health Care',
-'CAPT': 'Miscellaneous',
-'CAPTW': 'Miscellaneous',
-'CAR': 'Consumer Discretionary',
-'CARA': 'Health Care',
-'CARE': 'Finance',
-'CARG': 'Technology',
-'CARM': 'Health Care',
-'CARR': 'Industrials',
-'CARS': 'Technology',
-'CART': 'Consumer Discretionary',
-'CARV': 'Finance',
-'CASH': 'Finance',
-'CASI': 'Health Care',
-'CASS': 'Consumer Discretionary',
-'CASY': 'Consumer Discretionary',
-'CAT': 'Industrials',
-'CATO': 'Consumer Discretionary',
-'CATX': 'Health Care',
-'CATY': 'Finance',
-'CAVA': 'Consumer Discretionary',
-'CB': 'Finance',
-'CBAN': 'Finance',
-'CBAT': 'Miscellaneous',
-'CBFV': 'Finance',
-'CBL': 'Real Estate',
-'CBLL': 'Health Care',
-'CBNA': 'Finance',
-'CBNK': 'Finance',
-'CBOE': 'Finance',
-'CBRE': 'Finance',
-'CBRG': 'Finance',
-'CBRL': 'Consumer Discretionary',
-'CBSH': 'Finance',
-'CBT': 'Industrials',
-'CBU': 'Finance',
-'CBUS': 'Industrials',
-'CBZ': 'Consumer Discretionary',
-'CC': 'Industrials',
-'CCAP': 'Finance',
-'CCB': 'Finance',
-'CCBG': 'Finance',
-'CCCC': 'Health Care',
-'CCCS': 'Technology',
-'CCD': 'Finance',
-'CCEC': 'Consumer Discretionary',
-'CCEL': 'Health Care',
-'CCEP': 'Consumer Staples',
-'CCG': 'Finance',
-'CCGWW': 'Finance',
-'CCI': 'Real Estate',
-'CCIA': 'nan',
-'CCIF': 'Finance',
-'CCIRU': 'Finance',
-'CCIX': 'nan',
-'CCIXU': 'nan',
-'CCIXW': 'nan',
-'CCJ': 'Basic Materials',
-'CCK': 'Industrials',
-'CCL': 'Consumer Discretionary',
-'CCLD': 'Technology',
-'CCLDO': 'Technology',
-'CCLDP': 'Technology',
-'CCM': 'Health Care',
-'CCNE': 'Finance',
-'CCNEP': 'Finance',
-'CCO': 'Consumer Discretionary',
-'CCOI': 'Consumer Discretionary',
-'CCRD': 'Technology',
-'CCRN': 'Consumer Discretionary',
-'CCS': 'Consumer Discretionary',
-'CCSI': 'Technology',
-'CCTG': 'Consumer Discretionary',
-'CCTS': 'Finance',
-'CCTSU': 'Finance',
-'CCTSW': 'Finance',
-'CCU': 'Consumer Staples',
-'CCZ': 'Telecommunications',
-'CDE': 'Basic Materials',
-'CDIO': 'Health Care',
-'CDIOW': 'Health Care',
-'CDLR': 'Consumer Discretionary',
-'CDLX': 'Technology',
-'CDMO': 'Health Care',
-'CDNA': 'Health Care',
-'CDNS': 'Technology',
-'CDP': 'Real Estate',
-'CDR^B': 'nan',
-'CDR^C': 'nan',
-'CDRE': 'Health Care',
-'CDRO': 'Consumer Discretionary',
-'CDROW': 'Consumer Discretionary',
-'CDT': 'Health Care',
-'CDTG': 'Industrials',
-'CDTTW': 'Health Care',
-'CDTX': 'Health Care',
-'CDW': 'Consumer Discretionary',
-'CDXC': 'Health Care',
-'CDXS': 'Industrials',
-'CDZI': 'Utilities',
-'CDZIP': 'Utilities',
-'CE': 'Industrials',
-'CEAD': 'Industrials',
-'CECO': 'Industrials',
-'CEE': 'Finance',
-'CEG': 'Utilities',
-'CEIX': 'Energy',
-'CELC': 'Health Care',
-'CELH': 'Consumer Staples',
-'CELU': 'Health Care',
-'CELUW': 'Health Care',
-'CELZ': 'Finance',
-'CENN': 'Consumer Discretionary',
-'CENT': 'Consumer Discretionary',
-'CENTA': 'Consumer Discretionary',
-'CENX': 'Industrials',
-'CEP': 'Finance',
-'CEPU': 'Utilities',
-'CERO': 'Health Care',
-'CEROW': 'Health Care',
-'CERS': 'Technology',
-'CERT': 'Technology',
-'CET': 'Finance',
-'CETX': 'Technology',
-'CETY': 'Consumer Discretionary',
-'CEV': 'Finance',
-'CEVA': 'Technology',
-'CF': 'Industrials',
-'CFB': 'Finance',
-'CFBK': 'Finance',
-'CFFI': 'Finance',
-'CFFN': 'Finance',
-'CFFS': 'Finance',
-'CFG': 'Finance',
-'CFG^E': 'nan',
-'CFG^H': 'nan',
-'CFLT': 'Technology',
-'CFR': 'Finance',
-'CFR^B': 'nan',
-'CFSB': 'Finance',
-'CG': 'Finance',
-'CGA': 'Industrials',
-'CGABL': 'Finance',
-'CGAU': 'Basic Materials',
-'CGBD': 'Finance',
-'CGBDL': 'nan',
-'CGBS': 'Utilities',
-'CGBSW': 'Utilities',
-'CGC': 'Health Care',
-'CGEM': 'Health Care',
-'CGEN': 'Health Care',
-'CGNT': 'Technology',
-'CGNX': 'Industrials',
-'CGO': 'Finance',
-'CGON': 'nan',
-'CGTX': 'Health Care',
-'CHARU': 'nan',
-'CHCI': 'Finance',
-'CHCO': 'Finance',
-'CHCT': 'Real Estate',
-'CHD': 'Consumer Discretionary',
-'CHDN': 'Consumer Discretionary',
-'CHE': 'Health Care',
-'CHEB': 'nan',
-'CHEF': 'Consumer Discretionary',
-'CHEK': 'Health Care',
-'CHGG': 'Real Estate',
-'CHH': 'Consumer Discretionary',
-'CHI': 'Finance',
-'CHKP': 'Technology',
-'CHMG': 'Finance',
-'CHMI': 'Real Estate',
-'CHMI^A': 'nan',
-'CHMI^B': 'nan',
-'CHN': 'Finance',
-'CHNR': 'Basic Materials',
-'CHPT': 'Consumer Discretionary',
-'CHR': 'Technology',
-'CHRD': 'Energy',
-'CHRO': 'Health Care',
-'CHRS': 'Health Care',
-'CHRW': 'Consumer Discretionary',
-'CHSCL': 'Industrials',
-'CHSCM': 'Industrials',
-'CHSCN': 'Industrials',
-'CHSCO': 'Industrials',
-'CHSCP': 'Industrials',
-'CHSN': 'Consumer Staples',
-'CHT': 'Telecommunications',
-'CHTR': 'Telecommunications',
-'CHW': 'Finance',
-'CHWY': 'Consumer Discretionary',
-'CHX': 'Industrials',
-'CHY': 'Finance',
-'CI': 'Health Care',
-'CIA': 'Finance',
-'CIB': 'Finance',
-'CICB': 'Finance',
-'CIEN': 'Utilities',
-'CIF': 'Finance',
-'CIFR': 'Finance',
-'CIFRW': 'Finance',
-'CIG': 'Utilities',
-'CIGI': 'Finance',
-'CII': 'Finance',
-'CIK': 'Finance',
-'CIM': 'Real Estate',
-'CIM^A': 'nan',
-'CIM^B': 'nan',
-'CIM^C': 'nan',
-'CIM^D': 'nan',
-'CIMN': 'Real Estate',
-'CIMO': 'Real Estate',
-'CINF': 'Finance',
-'CING': 'Health Care',
-'CINGW': 'Health Care',
-'CINT': 'Technology',
-'CIO': 'Real Estate',
-'CIO^A': 'nan',
-'CION': 'Finance',
-'CISO': 'Consumer Discretionary',
-'CISS': 'Consumer Discretionary',
-'CITE': 'Finance',
-'CITEU': 'Finance',
-'CITEW': 'Finance',
-'CIVB': 'Finance',
-'CIVI': 'Energy',
-'CIX': 'Consumer Discretionary',
-'CJET': 'Consumer Discretionary',
-'CJJD': 'Consumer Staples',
-'CKPT': 'Health Care',
-'CKX': 'Energy',
-'CL': 'Consumer Discretionary',
-'CLAR': 'Consumer Discretionary',
-'CLB': 'Energy',
-'CLBK': 'Finance',
-'CLBR': 'nan',
-'CLBT': 'Technology',
-'CLCO': 'Consumer Discretionary',
-'CLDI': 'Health Care',
-'CLDT': 'Real Estate',
-'CLDT^A': 'nan',
-'CLDX': 'Health Care',
-'CLEU': 'Real Estate',
-'CLF': 'Basic Materials',
-'CLFD': 'Utilities',
-'CLGN': 'Health Care',
-'CLH': 'Industrials',
-'CLIK': 'Consumer Discretionary',
-'CLIR': 'Industrials',
-'CLLS': 'Health Care',
-'CLM': 'Finance',
-'CLMB': 'Technology',
-'CLMT': 'Energy',
-'CLNE': 'Utilities',
-'CLNN': 'Health Care',
-'CLNNW': 'Health Care',
-'CLOV': 'Health Care',
-'CLPR': 'Real Estate',
-'CLPS': 'Technology',
-'CLPT': 'Health Care',
-'CLRB': 'Health Care',
-'CLRO': 'Utilities',
-'CLS': 'Technology',
-'CLSD': 'Health Care',
-'CLSK': 'Finance',
-'CLST': 'Finance',
-'CLVT': 'Technology',
-'CLW': 'Basic Materials',
-'CLWT': 'Consumer Discretionary',
-'CLX': 'Consumer Discretionary',
-'CLYM': 'Health Care',
-'CM': 'Finance',
-'CMA': 'Finance',
-'CMAX': 'Health Care',
-'CMBM': 'Technology',
-'CMBT': 'Consumer Discretionary',
-'CMC': 'Industrials',
-'CMCL': 'Basic Materials',
-'CMCM': 'Technology',
-'CMCO': 'Industrials',
-'CMCSA': 'Telecommunications',
-'CMCT': 'Real Estate',
-'CME': 'Finance',
-'CMG': 'Consumer Discretionary',
-'CMI': 'Industrials',
-'CMLS': 'Consumer Discretionary',
-'CMMB': 'Health Care',
-'CMND': 'Health Care',
-'CMP': 'Industrials',
-'CMPO': 'Finance',
-'CMPOW': 'Finance',
-'CMPR': 'Consumer Discretionary',
-'CMPS': 'Health Care',
-'CMPX': 'Health Care',
-'CMRE': 'Consumer Discretionary',
-'CMRE^B': 'nan',
-'CMRE^C': 'nan',
-'CMRE^D': 'nan',
-'CMRX': 'Health Care',
-'CMS': 'Utilities',
-'CMS^B': 'nan',
-'CMS^C': 'nan',
-'CMSA': 'Utilities',
-'CMSC': 'Utilities',
-'CMSD': 'Utilities',
-'CMT': 'Industrials',
-'CMTG': 'Finance',
-'CMTL': 'Technology',
-'CMU': 'Finance',
-'CNA': 'Finance',
-'CNC': 'Health Care',
-'CNDT': 'Consumer Discretionary',
-'CNET': 'Technology',
-'CNEY': 'Industrials',
-'CNF': 'Finance',
-'CNFR': 'Finance',
-'CNFRZ': 'nan',
-'CNH': 'Industrials',
-'CNI': 'Industrials',
-'CNK': 'Consumer Discretionary',
-'CNL': 'nan',
-'CNM': 'Consumer Discretionary',
-'CNMD': 'Health Care',
-'CNNE': 'Consumer Discretionary',
-'CNO': 'Finance',
-'CNO^A': 'nan',
-'CNOB': 'Finance',
-'CNOBP': 'Finance',
-'CNP': 'Utilities',
-'CNQ': 'Energy',
-'CNS': 'Finance',
-'CNSL': 'Telecommunications',
-'CNSP': 'Health Care',
-'CNTA': 'Health Care',
-'CNTB': 'Health Care',
-'CNTM': 'Consumer Discretionary',
-'CNTX': 'Health Care',
-'CNTY': 'Consumer Discretionary',
-'CNVS': 'Consumer Discretionary',
-'CNX': 'Energy',
-'CNXC': 'Technology',
-'CNXN': 'Consumer Discretionary',
-'COCH': 'Health Care',
-'COCO': 'Consumer Staples',
-'COCP': 'Health Care',
-'CODA': 'Industrials',
-'CODI': 'Consumer Discretionary',
-'CODI^A': 'nan',
-'CODI^B': 'nan',
-'CODI^C': 'nan',
-'CODX': 'Health Care',
-'COE': 'Real Estate',
-'COEP': 'Health Care',
-'COEPW': 'Health Care',
-'COF': 'Finance',
-'COF^I': 'nan',
-'COF^J': 'nan',
-'COF^K': 'nan',
-'COF^L': 'nan',
-'COF^N': 'nan',
-'COFS': 'Finance',
-'COGT': 'Health Care',
-'COHN': 'Finance',
-'COHR': 'Technology',
-'COHU': 'Industrials',
-'COIN': 'Finance',
-'COKE': 'Consumer Staples',
-'COLB': 'Finance',
-'COLD': 'Real Estate',
-'COLL': 'Health Care',
-'COLM': 'Consumer Discretionary',
-'COMM': 'Technology',
-'COMP': 'Technology',
-'CON': 'Health Care',
-'COO': 'Health Care',
-'COOK': 'Consumer Discretionary',
-'COOP': 'Finance',
-'COOT': 'Consumer Staples',
-'COOTW': 'Consumer Staples',
-'COP': 'Energy',
-'COR': 'Health Care',
-'CORT': 'Health Care',
-'CORZ': 'Finance',
-'CORZW': 'Finance',
-'CORZZ': 'Finance',
-'COSM': 'Health Care',
-'COST': 'Consumer Discretionary',
-'COTY': 'Consumer Discretionary',
-'COUR': 'Technology',
-'COYA': 'Health Care',
-'CP': 'Industrials',
-'CPA': 'Consumer Discretionary',
-'CPAC': 'Industrials',
-'CPAY': 'Consumer Discretionary',
-'CPB': 'Consumer Staples',
-'CPBI': 'Finance',
-'CPF': 'Finance',
-'CPHC': 'Consumer Discretionary',
-'CPHI': 'Health Care',
-'CPIX': 'Health Care',
-'CPK': 'Utilities',
-'CPNG': 'Consumer Discretionary',
-'CPOP': 'Consumer Discretionary',
-'CPRI': 'Consumer Discretionary',
-'CPRT': 'Consumer Discretionary',
-'CPRX': 'Health Care',
-'CPS': 'Consumer Discretionary',
-'CPSH': 'Consumer Discretionary',
-'CPSS': 'Finance',
-'CPT': 'Real Estate',
-'CPTN': 'Consumer Discretionary',
-'CPTNW': 'Consumer Discretionary',
-'CPZ': 'Finance',
-'CQP': 'Utilities',
-'CR': 'Industrials',
-'CRAI': 'Consumer Discretionary',
-'CRBG': 'Finance',
-'CRBP': 'Health Care',
-'CRBU': 'Health Care',
-'CRC': 'Energy',
-'CRCT': 'Technology',
-'CRD/A': 'nan',
-'CRD/B': 'nan',
-'CRDF': 'Health Care',
-'CRDL': 'Health Care',
-'CRDO': 'Technology',
-'CREG': 'Consumer Discretionary',
-'CRESW': 'Finance',
-'CRESY': 'Finance',
-'CREV': 'Consumer Discretionary',
-'CREVW': 'Consumer Discretionary',
-'CREX': 'Technology',
-'CRF': 'Finance',
-'CRGO': 'Consumer Discretionary',
-'CRGOW': 'Consumer Discretionary',
-'CRGX': 'nan',
-'CRGY': 'Energy',
-'CRH': 'Industrials',
-'CRI': 'Consumer Discretionary',
-'CRIS': 'Health Care',
-'CRK': 'Energy',
-'CRKN': 'Technology',
-'CRL': 'Health Care',
-'CRM': 'Technology',
-'CRMD': 'Health Care',
-'CRML': 'Basic Materials',
-'CRMLW': 'Basic Materials',
-'CRMT': 'Consumer Discretionary',
-'CRNC': 'Technology',
-'CRNT': 'Technology',
-'CRNX': 'Health Care',
-'CRON': 'Health Care',
-'CROX': 'Consumer Discretionary',
-'CRS': 'Industrials',
-'CRSP': 'Health Care',
-'CRSR': 'Technology',
-'CRT': 'Energy',
-'CRTO': 'Consumer Discretionary',
-'CRUS': 'Technology',
-'CRVL': 'Finance',
-'CRVO': 'Health Care',
-'CRVS': 'Health Care',
-'CRWD': 'Technology',
-'CRWS': 'Consumer Discretionary',
-'CSAN': 'Consumer Discretionary',
-'CSBR': 'Health Care',
-'CSCI': 'Health Care',
-'CSCO': 'Telecommunications',
-'CSGP': 'Consumer Discretionary',
-'CSGS': 'Technology',
-'CSIQ': 'Technology',
-'CSL': 'Industrials',
-'CSLM': 'Finance',
-'CSLMR': 'Finance',
-'CSLMU': 'Finance',
-'CSLR': 'Technology',
-'CSLRW': 'Technology',
-'CSPI': 'Technology',
-'CSQ': 'Finance',
-'CSR': 'Real Estate',
-'CSTE': 'Industrials',
-'CSTL': 'Health Care',
-'CSTM': 'Industrials',
-'CSV': 'Consumer Discretionary',
-'CSWC': 'Consumer Discretionary',
-'CSWCZ': 'Finance',
-'CSWI': 'Industrials',
-'CSX': 'Industrials',
-'CTA^A': 'nan',
-'CTA^B': 'nan',
-'CTAS': 'Consumer Discretionary',
-'CTBB': 'Telecommunications',
-'CTBI': 'Finance',
-'CTCX': 'Health Care',
-'CTDD': 'Telecommunications',
-'CTGO': 'Basic Materials',
-'CTHR': 'Consumer Discretionary',
-'CTKB': 'Industrials',
-'CTLP': 'Miscellaneous',
-'CTLT': 'Health Care',
-'CTM': 'Consumer Discretionary',
-'CTMX': 'Health Care',
-'CTNM': 'Health Care',
-'CTNT': 'Consumer Discretionary',
-'CTO': 'Real Estate',
-'CTO^A': 'nan',
-'CTOR': 'Health Care',
-'CTOS': 'Consumer Discretionary',
-'CTRA': 'Energy',
-'CTRE': 'Real Estate',
-'CTRI': 'Utilities',
-'CTRM': 'Consumer Discretionary',
-'CTRN': 'Consumer Discretionary',
-'CTS': 'Technology',
-'CTSH': 'Technology',
-'CTSO': 'Health Care',
-'CTV': 'Technology',
-'CTVA': 'Consumer Staples',
-'CTXR': 'Health Care',
-'CUB': 'Industrials',
-'CUBA': 'Finance',
-'CUBB': 'Finance',
-'CUBE': 'Real Estate',
-'CUBI': 'Finance',
-'CUBI^E': 'nan',
-'CUBI^F': 'nan',
-'CUBWU': 'Finance',
-'CUBWW': 'nan',
-'CUE': 'Health Care',
-'CUK': 'Consumer Discretionary',
-'CULP': 'Consumer Discretionary',
-'CURB': 'Finance',
-'CURI': 'Consumer Discretionary',
-'CURIW': 'Consumer Discretionary',
-'CURR': 'Consumer Discretionary',
-'CURV': 'Consumer Discretionary',
-'CUTR': 'Health Care',
-'CUZ': 'Real Estate',
-'CVAC': 'Health Care',
-'CVBF': 'Finance',
-'CVCO': 'Consumer Discretionary',
-'CVE': 'Energy',
-'CVEO': 'Consumer Discretionary',
-'CVGI': 'Consumer Discretionary',
-'CVGW': 'Consumer Discretionary',
-'CVI': 'Energy',
-'CVKD': 'Health Care',
-'CVLG': 'Industrials',
-'CVLT': 'Technology',
-'CVM': 'Health Care',
-'CVNA': 'Consumer Discretionary',
-'CVR': 'Industrials',
-'CVRX': 'Health Care',
-'CVS': 'Consumer Staples',
-'CVU': 'Industrials',
-'CVV': 'Technology',
-'CVX': 'Energy',
-'CW': 'Technology',
-'CWAN': 'Technology',
-'CWBC': 'Finance',
-'CWCO': 'Utilities',
-'CWD': 'Finance',
-'CWEN': 'Utilities',
-'CWH': 'Consumer Discretionary',
-'CWK': 'Finance',
-'CWST': 'Utilities',
-'CWT': 'Utilities',
-'CX': 'Industrials',
-'CXAI': 'Technology',
-'CXAIW': 'Technology',
-'CXDO': 'Telecommunications',
-'CXE': 'Finance',
-'CXH': 'Finance',
-'CXM': 'Technology',
-'CXT': 'Industrials',
-'CXW': 'Real Estate',
-'CYBN': 'Health Care',
-'CYBR': 'Technology',
-'CYCC': 'Health Care',
-'CYCCP': 'Health Care',
-'CYCN': 'Health Care',
-'CYD': 'Industrials',
-'CYH': 'Health Care',
-'CYN': 'Technology',
-'CYRX': 'Health Care',
-'CYTH': 'Health Care',
-'CYTHW': 'Health Care',
-'CYTK': 'Health Care',
-'CYTO': 'Health Care',
-'CZFS': 'Finance',
-'CZNC': 'Finance',
-'CZR': 'Consumer Discretionary',
-'CZWI': 'Finance',
-'D': 'Utilities',
-'DAC': 'Consumer Discretionary',
-'DADA': 'Technology',
-'DAIO': 'Industrials',
-'DAKT': 'Consumer Discretionary',
-'DAL': 'Consumer Discretionary',
-'DALN': 'Consumer Discretionary',
-'DAN': 'Consumer Discretionary',
-'DAO': 'Real Estate',
-'DAR': 'Consumer Staples',
-'DARE': 'Health Care',
-'DASH': 'Consumer Discretionary',
-'DATS': 'Telecommunications',
-'DATSW': 'Telecommunications',
-'DAVA': 'Technology',
-'DAVE': 'Finance',
-'DAVEW': 'Finance',
-'DAWN': 'Health Care',
-'DAY': 'Technology',
-'DB': 'Finance',
-'DBD': 'Miscellaneous',
-'DBGI': 'Consumer Discretionary',
-'DBGIW': 'Consumer Discretionary',
-'DBI': 'Consumer Discretionary',
-'DBL': 'nan',
-'DBRG': 'Real Estate',
-'DBRG^H': 'nan',
-'DBRG^I': 'nan',
-'DBRG^J': 'nan',
-'DBVT': 'Health Care',
-'DBX': 'Technology',
-'DC': 'Basic Materials',
-'DCBO': 'Technology',
-'DCF': 'Finance',
-'DCGO': 'Health Care',
-'DCI': 'Industrials',
-'DCO': 'Industrials',
-'DCOM': 'Finance',
-'DCOMG': 'Finance',
-'DCOMP': 'Finance',
-'DCTH': 'Health Care',
-'DD': 'Industrials',
-'DDC': 'Consumer Staples',
-'DDD': 'Technology',
-'DDI': 'Technology',
-'DDL': 'Consumer Discretionary',
-'DDOG': 'Technology',
-'DDS': 'Consumer Discretionary',
-'DDT': 'Consumer Discretionary',
-'DE': 'Industrials',
-'DEA': 'Real Estate',
-'DEC': 'nan',
-'DECAU': 'Finance',
-'DECK': 'Consumer Discretionary',
-'DEI': 'Real Estate',
-'DELL': 'Technology',
-'DENN': 'Consumer Discretionary',
-'DEO': 'Consumer Staples',
-'DERM': 'Health Care',
-'DESP': 'Consumer Discretionary',
-'DFH': 'Consumer Discretionary',
-'DFIN': 'Consumer Discretionary',
-'DFLI': 'Miscellaneous',
-'DFLIW': 'Miscellaneous',
-'DFP': 'Finance',
-'DFS': 'Finance',
-'DG': 'Consumer Discretionary',
-'DGHI': 'Finance',
-'DGICA': 'Finance',
-'DGICB': 'Finance',
-'DGII': 'Telecommunications',
-'DGLY': 'Technology',
-'DGX': 'Health Care',
-'DH': 'Technology',
-'DHAI': 'Health Care',
-'DHAIW': 'Health Care',
-'DHC': 'Real Estate',
-'DHCNI': 'Real Estate',
-'DHCNL': 'Real Estate',
-'DHF': 'Finance',
-'DHI': 'Consumer Discretionary',
-'DHIL': 'Finance',
-'DHR': 'Industrials',
-'DHT': 'Consumer Discretionary',
-'DHX': 'Consumer Discretionary',
-'DHY': 'Finance',
-'DIAX': 'Finance',
-'DIBS': 'Consumer Discretionary',
-'DIN': 'Consumer Discretionary',
-'DINO': 'Energy',
-'DIOD': 'Technology',
-'DIS': 'Consumer Discretionary',
-'DIST': 'Finance',
-'DISTW': 'Finance',
-'DIT': 'Consumer Discretionary',
-'DJCO': 'Consumer Discretionary',
-'DJT': 'Technology',
-'DJTWW': 'Technology',
-'DK': 'Energy',
-'DKL': 'Energy',
-'DKNG': 'Consumer Discretionary',
-'DKS': 'Consumer Discretionary',
-'DLB': 'Miscellaneous',
-'DLHC': 'Consumer Discretionary',
-'DLNG': 'Consumer Discretionary',
-'DLNG^A': 'nan',
-'DLNG^B': 'nan',
-'DLO': 'Consumer Discretionary',
-'DLPN': 'Consumer Discretionary',
-'DLR': 'Real Estate',
-'DLR^J': 'nan',
-'DLR^K': 'nan',
-'DLR^L': 'nan',
-'DLTH': 'Consumer Discretionary',
-'DLTR': 'Consumer Discretionary',
-'DLX': 'Consumer Discretionary',
-'DLY': 'Finance',
-'DM': 'Technology',
-'DMA': 'Finance',
-'DMAC': 'Health Care',
-'DMB': 'Finance',
-'DMF': 'Finance',
-'DMLP': 'Energy',
-'DMO': 'Finance',
-'DMRC': 'Technology',
-'DMYY': 'Finance',
-'DNA': 'Health Care',
-'DNB': 'Finance',
-'DNLI': 'Health Care',
-'DNMR': 'Industrials',
-'DNN': 'Basic Materials',
-'DNOW': 'Industrials',
-'DNP': 'Finance',
-'DNTH': 'Health Care',
-'DNUT': 'Consumer Staples',
-'DOC': 'Real Estate',
-'DOCN': 'Technology',
-'DOCS': 'Technology',
-'DOCU': 'Technology',
-'DOGZ': 'Consumer Discretionary',
-'DOLE': 'Consumer Staples',
-'DOMH': 'Health Care',
-'DOMO': 'Technology',
-'DOOO': 'Consumer Discretionary',
-'DORM': 'Consumer Discretionary',
-'DOUG': 'Finance',
-'DOV': 'Industrials',
-'DOW': 'Industrials',
-'DOX': 'Technology',
-'DOYU': 'Technology',
-'DPCS': 'Finance',
-'DPCSU': 'Finance',
-'DPCSW': 'Finance',
-'DPG': 'Finance',
-'DPRO': 'Industrials',
-'DPZ': 'Consumer Discretionary',
-'DQ': 'Technology',
-'DRCT': 'Consumer Discretionary',
-'DRD': 'Basic Materials',
-'DRH': 'Real Estate',
-'DRH^A': 'nan',
-'DRI': 'Consumer Discretionary',
-'DRIO': 'Health Care',
-'DRMA': 'Health Care',
-'DRRX': 'Health Care',
-'DRS': 'Industrials',
-'DRTS': 'Health Care',
-'DRTSW': 'Health Care',
-'DRUG': 'Health Care',
-'DRVN': 'Consumer Discretionary',
-'DSGN': 'Health Care',
-'DSGR': 'Consumer Discretionary',
-'DSGX': 'Technology',
-'DSL': 'Finance',
-'DSM': 'Finance',
-'DSP': 'Technology',
-'DSS': 'Consumer Discretionary',
-'DSU': 'Finance',
-'DSWL': 'Industrials',
-'DSX': 'Consumer Discretionary',
-'DSX^B': 'nan',
-'DSY': 'Consumer Discretionary',
-'DSYWW': 'Consumer Discretionary',
-'DT': 'Technology',
-'DTB': 'Utilities',
-'DTC': 'Consumer Discretionary',
-'DTCK': 'Industrials',
-'DTE': 'Utilities',
-'DTF': 'Finance',
-'DTG': 'Utilities',
-'DTI': 'Industrials',
-'DTIL': 'Health Care',
-'DTM': 'Utilities',
-'DTSQ': 'nan',
-'DTSQR': 'nan',
-'DTSQU': 'nan',
-'DTSS': 'Technology',
-'DTST': 'Technology',
-'DTSTW': 'Technology',
-'DTW': 'Utilities',
-'DUET': 'Finance',
-'DUK': 'Utilities',
-'DUK^A': 'nan',
-'DUKB': 'Utilities',
-'DUO': 'Finance',
-'DUOL': 'Technology',
-'DUOT': 'Technology',
-'DV': 'Technology',
-'DVA': 'Health Care',
-'DVAX': 'Health Care',
-'DVN': 'Energy',
-'DWSN': 'Energy',
-'DWTX': 'Health Care',
-'DX': 'Real Estate',
-'DX^C': 'nan',
-'DXC': 'Technology',
-'DXCM': 'Health Care',
-'DXLG': 'Consumer Discretionary',
-'DXPE': 'Industrials',
-'DXR': 'Health Care',
-'DXYZ': 'nan',
-'DY': 'Industrials',
-'DYAI': 'Health Care',
-'DYCQ': 'nan',
-'DYN': 'Health Care',
-'E': 'Energy',
-'EA': 'Technology',
-'EAD': 'Finance',
-'EAF': 'Energy',
-'EAI': 'Utilities',
-'EARN': 'Real Estate',
-'EAST': 'Consumer Staples',
-'EAT': 'Consumer Discretionary',
-'EB': 'Technology',
-'EBAY': 'Consumer Discretionary',
-'EBC': 'Finance',
-'EBF': 'Consumer Discretionary',
-'EBMT': 'Finance',
-'EBON': 'Technology',
-'EBR': 'Utilities',
-'EBS': 'Health Care',
-'EBTC': 'Finance',
-'EC': 'Energy',
-'ECAT': 'Finance',
-'ECBK': 'Finance',
-'ECC           ': 'Finance',
-'ECC^D': 'nan',
-'ECCC': 'Finance',
-'ECCF': 'nan',
-'ECCV': 'Finance',
-'ECCW': 'Finance',
-'ECCX': 'Finance',
-'ECDA': 'Consumer Discretionary',
-'ECF': 'Finance',
-'ECF^A': 'nan',
-'ECL': 'Consumer Discretionary',
-'ECO': 'Consumer Discretionary',
-'ECOR': 'Health Care',
-'ECPG': 'Finance',
-'ECVT': 'Industrials',
-'ECX': 'Technology',
-'ED': 'Utilities',
-'EDAP': 'Health Care',
-'EDBL': 'Consumer Staples',
-'EDBLW': 'Consumer Staples',
-'EDD': 'Finance',
-'EDF': 'Finance',
-'EDIT': 'Health Care',
-'EDN': 'Utilities',
-'EDR': 'Consumer Discretionary',
-'EDRY': 'Consumer Discretionary',
-'EDSA': 'Health Care',
-'EDTK': 'Real Estate',
-'EDU': 'Real Estate',
-'EDUC': 'Consumer Discretionary',
-'EE': 'Utilities',
-'EEA': 'Finance',
-'EEFT': 'Finance',
-'EEIQ': 'Real Estate',
-'EEX': 'Consumer Discretionary',
-'EFC': 'Finance',
-'EFC^A': 'nan',
-'EFC^B': 'nan',
-'EFC^C': 'nan',
-'EFC^E': 'nan',
-'EFOI': 'Consumer Discretionary',
-'EFR': 'Finance',
-'EFSC': 'Finance',
-'EFSCP': 'Finance',
-'EFSH': 'Consumer Discretionary',
-'EFT': 'Finance',
-'EFX': 'Finance',
-'EFXT': 'Industrials',
-'EG': 'Finance',
-'EGAN': 'Technology',
-'EGBN': 'Finance',
-'EGF': 'Finance',
-'EGY': 'Energy',
-'EH': 'Industrials',
-'EHAB': 'Health Care',
-'EHC': 'Health Care',
-'EHGO': 'Consumer Discretionary',
-'EHI': 'Finance',
-'EHTH': 'Finance',
-'EIC': 'Finance',
-'EICA': 'Finance',
-'EICB': 'nan',
-'EICC': 'nan',
-'EIG': 'Finance',
-'EIIA': 'nan',
-'EIM': 'Finance',
-'EIX': 'Utilities',
-'EJH': 'Consumer Discretionary',
-'EKSO': 'Industrials',
-'EL': 'Consumer Discretionary',
-'ELA': 'Consumer Discretionary',
-'ELAB': 'Health Care',
-'ELAN': 'Health Care',
-'ELBM': 'Miscellaneous',
-'ELC': 'Utilities',
-'ELDN': 'Health Care',
-'ELEV': 'Health Care',
-'ELF': 'Consumer Discretionary',
-'ELLO': 'Utilities',
-'ELMD': 'Health Care',
-'ELME': 'Real Estate',
-'ELP': 'Utilities',
-'ELPC': 'Utilities',
-'ELS': 'Real Estate',
-'ELSE': 'Industrials',
-'ELTK': 'Technology',
-'ELTX': 'Health Care',
-'ELUT': 'Health Care',
-'ELV': 'Health Care',
-'ELVA': 'nan',
-'ELVN': 'Health Care',
-'ELWS': 'Technology',
-'EM': 'Consumer Discretionary',
-'EMBC': 'Health Care',
-'EMCG': 'Finance',
-'EMCGR': 'Finance',
-'EMCGU': 'Finance',
-'EMCGW': 'Finance',
-'EMD': 'Finance',
-'EME': 'Industrials',
-'EMF': 'Finance',
-'EMKR': 'Technology',
-'EML': 'Consumer Discretionary',
-'EMN': 'Industrials',
-'EMO': 'Finance',
-'EMP': 'Utilities',
-'EMR': 'Technology',
-'EMX': 'Basic Materials',
-'ENB': 'Energy',
-'ENFN': 'Technology',
-'ENG': 'Consumer Discretionary',
-'ENGN': 'Health Care',
-'ENGNW': 'Health Care',
-'ENIC': 'Utilities',
-'ENJ': 'Utilities',
-'ENLC': 'Utilities',
-'ENLT': 'Utilities',
-'ENLV': 'Health Care',
-'ENO': 'Utilities',
-'ENOV': 'Health Care',
-'ENPH': 'Technology',
-'ENR': 'Miscellaneous',
-'ENS': 'Technology',
-'ENSC': 'Health Care',
-'ENSG': 'Health Care',
-'ENSV': 'Energy',
-'ENTA': 'Health Care',
-'ENTG': 'Industrials',
-'ENTO': 'Health Care',
-'ENTX': 'Health Care',
-'ENV': 'Consumer Discretionary',
-'ENVA': 'Finance',
-'ENVB': 'Health Care',
-'ENVX': 'Miscellaneous',
-'ENX': 'Finance',
-'ENZ': 'Health Care',
-'EOD': 'Finance',
-'EOG': 'Energy',
-'EOI': 'Finance',
-'EOLS': 'Health Care',
-'EONR': 'Energy',
-'EOS': 'Finance',
-'EOSE': 'Miscellaneous',
-'EOSEW': 'Miscellaneous',
-'EOT': 'Finance',
-'EP': 'Energy',
-'EP^C': 'nan',
-'EPAC': 'Technology',
-'EPAM': 'Technology',
-'EPC': 'Consumer Discretionary',
-'EPD': 'Utilities',
-'EPIX': 'Health Care',
-'EPM': 'Energy',
-'EPOW': 'Consumer Discretionary',
-'EPR': 'Real Estate',
-'EPR^C': 'nan',
-'EPR^E': 'nan',
-'EPR^G': 'nan',
-'EPRT': 'Real Estate',
-'EPRX': 'Health Care',
-'EPSN': 'Energy',
-'EQ': 'Health Care',
-'EQBK': 'Finance',
-'EQC': 'Real Estate',
-'EQC^D': 'nan',
-'EQH': 'Finance',
-'EQH^A': 'nan',
-'EQH^C': 'nan',
-'EQIX': 'Real Estate',
-'EQNR': 'Energy',
-'EQR': 'Real Estate',
-'EQS': 'Finance',
-'EQT': 'Energy',
-'EQV': 'nan',
-'EQX': 'Basic Materials',
-'ERAS': 'Health Care',
-'ERC': 'Finance',
-'ERH': 'Finance',
-'ERIC': 'Technology',
-'ERIE': 'Finance',
-'ERII': 'Technology',
-'ERJ': 'Industrials',
-'ERNA': 'Health Care',
-'ERO': 'Basic Materials',
-'ES': 'Utilities',
-'ESAB': 'Industrials',
-'ESCA': 'Consumer Discretionary',
-'ESE': 'Telecommunications',
-'ESEA': 'Consumer Discretionary',
-'ESGL': 'Utilities',
-'ESGLW': 'Utilities',
-'ESGR': 'Finance',
-'ESGRO': 'Finance',
-'ESGRP': 'Finance',
-'ESHA': 'Finance',
-'ESHAR': 'Finance',
-'ESI': 'Industrials',
-'ESLA': 'Health Care',
-'ESLAW': 'Health Care',
-'ESLT': 'Industrials',
-'ESNT': 'Finance',
-'ESOA': 'Industrials',
-'ESP': 'Technology',
-'ESPR': 'Health Care',
-'ESQ': 'Finance',
-'ESRT': 'Real Estate',
-'ESS': 'Real Estate',
-'ESSA': 'Finance',
-'ESTA': 'Health Care',
-'ESTC': 'Technology',
-'ET': 'Utilities',
-'ET^I': 'nan',
-'ETB': 'Finance',
-'ETD': 'Consumer Discretionary',
-'ETG': 'Finance',
-'ETI^': 'nan',
-'ETJ': 'Finance',
-'ETN': 'Technology',
-'ETNB': 'Health Care',
-'ETO': 'Finance',
-'ETON': 'Health Care',
-'ETR': 'Utilities',
-'ETSY': 'Consumer Discretionary',
-'ETV': 'Finance',
-'ETW': 'Finance',
-'ETWO': 'Technology',
-'ETX           ': 'Finance',
-'ETY': 'Finance',
-'EU': 'Basic Materials',
-'EUDA': 'Health Care',
-'EUDAW': 'Health Care',
-'EURK': 'nan',
-'EURKU': 'nan',
-'EVAX': 'Health Care',
-'EVBN': 'Finance',
-'EVC': 'Industrials',
-'EVCM': 'Technology',
-'EVE': 'Finance',
-'EVER': 'Technology',
-'EVEX': 'Industrials',
-'EVF': 'Finance',
-'EVG': 'Finance',
-'EVGN': 'Industrials',
-'EVGO': 'Technology',
-'EVGOW': 'Technology',
-'EVGR': 'Finance',
-'EVGRU': 'Finance',
-'EVH': 'Consumer Discretionary',
-'EVI': 'Consumer Discretionary',
-'EVLV': 'Technology',
-'EVLVW': 'Technology',
-'EVM': 'Finance',
-'EVN': 'Finance',
-'EVO': 'Health Care',
-'EVOK': 'Health Care',
-'EVR': 'Finance',
-'EVRG': 'Utilities',
-'EVRI': 'Consumer Discretionary',
-'EVT': 'Finance',
-'EVTC': 'Technology',
-'EVTL': 'Industrials',
-'EVTV': 'Consumer Discretionary',
-'EVV': 'Finance',
-'EW': 'Health Care',
-'EWBC': 'Finance',
-'EWCZ': 'Consumer Discretionary',
-'EWTX': 'Health Care',
-'EXAI': 'Health Care',
-'EXAS': 'Health Care',
-'EXC': 'Utilities',
-'EXE': 'Energy',
-'EXEEL': 'Energy',
-'EXEL': 'Health Care',
-'EXFY': 'Technology',
-'EXG': 'Finance',
-'EXK': 'Basic Materials',
-'EXLS': 'Consumer Discretionary',
-'EXP': 'Industrials',
-'EXPD': 'Consumer Discretionary',
-'EXPE': 'Consumer Discretionary',
-'EXPI': 'Finance',
-'EXPO': 'Consumer Discretionary',
-'EXR': 'Real Estate',
-'EXTO': 'Consumer Discretionary',
-'EXTR': 'Telecommunications',
-'EYE': 'Health Care',
-'EYEN': 'Health Care',
-'EYPT': 'Industrials',
-'EZFL': 'Consumer Discretionary',
-'EZGO': 'Consumer Discretionary',
-'EZPW': 'Consumer Discretionary',
-'F': 'Consumer Discretionary',
-'F^B': 'nan',
-'F^C': 'nan',
-'F^D': 'nan',
-'FA': 'Consumer Discretionary',
-'FAAS': 'Technology',
-'FAASW': 'Technology',
-'FAF': 'Finance',
-'FAMI': 'Consumer Staples',
-'FANG': 'Energy',
-'FARM': 'Consumer Staples',
-'FARO': 'Industrials',
-'FAST': 'Consumer Discretionary',
-'FAT': 'Consumer Discretionary',
-'FATBB': 'Consumer Discretionary',
-'FATBP': 'Consumer Discretionary',
-'FATBW': 'Consumer Discretionary',
-'FATE': 'Health Care',
-'FAX': 'Finance',
-'FBIN': 'Basic Materials',
-'FBIO': 'Health Care',
-'FBIOP': 'Health Care',
-'FBIZ': 'Finance',
-'FBK': 'Finance',
-'FBLA': 'Finance',
-'FBLG': 'Health Care',
-'FBMS': 'Finance',
-'FBNC': 'Finance',
-'FBP': 'Finance',
-'FBRT': 'Real Estate',
-'FBRT^E': 'nan',
-'FBRX': 'Health Care',
-'FBYD': 'Consumer Discretionary',
-'FBYDW': 'Consumer Discretionary',
-'FC': 'Consumer Discretionary',
-'FCAP': 'Finance',
-'FCBC': 'Finance',
-'FCCO': 'Finance',
-'FCEL': 'Energy',
-'FCF': 'Finance',
-'FCFS': 'Consumer Discretionary',
-'FCN': 'Consumer Discretionary',
-'FCNCA': 'Finance',
-'FCNCO': 'Finance',
-'FCNCP': 'Finance',
-'FCO': 'Finance',
-'FCPT': 'Real Estate',
-'FCRX': 'Finance',
-'FCT': 'Finance',
-'FCUV': 'Industrials',
-'FCX': 'Basic Materials',
-'FDBC': 'Finance',
-'FDMT': 'Health Care',
-'FDP': 'Consumer Staples',
-'FDS': 'Technology',
-'FDSB': 'Finance',
-'FDUS': 'Finance',
-'FDX': 'Consumer Discretionary',
-'FE': 'Utilities',
-'FEAM': 'Industrials',
-'FEBO': 'Consumer Discretionary',
-'FEDU': 'Real Estate',
-'FEIM': 'Industrials',
-'FELE': 'Consumer Discretionary',
-'FEMY': 'Health Care',
-'FENC': 'Health Care',
-'FENG': 'Industrials',
-'FER': 'Industrials',
-'FERG': 'Miscellaneous',
-'FET': 'Industrials',
-'FF': 'Industrials',
-'FFA': 'Finance',
-'FFBC': 'Finance',
-'FFC': 'Finance',
-'FFIC': 'Finance',
-'FFIE': 'Consumer Discretionary',
-'FFIEW': 'Consumer Discretionary',
-'FFIN': 'Finance',
-'FFIV': 'Telecommunications',
-'FFNW': 'Finance',
-'FFWM': 'Finance',
-'FG': 'Finance',
-'FGB': 'Finance',
-'FGBI': 'Finance',
-'FGBIP': 'Finance',
-'FGEN': 'Health Care',
-'FGF': 'Finance',
-'FGFPP': 'Finance',
-'FGI': 'Industrials',
-'FGIWW': 'Industrials',
-'FGL': 'Consumer Discretionary',
-'FGN': 'Finance',
-'FHB': 'Finance',
-'FHI': 'Finance',
-'FHN': 'Finance',
-'FHN^B': 'nan',
-'FHN^C': 'nan',
-'FHN^E': 'nan',
-'FHN^F': 'nan',
-'FHTX': 'Health Care',
-'FI': 'Consumer Discretionary',
-'FIAC': 'Finance',
-'FIACU': 'Finance',
-'FIBK': 'Finance',
-'FICO': 'Consumer Discretionary',
-'FIGS': 'Consumer Discretionary',
-'FIHL': 'Finance',
-'FINS': 'Finance',
-'FINV': 'Finance',
-'FINW': 'Finance',
-'FIP': 'Energy',
-'FIS': 'Consumer Discretionary',
-'FISI': 'Finance',
-'FITB': 'Finance',
-'FITBI': 'Finance',
-'FITBO': 'Finance',
-'FITBP': 'Finance',
-'FIVE': 'Consumer Discretionary',
-'FIVN': 'Technology',
-'FIX': 'Industrials',
-'FIZZ': 'Consumer Staples',
-'FKWL': 'Utilities',
-'FL': 'Consumer Discretionary',
-'FLC': 'Finance',
-'FLD': 'Finance',
-'FLDDU': 'Finance',
-'FLDDW': 'Finance',
-'FLEX': 'Technology',
-'FLGC': 'Health Care',
-'FLGT': 'Health Care',
-'FLIC': 'Finance',
-'FLL': 'Consumer Discretionary',
-'FLNC': 'Miscellaneous',
-'FLNG': 'Consumer Discretionary',
-'FLNT': 'Consumer Discretionary',
-'FLO': 'Consumer Staples',
-'FLR': 'Industrials',
-'FLS': 'Industrials',
-'FLUT': 'Technology',
-'FLUX': 'Miscellaneous',
-'FLWS': 'Consumer Discretionary',
-'FLX': 'Industrials',
-'FLXS': 'Consumer Discretionary',
-'FLYE': 'Industrials',
-'FLYW': 'Consumer Discretionary',
-'FLYX': 'Consumer Discretionary',
-'FMAO': 'Finance',
-'FMBH': 'Finance',
-'FMC': 'Industrials',
-'FMN': 'Finance',
-'FMNB': 'Finance',
-'FMS': 'Health Care',
-'FMST': 'Basic Materials',
-'FMSTW': 'Basic Materials',
-'FMX': 'Consumer Staples',
-'FMY': 'Finance',
-'FN': 'Utilities',
-'FNA': 'Health Care',
-'FNB': 'Finance',
-'FND': 'Consumer Discretionary',
-'FNF': 'Finance',
-'FNGR': 'Technology',
-'FNKO': 'Consumer Discretionary',
-'FNLC': 'Finance',
-'FNV': 'Basic Materials',
-'FNVT': 'Finance',
-'FNVTU': 'Finance',
-'FNVTW': 'Finance',
-'FNWB': 'Finance',
-'FNWD': 'Finance',
-'FOA': 'Finance',
-'FOF': 'Finance',
-'FOLD': 'Health Care',
-'FONR': 'Health Care',
-'FOR': 'Finance',
-'FORA': 'Technology',
-'FORD': 'Industrials',
-'FORLW': 'Finance',
-'FORM': 'Technology',
-'FORR': 'Consumer Discretionary',
-'FORTY': 'Technology',
-'FOSL': 'Consumer Discretionary',
-'FOSLL': 'Consumer Discretionary',
-'FOUR': 'Consumer Discretionary',
-'FOX': 'Industrials',
-'FOXA': 'Industrials',
-'FOXF': 'Consumer Discretionary',
-'FOXO': 'Finance',
-'FOXX': 'Telecommunications',
-'FOXXW': 'Telecommunications',
-'FPAY': 'Consumer Discretionary',
-'FPF': 'Finance',
-'FPH': 'Finance',
-'FPI': 'Real Estate',
-'FR': 'Real Estate',
-'FRA': 'Finance',
-'FRAF': 'Finance',
-'FRBA': 'Finance',
-'FRD': 'Industrials',
-'FRES': 'Health Care',
-'FREY': 'Miscellaneous',
-'FRGE': 'Finance',
-'FRGT': 'Consumer Discretionary',
-'FRHC': 'Finance',
-'FRLA': 'Finance',
-'FRME': 'Finance',
-'FRMEP': 'Finance',
-'FRO': 'Consumer Discretionary',
-'FROG': 'Technology',
-'FRPH': 'Finance',
-'FRPT': 'Consumer Staples',
-'FRSH': 'Technology',
-'FRST': 'Finance',
-'FRSX': 'Technology',
-'FRT': 'Real Estate',
-'FRT^C': 'nan',
-'FSBC': 'Finance',
-'FSBW': 'Finance',
-'FSCO': 'Finance',
-'FSEA': 'Finance',
-'FSFG': 'Finance',
-'FSHP': 'nan',
-'FSHPR': 'nan',
-'FSHPU': 'nan',
-'FSI': 'Industrials',
-'FSK': 'Finance',
-'FSLR': 'Technology',
-'FSLY': 'Technology',
-'FSM': 'Basic Materials',
-'FSP': 'Real Estate',
-'FSS': 'Consumer Discretionary',
-'FSTR': 'Industrials',
-'FSUN': 'Finance',
-'FSV': 'Finance',
-'FT': 'Finance',
-'FTAI': 'Industrials',
-'FTAIM': 'Industrials',
-'FTAIN': 'Industrials',
-'FTAIO': 'Industrials',
-'FTAIP': 'Industrials',
-'FTCI': 'Technology',
-'FTDR': 'Finance',
-'FTEK': 'Industrials',
-'FTEL': 'Consumer Discretionary',
-'FTF': 'Finance',
-'FTFT': 'Consumer Discretionary',
-'FTHM': 'Finance',
-'FTHY': 'Finance',
-'FTI': 'Industrials',
-'FTII': 'Finance',
-'FTIIU': 'Finance',
-'FTK': 'Industrials',
-'FTLF': 'Health Care',
-'FTNT': 'Technology',
-'FTRE': 'Health Care',
-'FTS': 'Utilities',
-'FTV': 'Industrials',
-'FUBO': 'Consumer Discretionary',
-'FUFU': 'Finance',
-'FUFUW': 'Finance',
-'FUL': 'Industrials',
-'FULC': 'Health Care',
-'FULT': 'Finance',
-'FULTP': 'Finance',
-'FUN': 'Consumer Discretionary',
-'FUNC': 'Finance',
-'FUND': 'Finance',
-'FURY': 'Basic Materials',
-'FUSB': 'Finance',
-'FUTU': 'Finance',
-'FVCB': 'Finance',
-'FVNNU': 'nan',
-'FVR': 'Real Estate',
-'FVRR': 'Consumer Discretionary',
-'FWONA': 'Industrials',
-'FWONK': 'Industrials',
-'FWRD': 'Consumer Discretionary',
-'FWRG': 'Consumer Discretionary',
-'FXNC': 'Finance',
-'FYBR': 'Telecommunications',
-'G': 'Consumer Discretionary',
-'GAB': 'Finance',
-'GAB^G': 'nan',
-'GAB^H': 'nan',
-'GAB^K': 'nan',
-'GABC': 'Finance',
-'GAIA': 'Consumer Discretionary',
-'GAIN': 'Finance',
-'GAINL': 'Finance',
-'GAINN': 'Finance',
-'GAINZ': 'Finance',
-'GALT': 'Health Care',
-'GAM': 'Finance',
-'GAM^B': 'nan',
-'GAMB': 'Consumer Discretionary',
-'GAME': 'Consumer Discretionary',
-'GAN': 'Technology',
-'GANX': 'Health Care',
-'GAP': 'Consumer Discretionary',
-'GAQ': 'Finance',
-'GASS': 'Consumer Discretionary',
-'GATE': 'Finance',
-'GATO': 'Basic Materials',
-'GATX': 'Consumer Discretionary',
-'GAU': 'Industrials',
-'GAUZ': 'Miscellaneous',
-'GB': 'Technology',
-'GBAB': 'Finance',
-'GBBK': 'Finance',
-'GBBKR': 'Finance',
-'GBBKW': 'Finance',
-'GBCI': 'Finance',
-'GBDC': 'Finance',
-'GBIO': 'Health Care',
-'GBLI': 'Finance',
-'GBR': 'Energy',
-'GBTG': 'Consumer Discretionary',
-'GBX': 'Industrials',
-'GCBC': 'Finance',
-'GCI': 'Consumer Discretionary',
-'GCMG': 'Finance',
-'GCMGW': 'Finance',
-'GCO': 'Consumer Discretionary',
-'GCT': 'Consumer Discretionary',
-'GCTK': 'Health Care',
-'GCTS': 'Technology',
-'GCV': 'Finance',
-'GD': 'Industrials',
-'GDC': 'Industrials',
-'GDDY': 'Technology',
-'GDEN': 'Consumer Discretionary',
-'GDEV': 'Technology',
-'GDEVW': 'Technology',
-'GDHG': 'Consumer Discretionary',
-'GDL': 'Finance',
-'GDO': 'Finance',
-'GDOT': 'Finance',
-'GDRX': 'Technology',
-'GDS': 'Technology',
-'GDST': 'Finance',
-'GDSTR': 'Finance',
-'GDTC': 'Health Care',
-'GDV': 'Finance',
-'GDV^H': 'nan',
-'GDV^K': 'nan',
-'GDYN': 'Technology',
-'GE': 'Technology',
-'GECC': 'Finance',
-'GECCH': 'nan',
-'GECCI': 'Finance',
-'GECCO': 'Finance',
-'GECCZ': 'Finance',
-'GEF': 'nan',
-'GEG': 'Technology',
-'GEGGL': 'Finance',
-'GEHC': 'Health Care',
-'GEL': 'Energy',
-'GEN': 'Technology',
-'GENC': 'Industrials',
-'GENI': 'Consumer Discretionary',
-'GENK': 'Consumer Discretionary',
-'GEO': 'Consumer Discretionary',
-'GEOS': 'Industrials',
-'GERN': 'Health Care',
-'GES': 'Consumer Discretionary',
-'GETY': 'Consumer Discretionary',
-'GEV': 'nan',
-'GEVO': 'Industrials',
-'GF': 'Finance',
-'GFAI': 'Consumer Discretionary',
-'GFAIW': 'Consumer Discretionary',
-'GFF': 'Industrials',
-'GFI': 'Basic Materials',
-'GFL': 'Utilities',
-'GFR': 'Energy',
-'GFS': 'Technology',
-'GGAL': 'Finance',
-'GGB': 'Industrials',
-'GGG': 'Industrials',
-'GGN': 'Finance',
-'GGN^B': 'nan',
-'GGR': 'Consumer Discretionary',
-'GGROW': 'Consumer Discretionary',
-'GGT': 'Finance',
-'GGT^E': 'nan',
-'GGT^G': 'nan',
-'GGZ': 'Finance',
-'GH': 'Health Care',
-'GHC': 'Real Estate',
-'GHG': 'Consumer Discretionary',
-'GHI': 'Finance',
-'GHIX': 'Finance',
-'GHLD': 'Finance',
-'GHM': 'Industrials',
-'GHRS': 'Health Care',
-'GHY': 'Finance',
-'GIB': 'Consumer Discretionary',
-'GIC': 'Industrials',
-'GIFI': 'Industrials',
-'GIFT': 'Consumer Discretionary',
-'GIG': 'Finance',
-'GIGGU': 'Technology',
-'GIGGW': 'Finance',
-'GIGM': 'Technology',
-'GIII': 'Consumer Discretionary',
-'GIL': 'Consumer Discretionary',
-'GILD': 'Health Care',
-'GILT': 'Technology',
-'GIPR': 'Real Estate',
-'GIS': 'Consumer Staples',
-'GJH': 'Finance',
-'GJO': 'Finance',
-'GJR': 'Finance',
-'GJS': 'Finance',
-'GJT': 'Finance',
-'GKOS': 'Health Care',
-'GL': 'Finance',
-'GL^D': 'nan',
-'GLAC': 'nan',
-'GLAD': 'Consumer Discretionary',
-'GLADZ': 'nan',
-'GLBE': 'Technology',
-'GLBS': 'Consumer Discretionary',
-'GLBZ': 'Finance',
-'GLDD': 'Industrials',
-'GLDG': 'Basic Materials',
-'GLE': 'Technology',
-'GLLI': 'Industrials',
-'GLLIU': 'Industrials',
-'GLMD': 'Health Care',
-'GLNG': 'Consumer Discretionary',
-'GLO': 'Finance',
-'GLOB': 'Technology',
-'GLOP^A': 'nan',
-'GLOP^B': 'nan',
-'GLOP^C': 'nan',
-'GLP': 'Energy',
-'GLP^B': 'nan',
-'GLPG': 'Health Care',
-'GLPI': 'Real Estate',
-'GLQ': 'Finance',
-'GLRE': 'Finance',
-'GLSI': 'Health Care',
-'GLST': 'Industrials',
-'GLSTR': 'nan',
-'GLSTU': 'Industrials',
-'GLSTW': 'Industrials',
-'GLT': 'Basic Materials',
-'GLTO': 'Health Care',
-'GLU': 'Finance',
-'GLU^A': 'nan',
-'GLU^B': 'nan',
-'GLUE': 'Health Care',
-'GLV': 'Finance',
-'GLW': 'Industrials',
-'GLXG': 'Consumer Discretionary',
-'GLYC': 'Health Care',
-'GM': 'Consumer Discretionary',
-'GMAB': 'Health Care',
-'GME': 'Consumer Discretionary',
-'GMED': 'Health Care',
-'GMGI': 'Technology',
-'GMM': 'Technology',
-'GMRE': 'Real Estate',
-'GMRE^A': 'nan',
-'GMS': 'Consumer Discretionary',
-'GNE': 'Utilities',
-'GNFT': 'Health Care',
-'GNK': 'Consumer Discretionary',
-'GNL': 'Real Estate',
-'GNL^A': 'nan',
-'GNL^B': 'nan',
-'GNL^D': 'nan',
-'GNL^E': 'nan',
-'GNLN': 'Consumer Discretionary',
-'GNLX': 'Health Care',
-'GNPX': 'Health Care',
-'GNRC': 'Consumer Discretionary',
-'GNS': 'Consumer Discretionary',
-'GNSS': 'Consumer Staples',
-'GNT': 'Finance',
-'GNT^A': 'nan',
-'GNTA': 'Health Care',
-'GNTX': 'Consumer Discretionary',
-'GNTY': 'Finance',
-'GNW': 'Finance',
-'GO': 'Consumer Staples',
-'GOCO': 'Finance',
-'GODN': 'Finance',
-'GODNR': 'Finance',
-'GODNU': 'Finance',
-'GOEV': 'Consumer Discretionary',
-'GOEVW': 'Consumer Discretionary',
-'GOF': 'Finance',
-'GOGL': 'Consumer Discretionary',
-'GOGO': 'Consumer Discretionary',
-'GOLD': 'Basic Materials',
-'GOLF': 'Consumer Discretionary',
-'GOOD': 'Real Estate',
-'GOODN': 'Real Estate',
-'GOODO': 'Real Estate',
-'GOOG': 'Technology',
-'GOOGL': 'Technology',
-'GOOS': 'Consumer Discretionary',
-'GORO': 'Basic Materials',
-'GORV': 'Consumer Discretionary',
-'GOSS': 'Health Care',
-'GOTU': 'Real Estate',
-'GOVX': 'Health Care',
-'GOVXW': 'Health Care',
-'GP': 'Consumer Discretionary',
-'GPAT': 'nan',
-'GPATU': 'nan',
-'GPATW': 'nan',
-'GPC': 'Consumer Discretionary',
-'GPCR': 'Health Care',
-'GPI': 'Consumer Discretionary',
-'GPJA': 'Utilities',
-'GPK': 'Consumer Discretionary',
-'GPMT': 'Real Estate',
-'GPMT^A': 'nan',
-'GPN': 'Consumer Discretionary',
-'GPOR': 'Energy',
-'GPRE': 'Industrials',
-'GPRK': 'Energy',
-'GPRO': 'Consumer Discretionary',
-'GPUS': 'Technology',
-'GPUS^D': 'nan',
-'GRAB': 'Consumer Discretionary',
-'GRABW': 'Consumer Discretionary',
-'GRAF': 'nan',
-'GRAL': 'Health Care',
-'GRBK': 'Consumer Discretionary',
-'GRBK^A': 'nan',
-'GRC': 'Industrials',
-'GRDI': 'Technology',
-'GRDN': 'Consumer Staples',
-'GREE': 'Finance',
-'GREEL': 'Finance',
-'GRF': 'Finance',
-'GRFS': 'Health Care',
-'GRFX': 'nan',
-'GRI': 'Health Care',
-'GRMN': 'Industrials',
-'GRND': 'Technology',
-'GRNQ': 'Technology',
-'GRNT': 'Energy',
-'GROV': 'Consumer Discretionary',
-'GROW': 'Finance',
-'GROY': 'Basic Materials',
-'GRPN': 'Consumer Discretionary',
-'GRRR': 'Technology',
-'GRRRW': 'Technology',
-'GRVY': 'Consumer Discretionary',
-'GRWG': 'Consumer Discretionary',
-'GRX': 'Finance',
-'GRYP': 'Technology',
-'GS': 'Finance',
-'GS^A': 'nan',
-'GS^C': 'nan',
-'GS^D': 'nan',
-'GSAT': 'Consumer Discretionary',
-'GSBC': 'Finance',
-'GSBD': 'Finance',
-'GSHD': 'Finance',
-'GSIT': 'Technology',
-'GSIW': 'Finance',
-'GSK': 'Health Care',
-'GSL': 'Consumer Discretionary',
-'GSL^B': 'nan',
-'GSM': 'Basic Materials',
-'GSMGW': 'Technology',
-'GSUN': 'Real Estate',
-'GT': 'Consumer Discretionary',
-'GTBP': 'Health Care',
-'GTE': 'Energy',
-'GTEC': 'Industrials',
-'GTES': 'Industrials',
-'GTI': 'Energy',
-'GTIM': 'Consumer Discretionary',
-'GTLB': 'Technology',
-'GTLS': 'Industrials',
-'GTLS^B': 'nan',
-'GTN': 'Industrials',
-'GTX': 'Consumer Discretionary',
-'GTY': 'Finance',
-'GUG': 'Finance',
-'GURE': 'Industrials',
-'GUT': 'Finance',
-'GUT^C': 'nan',
-'GUTS': 'nan',
-'GV': 'Real Estate',
-'GVA': 'Industrials',
-'GVH': 'Consumer Discretionary',
-'GVP': 'Technology',
-'GWAV': 'Industrials',
-'GWH': 'Miscellaneous',
-'GWRE': 'Technology',
-'GWRS': 'Utilities',
-'GWW': 'Industrials',
-'GXAI': 'Technology',
-'GXO': 'Consumer Discretionary',
-'GYRE': 'Health Care',
-'GYRO': 'Real Estate',
-'H': 'Consumer Discretionary',
-'HAE': 'Health Care',
-'HAFC': 'Finance',
-'HAFN': 'Consumer Discretionary',
-'HAIA': 'Finance',
-'HAIN': 'Consumer Staples',
-'HAL': 'Energy',
-'HALO': 'Health Care',
-'HAO': 'Consumer Discretionary',
-'HAS': 'Consumer Discretionary',
-'HASI': 'Real Estate',
-'HAYN': 'Industrials',
-'HAYW': 'Industrials',
-'HBAN': 'Finance',
-'HBANL': 'Finance',
-'HBANM': 'Finance',
-'HBANP': 'Finance',
-'HBB': 'Consumer Discretionary',
-'HBCP': 'Finance',
-'HBI': 'Consumer Discretionary',
-'HBIO': 'Industrials',
-'HBM': 'Basic Materials',
-'HBNC': 'Finance',
-'HBT': 'Finance',
-'HCA': 'Health Care',
-'HCAT': 'Technology',
-'HCC': 'Energy',
-'HCI': 'Finance',
-'HCKT': 'Consumer Discretionary',
-'HCM': 'Health Care',
-'HCP': 'Technology',
-'HCSG': 'Health Care',
-'HCTI': 'Technology',
-'HCVI': 'Finance',
-'HCVIU': 'Finance',
-'HCVIW': 'Finance',
-'HCWB': 'Health Care',
-'HCWC': 'Consumer Staples',
-'HCXY': 'Finance',
-'HD': 'Consumer Discretionary',
-'HDB': 'Finance',
-'HDL': 'Consumer Discretionary',
-'HDSN': 'Consumer Discretionary',
-'HE': 'Utilities',
-'HEAR': 'Telecommunications',
-'HEES': 'Industrials',
-'HEI': 'Industrials',
-'HEI/A': 'nan',
-'HELE': 'Consumer Discretionary',
-'HEPA': 'Health Care',
-'HEPS': 'Consumer Discretionary',
-'HEQ': 'Finance',
-'HES': 'Energy',
-'HESM': 'Energy',
-'HFBL': 'Finance',
-'HFFG': 'Consumer Discretionary',
-'HFRO': 'Finance',
-'HFRO^A': 'nan',
-'HFWA': 'Finance',
-'HG': 'nan',
-'HGBL': 'Consumer Discretionary',
-'HGLB': 'Finance',
-'HGTY': 'Finance',
-'HGV': 'Consumer Discretionary',
-'HHH': 'Real Estate',
-'HHS': 'Consumer Discretionary',
-'HI': 'Consumer Discretionary',
-'HIE': 'Finance',
-'HIFS': 'Finance',
-'HIG': 'Finance',
-'HIG^G': 'nan',
-'HIHO': 'Industrials',
-'HII': 'Industrials',
-'HIMS': 'Health Care',
-'HIMX': 'Technology',
-'HIO': 'Finance',
-'HIPO': 'Finance',
-'HITI': 'Consumer Discretionary',
-'HIVE': 'Finance',
-'HIW': 'Real Estate',
-'HIX': 'Finance',
-'HKD': 'Finance',
-'HKIT': 'Technology',
-'HL': 'Industrials',
-'HL^B': 'nan',
-'HLF': 'Health Care',
-'HLI': 'Finance',
-'HLIO': 'Industrials',
-'HLIT': 'Technology',
-'HLLY': 'Consumer Discretionary',
-'HLMN': 'Consumer Discretionary',
-'HLN': 'Consumer Discretionary',
-'HLNE': 'Finance',
-'HLP': 'Industrials',
-'HLT': 'Consumer Discretionary',
-'HLVX': 'Health Care',
-'HLX': 'Energy',
-'HLXB': 'nan',
-'HMC': 'Consumer Discretionary',
-'HMN': 'Finance',
-'HMST': 'Finance',
-'HMY': 'Basic Materials',
-'HNI': 'Consumer Discretionary',
-'HNNA': 'Finance',
-'HNNAZ': 'Finance',
-'HNRG': 'Energy',
-'HNST': 'Consumer Discretionary',
-'HNVR': 'Finance',
-'HNW': 'Finance',
-'HOFT': 'Consumer Discretionary',
-'HOFV': 'Consumer Discretionary',
-'HOFVW': 'Consumer Discretionary',
-'HOG': 'Consumer Discretionary',
-'HOLO': 'Technology',
-'HOLOW': 'Technology',
-'HOLX': 'Health Care',
-'HOMB': 'Finance',
-'HON': 'Industrials',
-'HOND': 'nan',
-'HONDU': 'Finance',
-'HONDW': 'Finance',
-'HONE': 'Finance',
-'HOOD': 'Finance',
-'HOOK': 'Health Care',
-'HOPE': 'Finance',
-'HOTH': 'Health Care',
-'HOUR': 'Consumer Discretionary',
-'HOUS': 'Finance',
-'HOV': 'Consumer Discretionary',
-'HOVNP': 'Consumer Discretionary',
-'HOVR': 'Industrials',
-'HOVRW': 'Industrials',
-'HOWL': 'Health Care',
-'HP': 'Energy',
-'HPAI': 'Technology',
-'HPAIW': 'Technology',
-'HPE': 'Technology',
-'HPE^C': 'nan',
-'HPF': 'Finance',
-'HPH': 'Finance',
-'HPI': 'Finance',
-'HPK': 'Energy',
-'HPKEW': 'Energy',
-'HPP': 'Finance',
-'HPP^C': 'nan',
-'HPQ': 'Technology',
-'HPS': 'Finance',
-'HQH': 'Finance',
-'HQI': 'Consumer Discretionary',
-'HQL': 'Finance',
-'HQY': 'Consumer Discretionary',
-'HR': 'Real Estate',
-'HRB': 'Consumer Discretionary',
-'HRI': 'Industrials',
-'HRL': 'Consumer Staples',
-'HRMY': 'Health Care',
-'HROW': 'Health Care',
-'HROWL': 'Health Care',
-'HROWM': 'Health Care',
-'HRTG': 'Finance',
-'HRTX': 'Health Care',
-'HRYU': 'Technology',
-'HRZN': 'Finance',
-'HSAI': 'Industrials',
-'HSBC': 'Finance',
-'HSCS': 'Health Care',
-'HSDT': 'Health Care',
-'HSHP': 'Consumer Discretionary',
-'HSIC': 'Health Care',
-'HSII': 'Consumer Discretionary',
-'HSON': 'Consumer Discretionary',
-'HSPO': 'Finance',
-'HST': 'Real Estate',
-'HSTM': 'Technology',
-'HSY': 'Consumer Staples',
-'HTBI': 'Finance',
-'HTBK': 'Finance',
-'HTCO': 'Consumer Discretionary',
-'HTCR': 'Technology',
-'HTD': 'Finance',
-'HTFB': 'Finance',
-'HTFC': 'Finance',
-'HTGC': 'Finance',
-'HTH': 'Finance',
-'HTHT': 'Consumer Discretionary',
-'HTIA': 'Real Estate',
-'HTIBP': 'Real Estate',
-'HTLD': 'Industrials',
-'HTLF': 'Finance',
-'HTLFP': 'Finance',
-'HTLM': 'Consumer Discretionary',
-'HTOO': 'Energy',
-'HTOOW': 'Energy',
-'HTZ': 'Consumer Discretionary',
-'HTZWW': 'Consumer Discretionary',
-'HUBB': 'Technology',
-'HUBC': 'Telecommunications',
-'HUBCW': 'Telecommunications',
-'HUBCZ': 'Telecommunications',
-'HUBG': 'Consumer Discretionary',
-'HUBS': 'Technology',
-'HUDI': 'Industrials',
-'HUHU': 'Telecommunications',
-'HUIZ': 'Finance',
-'HUM': 'Health Care',
-'HUMA': 'Health Care',
-'HUMAW': 'Health Care',
-'HUN': 'Industrials',
-'HURA': 'Health Care',
-'HURC': 'Industrials',
-'HURN': 'Consumer Discretionary',
-'HUSA': 'Energy',
-'HUT': 'Finance',
-'HUYA': 'Technology',
-'HVT': 'Consumer Discretionary',
-'HVT/A': 'nan',
-'HWBK': 'Finance',
-'HWC': 'Finance',
-'HWCPZ': 'Finance',
-'HWH': 'Health Care',
-'HWKN': 'Consumer Discretionary',
-'HWM': 'Industrials',
-'HWM^': 'nan',
-'HXL': 'Industrials',
-'HY': 'Industrials',
-'HYAC': 'nan',
-'HYB': 'Finance',
-'HYFM': 'Consumer Discretionary',
-'HYI': 'Finance',
-'HYLN': 'Consumer Discretionary',
-'HYMC': 'Basic Materials',
-'HYMCL': 'Basic Materials',
-'HYMCW': 'Basic Materials',
-'HYPR': 'Health Care',
-'HYT': 'Finance',
-'HYZN': 'Energy',
-'HYZNW': 'Energy',
-'HZO': 'Consumer Discretionary',
-'IAC': 'Technology',
-'IAE': 'Finance',
-'IAF': 'Finance',
-'IAG': 'Basic Materials',
-'IART': 'Health Care',
-'IAS': 'Technology',
-'IAUX': 'Basic Materials',
-'IBAC': 'nan',
-'IBACR': 'nan',
-'IBCP': 'Finance',
-'IBEX': 'Technology',
-'IBG': 'Consumer Staples',
-'IBIO': 'Health Care',
-'IBKR': 'Finance',
-'IBM': 'Technology',
-'IBN': 'Finance',
-'IBO': 'Health Care',
-'IBOC': 'Finance',
-'IBP': 'Consumer Discretionary',
-'IBRX': 'Health Care',
-'IBTA': 'Consumer Discretionary',
-'IBTX': 'Finance',
-'ICAD': 'Health Care',
-'ICCC': 'Health Care',
-'ICCH': 'Finance',
-'ICCM': 'Health Care',
-'ICCT': 'Technology',
-'ICE': 'Finance',
-'ICFI': 'Consumer Discretionary',
-'ICG': 'Technology',
-'ICHR': 'Technology',
-'ICL': 'Industrials',
-'ICLK': 'Technology',
-'ICLR': 'Health Care',
-'ICMB': 'Finance',
-'ICON': 'Consumer Discretionary',
-'ICR^A': 'nan',
-'ICU': 'Health Care',
-'ICUCW': 'Health Care',
-'ICUI': 'Health Care',
-'IDA': 'Utilities',
-'IDAI': 'Technology',
-'IDCC': 'Miscellaneous',
-'IDE': 'Finance',
-'IDN': 'Technology',
-'IDR': 'Basic Materials',
-'IDT': 'Telecommunications',
-'IDXX': 'Health Care',
-'IDYA': 'Health Care',
-'IE': 'Basic Materials',
-'IEP': 'Consumer Discretionary',
-'IESC': 'Industrials',
-'IEX': 'Industrials',
-'IFBD': 'Technology',
-'IFF': 'Industrials',
-'IFN': 'Finance',
-'IFRX': 'Health Care',
-'IFS': 'Finance',
-'IGA': 'Finance',
-'IGC': 'Health Care',
-'IGD': 'Finance',
-'IGI': 'Finance',
-'IGIC': 'Finance',
-'IGMS': 'Health Care',
-'IGR': 'Finance',
-'IGT': 'Consumer Discretionary',
-'IGTA': 'Finance',
-'IGTAR': 'Finance',
-'IH': 'Real Estate',
-'IHD': 'Finance',
-'IHG': 'Consumer Discretionary',
-'IHRT': 'Consumer Discretionary',
-'IHS': 'Telecommunications',
-'IHT': 'Finance',
-'IHTA': 'Finance',
-'IIF': 'Finance',
-'III': 'Consumer Discretionary',
-'IIIN': 'Industrials',
-'IIIV': 'Consumer Discretionary',
-'IIM': 'Finance',
-'IINN': 'Health Care',
-'IINNW': 'Health Care',
-'IIPR': 'Finance',
-'IIPR^A': 'nan',
-'IKNA': 'Health Care',
-'IKT': 'Health Care',
-'ILAG': 'Consumer Discretionary',
-'ILLR': 'Finance',
-'ILLRW': 'Finance',
-'ILMN': 'Health Care',
-'ILPT': 'Real Estate',
-'IMAB': 'Health Care',
-'IMAX': 'Consumer Discretionary',
-'IMCC': 'Health Care',
-'IMCR': 'Health Care',
-'IMKTA': 'Consumer Staples',
-'IMMP': 'Health Care',
-'IMMR': 'Technology',
-'IMMX': 'Health Care',
-'IMNM': 'Health Care',
-'IMNN': 'Health Care',
-'IMO': 'Energy',
-'IMOS': 'Technology',
-'IMPP': 'Consumer Discretionary',
-'IMPPP': 'Consumer Discretionary',
-'IMRN': 'Health Care',
-'IMRX': 'Health Care',
-'IMTE': 'Consumer Staples',
-'IMTX': 'Health Care',
-'IMTXW': 'Health Care',
-'IMUX': 'Health Care',
-'IMVT': 'Health Care',
-'IMXI': 'Consumer Discretionary',
-'INAB': 'Health Care',
-'INAQ': 'Finance',
-'INAQW': 'Finance',
-'INBK': 'Finance',
-'INBKZ': 'Finance',
-'INBS': 'Health Care',
-'INBX': 'Health Care',
-'INCR': 'Health Care',
-'INCY': 'Health Care',
-'INDB': 'Finance',
-'INDI': 'Technology',
-'INDO': 'Energy',
-'INDP': 'Health Care',
-'INDV': 'Health Care',
-'INFA': 'Technology',
-'INFN': 'Utilities',
-'INFU': 'Health Care',
-'INFY': 'Technology',
-'ING': 'Finance',
-'INGM': 'nan',
-'INGN': 'Health Care',
-'INGR': 'Consumer Staples',
-'INHD': 'Industrials',
-'INKT': 'Health Care',
-'INLX': 'Technology',
-'INM': 'Health Care',
-'INMB': 'Health Care',
-'INMD': 'Health Care',
-'INN': 'Real Estate',
-'INN^E': 'nan',
-'INN^F': 'nan',
-'INNV': 'Health Care',
-'INO': 'Health Care',
-'INOD': 'Technology',
-'INSE': 'Technology',
-'INSG': 'Telecommunications',
-'INSI': 'Finance',
-'INSM': 'Health Care',
-'INSP': 'Health Care',
-'INST': 'Technology',
-'INSW': 'Consumer Discretionary',
-'INTA': 'Technology',
-'INTC': 'Technology',
-'INTE': 'Finance',
-'INTG': 'Real Estate',
-'INTJ': 'Consumer Discretionary',
-'INTR': 'Finance',
-'INTS': 'Health Care',
-'INTT': 'Industrials',
-'INTU': 'Technology',
-'INTZ': 'Telecommunications',
-'INUV': 'Consumer Discretionary',
-'INV': 'Finance',
-'INVA': 'Health Care',
-'INVE': 'Technology',
-'INVH': 'Finance',
-'INVX': 'Industrials',
-'INVZ': 'Consumer Discretionary',
-'INVZW': 'Consumer Discretionary',
-'INZY': 'Health Care',
-'IOBT': 'Health Care',
-'IONQ': 'Technology',
-'IONR': 'Industrials',
-'IONS': 'Health Care',
-'IOR': 'Real Estate',
-'IOSP': 'Industrials',
-'IOT': 'Technology',
-'IOVA': 'Health Care',
-'IP': 'Basic Materials',
-'IPA': 'Health Care',
-'IPAR': 'Consumer Discretionary',
-'IPDN': 'Technology',
-'IPG': 'Consumer Discretionary',
-'IPGP': 'Technology',
-'IPHA': 'Health Care',
-'IPI': 'Industrials',
-'IPSC': 'Health Care',
-'IPW': 'Consumer Discretionary',
-'IPWR': 'Technology',
-'IPX': 'Basic Materials',
-'IPXX': 'Finance',
-'IPXXW': 'Finance',
-'IQ': 'Consumer Discretionary',
-'IQI': 'Finance',
-'IQV': 'Health Care',
-'IR': 'Industrials',
-'IRBT': 'Consumer Discretionary',
-'IRD': 'nan',
-'IRDM': 'Telecommunications',
-'IREN': 'Technology',
-'IRIX': 'Health Care',
-'IRM': 'Real Estate',
-'IRMD': 'Health Care',
-'IROH': 'nan',
-'IROHR': 'nan',
-'IROHU': 'nan',
-'IROHW': 'nan',
-'IRON': 'Health Care',
-'IROQ': 'Finance',
-'IRS': 'Real Estate',
-'IRT': 'Real Estate',
-'IRTC': 'Health Care',
-'IRWD': 'Health Care',
-'ISD': 'Finance',
-'ISDR': 'Consumer Discretionary',
-'ISPC': 'Health Care',
-'ISPO': 'Finance',
-'ISPOW': 'Finance',
-'ISPR': 'Health Care',
-'ISRG': 'Health Care',
-'ISRL': 'Finance',
-'ISRLU': 'Finance',
-'ISRLW': 'Finance',
-'ISSC': 'Technology',
-'ISTR': 'Finance',
-'IT': 'Consumer Discretionary',
-'ITCI': 'Health Care',
-'ITGR': 'Health Care',
-'ITI': 'Telecommunications',
-'ITIC': 'Finance',
-'ITOS': 'Health Care',
-'ITP': 'Consumer Discretionary',
-'ITRG': 'Basic Materials',
-'ITRI': 'Industrials',
-'ITRM': 'Health Care',
-'ITRN': 'Technology',
-'ITT': 'Industrials',
-'ITUB': 'Finance',
-'ITW': 'Industrials',
-'IVA': 'Health Care',
-'IVAC': 'Technology',
-'IVCA': 'Finance',
-'IVCAW': 'Finance',
-'IVCB': 'Finance',
-'IVCBU': 'Finance',
-'IVCBW': 'Finance',
-'IVCP': 'Finance',
-'IVCPW': 'Finance',
-'IVDA': 'Technology',
-'IVP': 'Consumer Staples',
-'IVR': 'Real Estate',
-'IVR^B': 'nan',
-'IVR^C': 'nan',
-'IVT': 'Real Estate',
-'IVVD': 'Health Care',
-'IVZ': 'Finance',
-'IX': 'Finance',
-'IXHL': 'Health Care',
-'IZEA': 'Consumer Discretionary',
-'IZM': 'Consumer Discretionary',
-'J': 'Industrials',
-'JACK': 'Consumer Discretionary',
-'JAGX': 'Health Care',
-'JAKK': 'Consumer Discretionary',
-'JAMF': 'Technology',
-'JANX': 'Health Care',
-'JAZZ': 'Health Care',
-'JBDI': 'nan',
-'JBGS': 'Real Estate',
-'JBHT': 'Industrials',
-'JBI': 'Industrials',
-'JBK': 'Finance',
-'JBL': 'Technology',
-'JBLU': 'Consumer Discretionary',
-'JBSS': 'Consumer Staples',
-'JBT': 'Industrials',
-'JCE': 'Finance',
-'JCI': 'Industrials',
-'JCSE': 'Consumer Discretionary',
-'JCTC': 'Consumer Discretionary',
-'JD': 'Consumer Discretionary',
-'JDZG': 'Real Estate',
-'JEF': 'Finance',
-'JELD': 'Basic Materials',
-'JEQ': 'Consumer Discretionary',
-'JFBR': 'Consumer Discretionary',
-'JFBRW': 'Consumer Discretionary',
-'JFIN': 'Finance',
-'JFR': 'Finance',
-'JFU': 'Finance',
-'JG': 'Technology',
-'JGH': 'Finance',
-'JHG': 'Finance',
-'JHI': 'Finance',
-'JHS': 'Finance',
-'JHX': 'Industrials',
-'JILL': 'Consumer Discretionary',
-'JJSF': 'Consumer Staples',
-'JKHY': 'Technology',
-'JKS': 'Technology',
-'JL': 'Consumer Discretionary',
-'JLL': 'Finance',
-'JLS': 'Finance',
-'JMIA': 'Consumer Discretionary',
-'JMM': 'Finance',
-'JMSB': 'Finance',
-'JNJ': 'Health Care',
-'JNPR': 'Telecommunications',
-'JNVR': 'Finance',
-'JOB': 'Consumer Discretionary',
-'JOBY': 'Industrials',
-'JOE': 'Real Estate',
-'JOF': 'Finance',
-'JOUT': 'Consumer Discretionary',
-'JPC': 'Finance',
-'JPI': 'Finance',
-'JPM': 'Finance',
-'JPM^C': 'nan',
-'JPM^D': 'nan',
-'JPM^J': 'nan',
-'JPM^K': 'nan',
-'JPM^L': 'nan',
-'JPM^M': 'nan',
-'JQC': 'Finance',
-'JRI': 'Finance',
-'JRS': 'Finance',
-'JRSH': 'Consumer Discretionary',
-'JRVR': 'Finance',
-'JSM': 'Finance',
-'JSPR': 'Health Care',
-'JSPRW': 'Health Care',
-'JTAI': 'Consumer Discretionary',
-'JUNE': 'nan',
-'JVA': 'Consumer Staples',
-'JVSA': 'nan',
-'JVSAU': 'nan',
-'JWEL': 'Consumer Discretionary',
-'JWN': 'Consumer Discretionary',
-'JWSM': 'Finance',
-'JXJT': 'Consumer Staples',
-'JXN': 'Finance',
-'JXN^A': 'nan',
-'JYD': 'Consumer Discretionary',
-'JYNT': 'Miscellaneous',
-'JZ': 'Real Estate',
-'JZXN': 'Consumer Discretionary',
-'K': 'Consumer Staples',
-'KACL': 'Finance',
-'KACLR': 'Finance',
-'KACLU': 'Finance',
-'KACLW': 'Finance',
-'KAI': 'Industrials',
-'KALA': 'Health Care',
-'KALU': 'Industrials',
-'KALV': 'Health Care',
-'KAPA': 'Health Care',
-'KAR': 'Consumer Discretionary',
-'KARO': 'Technology',
-'KAVL': 'Consumer Discretionary',
-'KB': 'Finance',
-'KBDC': 'nan',
-'KBH': 'Consumer Discretionary',
-'KBR': 'Industrials',
-'KC': 'Technology',
-'KD': 'Technology',
-'KDLY': 'Health Care',
-'KDLYW': 'Health Care',
-'KDP': 'Consumer Staples',
-'KE': 'Technology',
-'KELYA': 'Consumer Discretionary',
-'KELYB': 'Consumer Discretionary',
-'KEN': 'Utilities',
-'KEP': 'Utilities',
-'KEQU': 'Industrials',
-'KEX': 'Consumer Discretionary',
-'KEY': 'Finance',
-'KEY^I': 'nan',
-'KEY^J': 'nan',
-'KEY^K': 'nan',
-'KEY^L': 'nan',
-'KEYS': 'Industrials',
-'KF': 'Finance',
-'KFFB': 'Finance',
-'KFRC': 'Consumer Discretionary',
-'KFS': 'Finance',
-'KFY': 'Consumer Discretionary',
-'KGC': 'Basic Materials',
-'KGEI': 'Energy',
-'KGS': 'Utilities',
-'KHC': 'Consumer Staples',
-'KIDS': 'Health Care',
-'KIM': 'Real Estate',
-'KIM^L': 'nan',
-'KIM^M': 'nan',
-'KIM^N': 'nan',
-'KIND': 'Technology',
-'KINS': 'Finance',
-'KIO': 'Finance',
-'KIRK': 'Consumer Discretionary',
-'KITT': 'Industrials',
-'KITTW': 'Industrials',
-'KKR': 'Finance',
-'KKRS': 'nan',
-'KLAC': 'Technology',
-'KLC': 'Consumer Discretionary',
-'KLG': 'Consumer Staples',
-'KLIC': 'Technology',
-'KLTO': 'Health Care',
-'KLTOW': 'Health Care',
-'KLTR': 'Technology',
-'KLXE': 'Energy',
-'KMB': 'Consumer Discretionary',
-'KMDA': 'Health Care',
-'KMI': 'Utilities',
-'KMPB': 'Finance',
-'KMPR': 'Finance',
-'KMT': 'Industrials',
-'KMX': 'Consumer Discretionary',
-'KN': 'Consumer Staples',
-'KNDI': 'Consumer Discretionary',
-'KNF': 'Industrials',
-'KNOP': 'Consumer Discretionary',
-'KNSA': 'Health Care',
-'KNSL': 'Finance',
-'KNTK': 'Utilities',
-'KNW': 'Industrials',
-'KNX': 'Industrials',
-'KO': 'Consumer Staples',
-'KOD': 'Health Care',
-'KODK': 'Consumer Discretionary',
-'KOF': 'Consumer Staples',
-'KOP': 'Basic Materials',
-'KOPN': 'Technology',
-'KORE': 'Telecommunications',
-'KOS': 'Energy',
-'KOSS': 'Consumer Staples',
-'KPLT': 'Consumer Discretionary',
-'KPLTW': 'Consumer Discretionary',
-'KPRX': 'Health Care',
-'KPTI': 'Health Care',
-'KR': 'Consumer Staples',
-'KRC': 'Real Estate',
-'KREF': 'Real Estate',
-'KREF^A': 'nan',
-'KRG': 'Real Estate',
-'KRKR': 'Consumer Discretionary',
-'KRMD': 'Health Care',
-'KRNT': 'Industrials',
-'KRNY': 'Finance',
-'KRO': 'Industrials',
-'KRON': 'Health Care',
-'KROS': 'Health Care',
-'KRP': 'Energy',
-'KRRO': 'Health Care',
-'KRT': 'Industrials',
-'KRUS': 'Consumer Discretionary',
-'KRYS': 'Health Care',
-'KSCP': 'Telecommunications',
-'KSM': 'Finance',
-'KSPI': 'nan',
-'KSS': 'Consumer Discretionary',
-'KT': 'Telecommunications',
-'KTB': 'Consumer Discretionary',
-'KTCC': 'Technology',
-'KTF': 'Finance',
-'KTH': 'Finance',
-'KTN': 'Finance',
-'KTOS': 'Industrials',
-'KTTA': 'Health Care',
-'KTTAW': 'Health Care',
-'KUKE': 'Real Estate',
-'KULR': 'Technology',
-'KURA': 'Health Care',
-'KVAC': 'nan',
-'KVACU': 'nan',
-'KVACW': 'nan',
-'KVHI': 'Technology',
-'KVUE': 'Consumer Discretionary',
-'KVYO': 'Technology',
-'KW': 'Finance',
-'KWE': 'Technology',
-'KWESW': 'Technology',
-'KWR': 'Industrials',
-'KXIN': 'Consumer Discretionary',
-'KYMR': 'Health Care',
-'KYN': 'Finance',
-'KYTX': 'Health Care',
-'KZIA': 'Health Care',
-'KZR': 'Health Care',
-'L': 'Finance',
-'LAAC': 'nan',
-'LAB': 'Industrials',
-'LAC': 'Basic Materials',
-'LAD': 'Consumer Discretionary',
-'LADR': 'Real Estate',
-'LAES': 'Technology',
-'LAKE': 'Health Care',
-'LAMR': 'Real Estate',
-'LANC': 'Consumer Staples',
-'LAND': 'Real Estate',
-'LANDM': 'Real Estate',
-'LANDO': 'Real Estate',
-'LANDP': 'Real Estate',
-'LANV': 'Finance',
-'LARK': 'Finance',
-'LASE': 'Miscellaneous',
-'LASR': 'Technology',
-'LATG': 'Finance',
-'LATGU': 'Finance',
-'LAUR': 'Real Estate',
-'LAW': 'Technology',
-'LAZ': 'Finance',
-'LAZR': 'Consumer Discretionary',
-'LB': 'Energy',
-'LBGJ': 'nan',
-'LBPH': 'Health Care',
-'LBRDA': 'Telecommunications',
-'LBRDK': 'Telecommunications',
-'LBRDP': 'Telecommunications',
-'LBRT': 'Energy',
-'LBTYA': 'Telecommunications',
-'LBTYB': 'Telecommunications',
-'LBTYK': 'Telecommunications',
-'LC': 'Finance',
-'LCFY': 'Technology',
-'LCID': 'Consumer Discretionary',
-'LCII': 'Consumer Discretionary',
-'LCNB': 'Finance',
-'LCTX': 'Health Care',
-'LCUT': 'Consumer Discretionary',
-'LDI': 'Finance',
-'LDOS': 'Technology',
-'LDP': 'Finance',
-'LDTC': 'Technology',
-'LDTCW': 'Technology',
-'LDWY': 'Consumer Discretionary',
-'LE': 'Consumer Discretionary',
-'LEA': 'Consumer Discretionary',
-'LECO': 'Industrials',
-'LEDS': 'Technology',
-'LEE': 'Consumer Discretionary',
-'LEG': 'Consumer Discretionary',
-'LEGH': 'Consumer Discretionary',
-'LEGN': 'Health Care',
-'LEGT': 'nan',
-'LEN': 'Consumer Discretionary',
-'LENZ': 'Health Care',
-'LEO': 'Finance',
-'LESL': 'Consumer Discretionary',
-'LEU': 'Industrials',
-'LEV': 'Consumer Discretionary',
-'LEVI': 'Consumer Discretionary',
-'LEXX': 'Health Care',
-'LEXXW': 'Health Care',
-'LFCR': 'Health Care',
-'LFLY': 'Technology',
-'LFLYW': 'Technology',
-'LFMD': 'Health Care',
-'LFMDP': 'Health Care',
-'LFST': 'Health Care',
-'LFT': 'Real Estate',
-'LFT^A': 'nan',
-'LFUS': 'Energy',
-'LFVN': 'Health Care',
-'LFWD': 'Health Care',
-'LGCB': 'Consumer Discretionary',
-'LGCL': 'Technology',
-'LGCY': 'Real Estate',
-'LGHL': 'Finance',
-'LGHLW': 'Finance',
-'LGI': 'nan',
-'LGIH': 'Consumer Discretionary',
-'LGL': 'Technology',
-'LGMK': 'Health Care',
-'LGND': 'Health Care',
-'LGO': 'Industrials',
-'LGTY': 'Technology',
-'LGVN': 'Health Care',
-'LH': 'Health Care',
-'LHX': 'Industrials',
-'LI': 'Consumer Discretionary',
-'LICN': 'Consumer Discretionary',
-'LICY': 'Industrials',
-'LIDR': 'Consumer Discretionary',
-'LIDRW': 'Consumer Discretionary',
-'LIEN': 'Finance',
-'LIF': 'nan',
-'LIFW': 'Technology',
-'LIFWW': 'Technology',
-'LIFWZ': 'Technology',
-'LII': 'Industrials',
-'LILA': 'Telecommunications',
-'LILAK': 'Telecommunications',
-'LILM': 'Industrials',
-'LILMW': 'Industrials',
-'LIN': 'Industrials',
-'LINC': 'Real Estate',
-'LIND': 'Consumer Discretionary',
-'LINE': 'Real Estate',
-'LINK': 'Technology',
-'LION': 'Consumer Discretionary',
-'LIPO': 'Health Care',
-'LIQT': 'Technology',
-'LITB': 'Consumer Discretionary',
-'LITE': 'Telecommunications',
-'LITM': 'Basic Materials',
-'LIVE': 'Consumer Discretionary',
-'LIVN': 'Health Care',
-'LIXT': 'Health Care',
-'LIXTW': 'Health Care',
-'LKCO': 'Technology',
-'LKFN': 'Finance',
-'LKQ': 'Consumer Discretionary',
-'LLAP': 'Industrials',
-'LLY': 'Health Care',
-'LLYVA': 'Industrials',
-'LLYVK': 'Industrials',
-'LMAT': 'Health Care',
-'LMB': 'Consumer Discretionary',
-'LMFA': 'Finance',
-'LMND': 'Finance',
-'LMNR': 'Consumer Staples',
-'LMT': 'Industrials',
-'LNC': 'Finance',
-'LNC^D': 'nan',
-'LND': 'Consumer Staples',
-'LNG': 'Utilities',
-'LNKB': 'Finance',
-'LNN': 'Industrials',
-'LNSR': 'Health Care',
-'LNT': 'Utilities',
-'LNTH': 'Health Care',
-'LNW': 'Technology',
-'LNZA': 'Industrials',
-'LNZAW': 'Industrials',
-'LOAN': 'Real Estate',
-'LOAR': 'Industrials',
-'LOB': 'Finance',
-'LOBO': 'Consumer Discretionary',
-'LOCL': 'Consumer Staples',
-'LOCO': 'Consumer Discretionary',
-'LODE': 'Industrials',
-'LOGC': 'Consumer Discretionary',
-'LOGI': 'Technology',
-'LOMA': 'Industrials',
-'LOOP': 'Industrials',
-'LOPE': 'Real Estate',
-'LOT': 'nan',
-'LOTWW': 'Consumer Discretionary',
-'LOVE': 'Consumer Discretionary',
-'LOW': 'Consumer Discretionary',
-'LPA': 'Finance',
-'LPAA': 'nan',
-'LPAAU': 'Finance',
-'LPAAW': 'Finance',
-'LPBBU': 'Finance',
-'LPCN': 'Health Care',
-'LPG': 'Consumer Discretionary',
-'LPL': 'Technology',
-'LPLA': 'Finance',
-'LPRO': 'Finance',
-'LPSN': 'Technology',
-'LPTH': 'Technology',
-'LPTX': 'Health Care',
-'LPX': 'Basic Materials',
-'LQDA': 'Health Care',
-'LQDT': 'Consumer Discretionary',
-'LQR': 'Consumer Staples',
-'LRCX': 'Technology',
-'LRE': 'Consumer Discretionary',
-'LRFC': 'Finance',
-'LRHC': 'Finance',
-'LRMR': 'Health Care',
-'LRN': 'Real Estate',
-'LSAK': 'Finance',
-'LSB': 'Health Care',
-'LSBK': 'Finance',
-'LSBPW': 'Health Care',
-'LSCC': 'Technology',
-'LSEA': 'Consumer Discretionary',
-'LSEAW': 'Consumer Discretionary',
-'LSF': 'Consumer Staples',
-'LSH': 'nan',
-'LSPD': 'Technology',
-'LSTA': 'Health Care',
-'LSTR': 'Industrials',
-'LTBR': 'Consumer Discretionary',
-'LTC': 'Real Estate',
-'LTH': 'Consumer Discretionary',
-'LTM': 'Consumer Discretionary',
-'LTRN': 'Health Care',
-'LTRX': 'Telecommunications',
-'LTRY': 'Technology',
-'LTRYW': 'Technology',
-'LU': 'Finance',
-'LUCD': 'Health Care',
-'LUCY': 'Health Care',
-'LUCYW': 'Health Care',
-'LULU': 'Consumer Discretionary',
-'LUMN': 'Telecommunications',
-'LUMO': 'Health Care',
-'LUNA': 'Health Care',
-'LUNG': 'Health Care',
-'LUNR': 'Industrials',
-'LUNRW': 'Industrials',
-'LUV': 'Consumer Discretionary',
-'LUXH': 'Finance',
-'LUXHP': 'Finance',
-'LVLU': 'Consumer Discretionary',
-'LVO': 'Consumer Discretionary',
-'LVRO': 'Consumer Discretionary',
-'LVS': 'Consumer Discretionary',
-'LVTX': 'Health Care',
-'LVWR': 'Consumer Discretionary',
-'LW': 'Consumer Staples',
-'LWAY': 'Consumer Staples',
-'LWLG': 'Industrials',
-'LX': 'Finance',
-'LXEH': 'Real Estate',
-'LXEO': 'Health Care',
-'LXFR': 'Industrials',
-'LXP': 'Real Estate',
-'LXP^C': 'nan',
-'LXRX': 'Health Care',
-'LXU': 'Industrials',
-'LYB': 'Industrials',
-'LYEL': 'Health Care',
-'LYFT': 'Consumer Discretionary',
-'LYG': 'Finance',
-'LYRA': 'Health Care',
-'LYT': 'Technology',
-'LYTS': 'Consumer Discretionary',
-'LYV': 'Consumer Discretionary',
-'LZ': 'Technology',
-'LZB': 'Consumer Discretionary',
-'LZM': 'Basic Materials',
-'M': 'Consumer Discretionary',
-'MA': 'Consumer Discretionary',
-'MAA': 'Real Estate',
-'MAA^I': 'nan',
-'MAC': 'Real Estate',
-'MACI': 'nan',
-'MACIW': 'nan',
-'MAG': 'Basic Materials',
-'MAIA': 'Health Care',
-'MAIN': 'Finance',
-'MAMA': 'Consumer Staples',
-'MAMO': 'Consumer Discretionary',
-'MAN': 'Consumer Discretionary',
-'MANH': 'Technology',
-'MANU': 'Consumer Discretionary',
-'MAPS': 'Technology',
-'MAPSW': 'Technology',
-'MAR': 'Consumer Discretionary',
-'MARA': 'Technology',
-'MARPS': 'Energy',
-'MARX': 'Finance',
-'MARXU': 'Finance',
-'MAS': 'Industrials',
-'MASI': 'Health Care',
-'MASS': 'Industrials',
-'MAT': 'Consumer Discretionary',
-'MATH': 'Finance',
-'MATV': 'Basic Materials',
-'MATW': 'Telecommunications',
-'MATX': 'Consumer Discretionary',
-'MAV': 'Finance',
-'MAX': 'Consumer Discretionary',
-'MAXN': 'Technology',
-'MAYS': 'Real Estate',
-'MBAV': 'nan',
-'MBAVU': 'Finance',
-'MBAVW': 'Finance',
-'MBC': 'Consumer Discretionary',
-'MBCN': 'Finance',
-'MBI': 'Finance',
-'MBIN': 'Finance',
-'MBINM': 'Finance',
-'MBINN': 'Finance',
-'MBINO': 'Finance',
-'MBIO': 'Health Care',
-'MBLY': 'Technology',
-'MBNKP': 'Finance',
-'MBOT': 'Health Care',
-'MBRX': 'Health Care',
-'MBUU': 'Industrials',
-'MBWM': 'Finance',
-'MBX': 'Health Care',
-'MC': 'Finance',
-'MCAA': 'Finance',
-'MCAG': 'Finance',
-'MCAGU': 'Finance',
-'MCB': 'Finance',
-'MCBS': 'Finance',
-'MCD': 'Consumer Discretionary',
-'MCFT': 'Industrials',
-'MCHP': 'Technology',
-'MCHX': 'Consumer Discretionary',
-'MCI': 'Finance',
-'MCK': 'Health Care',
-'MCN': 'nan',
-'MCO': 'Finance',
-'MCR': 'Finance',
-'MCRB': 'Health Care',
-'MCRI': 'Consumer Discretionary',
-'MCS': 'Consumer Discretionary',
-'MCVT': 'Finance',
-'MCW': 'Consumer Discretionary',
-'MCY': 'Finance',
-'MD': 'Health Care',
-'MDAI': 'Health Care',
-'MDAIW': 'Health Care',
-'MDB': 'Technology',
-'MDBH': 'Finance',
-'MDGL': 'Health Care',
-'MDIA': 'Consumer Discretionary',
-'MDJH': 'Finance',
-'MDLZ': 'Consumer Staples',
-'MDRR': 'Real Estate',
-'MDRRP': 'Real Estate',
-'MDT': 'Health Care',
-'MDU': 'Industrials',
-'MDV': 'Real Estate',
-'MDV^A': 'nan',
-'MDWD': 'Health Care',
-'MDXG': 'Health Care',
-'MDXH': 'Health Care',
-'ME': 'Health Care',
-'MEC': 'Industrials',
-'MED': 'Consumer Staples',
-'MEDP': 'Health Care',
-'MEG': 'Consumer Discretionary',
-'MEGI': 'Finance',
-'MEGL': 'Finance',
-'MEI': 'Technology',
-'MEIP': 'Health Care',
-'MELI': 'Consumer Discretionary',
-'MEOH': 'Industrials',
-'MER^K': 'nan',
-'MERC': 'Basic Materials',
-'MESA': 'Consumer Discretionary',
-'MESO': 'Health Care',
-'MET': 'Finance',
-'MET^A': 'nan',
-'MET^E': 'nan',
-'MET^F': 'nan',
-'META': 'Technology',
-'METC': 'Energy',
-'METCB': 'Energy',
-'METCL': 'Energy',
-'MFA': 'Real Estate',
-'MFA^B': 'nan',
-'MFA^C': 'nan',
-'MFAN': 'Real Estate',
-'MFAO': 'Real Estate',
-'MFC': 'Finance',
-'MFG': 'Finance',
-'MFH': 'Finance',
-'MFI': 'Technology',
-'MFIC': 'Finance',
-'MFICL': 'Finance',
-'MFIN': 'Finance',
-'MFM': 'Finance',
-'MG': 'Consumer Discretionary',
-'MGA': 'Consumer Discretionary',
-'MGEE': 'Energy',
-'MGF': 'Finance',
-'MGIC': 'Technology',
-'MGIH': 'Consumer Discretionary',
-'MGLD': 'Finance',
-'MGM': 'Consumer Discretionary',
-'MGNI': 'Technology',
-'MGNX': 'Health Care',
-'MGOL': 'Consumer Discretionary',
-'MGPI': 'Consumer Staples',
-'MGR': 'Finance',
-'MGRB': 'Finance',
-'MGRC': 'Consumer Discretionary',
-'MGRD': 'Finance',
-'MGRE': 'nan',
-'MGRM': 'Health Care',
-'MGRX': 'Health Care',
-'MGTX': 'Health Care',
-'MGX': 'Health Care',
-'MGY': 'Energy',
-'MGYR': 'Finance',
-'MHD': 'Finance',
-'MHF': 'Finance',
-'MHH': 'Consumer Discretionary',
-'MHI': 'Finance',
-'MHK': 'Consumer Discretionary',
-'MHLA': 'Finance',
-'MHLD': 'Finance',
-'MHN': 'Finance',
-'MHNC': 'Finance',
-'MHO': 'Consumer Discretionary',
-'MHUA': 'Health Care',
-'MI': 'Consumer Discretionary',
-'MIDD': 'Industrials',
-'MIGI': 'Finance',
-'MIN': 'Finance',
-'MIND': 'Industrials',
-'MIO': 'Finance',
-'MIR': 'Industrials',
-'MIRA': 'Health Care',
-'MIRM': 'Health Care',
-'MIST': 'Health Care',
-'MITAU': 'Finance',
-'MITK': 'Technology',
-'MITN': 'Real Estate',
-'MITP': 'Real Estate',
-'MITQ': 'Consumer Discretionary',
-'MITT': 'Real Estate',
-'MITT^A': 'nan',
-'MITT^B': 'nan',
-'MITT^C': 'nan',
-'MIY': 'Finance',
-'MKC': 'Consumer Staples',
-'MKDW': 'Technology',
-'MKFG': 'Technology',
-'MKL': 'Finance',
-'MKSI': 'Industrials',
-'MKTW': 'Technology',
-'MKTX': 'Finance',
-'ML': 'Finance',
-'MLAB': 'Industrials',
-'MLCO': 'Consumer Discretionary',
-'MLEC': 'Finance',
-'MLECW': 'Finance',
-'MLGO': 'Technology',
-'MLI': 'Industrials',
-'MLKN': 'Consumer Discretionary',
-'MLM': 'Industrials',
-'MLNK': 'Technology',
-'MLP': 'Finance',
-'MLR': 'Consumer Discretionary',
-'MLSS': 'Health Care',
-'MLTX': 'Health Care',
-'MLYS': 'Health Care',
-'MMA': 'Consumer Discretionary',
-'MMC': 'Finance',
-'MMD': 'Finance',
-'MMI': 'Finance',
-'MMLP': 'Energy',
-'MMM': 'Health Care',
-'MMS': 'Consumer Discretionary',
-'MMSI': 'Health Care',
-'MMT': 'Finance',
-'MMU': 'Finance',
-'MMV': 'Technology',
-'MMVWW': 'Technology',
-'MMYT': 'Consumer Discretionary',
-'MNDO': 'Technology',
-'MNDR': 'Technology',
-'MNDY': 'Technology',
-'MNKD': 'Health Care',
-'MNMD': 'Health Care',
-'MNOV': 'Health Care',
-'MNPR': 'Health Care',
-'MNR': 'Energy',
-'MNRO': 'Consumer Discretionary',
-'MNSB': 'Finance',
-'MNSBP': 'Finance',
-'MNSO': 'Consumer Discretionary',
-'MNST': 'Consumer Staples',
-'MNTK': 'Utilities',
-'MNTN': 'Finance',
-'MNTS': 'Industrials',
-'MNTSW': 'Industrials',
-'MNTX': 'Technology',
-'MNY': 'Consumer Discretionary',
-'MNYWW': 'Consumer Discretionary',
-'MO': 'Health Care',
-'MOB': 'Industrials',
-'MOBBW': 'Industrials',
-'MOBX': 'Technology',
-'MOD': 'Consumer Discretionary',
-'MODD': 'Health Care',
-'MODG': 'Consumer Discretionary',
-'MODV': 'Consumer Discretionary',
-'MOFG': 'Finance',
-'MOGO': 'Finance',
-'MOGU': 'Consumer Discretionary',
-'MOH': 'Health Care',
-'MOLN': 'Health Care',
-'MOMO': 'Technology',
-'MOND': 'Consumer Discretionary',
-'MORN': 'Finance',
-'MOS': 'Industrials',
-'MOV': 'Consumer Discretionary',
-'MOVE': 'Health Care',
-'MP': 'Basic Materials',
-'MPA': 'Finance',
-'MPAA': 'Consumer Discretionary',
-'MPB': 'Finance',
-'MPC': 'Energy',
-'MPLN': 'Consumer Discretionary',
-'MPLX': 'Energy',
-'MPTI': 'Technology',
-'MPU': 'Consumer Discretionary',
-'MPV': 'Finance',
-'MPW': 'Real Estate',
-'MPWR': 'Technology',
-'MPX': 'Industrials',
-'MQ': 'Technology',
-'MQT': 'Finance',
-'MQY': 'Finance',
-'MRAM': 'Technology',
-'MRBK': 'Finance',
-'MRC': 'Industrials',
-'MRCC': 'Finance',
-'MRCY': 'Technology',
-'MREO': 'Health Care',
-'MRIN': 'Technology',
-'MRK': 'Health Care',
-'MRKR': 'Health Care',
-'MRM': 'Consumer Discretionary',
-'MRNA': 'Health Care',
-'MRNO': 'Consumer Discretionary',
-'MRNOW': 'Consumer Discretionary',
-'MRNS': 'Health Care',
-'MRO': 'Energy',
-'MRSN': 'Health Care',
-'MRT': 'Consumer Discretionary',
-'MRTN': 'Industrials',
-'MRUS': 'Health Care',
-'MRVI': 'Health Care',
-'MRVL': 'Technology',
-'MRX': 'Finance',
-'MS': 'Finance',
-'MS^A': 'nan',
-'MS^E': 'nan',
-'MS^F': 'nan',
-'MS^I': 'nan',
-'MS^K': 'nan',
-'MS^L': 'nan',
-'MS^O': 'nan',
-'MS^P': 'nan',
-'MS^Q': 'nan',
-'MSA': 'Health Care',
-'MSAI': 'Technology',
-'MSAIW': 'Technology',
-'MSB': 'Industrials',
-'MSBI': 'Finance',
-'MSBIP': 'Finance',
-'MSC': 'Consumer Discretionary',
-'MSCI': 'Consumer Discretionary',
-'MSD': 'Finance',
-'MSDL': 'nan',
-'MSEX': 'Utilities',
-'MSFT': 'Technology',
-'MSGE': 'Consumer Discretionary',
-'MSGM': 'Technology',
-'MSGS': 'Consumer Discretionary',
-'MSI': 'Technology',
-'MSM': 'Industrials',
-'MSN': 'Consumer Staples',
-'MSS': 'Consumer Staples',
-'MSSA': 'Finance',
-'MSSAU': 'Finance',
-'MSTR': 'Technology',
-'MT': 'Industrials',
-'MTA': 'Basic Materials',
-'MTAL': 'Basic Materials',
-'MTB': 'Finance',
-'MTB^H': 'nan',
-'MTB^J': 'nan',
-'MTC': 'Technology',
-'MTCH': 'Technology',
-'MTD': 'Industrials',
-'MTDR': 'Energy',
-'MTEK': 'Telecommunications',
-'MTEKW': 'Telecommunications',
-'MTEM': 'Health Care',
-'MTEN': 'Industrials',
-'MTEX': 'Health Care',
-'MTG': 'Finance',
-'MTH': 'Consumer Discretionary',
-'MTLS': 'Technology',
-'MTN': 'Consumer Discretionary',
-'MTNB': 'Health Care',
-'MTR': 'Energy',
-'MTRN': 'Industrials',
-'MTRX': 'Consumer Discretionary',
-'MTSI': 'Technology',
-'MTTR': 'Technology',
-'MTUS': 'Industrials',
-'MTW': 'Industrials',
-'MTX': 'Industrials',
-'MTZ': 'Industrials',
-'MU': 'Technology',
-'MUA': 'Finance',
-'MUC': 'Finance',
-'MUE': 'Finance',
-'MUFG': 'Finance',
-'MUI': 'Finance',
-'MUJ': 'Finance',
-'MULN': 'Technology',
-'MUR': 'Energy',
-'MURA': 'Health Care',
-'MUSA': 'Consumer Discretionary',
-'MUX': 'Basic Materials',
-'MVBF': 'Finance',
-'MVF': 'Finance',
-'MVIS': 'Technology',
-'MVO': 'Energy',
-'MVST': 'Miscellaneous',
-'MVSTW': 'Miscellaneous',
-'MVT': 'Finance',
-'MWA': 'Industrials',
-'MWG': 'Consumer Discretionary',
-'MX': 'Technology',
-'MXC': 'Energy',
-'MXCT': 'Health Care',
-'MXE': 'Finance',
-'MXF': 'Finance',
-'MXL': 'Technology',
-'MYD': 'Finance',
-'MYE': 'Industrials',
-'MYFW': 'Finance',
-'MYGN': 'Health Care',
-'MYI': 'Finance',
-'MYN': 'Finance',
-'MYNA': 'Consumer Discretionary',
-'MYND': 'Real Estate',
-'MYNZ': 'Health Care',
-'MYO': 'Health Care',
-'MYPS': 'Technology',
-'MYRG': 'Industrials',
-'MYSZ': 'Technology',
-'MYTE': 'Consumer Discretionary',
-'nan': 'Technology',
-'NAAS': 'Consumer Discretionary',
-'NABL': 'Technology',
-'NAC': 'Finance',
-'NAD': 'Finance',
-'NAII': 'Health Care',
-'NAK': 'Basic Materials',
-'NAMS': 'Health Care',
-'NAMSW': 'Health Care',
-'NAN': 'Finance',
-'NAOV': 'Health Care',
-'NAPA': 'Consumer Staples',
-'NARI': 'Health Care',
-'NAT': 'Consumer Discretionary',
-'NATH': 'Consumer Discretionary',
-'NATL': 'Miscellaneous',
-'NATR': 'Health Care',
-'NAUT': 'Industrials',
-'NAVI': 'Finance',
-'NAYA': 'Health Care',
-'NAZ': 'Finance',
-'NB': 'Basic Materials',
-'NBB': 'Finance',
-'NBBK': 'Finance',
-'NBH': 'Finance',
-'NBHC': 'Finance',
-'NBIS': 'Technology',
-'NBIX': 'Health Care',
-'NBN': 'Finance',
-'NBR': 'Energy',
-'NBTB': 'Finance',
-'NBTX': 'Health Care',
-'NBXG': 'Finance',
-'NBY': 'Health Care',
-'NC': 'Energy',
-'NCA': 'Finance',
-'NCDL': 'nan',
-'NCI': 'Consumer Discretionary',
-'NCL': 'Industrials',
-'NCLH': 'Consumer Discretionary',
-'NCMI': 'Consumer Discretionary',
-'NCNA': 'Health Care',
-'NCNC': 'Miscellaneous',
-'NCNCW': 'Miscellaneous',
-'NCNO': 'Technology',
-'NCPL': 'Finance',
-'NCPLW': 'Finance',
-'NCRA': 'Consumer Staples',
-'NCSM': 'Energy',
-'NCTY': 'Finance',
-'NCV': 'Finance',
-'NCV^A': 'nan',
-'NCZ': 'Finance',
-'NCZ^A': 'nan',
-'NDAQ': 'Finance',
-'NDLS': 'Consumer Discretionary',
-'NDMO': 'Finance',
-'NDP': 'Finance',
-'NDRA': 'Health Care',
-'NDSN': 'Industrials',
-'NE': 'Energy',
-'NEA': 'Finance',
-'NECB': 'Finance',
-'NEE': 'Technology',
-'NEE^N': 'nan',
-'NEE^R': 'nan',
-'NEE^S': 'nan',
-'NEGG': 'Consumer Discretionary',
-'NEM': 'Basic Materials',
-'NEN': 'Real Estate',
-'NEO': 'Health Care',
-'NEOG': 'Health Care',
-'NEON': 'Technology',
-'NEOV': 'Miscellaneous',
-'NEOVW': 'Miscellaneous',
-'NEP': 'Utilities',
-'NEPH': 'Health Care',
-'NERV': 'Health Care',
-'NESR': 'Energy',
-'NESRW': 'Energy',
-'NET': 'Technology',
-'NETD': 'nan',
-'NETDW': 'nan',
-'NEU': 'Industrials',
-'NEUE': 'Health Care',
-'NEWP': 'Basic Materials',
-'NEWT': 'Finance',
-'NEWTG': 'nan',
-'NEWTH': 'Finance',
-'NEWTI': 'Finance',
-'NEWTZ': 'Finance',
-'NEXA': 'Basic Materials',
-'NEXN': 'Technology',
-'NEXT': 'Utilities',
-'NFBK': 'Finance',
-'NFE': 'Utilities',
-'NFG': 'Utilities',
-'NFGC': 'Basic Materials',
-'NFJ': 'Finance',
-'NFLX': 'Consumer Discretionary',
-'NG': 'Basic Materials',
-'NGD': 'Basic Materials',
-'NGG': 'Utilities',
-'NGL': 'Utilities',
-'NGL^B': 'nan',
-'NGL^C': 'nan',
-'NGNE': 'Health Care',
-'NGS': 'Energy',
-'NGVC': 'Consumer Staples',
-'NGVT': 'Industrials',
-'NHC': 'Health Care',
-'NHI': 'Real Estate',
-'NHS': 'Finance',
-'NHTC': 'Consumer Discretionary',
-'NI': 'Utilities',
-'NIC': 'Finance',
-'NICE': 'Technology',
-'NIE': 'Finance',
-'NIM': 'Finance',
-'NINE': 'Energy',
-'NIO': 'Consumer Discretionary',
-'NIOBW': 'Basic Materials',
-'NIPG': 'Consumer Discretionary',
-'NISN': 'Industrials',
-'NITO': 'Industrials',
-'NIU': 'Consumer Discretionary',
-'NIVF': 'Health Care',
-'NIVFW': 'Health Care',
-'NIXX': 'Technology',
-'NIXXW': 'Technology',
-'NJR': 'Utilities',
-'NKE': 'Consumer Discretionary',
-'NKGN': 'Health Care',
-'NKGNW': 'Health Care',
-'NKLA': 'Consumer Discretionary',
-'NKSH': 'Finance',
-'NKTR': 'Health Care',
-'NKTX': 'Health Care',
-'NKX': 'Finance',
-'NL': 'Industrials',
-'NLOP': 'Real Estate',
-'NLSP': 'Health Care',
-'NLSPW': 'Health Care',
-'NLY': 'Real Estate',
-'NLY^F': 'nan',
-'NLY^G': 'nan',
-'NLY^I': 'nan',
-'NMAI': 'Finance',
-'NMCO': 'Finance',
-'NMFC': 'Finance',
-'NMFCZ': 'nan',
-'NMG': 'Basic Materials',
-'NMHI': 'Industrials',
-'NMHIW': 'Industrials',
-'NMI': 'Finance',
-'NMIH': 'Finance',
-'NML': 'Finance',
-'NMM': 'Consumer Discretionary',
-'NMR': 'Finance',
-'NMRA': 'Health Care',
-'NMRK': 'Finance',
-'NMS': 'Finance',
-'NMT': 'Finance',
-'NMTC': 'Health Care',
-'NMZ': 'Finance',
-'NN': 'Industrials',
-'NNAVW': 'Industrials',
-'NNBR': 'Industrials',
-'NNDM': 'Technology',
-'NNE': 'Utilities',
-'NNI': 'Finance',
-'NNN': 'Real Estate',
-'NNOX': 'Health Care',
-'NNVC': 'Health Care',
-'NNY': 'Finance',
-'NOA': 'Energy',
-'NOAH': 'Finance',
-'NOC': 'Industrials',
-'NODK': 'Finance',
-'NOG': 'Energy',
-'NOK': 'Technology',
-'NOM': 'Finance',
-'NOMD': 'Consumer Staples',
-'NOTE': 'Consumer Discretionary',
-'NOTV': 'Health Care',
-'NOV': 'Industrials',
-'NOVA': 'Utilities',
-'NOVT': 'Miscellaneous',
-'NOW': 'Technology',
-'NPAB': 'Finance',
-'NPABU': 'Finance',
-'NPABW': 'Finance',
-'NPCE': 'Health Care',
-'NPCT': 'Finance',
-'NPFD': 'Finance',
-'NPK': 'Industrials',
-'NPO': 'Industrials',
-'NPV': 'Finance',
-'NPWR': 'Energy',
-'NQP': 'Finance',
-'NR': 'Industrials',
-'NRBO': 'Health Care',
-'NRC': 'Health Care',
-'NRDS': 'Technology',
-'NRDY': 'Real Estate',
-'NREF': 'Real Estate',
-'NREF^A': 'nan',
-'NRG': 'Utilities',
-'NRGV': 'Miscellaneous',
-'NRIM': 'Finance',
-'NRIX': 'Health Care',
-'NRK': 'Finance',
-'NRO': 'Finance',
-'NRP': 'Energy',
-'NRSN': 'Health Care',
-'NRSNW': 'Health Care',
-'NRT': 'Energy',
-'NRUC': 'Finance',
-'NRXP': 'Health Care',
-'NRXPW': 'Health Care',
-'NRXS': 'Health Care',
-'NSA': 'Real Estate',
-'NSA^A': 'nan',
-'NSA^B': 'nan',
-'NSC': 'Industrials',
-'NSIT': 'Consumer Discretionary',
-'NSP': 'Consumer Discretionary',
-'NSPR': 'Health Care',
-'NSSC': 'Telecommunications',
-'NSTS': 'Finance',
-'NSYS': 'Technology',
-'NTAP': 'Technology',
-'NTB': 'Finance',
-'NTCT': 'Technology',
-'NTES': 'Technology',
-'NTG': 'Finance',
-'NTGR': 'Utilities',
-'NTIC': 'Industrials',
-'NTIP': 'Miscellaneous',
-'NTLA': 'Health Care',
-'NTNX': 'Technology',
-'NTR': 'Industrials',
-'NTRA': 'Health Care',
-'NTRB': 'Health Care',
-'NTRBW': 'Health Care',
-'NTRP': 'Consumer Discretionary',
-'NTRS': 'Finance',
-'NTRSO': 'Finance',
-'NTST': 'Real Estate',
-'NTWK': 'Technology',
-'NTZ': 'Consumer Discretionary',
-'NU': 'Finance',
-'NUE': 'Industrials',
-'NUKK': 'Consumer Discretionary',
-'NUKKW': 'Consumer Discretionary',
-'NURO': 'Health Care',
-'NUS': 'Health Care',
-'NUTX': 'Consumer Discretionary',
-'NUV': 'Finance',
-'NUVB': 'Health Care',
-'NUVL': 'Health Care',
-'NUW': 'Finance',
-'NUWE': 'Health Care',
-'NUZE': 'Consumer Discretionary',
-'NVA': 'Basic Materials',
-'NVACR': 'Health Care',
-'NVACW': 'Health Care',
-'NVAWW': 'nan',
-'NVAX': 'Health Care',
-'NVCR': 'Health Care',
-'NVCT': 'Health Care',
-'NVDA': 'Technology',
-'NVEC': 'Technology',
-'NVEE': 'Consumer Discretionary',
-'NVEI': 'Consumer Discretionary',
-'NVFY': 'Consumer Discretionary',
-'NVG': 'Finance',
-'NVGS': 'Consumer Discretionary',
-'NVMI': 'Technology',
-'NVNI': 'Technology',
-'NVNIW': 'Technology',
-'NVNO': 'Health Care',
-'NVO': 'Health Care',
-'NVOS': 'Industrials',
-'NVR': 'Consumer Discretionary',
-'NVRI': 'Miscellaneous',
-'NVRO': 'Health Care',
-'NVS': 'Health Care',
-'NVST': 'Health Care',
-'NVT': 'Industrials',
-'NVTS': 'Technology',
-'NVVE': 'Industrials',
-'NVVEW': 'Industrials',
-'NVX': 'Miscellaneous',
-'NWBI': 'Finance',
-'NWE': 'Utilities',
-'NWFL': 'Finance',
-'NWG': 'Finance',
-'NWGL': 'Energy',
-'NWL': 'Industrials',
-'NWN': 'Utilities',
-'NWPX': 'Industrials',
-'NWS': 'Consumer Discretionary',
-'NWSA': 'Consumer Discretionary',
-'NWTN': 'Consumer Discretionary',
-'NWTNW': 'Consumer Discretionary',
-'NX': 'Industrials',
-'NXC': 'Finance',
-'NXDT': 'Real Estate',
-'NXDT^A': 'nan',
-'NXE': 'Basic Materials',
-'NXG': 'nan',
-'NXGL': 'Health Care',
-'NXGLW': 'Health Care',
-'NXJ': 'Finance',
-'NXL': 'Health Care',
-'NXLIW': 'Health Care',
-'NXN': 'Finance',
-'NXP': 'Finance',
-'NXPI': 'Technology',
-'NXPL': 'Telecommunications',
-'NXPLW': 'Telecommunications',
-'NXRT': 'Real Estate',
-'NXST': 'Industrials',
-'NXT': 'Industrials',
-'NXTC': 'Health Care',
-'NXTT': 'Technology',
-'NXU': 'Consumer Discretionary',
-'NYAX': 'Technology',
-'NYC': 'Real Estate',
-'NYCB': 'Finance',
-'NYCB^A': 'nan',
-'NYCB^U': 'nan',
-'NYMT': 'Real Estate',
-'NYMTI': 'Real Estate',
-'NYMTL': 'Real Estate',
-'NYMTM': 'Real Estate',
-'NYMTN': 'Real Estate',
-'NYMTZ': 'Real Estate',
-'NYT': 'Consumer Discretionary',
-'NYXH': 'Health Care',
-'NZF': 'Finance',
-'O': 'Real Estate',
-'OABI': 'Health Care',
-'OABIW': 'Health Care',
-'OACCU': 'Finance',
-'OAK^A': 'nan',
-'OAK^B': 'nan',
-'OAKU': 'Finance',
-'OAKUR': 'Finance',
-'OAKUU': 'Finance',
-'OAKUW': 'Finance',
-'OB': 'Technology',
-'OBDC': 'Finance',
-'OBDE': 'nan',
-'OBE': 'Energy',
-'OBIO': 'Health Care',
-'OBK': 'Finance',
-'OBLG': 'Technology',
-'OBT': 'Finance',
-'OC': 'Industrials',
-'OCC': 'Industrials',
-'OCCI': 'Finance',
-'OCCIM': 'nan',
-'OCCIN': 'Finance',
-'OCCIO': 'Finance',
-'OCEA': 'Health Care',
-'OCEAW': 'Health Care',
-'OCFC': 'Finance',
-'OCFCP': 'Finance',
-'OCFT': 'Technology',
-'OCG': 'Consumer Discretionary',
-'OCGN': 'Health Care',
-'OCS': 'Health Care',
-'OCSAW': 'Health Care',
-'OCSL': 'Finance',
-'OCTO': 'nan',
-'OCUL': 'Health Care',
-'OCX': 'Health Care',
-'ODC': 'Consumer Discretionary',
-'ODD': 'Consumer Discretionary',
-'ODFL': 'Industrials',
-'ODP': 'Consumer Discretionary',
-'ODV': 'Basic Materials',
-'ODVWZ': 'Basic Materials',
-'OEC': 'Industrials',
-'OESX': 'Consumer Discretionary',
-'OFG': 'Finance',
-'OFIX': 'Health Care',
-'OFLX': 'Industrials',
-'OFS': 'Finance',
-'OFSSH': 'Finance',
-'OGE': 'Utilities',
-'OGEN': 'Health Care',
-'OGI': 'Health Care',
-'OGN': 'Health Care',
-'OGS': 'Utilities',
-'OHI': 'Real Estate',
-'OI': 'Consumer Discretionary',
-'OIA': 'Finance',
-'OII': 'Energy',
-'OIS': 'Industrials',
-'OKE': 'Utilities',
-'OKLO': 'Utilities',
-'OKTA': 'Technology',
-'OKUR': 'Health Care',
-'OKYO': 'Health Care',
-'OLB': 'Consumer Discretionary',
-'OLED': 'Technology',
-'OLLI': 'Consumer Discretionary',
-'OLMA': 'Health Care',
-'OLN': 'Industrials',
-'OLO': 'Technology',
-'OLP': 'Real Estate',
-'OLPX': 'Consumer Discretionary',
-'OM': 'Health Care',
-'OMAB': 'Consumer Discretionary',
-'OMC': 'Consumer Discretionary',
-'OMCC': 'Finance',
-'OMCL': 'Technology',
-'OMER': 'Health Care',
-'OMEX': 'Consumer Discretionary',
-'OMF': 'Finance',
-'OMGA': 'Health Care',
-'OMH': 'Finance',
-'OMI': 'Health Care',
-'OMIC': 'Industrials',
-'ON': 'Technology',
-'ONB': 'Finance',
-'ONBPO': 'Finance',
-'ONBPP': 'Finance',
-'ONCO': 'Health Care',
-'ONCT': 'Health Care',
-'ONCY': 'Health Care',
-'ONDS': 'Technology',
-'ONEW': 'Consumer Discretionary',
-'ONFO': 'Technology',
-'ONFOW': 'Technology',
-'ONIT': 'Finance',
-'ONL': 'Real Estate',
-'ONMD': 'Health Care',
-'ONMDW': 'Health Care',
-'ONON': 'Consumer Discretionary',
-'ONTF': 'Technology',
-'ONTO': 'Industrials',
-'ONVO': 'Health Care',
-'ONYX': 'Finance',
-'OOMA': 'Technology',
-'OP': 'Consumer Discretionary',
-'OPAD': 'Finance',
-'OPAL': 'Utilities',
-'OPBK': 'Finance',
-'OPCH': 'Health Care',
-'OPEN': 'Finance',
-'OPFI': 'Finance',
-'OPHC': 'Finance',
-'OPI': 'Finance',
-'OPINL': 'Finance',
-'OPK': 'Health Care',
-'OPOF': 'Finance',
-'OPP': 'Finance',
-'OPP^A': 'nan',
-'OPP^B': 'nan',
-'OPRA': 'Technology',
-'OPRT': 'Finance',
-'OPRX': 'Consumer Discretionary',
-'OPT': 'Health Care',
-'OPTN': 'Health Care',
-'OPTT': 'Utilities',
-'OPTX': 'Technology',
-'OPTXW': 'Technology',
-'OPXS': 'Technology',
-'OPY': 'Finance',
-'OR': 'Basic Materials',
-'ORA': 'Utilities',
-'ORC': 'Real Estate',
-'ORCL': 'Technology',
-'ORGN': 'Industrials',
-'ORGNW': 'Industrials',
-'ORGO': 'Health Care',
-'ORI': 'Finance',
-'ORIC': 'Health Care',
-'ORIS': 'Consumer Staples',
-'ORKA': 'Health Care',
-'ORKT': 'Technology',
-'ORLA': 'Basic Materials',
-'ORLY': 'Consumer Discretionary',
-'ORMP': 'Health Care',
-'ORN': 'Industrials',
-'ORRF': 'Finance',
-'OS': 'Technology',
-'OSBC': 'Finance',
-'OSCR': 'Health Care',
-'OSIS': 'Technology',
-'OSK': 'Consumer Discretionary',
-'OSPN': 'Technology',
-'OSS': 'Technology',
-'OST': 'Technology',
-'OSTX': 'Health Care',
-'OSUR': 'Health Care',
-'OSW': 'Consumer Discretionary',
-'OTEX': 'Technology',
-'OTIS': 'Technology',
-'OTLK': 'Health Care',
-'OTLY': 'Consumer Staples',
-'OTRK': 'Health Care',
-'OTTR': 'Utilities',
-'OUST': 'Industrials',
-'OUT': 'Real Estate',
-'OVBC': 'Finance',
-'OVID': 'Health Care',
-'OVLY': 'Finance',
-'OVV': 'Energy',
-'OWL': 'Finance',
-'OWLT': 'Industrials',
-'OXBR': 'Finance',
-'OXBRW': 'Finance',
-'OXLC': 'Finance',
-'OXLCI': 'nan',
-'OXLCL': 'Finance',
-'OXLCN': 'Finance',
-'OXLCO': 'Finance',
-'OXLCP': 'Finance',
-'OXLCZ': 'Finance',
-'OXM': 'Consumer Discretionary',
-'OXSQ': 'Finance',
-'OXSQG': 'Consumer Discretionary',
-'OXSQZ': 'Finance',
-'OXY': 'Energy',
-'OZ': 'Real Estate',
-'OZK': 'Finance',
-'OZKAP': 'Finance',
-'PAA': 'Energy',
-'PAAS': 'Basic Materials',
-'PAC': 'Consumer Discretionary',
-'PACB': 'Industrials',
-'PACK': 'Consumer Discretionary',
-'PACS': 'Health Care',
-'PAG': 'Consumer Discretionary',
-'PAGP': 'Energy',
-'PAGS': 'Technology',
-'PAHC': 'Health Care',
-'PAI': 'Finance',
-'PAL': 'Consumer Discretionary',
-'PALI': 'Health Care',
-'PALT': 'Consumer Discretionary',
-'PAM': 'Utilities',
-'PANL': 'Consumer Discretionary',
-'PANW': 'Technology',
-'PAPL': 'Finance',
-'PAR': 'Miscellaneous',
-'PARA': 'Industrials',
-'PARAA': 'Industrials',
-'PARR': 'Energy',
-'PASG': 'Health Care',
-'PATH': 'Technology',
-'PATK': 'Consumer Discretionary',
-'PAVM': 'Health Care',
-'PAVMZ': 'Health Care',
-'PAVS': 'Health Care',
-'PAX': 'Finance',
-'PAXS': 'Finance',
-'PAY': 'Consumer Discretionary',
-'PAYC': 'Technology',
-'PAYO': 'Consumer Discretionary',
-'PAYS': 'Consumer Discretionary',
-'PAYX': 'Consumer Discretionary',
-'PB': 'Finance',
-'PBA': 'Energy',
-'PBBK': 'Finance',
-'PBF': 'Energy',
-'PBFS': 'Finance',
-'PBH': 'Health Care',
-'PBHC': 'Finance',
-'PBI': 'Miscellaneous',
-'PBI^B': 'nan',
-'PBM': 'Health Care',
-'PBMWW': 'Health Care',
-'PBPB': 'Consumer Discretionary',
-'PBR': 'Energy',
-'PBT': 'Energy',
-'PBYI': 'Health Care',
-'PC': 'Consumer Discretionary',
-'PCAR': 'Consumer Discretionary',
-'PCB': 'Finance',
-'PCF': 'Finance',
-'PCG': 'Utilities',
-'PCG^A': 'nan',
-'PCG^B': 'nan',
-'PCG^C': 'nan',
-'PCG^D': 'nan',
-'PCG^E': 'nan',
-'PCG^G': 'nan',
-'PCG^H': 'nan',
-'PCG^I': 'nan',
-'PCH': 'Real Estate',
-'PCK': 'Finance',
-'PCM': 'Finance',
-'PCN': 'Finance',
-'PCOR': 'Technology',
-'PCQ': 'Finance',
-'PCRX': 'Health Care',
-'PCSA': 'Health Care',
-'PCSC': 'nan',
-'PCT': 'Industrials',
-'PCTTU': 'Industrials',
-'PCTTW': 'Industrials',
-'PCTY': 'Technology',
-'PCVX': 'Health Care',
-'PCYO': 'Utilities',
-'PD': 'Technology',
-'PDCC': 'nan',
-'PDCO': 'Health Care',
-'PDD': 'Consumer Discretionary',
-'PDEX': 'Health Care',
-'PDFS': 'Technology',
-'PDI': 'Finance',
-'PDLB': 'Finance',
-'PDM': 'Real Estate',
-'PDO': 'Finance',
-'PDS': 'Energy',
-'PDSB': 'Health Care',
-'PDT': 'Finance',
-'PDX': 'Finance',
-'PDYN': 'Technology',
-'PDYNW': 'Technology',
-'PEB': 'Real Estate',
-'PEB^E': 'nan',
-'PEB^F': 'nan',
-'PEB^G': 'nan',
-'PEB^H': 'nan',
-'PEBK': 'Finance',
-'PEBO': 'Finance',
-'PECO': 'Real Estate',
-'PED': 'Energy',
-'PEG': 'Utilities',
-'PEGA': 'Technology',
-'PEGY': 'Utilities',
-'PEN': 'Health Care',
-'PENG': 'Technology',
-'PENN': 'Consumer Discretionary',
-'PEO': 'Finance',
-'PEP': 'Consumer Staples',
-'PEPG': 'Health Care',
-'PERF': 'Technology',
-'PERI': 'Technology',
-'PESI': 'Industrials',
-'PET': 'Consumer Discretionary',
-'PETQ': 'Health Care',
-'PETS': 'Consumer Staples',
-'PETWW': 'Consumer Discretionary',
-'PETZ': 'Industrials',
-'PEV': 'Consumer Discretionary',
-'PFBC': 'Finance',
-'PFC': 'Finance',
-'PFD': 'Finance',
-'PFE': 'Health Care',
-'PFG': 'Finance',
-'PFGC': 'Consumer Discretionary',
-'PFH': 'Finance',
-'PFIE': 'Industrials',
-'PFIS': 'Finance',
-'PFL': 'Finance',
-'PFLT': 'Finance',
-'PFMT': 'Consumer Discretionary',
-'PFN': 'Finance',
-'PFO': 'Finance',
-'PFS': 'Finance',
-'PFSI': 'Finance',
-'PFTA': 'Finance',
-'PFTAU': 'Finance',
-'PFTAW': 'Finance',
-'PFX': 'Finance',
-'PFXNZ': 'Finance',
-'PG': 'Consumer Discretionary',
-'PGC': 'Finance',
-'PGEN': 'Health Care',
-'PGHL': 'Consumer Discretionary',
-'PGNY': 'Health Care',
-'PGP': 'Finance',
-'PGR': 'Finance',
-'PGRE': 'Real Estate',
-'PGRU': 'Technology',
-'PGY': 'Finance',
-'PGYWW': 'Finance',
-'PGZ': 'Finance',
-'PH': 'Industrials',
-'PHAR': 'Health Care',
-'PHAT': 'Health Care',
-'PHD': 'Finance',
-'PHG': 'Health Care',
-'PHGE': 'Health Care',
-'PHI': 'Telecommunications',
-'PHIN': 'Consumer Discretionary',
-'PHIO': 'Health Care',
-'PHK': 'Finance',
-'PHM': 'Consumer Discretionary',
-'PHR': 'Consumer Discretionary',
-'PHT': 'Finance',
-'PHUN': 'Technology',
-'PHVS': 'Health Care',
-'PHX': 'Energy',
-'PHYT': 'Finance',
-'PI': 'Technology',
-'PII': 'Consumer Discretionary',
-'PIII': 'Health Care',
-'PIIIW': 'Health Care',
-'PIK': 'Consumer Discretionary',
-'PIM': 'Finance',
-'PINC': 'Consumer Discretionary',
-'PINE': 'Real Estate',
-'PINS': 'Technology',
-'PIPR': 'Finance',
-'PIRS': 'Health Care',
-'PITA': 'Miscellaneous',
-'PITAW': 'Miscellaneous',
-'PIXY': 'Consumer Discretionary',
-'PJT': 'Finance',
-'PK': 'Consumer Discretionary',
-'PKBK': 'Finance',
-'PKE': 'Industrials',
-'PKG': 'Consumer Discretionary',
-'PKOH': 'Industrials',
-'PKST': 'Real Estate',
-'PKX': 'Industrials',
-'PL': 'Technology',
-'PLAB': 'Technology',
-'PLAG': 'Consumer Staples',
-'PLAOU': 'Finance',
-'PLAOW': 'Finance',
-'PLAY': 'Consumer Discretionary',
-'PLBC': 'Finance',
-'PLBY': 'Consumer Discretionary',
-'PLCE': 'Consumer Discretionary',
-'PLD': 'Real Estate',
-'PLG': 'Basic Materials',
-'PLL': 'Industrials',
-'PLMJ': 'nan',
-'PLMJU': 'nan',
-'PLMJW': 'nan',
-'PLMR': 'Finance',
-'PLNT': 'Consumer Discretionary',
-'PLOW': 'Industrials',
-'PLPC': 'Industrials',
-'PLRX': 'Health Care',
-'PLSE': 'Health Care',
-'PLTK': 'Technology',
-'PLTR': 'Technology',
-'PLUG': 'Energy',
-'PLUR': 'Health Care',
-'PLUS': 'Technology',
-'PLX': 'Health Care',
-'PLXS': 'Technology',
-'PLYA': 'Consumer Discretionary',
-'PLYM': 'Real Estate',
-'PM': 'Health Care',
-'PMAX': 'Consumer Discretionary',
-'PMCB': 'Health Care',
-'PMD': 'Health Care',
-'PMEC': 'Finance',
-'PMF': 'Finance',
-'PML': 'Finance',
-'PMM': 'Finance',
-'PMN': 'Health Care',
-'PMNT': 'nan',
-'PMO': 'Finance',
-'PMT': 'Real Estate',
-'PMT^A': 'nan',
-'PMT^B': 'nan',
-'PMT^C': 'nan',
-'PMTS': 'Consumer Discretionary',
-'PMTU': 'Real Estate',
-'PMVP': 'Health Care',
-'PMX': 'Finance',
-'PNBK': 'Finance',
-'PNC': 'Finance',
-'PNF': 'Finance',
-'PNFP': 'Finance',
-'PNFPP': 'Finance',
-'PNI': 'Finance',
-'PNNT': 'Finance',
-'PNR': 'Industrials',
-'PNRG': 'Energy',
-'PNST': 'Consumer Discretionary',
-'PNTG': 'Health Care',
-'PNW': 'Utilities',
-'POAI': 'Health Care',
-'POCI': 'Health Care',
-'PODC': 'Technology',
-'PODD': 'Health Care',
-'POET': 'Technology',
-'POLA': 'Miscellaneous',
-'POLEU': 'nan',
-'POOL': 'Consumer Discretionary',
-'POR': 'Utilities',
-'POST': 'Consumer Staples',
-'POWI': 'Technology',
-'POWL': 'Energy',
-'POWW': 'Industrials',
-'POWWP': 'Industrials',
-'PPBI': 'Finance',
-'PPBT': 'Health Care',
-'PPC': 'Consumer Staples',
-'PPG': 'Consumer Discretionary',
-'PPIH': 'Industrials',
-'PPL': 'Utilities',
-'PPSI': 'Industrials',
-'PPT': 'Finance',
-'PPTA': 'Basic Materials',
-'PPYAU': 'Finance',
-'PPYAW': 'Finance',
-'PR': 'Energy',
-'PRA': 'Finance',
-'PRAA': 'Finance',
-'PRAX': 'Health Care',
-'PRCH': 'Technology',
-'PRCT': 'Health Care',
-'PRDO': 'Real Estate',
-'PRE': 'Finance',
-'PRENW': 'Finance',
-'PRFX': 'Health Care',
-'PRG': 'Consumer Discretionary',
-'PRGO': 'Health Care',
-'PRGS': 'Technology',
-'PRH': 'Finance',
-'PRI': 'Finance',
-'PRIF^D': 'nan',
-'PRIF^F': 'nan',
-'PRIF^G': 'nan',
-'PRIF^H': 'nan',
-'PRIF^J': 'nan',
-'PRIF^K': 'nan',
-'PRIF^L': 'nan',
-'PRIM': 'Industrials',
-'PRK': 'Finance',
-'PRKS': 'Health Care',
-'PRLB': 'Industrials',
-'PRLD': 'Health Care',
-'PRM': 'Industrials',
-'PRME': 'Health Care',
-'PRMW': 'Consumer Staples',
-'PRO': 'Technology',
-'PROC': 'Health Care',
-'PROCW': 'Health Care',
-'PROF': 'Health Care',
-'PROK': 'Health Care',
-'PROP': 'Finance',
-'PROV': 'Finance',
-'PRPH': 'Health Care',
-'PRPL': 'Consumer Discretionary',
-'PRPO': 'Industrials',
-'PRQR': 'Health Care',
-'PRS': 'Finance',
-'PRSO': 'Technology',
-'PRT': 'Energy',
-'PRTA': 'Health Care',
-'PRTC': 'Health Care',
-'PRTG': 'Energy',
-'PRTH': 'Consumer Discretionary',
-'PRTS': 'Consumer Discretionary',
-'PRU': 'Finance',
-'PRVA': 'Health Care',
-'PRZO': 'Industrials',
-'PSA': 'Real Estate',
-'PSA^F': 'nan',
-'PSA^G': 'nan',
-'PSA^H': 'nan',
-'PSA^I': 'nan',
-'PSA^J': 'nan',
-'PSA^K': 'nan',
-'PSA^L': 'nan',
-'PSA^M': 'nan',
-'PSA^N': 'nan',
-'PSA^O': 'nan',
-'PSA^P': 'nan',
-'PSA^Q': 'nan',
-'PSA^R': 'nan',
-'PSA^S': 'nan',
-'PSBD': 'nan',
-'PSEC': 'Finance',
-'PSEC^A': 'nan',
-'PSF': 'Finance',
-'PSFE': 'Consumer Discretionary',
-'PSHG': 'Consumer Discretionary',
-'PSIG': 'Consumer Discretionary',
-'PSMT': 'Consumer Discretionary',
-'PSN': 'Technology',
-'PSNL': 'Health Care',
-'PSNY': 'Consumer Discretionary',
-'PSNYW': 'Consumer Discretionary',
-'PSO': 'Consumer Discretionary',
-'PSQH': 'Consumer Discretionary',
-'PSTG': 'Technology',
-'PSTL': 'Real Estate',
-'PSTV': 'Health Care',
-'PSTX': 'Health Care',
-'PSX': 'Energy',
-'PT': 'Technology',
-'PTA': 'Finance',
-'PTC': 'Technology',
-'PTCT': 'Health Care',
-'PTEN': 'Energy',
-'PTGX': 'Health Care',
-'PTHL': 'Health Care',
-'PTIX': 'Health Care',
-'PTLE': 'Energy',
-'PTLO': 'Consumer Discretionary',
-'PTMN': 'Finance',
-'PTN': 'Health Care',
-'PTON': 'Consumer Discretionary',
-'PTPI': 'Health Care',
-'PTSI': 'Industrials',
-'PTVE': 'Consumer Discretionary',
-'PTY': 'Finance',
-'PUBM': 'Technology',
-'PUK': 'Finance',
-'PULM': 'Health Care',
-'PUMP': 'Energy',
-'PVBC': 'Finance',
-'PVH': 'Consumer Discretionary',
-'PVL': 'Energy',
-'PW': 'Real Estate',
-'PW^A': 'nan',
-'PWM': 'Finance',
-'PWOD': 'Finance',
-'PWP': 'Finance',
-'PWR': 'Industrials',
-'PWUP': 'Finance',
-'PWUPU': 'Finance',
-'PWUPW': 'Finance',
-'PX': 'Finance',
-'PXDT': 'Health Care',
-'PXLW': 'Technology',
-'PXS': 'Consumer Discretionary',
-'PXSAW': 'Consumer Discretionary',
-'PYCR': 'Technology',
-'PYN': 'Finance',
-'PYPD': 'Health Care',
-'PYPL': 'Consumer Discretionary',
-'PYT': 'Finance',
-'PYXS': 'Health Care',
-'PZC': 'Finance',
-'PZG': 'Basic Materials',
-'PZZA': 'Consumer Discretionary',
-'QBTS': 'Technology',
-'QCOM': 'Technology',
-'QCRH': 'Finance',
-'QD': 'Finance',
-'QDEL': 'Health Care',
-'QETA': 'Finance',
-'QETAR': 'Finance',
-'QETAU': 'Finance',
-'QFIN': 'Finance',
-'QGEN': 'Health Care',
-'QH': 'Consumer Discretionary',
-'QIPT': 'Health Care',
-'QLGN': 'Health Care',
-'QLYS': 'Technology',
-'QMCO': 'Technology',
-'QMMM': 'Consumer Discretionary',
-'QNCX': 'Health Care',
-'QNRX': 'Health Care',
-'QNST': 'Consumer Discretionary',
-'QNTM': 'Health Care',
-'QOMO': 'Finance',
-'QOMOU': 'Finance',
-'QOMOW': 'Finance',
-'QQQX': 'Finance',
-'QRHC': 'Utilities',
-'QRTEA': 'Consumer Discretionary',
-'QRTEB': 'Consumer Discretionary',
-'QRTEP': 'Consumer Discretionary',
-'QRVO': 'Technology',
-'QS': 'Miscellaneous',
-'QSG': 'Real Estate',
-'QSI': 'Industrials',
-'QSIAW': 'Industrials',
-'QSR': 'Consumer Discretionary',
-'QTI': 'Health Care',
-'QTRX': 'Industrials',
-'QTTB': 'Health Care',
-'QTWO': 'Technology',
-'QUAD': 'Consumer Discretionary',
-'QUBT': 'Technology',
-'QUIK': 'Technology',
-'QURE': 'Health Care',
-'QVCC': 'Consumer Discretionary',
-'QVCD': 'Consumer Discretionary',
-'QXO': 'Technology',
-'R': 'Consumer Discretionary',
-'RA': 'Finance',
-'RACE': 'Consumer Discretionary',
-'RAIL': 'Industrials',
-'RAMP': 'Technology',
-'RAND': 'Finance',
-'RANI': 'Health Care',
-'RAPP': 'Health Care',
-'RAPT': 'Health Care',
-'RARE': 'Health Care',
-'RAVE': 'Consumer Discretionary',
-'RAY': 'Consumer Discretionary',
-'RAYA': 'Consumer Discretionary',
-'RBA': 'Consumer Discretionary',
-'RBB': 'Finance',
-'RBBN': 'Technology',
-'RBC': 'Industrials',
-'RBCAA': 'Finance',
-'RBKB': 'Finance',
-'RBLX': 'Technology',
-'RBOT': 'Health Care',
-'RBRK': 'Technology',
-'RC': 'Real Estate',
-'RC^C': 'nan',
-'RC^E': 'nan',
-'RCAT': 'Technology',
-'RCB': 'Real Estate',
-'RCC': 'Real Estate',
-'RCEL': 'Health Care',
-'RCFA': 'Finance',
-'RCG': 'Finance',
-'RCI': 'Telecommunications',
-'RCKT': 'Health Care',
-'RCKTW': 'Health Care',
-'RCKY': 'Consumer Discretionary',
-'RCL': 'Consumer Discretionary',
-'RCM': 'Consumer Discretionary',
-'RCMT': 'Consumer Discretionary',
-'RCON': 'Energy',
-'RCS': 'Finance',
-'RCUS': 'Health Care',
-'RDACU': 'Finance',
-'RDCM': 'Technology',
-'RDDT': 'Technology',
-'RDFN': 'Finance',
-'RDHL': 'Health Care',
-'RDI': 'Consumer Discretionary',
-'RDIB': 'Consumer Discretionary',
-'RDN': 'Finance',
-'RDNT': 'Health Care',
-'RDUS': 'Consumer Discretionary',
-'RDVT': 'Technology',
-'RDW': 'Industrials',
-'RDWR': 'Consumer Discretionary',
-'RDY': 'Health Care',
-'RDZN': 'Finance',
-'REAL': 'Consumer Discretionary',
-'REAX': 'Finance',
-'REBN': 'Consumer Discretionary',
-'RECT': 'Consumer Discretionary',
-'REE': 'Consumer Discretionary',
-'REFI': 'Real Estate',
-'REFR': 'Miscellaneous',
-'REG': 'Real Estate',
-'REGCO': 'Real Estate',
-'REGCP': 'Real Estate',
-'REGN': 'Health Care',
-'REI': 'Energy',
-'REKR': 'Telecommunications',
-'RELI': 'Finance',
-'RELIW': 'Finance',
-'RELL': 'Technology',
-'RELX': 'Consumer Discretionary',
-'RELY': 'Consumer Discretionary',
-'RENB': 'Health Care',
-'RENE': 'Finance',
-'RENEW': 'Finance',
-'RENT': 'Consumer Discretionary',
-'REPL': 'Health Care',
-'REPX': 'Energy',
-'RERE': 'Consumer Discretionary',
-'RES': 'Energy',
-'RETO': 'Industrials',
-'REVB': 'Health Care',
-'REVBW': 'Health Care',
-'REVG': 'Consumer Discretionary',
-'REX': 'Industrials',
-'REXR': 'Real Estate',
-'REXR^B': 'nan',
-'REXR^C': 'nan',
-'REYN': 'Consumer Discretionary',
-'REZI': 'Industrials',
-'RF': 'Finance',
-'RF^C': 'nan',
-'RF^E': 'nan',
-'RF^F': 'nan',
-'RFAC': 'Finance',
-'RFAI': 'nan',
-'RFAIR': 'Finance',
-'RFAIU': 'Finance',
-'RFI': 'Finance',
-'RFIL': 'Technology',
-'RFL': 'Finance',
-'RFM': 'Finance',
-'RFMZ': 'Finance',
-'RGA': 'Finance',
-'RGC': 'Health Care',
-'RGCO': 'Utilities',
-'RGEN': 'Health Care',
-'RGF': 'Consumer Staples',
-'RGLD': 'Industrials',
-'RGLS': 'Health Care',
-'RGNX': 'Health Care',
-'RGP': 'Consumer Discretionary',
-'RGR': 'Industrials',
-'RGS': 'Consumer Discretionary',
-'RGT': 'Finance',
-'RGTI': 'Technology',
-'RGTIW': 'Technology',
-'RH': 'Consumer Discretionary',
-'RHE': 'Real Estate',
-'RHI': 'Consumer Discretionary',
-'RHP': 'Real Estate',
-'RICK': 'Consumer Discretionary',
-'RIG': 'Energy',
-'RIGL': 'Health Care',
-'RILY': 'Finance',
-'RILYG': 'Finance',
-'RILYK': 'Finance',
-'RILYL': 'Finance',
-'RILYM': 'Finance',
-'RILYN': 'Finance',
-'RILYP': 'Finance',
-'RILYT': 'Finance',
-'RILYZ': 'Finance',
-'RIME': 'Consumer Staples',
-'RIO': 'Basic Materials',
-'RIOT': 'Finance',
-'RITM': 'Real Estate',
-'RITM^A': 'nan',
-'RITM^B': 'nan',
-'RITM^C': 'nan',
-'RITM^D': 'nan',
-'RITR': 'Finance',
-'RIV': 'Finance',
-'RIV^A': 'nan',
-'RIVN': 'Consumer Discretionary',
-'RJF': 'Finance',
-'RJF^B': 'nan',
-'RKDA': 'Consumer Staples',
-'RKLB': 'Industrials',
-'RKT': 'Finance',
-'RL': 'Consumer Discretionary',
-'RLAY': 'Health Care',
-'RLGT': 'Consumer Discretionary',
-'RLI': 'Finance',
-'RLJ': 'Real Estate',
-'RLJ^A': 'nan',
-'RLMD': 'Health Care',
-'RLTY': 'Finance',
-'RLX': 'Health Care',
-'RLYB': 'Health Care',
-'RM': 'Finance',
-'RMAX': 'Finance',
-'RMBI': 'Finance',
-'RMBL': 'Technology',
-'RMBS': 'Technology',
-'RMCF': 'Consumer Staples',
-'RMCO': 'Miscellaneous',
-'RMCOW': 'Miscellaneous',
-'RMD': 'Health Care',
-'RMI': 'Finance',
-'RMM': 'Finance',
-'RMMZ': 'Finance',
-'RMNI': 'Consumer Discretionary',
-'RMPL^': 'nan',
-'RMR': 'Consumer Discretionary',
-'RMT': 'Finance',
-'RMTI': 'Health Care',
-'RNA': 'Health Care',
-'RNAC': 'Health Care',
-'RNAZ': 'Health Care',
-'RNG': 'Technology',
-'RNGR': 'Energy',
-'RNP': 'Finance',
-'RNR': 'Finance',
-'RNR^F': 'nan',
-'RNR^G': 'nan',
-'RNST': 'Finance',
-'RNW': 'Utilities',
-'RNWWW': 'Utilities',
-'RNXT': 'Health Care',
-'ROAD': 'Industrials',
-'ROCK': 'Industrials',
-'ROCL': 'Finance',
-'ROCLU': 'Finance',
-'ROCLW': 'Finance',
-'ROG': 'Industrials',
-'ROIC': 'Real Estate',
-'ROIV': 'Health Care',
-'ROK': 'Industrials',
-'ROKU': 'Telecommunications',
-'ROL': 'Finance',
-'ROLR': 'Consumer Discretionary',
-'ROMA': 'Consumer Discretionary',
-'ROOT': 'Finance',
-'ROP': 'Industrials',
-'ROST': 'Consumer Discretionary',
-'RPAY': 'Consumer Discretionary',
-'RPD': 'Technology',
-'RPID': 'Industrials',
-'RPM': 'Consumer Discretionary',
-'RPRX': 'Health Care',
-'RPTX': 'Health Care',
-'RQI': 'Finance',
-'RR': 'Industrials',
-'RRAC': 'Finance',
-'RRBI': 'Consumer Discretionary',
-'RRC': 'Energy',
-'RRGB': 'Consumer Discretionary',
-'RRR': 'Consumer Discretionary',
-'RRX': 'Consumer Discretionary',
-'RS': 'Industrials',
-'RSF': 'Finance',
-'RSG': 'Utilities',
-'RSI': 'Consumer Discretionary',
-'RSKD': 'Consumer Discretionary',
-'RSLS': 'Health Care',
-'RSSS': 'Consumer Discretionary',
-'RSVR': 'Consumer Discretionary',
-'RSVRW': 'Consumer Discretionary',
-'RTC': 'Technology',
-'RTO': 'Consumer Discretionary',
-'RTX': 'Industrials',
-'RUM': 'Technology',
-'RUMBW': 'Technology',
-'RUN': 'Miscellaneous',
-'RUSHA': 'Consumer Discretionary',
-'RUSHB': 'Consumer Discretionary',
-'RVLV': 'Consumer Discretionary',
-'RVMD': 'Health Care',
-'RVMDW': 'nan',
-'RVNC': 'Health Care',
-'RVP': 'Health Care',
-'RVPH': 'Health Care',
-'RVPHW': 'Health Care',
-'RVSB': 'Finance',
-'RVSN': 'Industrials',
-'RVSNW': 'Industrials',
-'RVT': 'Finance',
-'RVTY': 'Industrials',
-'RVYL': 'Consumer Discretionary',
-'RWAY': 'Finance',
-'RWAYL': 'Finance',
-'RWAYZ': 'Finance',
-'RWT': 'Real Estate',
-'RWT^A': 'nan',
-'RWTN': 'Real Estate',
-'RWTO': 'Real Estate',
-'RXO': 'Consumer Discretionary',
-'RXRX': 'Health Care',
-'RXST': 'Health Care',
-'RXT': 'Technology',
-'RY': 'Finance',
-'RYAAY': 'Consumer Discretionary',
-'RYAM': 'Basic Materials',
-'RYAN': 'Finance',
-'RYDE': 'Consumer Discretionary',
-'RYI': 'Industrials',
-'RYN': 'Real Estate',
-'RYTM': 'Health Care',
-'RZB': 'Finance',
-'RZC': 'Finance',
-'RZLT': 'Health Care',
-'RZLV': 'Technology',
-'RZLVW': 'Technology',
-'S': 'Technology',
-'SA': 'Basic Materials',
-'SABA': 'nan',
-'SABR': 'Technology',
-'SABS': 'Health Care',
-'SABSW': 'Health Care',
-'SACC': 'Real Estate',
-'SACH': 'Real Estate',
-'SACH^A': 'nan',
-'SAFE': 'Real Estate',
-'SAFT': 'Finance',
-'SAG': 'nan',
-'SAGE': 'Health Care',
-'SAH': 'Consumer Discretionary',
-'SAIA': 'Industrials',
-'SAIC': 'Technology',
-'SAIH': 'Technology',
-'SAJ': 'Finance',
-'SAM': 'Consumer Staples',
-'SAMG': 'Finance',
-'SAN': 'Finance',
-'SANA': 'Health Care',
-'SAND          ': 'Basic Materials',
-'SANG': 'Technology',
-'SANM': 'Technology',
-'SANW': 'Consumer Staples',
-'SAP': 'Technology',
-'SAR': 'Finance',
-'SARO': 'Industrials',
-'SASR': 'Finance',
-'SAT': 'Finance',
-'SATL': 'Technology',
-'SATLW': 'Technology',
-'SATS': 'Consumer Discretionary',
-'SATX': 'Technology',
-'SAVA': 'Health Care',
-'SAVE': 'Consumer Discretionary',
-'SAY': 'Finance',
-'SAZ': 'Finance',
-'SB': 'Consumer Discretionary',
-'SB^C': 'nan',
-'SB^D': 'nan',
-'SBAC': 'Real Estate',
-'SBBA': 'Consumer Discretionary',
-'SBC': 'Health Care',
-'SBCF': 'Finance',
-'SBCWW': 'Health Care',
-'SBET': 'Technology',
-'SBEV': 'Consumer Staples',
-'SBFG': 'Finance',
-'SBFM': 'Health Care',
-'SBFMW': 'Health Care',
-'SBGI': 'Industrials',
-'SBH': 'Consumer Discretionary',
-'SBI': 'Finance',
-'SBLK': 'Consumer Discretionary',
-'SBR': 'Energy',
-'SBRA': 'Real Estate',
-'SBS': 'Utilities',
-'SBSI': 'Finance',
-'SBSW': 'Basic Materials',
-'SBT': 'Finance',
-'SBUX': 'Consumer Discretionary',
-'SBXC': 'Finance',
-'SBXD': 'nan',
-'SCCC': 'Real Estate',
-'SCCD': 'Real Estate',
-'SCCE': 'Real Estate',
-'SCCF': 'Real Estate',
-'SCCG': 'Real Estate',
-'SCCO': 'Basic Materials',
-'SCD': 'Finance',
-'SCE^G': 'nan',
-'SCE^H': 'nan',
-'SCE^J': 'nan',
-'SCE^K': 'nan',
-'SCE^L': 'nan',
-'SCE^M': 'nan',
-'SCE^N': 'nan',
-'SCHL': 'Consumer Discretionary',
-'SCHW': 'Finance',
-'SCHW^D': 'nan',
-'SCHW^J': 'nan',
-'SCI': 'Consumer Discretionary',
-'SCKT': 'Technology',
-'SCL': 'Consumer Discretionary',
-'SCLX': 'Health Care',
-'SCLXW': 'Health Care',
-'SCM': 'Finance',
-'SCNI': 'Health Care',
-'SCNX': 'Health Care',
-'SCOR': 'Consumer Discretionary',
-'SCPH': 'Health Care',
-'SCPX': 'Health Care',
-'SCS': 'Consumer Discretionary',
-'SCSC': 'Technology',
-'SCVL': 'Consumer Discretionary',
-'SCWO': 'Consumer Discretionary',
-'SCWX': 'Technology',
-'SCYX': 'Health Care',
-'SD': 'Energy',
-'SDA': 'Consumer Discretionary',
-'SDAWW': 'Consumer Discretionary',
-'SDGR': 'Health Care',
-'SDHC': 'Consumer Discretionary',
-'SDHY': 'Finance',
-'SDIG': 'Technology',
-'SDOT': 'Consumer Discretionary',
-'SDRL': 'Energy',
-'SDST': 'Industrials',
-'SDSTW': 'nan',
-'SE': 'Consumer Discretionary',
-'SEAL^A': 'nan',
-'SEAL^B': 'nan',
-'SEAT': 'Consumer Discretionary',
-'SEATW': 'Consumer Discretionary',
-'SEB': 'Industrials',
-'SEDA': 'Finance',
-'SEDG': 'Technology',
-'SEE': 'Industrials',
-'SEED': 'Consumer Staples',
-'SEER': 'Industrials',
-'SEG': 'Consumer Discretionary',
-'SEI': 'Industrials',
-'SEIC': 'Finance',
-'SELF': 'Real Estate',
-'SELX': 'Technology',
-'SEM': 'Health Care',
-'SEMR': 'Technology',
-'SENEA': 'Consumer Staples',
-'SENEB': 'Consumer Staples',
-'SENS': 'Industrials',
-'SER': 'Health Care',
-'SERA': 'Health Care',
-'SERV': 'Consumer Discretionary',
-'SES': 'Miscellaneous',
-'SEVN': 'Real Estate',
-'SEZL': 'Consumer Discretionary',
-'SF': 'Finance',
-'SF^B': 'nan',
-'SF^C': 'nan',
-'SF^D': 'nan',
-'SFB': 'Finance',
-'SFBC': 'Finance',
-'SFBS': 'Finance',
-'SFHG': 'Consumer Discretionary',
-'SFIX': 'Consumer Discretionary',
-'SFL': 'Consumer Discretionary',
-'SFM': 'Consumer Staples',
-'SFNC': 'Finance',
-'SFST': 'Finance',
-'SFWL': 'Industrials',
-'SG': 'Consumer Discretionary',
-'SGA': 'Consumer Discretionary',
-'SGBX': 'Consumer Discretionary',
-'SGC': 'Consumer Discretionary',
-'SGD': 'Finance',
-'SGHC': 'Consumer Discretionary',
-'SGHT': 'Health Care',
-'SGLY': 'Consumer Discretionary',
-'SGMA': 'Technology',
-'SGML': 'Basic Materials',
-'SGMO': 'Health Care',
-'SGMT': 'Health Care',
-'SGN': 'Technology',
-'SGRP': 'Consumer Discretionary',
-'SGRY': 'Health Care',
-'SGU': 'Consumer Discretionary',
-'SHAK': 'Consumer Discretionary',
-'SHBI': 'Finance',
-'SHC': 'Health Care',
-'SHCO': 'Consumer Discretionary',
-'SHEL': 'Energy',
-'SHEN': 'Telecommunications',
-'SHFS': 'Finance',
-'SHFSW': 'Finance',
-'SHG': 'Finance',
-'SHIM': 'Industrials',
-'SHIP': 'Consumer Discretionary',
-'SHLS': 'Technology',
-'SHLT': 'Health Care',
-'SHMD': 'Technology',
-'SHO': 'Consumer Discretionary',
-'SHO^H': 'nan',
-'SHO^I': 'nan',
-'SHOO': 'Consumer Discretionary',
-'SHOP': 'Technology',
-'SHOT': 'Consumer Discretionary',
-'SHOTW': 'Consumer Discretionary',
-'SHPH': 'Health Care',
-'SHW': 'Consumer Discretionary',
-'SHYF': 'Consumer Discretionary',
-'SIBN': 'Health Care',
-'SID': 'Industrials',
-'SIDU': 'Telecommunications',
-'SIEB': 'Finance',
-'SIF': 'Industrials',
-'SIFY': 'Technology',
-'SIG': 'Consumer Discretionary',
-'SIGA': 'Health Care',
-'SIGI': 'Finance',
-'SIGIP': 'Finance',
-'SII': 'Finance',
-'SILA': 'Real Estate',
-'SILC': 'Telecommunications',
-'SILO': 'Consumer Discretionary',
-'SILV': 'Basic Materials',
-'SIM': 'Industrials',
-'SIMA': 'Miscellaneous',
-'SIMAW': 'Finance',
-'SIMO': 'Technology',
-'SINT': 'Health Care',
-'SIRI': 'Consumer Discretionary',
-'SISI': 'Health Care',
-'SITC': 'Real Estate',
-'SITC^A': 'nan',
-'SITE': 'Consumer Discretionary',
-'SITM': 'Technology',
-'SJ': 'Technology',
-'SJM': 'Consumer Staples',
-'SJT': 'Energy',
-'SJW': 'Utilities',
-'SKE': 'Basic Materials',
-'SKGR': 'Finance',
-'SKGRU': 'Finance',
-'SKGRW': 'Finance',
-'SKIL': 'Technology',
-'SKIN': 'Health Care',
-'SKK': 'Industrials',
-'SKLZ': 'Technology',
-'SKM': 'Telecommunications',
-'SKT': 'Real Estate',
-'SKWD': 'Finance',
-'SKX': 'Consumer Discretionary',
-'SKY': 'Consumer Discretionary',
-'SKYE': 'Health Care',
-'SKYH': 'Finance',
-'SKYQ': 'Industrials',
-'SKYT': 'Technology',
-'SKYW': 'Consumer Discretionary',
-'SKYX': 'Consumer Discretionary',
-'SLAB': 'Technology',
-'SLB': 'Energy',
-'SLDB': 'Health Care',
-'SLDP': 'Miscellaneous',
-'SLDPW': 'Miscellaneous',
-'SLE': 'Consumer Discretionary',
-'SLF': 'Finance',
-'SLG': 'Real Estate',
-'SLG^I': 'nan',
-'SLGL': 'Health Care',
-'SLGN': 'Industrials',
-'SLI': 'Industrials',
-'SLM': 'Finance',
-'SLMBP': 'Finance',
-'SLN': 'Health Care',
-'SLND': 'Industrials',
-'SLNG': 'Utilities',
-'SLNH': 'Finance',
-'SLNHP': 'Finance',
-'SLNO': 'Health Care',
-'SLP': 'Technology',
-'SLQT': 'Finance',
-'SLRC': 'Finance',
-'SLRN': 'Health Care',
-'SLRX': 'Health Care',
-'SLS': 'Health Care',
-'SLSR': 'nan',
-'SLVM': 'Basic Materials',
-'SLXN': 'Health Care',
-'SLXNW': 'Health Care',
-'SM': 'Energy',
-'SMAR': 'Technology',
-'SMBC': 'Finance',
-'SMBK': 'Finance',
-'SMC': 'Utilities',
-'SMCI': 'Technology',
-'SMFG': 'Finance',
-'SMG': 'Industrials',
-'SMHI': 'Consumer Discretionary',
-'SMID': 'Industrials',
-'SMLR': 'Health Care',
-'SMMT': 'Health Care',
-'SMP': 'Consumer Discretionary',
-'SMPL': 'Consumer Staples',
-'SMR': 'Industrials',
-'SMRT': 'Technology',
-'SMSI': 'Technology',
-'SMTC': 'Technology',
-'SMTI': 'Health Care',
-'SMTK': 'Technology',
-'SMWB': 'Technology',
-'SMX': 'Technology',
-'SMXT': 'Consumer Discretionary',
-'SMXWW': 'Technology',
-'SN': 'Consumer Discretionary',
-'SNA': 'Consumer Discretionary',
-'SNAL': 'Technology',
-'SNAP': 'Technology',
-'SNAX': 'Consumer Staples',
-'SNAXW': 'Consumer Staples',
-'SNBR': 'Consumer Discretionary',
-'SNCR': 'Technology',
-'SNCRL': 'Health Care',
-'SNCY': 'Consumer Discretionary',
-'SND': 'Industrials',
-'SNDA': 'Health Care',
-'SNDL': 'Health Care',
-'SNDR': 'Industrials',
-'SNDX': 'Health Care',
-'SNES': 'Industrials',
-'SNEX': 'Finance',
-'SNFCA': 'Finance',
-'SNGX': 'Health Care',
-'SNN': 'Health Care',
-'SNOA': 'Health Care',
-'SNOW': 'Technology',
-'SNPS': 'Technology',
-'SNPX': 'Health Care',
-'SNSE': 'Health Care',
-'SNT': 'Telecommunications',
-'SNTG': 'Finance',
-'SNTI': 'Health Care',
-'SNV': 'Finance',
-'SNV^D': 'nan',
-'SNV^E': 'nan',
-'SNX': 'Technology',
-'SNY': 'Health Care',
-'SNYR': 'Health Care',
-'SO': 'Utilities',
-'SOAR': 'Consumer Discretionary',
-'SOBO': 'nan',
-'SOBR': 'Consumer Discretionary',
-'SOC': 'Energy',
-'SOFI': 'Finance',
-'SOGP': 'Technology',
-'SOHO': 'Real Estate',
-'SOHOB': 'Real Estate',
-'SOHON': 'Real Estate',
-'SOHOO': 'Real Estate',
-'SOHU': 'Technology',
-'SOJC': 'Utilities',
-'SOJD': 'Utilities',
-'SOJE': 'Basic Materials',
-'SOL': 'Technology',
-'SOLV': 'Health Care',
-'SON': 'Consumer Discretionary',
-'SOND': 'Consumer Discretionary',
-'SONDW': 'Consumer Discretionary',
-'SONM': 'Utilities',
-'SONN': 'Health Care',
-'SONO': 'Consumer Staples',
-'SONY': 'Consumer Staples',
-'SOPA': 'Consumer Discretionary',
-'SOPH': 'Health Care',
-'SOR': 'Finance',
-'SOS': 'Finance',
-'SOTK': 'Technology',
-'SOUN': 'Technology',
-'SOUNW': 'Technology',
-'SOWG': 'Consumer Staples',
-'SPAI': 'Health Care',
-'SPB': 'Miscellaneous',
-'SPCB': 'Technology',
-'SPCE': 'Consumer Discretionary',
-'SPE': 'Finance',
-'SPFI': 'Finance',
-'SPG': 'Real Estate',
-'SPG^J': 'nan',
-'SPGC': 'Consumer Discretionary',
-'SPGI': 'Finance',
-'SPH': 'Consumer Discretionary',
-'SPHL': 'Consumer Discretionary',
-'SPHR': 'Consumer Discretionary',
-'SPI': 'Technology',
-'SPIR': 'Consumer Discretionary',
-'SPKL': 'nan',
-'SPKLU': 'nan',
-'SPLP': 'Industrials',
-'SPLP^A': 'nan',
-'SPMC': 'nan',
-'SPNS': 'Technology',
-'SPNT': 'Finance',
-'SPNT^B': 'nan',
-'SPOK': 'Telecommunications',
-'SPOT': 'Consumer Discretionary',
-'SPPL': 'Consumer Discretionary',
-'SPR': 'Industrials',
-'SPRB': 'Health Care',
-'SPRC': 'Health Care',
-'SPRO': 'Health Care',
-'SPRU': 'Consumer Discretionary',
-'SPRY': 'Health Care',
-'SPSC': 'Technology',
-'SPT': 'Technology',
-'SPTN': 'Consumer Discretionary',
-'SPWH': 'Consumer Discretionary',
-'SPXC': 'Industrials',
-'SPXX': 'Finance',
-'SQ': 'Technology',
-'SQFT': 'Real Estate',
-'SQFTP': 'Real Estate',
-'SQFTW': 'Real Estate',
-'SQM': 'Industrials',
-'SQNS': 'Technology',
-'SR': 'Utilities',
-'SR^A': 'nan',
-'SRAD': 'Technology',
-'SRBK': 'Finance',
-'SRCE': 'Finance',
-'SRCL': 'Industrials',
-'SRDX': 'Health Care',
-'SRE': 'Utilities',
-'SREA': 'Utilities',
-'SRFM': 'Consumer Discretionary',
-'SRG': 'Finance',
-'SRG^A': 'nan',
-'SRI': 'Consumer Discretionary',
-'SRL': 'Finance',
-'SRM': 'Consumer Discretionary',
-'SRPT': 'Health Care',
-'SRRK': 'Health Care',
-'SRTS': 'Health Care',
-'SRV': 'Finance',
-'SRZN': 'Health Care',
-'SSB': 'Finance',
-'SSBI': 'Finance',
-'SSBK': 'Finance',
-'SSD': 'Consumer Discretionary',
-'SSKN': 'Health Care',
-'SSL': 'Energy',
-'SSNC': 'Technology',
-'SSP': 'Industrials',
-'SSRM': 'Industrials',
-'SSSS': 'Finance',
-'SSSSL': 'Finance',
-'SST': 'Technology',
-'SSTI': 'Technology',
-'SSTK': 'Technology',
-'SSY': 'Health Care',
-'SSYS': 'Technology',
-'ST': 'Industrials',
-'STAA': 'Health Care',
-'STAF': 'Consumer Discretionary',
-'STAG': 'Real Estate',
-'STBA': 'Finance',
-'STBX': 'Consumer Discretionary',
-'STC': 'Finance',
-'STCN': 'Consumer Discretionary',
-'STE': 'Health Care',
-'STEC': 'Finance',
-'STEL': 'Finance',
-'STEM': 'Miscellaneous',
-'STEP': 'Finance',
-'STER': 'Technology',
-'STEW': 'Finance',
-'STFS': 'Consumer Discretionary',
-'STG': 'Real Estate',
-'STGW': 'Consumer Discretionary',
-'STHO': 'Real Estate',
-'STI': 'Miscellaneous',
-'STIM': 'Health Care',
-'STK': 'Finance',
-'STKH': 'Consumer Staples',
-'STKL': 'Industrials',
-'STKS': 'Consumer Discretionary',
-'STLA': 'Consumer Discretionary',
-'STLD': 'Industrials',
-'STM': 'Technology',
-'STN': 'Consumer Discretionary',
-'STNE': 'Technology',
-'STNG': 'Consumer Discretionary',
-'STOK': 'Health Care',
-'STR': 'Energy',
-'STRA': 'Real Estate',
-'STRL': 'Industrials',
-'STRM': 'Technology',
-'STRO': 'Health Care',
-'STRR': 'Health Care',
-'STRRP': 'Health Care',
-'STRS': 'Real Estate',
-'STRT': 'Consumer Discretionary',
-'STRW': 'Real Estate',
-'STSS': 'Health Care',
-'STSSW': 'Finance',
-'STT': 'Finance',
-'STT^G': 'nan',
-'STTK': 'Health Care',
-'STVN': 'Health Care',
-'STWD': 'Real Estate',
-'STX': 'Technology',
-'STXS': 'Health Care',
-'STZ': 'Consumer Staples',
-'SU': 'Energy',
-'SUGP': 'Consumer Discretionary',
-'SUI': 'Real Estate',
-'SUM': 'Industrials',
-'SUN': 'Energy',
-'SUNS': 'Real Estate',
-'SUP': 'Consumer Discretionary',
-'SUPN': 'Health Care',
-'SUPV': 'Finance',
-'SURG': 'Consumer Discretionary',
-'SURGW': 'Consumer Discretionary',
-'SUUN': 'Utilities',
-'SUZ': 'Basic Materials',
-'SVC': 'Real Estate',
-'SVCO': 'Technology',
-'SVII': 'Finance',
-'SVIIU': 'Finance',
-'SVIIW': 'Finance',
-'SVM': 'Basic Materials',
-'SVMH': 'Consumer Discretionary',
-'SVMHW': 'Consumer Discretionary',
-'SVRA': 'Health Care',
-'SVRE': 'Technology',
-'SVREW': 'Technology',
-'SVT': 'Consumer Discretionary',
-'SVV': 'Consumer Discretionary',
-'SW': 'Consumer Discretionary',
-'SWAG': 'Consumer Discretionary',
-'SWAGW': 'Consumer Discretionary',
-'SWBI': 'Industrials',
-'SWI': 'Technology',
-'SWIM': 'Industrials',
-'SWIN': 'Finance',
-'SWK': 'Consumer Discretionary',
-'SWKH': 'Finance',
-'SWKHL': 'nan',
-'SWKS': 'Technology',
-'SWTX': 'Health Care',
-'SWVL': 'Consumer Discretionary',
-'SWVLW': 'Consumer Discretionary',
-'SWX': 'Utilities',
-'SWZ': 'Finance',
-'SXC': 'Industrials',
-'SXI': 'Industrials',
-'SXT': 'Industrials',
-'SXTC': 'Health Care',
-'SXTP': 'Health Care',
-'SXTPW': 'Health Care',
-'SY': 'Technology',
-'SYBT': 'Finance',
-'SYBX': 'Health Care',
-'SYF': 'Finance',
-'SYF^A': 'nan',
-'SYF^B': 'nan',
-'SYK': 'Health Care',
-'SYM': 'Industrials',
-'SYNA': 'Technology',
-'SYNX': 'Consumer Staples',
-'SYPR': 'Industrials',
-'SYRA': 'Consumer Discretionary',
-'SYRE': 'Health Care',
-'SYRS': 'Health Care',
-'SYT': 'Finance',
-'SYTA': 'Telecommunications',
-'SYTAW': 'Telecommunications',
-'SYY': 'Consumer Discretionary',
-'T': 'Telecommunications',
-'T^A': 'nan',
-'T^C': 'nan',
-'TAC': 'Utilities',
-'TACT': 'Technology',
-'TAIT': 'Technology',
-'TAK': 'Health Care',
-'TAL': 'Real Estate',
-'TALK': 'Health Care',
-'TALKW': 'Health Care',
-'TALO': 'Energy',
-'TANH': 'Industrials',
-'TAOP': 'Technology',
-'TAP': 'Consumer Staples',
-'TARA': 'Health Care',
-'TARS': 'Health Care',
-'TASK': 'Technology',
-'TATT': 'Industrials',
-'TAYD': 'Industrials',
-'TBB': 'Telecommunications',
-'TBBB': 'Consumer Staples',
-'TBBK': 'Finance',
-'TBC': 'Telecommunications',
-'TBI': 'Consumer Discretionary',
-'TBLA': 'Technology',
-'TBLAW': 'Technology',
-'TBLD': 'Finance',
-'TBMC': 'Finance',
-'TBMCR': 'Finance',
-'TBN': 'Energy',
-'TBNK': 'Finance',
-'TBPH': 'Health Care',
-'TBRG': 'Technology',
-'TC': 'Consumer Discretionary',
-'TCBI': 'Finance',
-'TCBIO': 'Finance',
-'TCBK': 'Finance',
-'TCBP': 'Health Care',
-'TCBPW': 'Health Care',
-'TCBS': 'Finance',
-'TCBX': 'Finance',
-'TCI': 'Real Estate',
-'TCMD': 'Health Care',
-'TCOM': 'Consumer Discretionary',
-'TCPC': 'Finance',
-'TCRT': 'Health Care',
-'TCRX': 'Health Care',
-'TCS': 'Consumer Discretionary',
-'TCTM': 'Real Estate',
-'TCX': 'Technology',
-'TD': 'Finance',
-'TDC': 'Technology',
-'TDF': 'Finance',
-'TDG': 'Industrials',
-'TDOC': 'Health Care',
-'TDS': 'Telecommunications',
-'TDS^U': 'nan',
-'TDS^V': 'nan',
-'TDTH': 'Consumer Discretionary',
-'TDUP': 'Consumer Discretionary',
-'TDW': 'Consumer Discretionary',
-'TDY': 'Industrials',
-'TEAF': 'Finance',
-'TEAM': 'Technology',
-'TECH': 'Health Care',
-'TECK': 'Industrials',
-'TECTP': 'Finance',
-'TECX': 'Health Care',
-'TEF': 'Telecommunications',
-'TEI': 'Finance',
-'TEL': 'Technology',
-'TELA': 'Health Care',
-'TELO': 'Health Care',
-'TELZ': 'Energy',
-'TEM': 'Technology',
-'TEN': 'Consumer Discretionary',
-'TEN^E': 'nan',
-'TEN^F': 'nan',
-'TENB': 'Technology',
-'TENX': 'Health Care',
-'TEO': 'Telecommunications',
-'TER': 'Industrials',
-'TERN': 'Health Care',
-'TETE': 'Finance',
-'TETEU': 'Finance',
-'TETEW': 'Finance',
-'TEVA': 'Health Care',
-'TEX': 'Industrials',
-'TFC': 'Finance',
-'TFC^I': 'nan',
-'TFC^O': 'nan',
-'TFC^R': 'nan',
-'TFFP': 'Health Care',
-'TFII': 'Industrials',
-'TFIN': 'Finance',
-'TFINP': 'Finance',
-'TFPM': 'Industrials',
-'TFSL': 'Finance',
-'TFX': 'Health Care',
-'TG': 'Industrials',
-'TGAA': 'Finance',
-'TGAAU': 'Finance',
-'TGAAW': 'Finance',
-'TGB': 'Basic Materials',
-'TGI': 'Industrials',
-'TGL': 'Consumer Discretionary',
-'TGLS': 'Consumer Discretionary',
-'TGNA': 'Industrials',
-'TGS': 'Utilities',
-'TGT': 'Consumer Discretionary',
-'TGTX': 'Health Care',
-'TH': 'Consumer Discretionary',
-'THAR': 'Health Care',
-'THC': 'Health Care',
-'THCH': 'Consumer Discretionary',
-'THCP': 'Industrials',
-'THCPU': 'Industrials',
-'THFF': 'Finance',
-'THG': 'Finance',
-'THM': 'Basic Materials',
-'THO': 'Industrials',
-'THQ': 'Finance',
-'THR': 'Energy',
-'THRD': 'Health Care',
-'THRM': 'Consumer Discretionary',
-'THRY': 'Consumer Discretionary',
-'THS': 'Consumer Staples',
-'THTX': 'Health Care',
-'THW': 'Finance',
-'TIGO': 'Telecommunications',
-'TIGR': 'Finance',
-'TIL': 'Health Care',
-'TILE': 'Consumer Discretionary',
-'TIMB': 'Telecommunications',
-'TIPT': 'Finance',
-'TIRX': 'Finance',
-'TISI': 'Consumer Discretionary',
-'TITN': 'Consumer Discretionary',
-'TIVC': 'Health Care',
-'TIXT': 'Technology',
-'TJX': 'Consumer Discretionary',
-'TK': 'Consumer Discretionary',
-'TKC': 'Telecommunications',
-'TKLF': 'Consumer Discretionary',
-'TKNO': 'Health Care',
-'TKO': 'Consumer Discretionary',
-'TKR': 'Industrials',
-'TLF': 'Consumer Discretionary',
-'TLGY': 'Finance',
-'TLGYU': 'Finance',
-'TLGYW': 'Finance',
-'TLK': 'Telecommunications',
-'TLN': 'Utilities',
-'TLPH': 'Health Care',
-'TLRY': 'Health Care',
-'TLS': 'Technology',
-'TLSA': 'Health Care',
-'TLSI': 'Health Care',
-'TLSIW': 'Health Care',
-'TLYS': 'Consumer Discretionary',
-'TM': 'Consumer Discretionary',
-'TMC': 'Basic Materials',
-'TMCI': 'Health Care',
-'TMCWW': 'Basic Materials',
-'TMDX': 'Health Care',
-'TME': 'Consumer Discretionary',
-'TMHC': 'Consumer Discretionary',
-'TMO': 'Industrials',
-'TMP': 'Finance',
-'TMQ': 'Basic Materials',
-'TMTC': 'Finance',
-'TMTCR': 'Finance',
-'TMTCU': 'Finance',
-'TMUS': 'Telecommunications',
-'TNC': 'Industrials',
-'TNDM': 'Health Care',
-'TNET': 'Consumer Discretionary',
-'TNFA': 'Health Care',
-'TNGX': 'Health Care',
-'TNK': 'Consumer Discretionary',
-'TNL': 'Consumer Discretionary',
-'TNON': 'Health Care',
-'TNONW': 'Health Care',
-'TNXP': 'Health Care',
-'TNYA': 'Health Care',
-'TOI': 'Health Care',
-'TOIIW': 'Health Care',
-'TOL': 'Consumer Discretionary',
-'TOMZ': 'Industrials',
-'TOON': 'Consumer Discretionary',
-'TOP': 'Finance',
-'TOPS': 'Consumer Discretionary',
-'TORO': 'Consumer Discretionary',
-'TOST': 'Technology',
-'TOUR': 'Consumer Discretionary',
-'TOVX': 'Health Care',
-'TOWN': 'Finance',
-'TOYO': 'Consumer Discretionary',
-'TPB': 'Consumer Discretionary',
-'TPC': 'Consumer Discretionary',
-'TPCS': 'Industrials',
-'TPET': 'Energy',
-'TPG': 'Finance',
-'TPGXL': 'nan',
-'TPH': 'Consumer Discretionary',
-'TPIC': 'Industrials',
-'TPL': 'Energy',
-'TPR': 'Consumer Discretionary',
-'TPST': 'Health Care',
-'TPTA': 'Real Estate',
-'TPVG': 'Consumer Discretionary',
-'TPX': 'Consumer Discretionary',
-'TPZ': 'Finance',
-'TR': 'Consumer Staples',
-'TRAK': 'Technology',
-'TRAW': 'Health Care',
-'TRC': 'Finance',
-'TRDA': 'Health Care',
-'TREE': 'Finance',
-'TREX': 'Basic Materials',
-'TRGP': 'Utilities',
-'TRI': 'Consumer Discretionary',
-'TRIB': 'Health Care',
-'TRIN': 'Finance',
-'TRINI': 'Finance',
-'TRINL': 'Finance',
-'TRINZ': 'Finance',
-'TRIP': 'Technology',
-'TRMB': 'Industrials',
-'TRMD': 'Consumer Discretionary',
-'TRMK': 'Finance',
-'TRML': 'Health Care',
-'TRN': 'Industrials',
-'TRNO': 'Finance',
-'TRNR': 'Technology',
-'TRNS': 'Industrials',
-'TROO': 'Technology',
-'TROW': 'Finance',
-'TROX': 'Industrials',
-'TRP': 'Utilities',
-'TRS': 'Industrials',
-'TRSG': 'Industrials',
-'TRST': 'Finance',
-'TRT': 'Technology',
-'TRTN^A': 'nan',
-'TRTN^B': 'nan',
-'TRTN^C': 'nan',
-'TRTN^D': 'nan',
-'TRTN^E': 'nan',
-'TRTX': 'Real Estate',
-'TRTX^C': 'nan',
-'TRU': 'Finance',
-'TRUE': 'Technology',
-'TRUG': 'Consumer Discretionary',
-'TRUP': 'Health Care',
-'TRV': 'Finance',
-'TRVG': 'Technology',
-'TRVI': 'Health Care',
-'TRX': 'Basic Materials',
-'TS': 'Industrials',
-'TSAT': 'Industrials',
-'TSBK': 'Finance',
-'TSBX': 'Health Care',
-'TSCO': 'Consumer Discretionary',
-'TSE': 'Industrials',
-'TSEM': 'Technology',
-'TSHA': 'Health Care',
-'TSI': 'Finance',
-'TSLA': 'Consumer Discretionary',
-'TSLX': 'Finance',
-'TSM': 'Technology',
-'TSN': 'Consumer Staples',
-'TSQ': 'Consumer Discretionary',
-'TSVT': 'Health Care',
-'TT': 'Industrials',
-'TTC': 'Consumer Discretionary',
-'TTD': 'Technology',
-'TTE': 'Energy',
-'TTEC': 'Consumer Discretionary',
-'TTEK': 'Consumer Discretionary',
-'TTGT': 'Telecommunications',
-'TTI': 'Energy',
-'TTMI': 'Technology',
-'TTNP': 'Health Care',
-'TTOO': 'Health Care',
-'TTP': 'Finance',
-'TTSH': 'Consumer Discretionary',
-'TTWO': 'Technology',
-'TU': 'Telecommunications',
-'TURB': 'Miscellaneous',
-'TURN': 'Finance',
-'TUSK': 'Energy',
-'TUYA': 'Technology',
-'TV': 'Industrials',
-'TVC': 'Utilities',
-'TVE': 'Utilities',
-'TVGN': 'Health Care',
-'TVGNW': 'Health Care',
-'TVTX': 'Health Care',
-'TW': 'Finance',
-'TWFG': 'Finance',
-'TWG': 'Consumer Staples',
-'TWI': 'Industrials',
-'TWIN': 'Industrials',
-'TWKS': 'Technology',
-'TWLO': 'Technology',
-'TWN': 'Finance',
-'TWO': 'Real Estate',
-'TWO^A': 'nan',
-'TWO^B': 'nan',
-'TWO^C': 'nan',
-'TWST': 'Health Care',
-'TX': 'Industrials',
-'TXG': 'Industrials',
-'TXMD': 'Health Care',
-'TXN': 'Technology',
-'TXNM': 'Utilities',
-'TXO': 'Energy',
-'TXRH': 'Consumer Discretionary',
-'TXT': 'Industrials',
-'TY': 'Finance',
-'TY^': 'nan',
-'TYG': 'Finance',
-'TYGO': 'Technology',
-'TYL': 'Technology',
-'TYRA': 'Health Care',
-'TZOO': 'Consumer Discretionary',
-'U': 'Technology',
-'UA': 'Consumer Discretionary',
-'UAA': 'Consumer Discretionary',
-'UAL': 'Consumer Discretionary',
-'UAMY': 'Industrials',
-'UAN': 'Industrials',
-'UAVS': 'Industrials',
-'UBCP': 'Finance',
-'UBER': 'Consumer Discretionary',
-'UBFO': 'Finance',
-'UBS': 'Finance',
-'UBSI': 'Finance',
-'UBX': 'Health Care',
-'UBXG': 'Technology',
-'UCAR': 'Consumer Discretionary',
-'UCB': 'Finance',
-'UCB^I': 'nan',
-'UCL': 'Consumer Discretionary',
-'UCTT': 'Technology',
-'UDMY': 'Real Estate',
-'UDR': 'Real Estate',
-'UE': 'Finance',
-'UEC': 'Basic Materials',
-'UEIC': 'Consumer Staples',
-'UFCS': 'Finance',
-'UFI': 'Consumer Discretionary',
-'UFPI': 'Basic Materials',
-'UFPT': 'Health Care',
-'UG': 'Consumer Discretionary',
-'UGI': 'Utilities',
-'UGP': 'Utilities',
-'UGRO': 'Consumer Discretionary',
-'UHAL': 'Consumer Discretionary',
-'UHG': 'Consumer Discretionary',
-'UHGWW': 'Consumer Discretionary',
-'UHS': 'Health Care',
-'UHT': 'Real Estate',
-'UI': 'Technology',
-'UIS': 'Technology',
-'UK': 'Consumer Discretionary',
-'UKOMW': 'Consumer Discretionary',
-'UL': 'Consumer Discretionary',
-'ULBI': 'Miscellaneous',
-'ULCC': 'Consumer Discretionary',
-'ULH': 'Industrials',
-'ULS': 'Health Care',
-'ULTA': 'Consumer Discretionary',
-'ULY': 'Technology',
-'UMAC': 'Technology',
-'UMBF': 'Finance',
-'UMC': 'Technology',
-'UMH': 'Real Estate',
-'UMH^D': 'nan',
-'UNB': 'Finance',
-'UNCY': 'Health Care',
-'UNF': 'Consumer Discretionary',
-'UNFI': 'Consumer Discretionary',
-'UNH': 'Health Care',
-'UNIT': 'Real Estate',
-'UNM': 'Finance',
-'UNMA': 'Finance',
-'UNP': 'Industrials',
-'UNTY': 'Finance',
-'UONE': 'Consumer Discretionary',
-'UONEK': 'Consumer Discretionary',
-'UP': 'Consumer Discretionary',
-'UPB': 'Health Care',
-'UPBD': 'Consumer Discretionary',
-'UPC': 'Health Care',
-'UPLD': 'Technology',
-'UPS': 'Industrials',
-'UPST': 'Finance',
-'UPWK': 'Technology',
-'UPXI': 'Health Care',
-'URBN': 'Consumer Discretionary',
-'URG': 'Basic Materials',
-'URGN': 'Health Care',
-'URI': 'Consumer Discretionary',
-'UROY': 'Finance',
-'USA': 'Finance',
-'USAC': 'Utilities',
-'USAP': 'Industrials',
-'USAS': 'Basic Materials',
-'USAU': 'Basic Materials',
-'USB': 'Finance',
-'USB^A': 'nan',
-'USB^H': 'nan',
-'USB^P': 'nan',
-'USB^Q': 'nan',
-'USB^R': 'nan',
-'USB^S': 'nan',
-'USCB': 'Finance',
-'USEA': 'Consumer Discretionary',
-'USEG': 'Energy',
-'USFD': 'Consumer Discretionary',
-'USGO': 'Basic Materials',
-'USGOW': 'Basic Materials',
-'USIO': 'Finance',
-'USLM': 'Industrials',
-'USM': 'Telecommunications',
-'USNA': 'Health Care',
-'USPH': 'Health Care',
-'UTF': 'Finance',
-'UTG': 'Finance',
-'UTHR': 'Health Care',
-'UTI': 'Real Estate',
-'UTL': 'Utilities',
-'UTMD': 'Health Care',
-'UTSI': 'Telecommunications',
-'UTZ': 'Consumer Staples',
-'UUU': 'Technology',
-'UUUU': 'Industrials',
-'UVE': 'Finance',
-'UVSP': 'Finance',
-'UVV': 'Industrials',
-'UWMC': 'Finance',
-'UXIN': 'Consumer Discretionary',
-'UZD': 'Telecommunications',
-'UZE': 'Telecommunications',
-'UZF': 'Telecommunications',
-'V': 'Consumer Discretionary',
-'VABK': 'Finance',
-'VAC': 'Finance',
-'VACH': 'nan',
-'VACHU': 'nan',
-'VAL': 'Energy',
-'VALE': 'Basic Materials',
-'VALN': 'Health Care',
-'VALU': 'Finance',
-'VANI': 'Health Care',
-'VATE': 'Industrials',
-'VBF': 'Finance',
-'VBFC': 'Finance',
-'VBNK': 'Finance',
-'VBTX': 'Finance',
-'VC': 'Consumer Discretionary',
-'VCEL': 'Health Care',
-'VCICU': 'nan',
-'VCIG': 'Consumer Discretionary',
-'VCNX': 'Health Care',
-'VCSA': 'Finance',
-'VCTR': 'Finance',
-'VCV': 'Finance',
-'VCYT': 'Health Care',
-'VECO': 'Technology',
-'VEEA': 'Finance',
-'VEEAW': 'Finance',
-'VEEE': 'Industrials',
-'VEEV': 'Technology',
-'VEL': 'Finance',
-'VEON': 'Telecommunications',
-'VERA': 'Health Care',
-'VERB': 'Consumer Discretionary',
-'VERI': 'Technology',
-'VERO': 'Health Care',
-'VERU': 'Health Care',
-'VERV': 'Health Care',
-'VERX': 'Technology',
-'VET': 'Energy',
-'VEV': 'Consumer Discretionary',
-'VFC': 'Consumer Discretionary',
-'VFF': 'nan',
-'VFL': 'Finance',
-'VFS': 'Finance',
-'VFSWW': 'nan',
-'VGAS': 'Industrials',
-'VGASW': 'Industrials',
-'VGI': 'Finance',
-'VGM': 'Finance',
-'VGZ': 'Basic Materials',
-'VHC': 'Miscellaneous',
-'VHI': 'Industrials',
-'VIASP': 'Utilities',
-'VIAV': 'Technology',
-'VICI': 'Real Estate',
-'VICR': 'Technology',
-'VIGL': 'Health Care',
-'VIK': 'Consumer Discretionary',
-'VINC': 'Health Care',
-'VINE': 'Consumer Staples',
-'VINO': 'Real Estate',
-'VINP': 'Finance',
-'VIOT': 'Consumer Discretionary',
-'VIPS': 'Consumer Discretionary',
-'VIR': 'Health Care',
-'VIRC': 'Consumer Discretionary',
-'VIRT': 'Finance',
-'VIRX': 'Health Care',
-'VISL': 'Telecommunications',
-'VIST': 'Energy',
-'VITL': 'Consumer Staples',
-'VIV': 'Telecommunications',
-'VIVK': 'Utilities',
-'VKI': 'Finance',
-'VKQ': 'Finance',
-'VKTX': 'Health Care',
-'VLCN': 'Consumer Discretionary',
-'VLGEA': 'Consumer Staples',
-'VLN': 'Technology',
-'VLO': 'Energy',
-'VLRS': 'Consumer Discretionary',
-'VLT': 'Finance',
-'VLTO': 'Industrials',
-'VLY': 'Finance',
-'VLYPN': 'nan',
-'VLYPO': 'Finance',
-'VLYPP': 'Finance',
-'VMAR': 'Industrials',
-'VMC': 'Industrials',
-'VMCA': 'Finance',
-'VMCAW': 'Finance',
-'VMD': 'Health Care',
-'VMEO': 'Technology',
-'VMI': 'Industrials',
-'VMO': 'Finance',
-'VNCE': 'Consumer Discretionary',
-'VNDA': 'Health Care',
-'VNET': 'Technology',
-'VNO': 'Real Estate',
-'VNO^L': 'nan',
-'VNO^M': 'nan',
-'VNO^N': 'nan',
-'VNO^O': 'nan',
-'VNOM': 'Energy',
-'VNRX': 'Health Care',
-'VNT': 'Industrials',
-'VOC': 'Energy',
-'VOD': 'Telecommunications',
-'VOR': 'Health Care',
-'VOXR': 'Basic Materials',
-'VOXX': 'Technology',
-'VOYA': 'Finance',
-'VOYA^B': 'nan',
-'VPG': 'Technology',
-'VPV': 'Finance',
-'VRA': 'Consumer Discretionary',
-'VRAR': 'Technology',
-'VRAX': 'Health Care',
-'VRCA': 'Health Care',
-'VRDN': 'Health Care',
-'VRE': 'Real Estate',
-'VREX': 'Technology',
-'VRM': 'Consumer Discretionary',
-'VRME': 'Technology',
-'VRN': 'Energy',
-'VRNA': 'Health Care',
-'VRNS': 'Technology',
-'VRNT': 'Technology',
-'VRPX': 'Health Care',
-'VRRM': 'Consumer Discretionary',
-'VRSK': 'Technology',
-'VRSN': 'Technology',
-'VRT': 'Technology',
-'VRTS': 'Finance',
-'VRTX': 'Health Care',
-'VS': 'Technology',
-'VSAC': 'Finance',
-'VSACU': 'Finance',
-'VSACW': 'Finance',
-'VSAT': 'Technology',
-'VSCO': 'Consumer Discretionary',
-'VSEC': 'Consumer Discretionary',
-'VSEE': 'Health Care',
-'VSEEW': 'Health Care',
-'VSH': 'Technology',
-'VSME': 'Consumer Discretionary',
-'VSSYW': 'Technology',
-'VST': 'Utilities',
-'VSTA': 'Real Estate',
-'VSTE': 'Industrials',
-'VSTEW': 'Industrials',
-'VSTM': 'Health Care',
-'VSTO': 'Industrials',
-'VSTS': 'nan',
-'VTAK': 'Health Care',
-'VTEX': 'Technology',
-'VTGN': 'Health Care',
-'VTLE': 'Energy',
-'VTMX': 'Finance',
-'VTN': 'Finance',
-'VTOL': 'Consumer Discretionary',
-'VTR': 'Real Estate',
-'VTRS': 'Health Care',
-'VTS': 'Energy',
-'VTSI': 'Consumer Discretionary',
-'VTVT': 'Health Care',
-'VTYX': 'Health Care',
-'VUZI': 'Technology',
-'VVI': 'Consumer Discretionary',
-'VVOS': 'Health Care',
-'VVPR': 'Utilities',
-'VVR': 'Finance',
-'VVV': 'Industrials',
-'VVX': 'Consumer Discretionary',
-'VXRT': 'Health Care',
-'VYGR': 'Health Care',
-'VYNE': 'Health Care',
-'VYX': 'Miscellaneous',
-'VZ': 'Telecommunications',
-'VZIO': 'Consumer Staples',
-'VZLA': 'Basic Materials',
-'W': 'Consumer Discretionary',
-'WAB': 'Industrials',
-'WABC': 'Finance',
-'WAFD': 'Finance',
-'WAFDP': 'Finance',
-'WAFU': 'Real Estate',
-'WAI': 'Consumer Discretionary',
-'WAL': 'Finance',
-'WAL^A': 'nan',
-'WALD': 'Consumer Discretionary',
-'WALDW': 'Consumer Discretionary',
-'WASH': 'Finance',
-'WAT': 'Industrials',
-'WATT': 'Technology',
-'WAVE': 'Utilities',
-'WAVS': 'Technology',
-'WAVSW': 'Technology',
-'WAY': 'Technology',
-'WB': 'Technology',
-'WBA': 'Consumer Staples',
-'WBD': 'Telecommunications',
-'WBS': 'Finance',
-'WBS^F': 'nan',
-'WBS^G': 'nan',
-'WBTN': 'Consumer Discretionary',
-'WBUY': 'Consumer Discretionary',
-'WBX': 'Consumer Discretionary',
-'WCC': 'Consumer Discretionary',
-'WCC^A': 'nan',
-'WCN': 'Utilities',
-'WCT': 'Technology',
-'WD': 'Finance',
-'WDAY': 'Technology',
-'WDC': 'Technology',
-'WDFC': 'Industrials',
-'WDH': 'Finance',
-'WDI': 'Finance',
-'WDS': 'Energy',
-'WEA': 'Finance',
-'WEAV': 'Technology',
-'WEC': 'Utilities',
-'WEL': 'Finance',
-'WELL': 'Real Estate',
-'WEN': 'Consumer Discretionary',
-'WERN': 'Industrials',
-'WES': 'Utilities',
-'WEST': 'Consumer Staples',
-'WETH': 'Technology',
-'WEX': 'Consumer Discretionary',
-'WEYS': 'Consumer Staples',
-'WF': 'Finance',
-'WFC': 'Finance',
-'WFC^A': 'nan',
-'WFC^C': 'nan',
-'WFC^D': 'nan',
-'WFC^L': 'nan',
-'WFC^Y': 'nan',
-'WFC^Z': 'nan',
-'WFCF': 'Technology',
-'WFG': 'Basic Materials',
-'WFRD': 'Industrials',
-'WGO': 'Industrials',
-'WGS': 'Technology',
-'WGSWW': 'Technology',
-'WH': 'Consumer Discretionary',
-'WHD': 'Industrials',
-'WHF': 'Finance',
-'WHFCL': 'nan',
-'WHG': 'Finance',
-'WHLM': 'Consumer Discretionary',
-'WHLR': 'Real Estate',
-'WHLRD': 'Real Estate',
-'WHLRP': 'Real Estate',
-'WHR': 'Consumer Discretionary',
-'WIA': 'Finance',
-'WILC': 'Consumer Discretionary',
-'WIMI': 'Technology',
-'WINA': 'Consumer Discretionary',
-'WING': 'Consumer Discretionary',
-'WINT': 'Health Care',
-'WINV': 'Finance',
-'WINVR': 'Finance',
-'WISA': 'Technology',
-'WIT': 'Technology',
-'WIW': 'Finance',
-'WIX': 'Technology',
-'WK': 'Technology',
-'WKC': 'Energy',
-'WKEY': 'Technology',
-'WKHS': 'Consumer Discretionary',
-'WKSP': 'Consumer Discretionary',
-'WLDN': 'Consumer Discretionary',
-'WLDS': 'Telecommunications',
-'WLDSW': 'Telecommunications',
-'WLFC': 'Consumer Discretionary',
-'WLGS': 'Consumer Discretionary',
-'WLK': 'Industrials',
-'WLKP': 'Industrials',
-'WLY': 'Consumer Discretionary',
-'WLYB': 'Consumer Discretionary',
-'WM': 'Utilities',
-'WMB': 'Utilities',
-'WMG': 'Consumer Discretionary',
-'WMK': 'Consumer Staples',
-'WMPN': 'Finance',
-'WMS': 'Consumer Discretionary',
-'WMT': 'Consumer Discretionary',
-'WNC': 'Industrials',
-'WNEB': 'Finance',
-'WNS': 'Consumer Discretionary',
-'WNW': 'Consumer Discretionary',
-'WOK': 'Health Care',
-'WOLF': 'Technology',
-'WOOF': 'Consumer Discretionary',
-'WOR': 'Industrials',
-'WORX': 'Consumer Discretionary',
-'WOW': 'Telecommunications',
-'WPC': 'Real Estate',
-'WPM': 'Basic Materials',
-'WPP': 'Consumer Discretionary',
-'WPRT': 'Industrials',
-'WRAP': 'Industrials',
-'WRB': 'Finance',
-'WRB^E': 'nan',
-'WRB^F': 'nan',
-'WRB^G': 'nan',
-'WRB^H': 'nan',
-'WRBY': 'Health Care',
-'WRLD': 'Finance',
-'WRN': 'Basic Materials',
-'WS': 'Industrials',
-'WSBC': 'Finance',
-'WSBCP': 'Finance',
-'WSBF': 'Finance',
-'WSC': 'Industrials',
-'WSFS': 'Finance',
-'WSM': 'Consumer Discretionary',
-'WSO': 'Consumer Discretionary',
-'WSO/B': 'nan',
-'WSR': 'Real Estate',
-'WST': 'Health Care',
-'WT': 'Finance',
-'WTBA': 'Finance',
-'WTFC': 'Finance',
-'WTFCM': 'Finance',
-'WTFCP': 'Finance',
-'WTI': 'Energy',
-'WTM': 'Finance',
-'WTMA': 'Miscellaneous',
-'WTO': 'Technology',
-'WTRG': 'Utilities',
-'WTS': 'Industrials',
-'WTTR': 'Energy',
-'WTW': 'Finance',
-'WU': 'Consumer Discretionary',
-'WULF': 'Technology',
-'WVE': 'Health Care',
-'WVVI': 'Consumer Staples',
-'WVVIP': 'Consumer Staples',
-'WW': 'Consumer Discretionary',
-'WWD': 'Energy',
-'WWR': 'Basic Materials',
-'WWW': 'Consumer Discretionary',
-'WY': 'Real Estate',
-'WYNN': 'Consumer Discretionary',
-'WYY': 'Technology',
-'X': 'Industrials',
-'XAIR': 'Health Care',
-'XBIO': 'Health Care',
-'XBIT': 'Health Care',
-'XBP': 'Consumer Discretionary',
-'XBPEW': 'Consumer Discretionary',
-'XCH': 'nan',
-'XCUR': 'Health Care',
-'XEL': 'Utilities',
-'XELA': 'Consumer Discretionary',
-'XELAP': 'Consumer Discretionary',
-'XELB': 'Miscellaneous',
-'XENE': 'Health Care',
-'XERS': 'Health Care',
-'XFLT': 'Finance',
-'XFLT^A': 'nan',
-'XFOR': 'Health Care',
-'XGN': 'Health Care',
-'XHG': 'Finance',
-'XHR': 'Consumer Discretionary',
-'XIN': 'Consumer Discretionary',
-'XLO': 'Health Care',
-'XMTR': 'Consumer Discretionary',
-'XNCR': 'Health Care',
-'XNET': 'Technology',
-'XOM': 'Energy',
-'XOMA': 'Health Care',
-'XOMAO': 'Health Care',
-'XOMAP': 'Health Care',
-'XOS': 'Consumer Discretionary',
-'XOSWW': 'Consumer Discretionary',
-'XP': 'Finance',
-'XPEL': 'Industrials',
-'XPER': 'Technology',
-'XPEV': 'Consumer Discretionary',
-'XPL': 'Basic Materials',
-'XPO': 'Consumer Discretionary',
-'XPOF': 'Consumer Discretionary',
-'XPON': 'Miscellaneous',
-'XPRO': 'Energy',
-'XRAY': 'Health Care',
-'XRTX': 'Health Care',
-'XRX': 'Technology',
-'XTIA': 'Technology',
-'XTKG': 'Technology',
-'XTLB': 'Health Care',
-'XTNT': 'Health Care',
-'XWEL': 'Consumer Discretionary',
-'XXII': 'Health Care',
-'XYF': 'Finance',
-'XYL': 'Industrials',
-'XYLO': 'Health Care',
-'YALA': 'Technology',
-'YCBD': 'Consumer Discretionary',
-'YCBD^A': 'nan',
-'YELP': 'Consumer Discretionary',
-'YETI': 'Consumer Discretionary',
-'YEXT': 'Technology',
-'YGMZ': 'Consumer Discretionary',
-'YHGJ': 'Industrials',
-'YHNAU': 'nan',
-'YI': 'Consumer Staples',
-'YIBO': 'Industrials',
-'YJ': 'Consumer Discretionary',
-'YMAB': 'Health Care',
-'YMM': 'Technology',
-'YORW': 'Utilities',
-'YOSH': 'Consumer Discretionary',
-'YOTA': 'Consumer Staples',
-'YOTAR': 'Consumer Staples',
-'YOTAW': 'Consumer Staples',
-'YOU': 'Technology',
-'YPF': 'Energy',
-'YQ': 'Real Estate',
-'YRD': 'Finance',
-'YSG': 'Consumer Discretionary',
-'YTRA': 'Consumer Discretionary',
-'YUM': 'Consumer Discretionary',
-'YUMC': 'Consumer Discretionary',
-'YXT': 'Technology',
-'YY': 'Technology',
-'YYAI': 'Consumer Discretionary',
-'YYGH': 'Consumer Discretionary',
-'Z': 'Consumer Discretionary',
-'ZAPP': 'Consumer Discretionary',
-'ZAPPW': 'Consumer Discretionary',
-'ZBAO': 'Finance',
-'ZBH': 'Health Care',
-'ZBIO': 'Health Care',
-'ZBRA': 'Industrials',
-'ZCAR': 'Consumer Discretionary',
-'ZCARW': 'Consumer Discretionary',
-'ZCMD': 'Real Estate',
-'ZD': 'Telecommunications',
-'ZDGE': 'Technology',
-'ZENA': 'Technology',
-'ZENV': 'Technology',
-'ZEO': 'Miscellaneous',
-'ZEPP': 'Technology',
-'ZETA': 'Technology',
-'ZEUS': 'Industrials',
-'ZG': 'Consumer Discretionary',
-'ZGN': 'Consumer Discretionary',
-'ZH': 'Consumer Discretionary',
-'ZI': 'Technology',
-'ZIM': 'Consumer Discretionary',
-'ZIMV': 'Health Care',
-'ZION': 'Finance',
-'ZIONL': 'Finance',
-'ZIONO': 'Finance',
-'ZIONP': 'Finance',
-'ZIP': 'Technology',
-'ZJK': 'Industrials',
-'ZJYL': 'Health Care',
-'ZK': 'Consumer Discretionary',
-'ZKH': 'Consumer Discretionary',
-'ZKIN': 'Industrials',
-'ZLAB': 'Health Care',
-'ZM': 'Technology',
-'ZNTL': 'Health Care',
-'ZOM': 'Health Care',
-'ZONE': 'Industrials',
-'ZOOZ': 'Technology',
-'ZOOZW': 'Technology',
-'ZPTA': 'Finance',
-'ZPTAW': 'Finance',
-'ZS': 'Technology',
-'ZTEK': 'Industrials',
-'ZTO': 'Industrials',
-'ZTR': 'Finance',
-'ZTS': 'Health Care',
-'ZUMZ': 'Consumer Discretionary',
-'ZUO': 'Technology',
-'ZURA': 'Health Care',
-'ZVIA': 'Consumer Staples',
-'ZVRA': 'Health Care',
-'ZVSA': 'Health Care',
-'ZWS': 'Industrials',
-'ZYME': 'Health Care',
-'ZYXI': 'Health Care',
-         }
+class SectorLookupView(APIView):
+    def get(self, request):
+        """Sectors of many symbols, `?symbols=AAPL,MSFT` (unknown symbols map to null)."""
+        symbols = [symbol.strip().upper() for symbol in request.query_params.get('symbols', '').split(',') if symbol.strip()]
+        return self._lookup(symbols)
+
+    def post(self, request):
+        """Same as GET with a JSON body `{"symbols": [...]}` for long lists."""
+        symbols = request.data.get('symbols')
+        if not isinstance(symbols, list):
+            return Response({"error": "'symbols' must be a list."}, status=status.HTTP_400_BAD_REQUEST)
+        return self._lookup([str(symbol).strip().upper() for symbol in symbols if str(symbol).strip()])
+
+    def _lookup(self, symbols):
+        if not symbols:
+            return Response({"error": "No symbols given."}, status=status.HTTP_400_BAD_REQUEST)
+        if len(symbols) > settings.SECTOR_LOOKUP_MAX_SYMBOLS:
+            return Response(
+                {"error": f"At most {settings.SECTOR_LOOKUP_MAX_SYMBOLS} symbols per request."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return Response({"sectors": sectors.get_index().lookup_many(symbols)}, status=status.HTTP_200_OK)
+
+
+class SectorExposureView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        """The signed-in user's portfolio weights aggregated by sector."""
+        holdings = list(Portfolio.objects.filter(user=request.user).values_list('ticker_name', 'investment_amount'))
+        if not holdings:
+            return Response({"total": 0, "sectors": []}, status=status.HTTP_200_OK)
+
+        symbols = [ticker.strip().upper() for ticker, _ in holdings]
+        amounts = [amount for _, amount in holdings]
+        rows = sectors.get_index().exposure(symbols, amounts)
+        response_data = {
+            "total": sum(amounts),
+            "sectors": [
+                {"sector": name, "amount": amount, "weight": weight}
+                for name, amount, weight in rows
+            ],
+        }
+        return Response(response_data, status=status.HTTP_200_OK)
+
+
 def get_sector(request, symbol):
     # Retrieve the sector based on the company symbol
-    sector = dict.get(symbol)
-    
+    sector = sectors.lookup(symbol.upper())
+
     # If the symbol is not found, return a 404 response
     if not sector:
         return JsonResponse({'error': 'Company symbol not found'}, status=404)
-    
+
     # Return just the sector as a JSON response
     return JsonResponse(sector, safe=False)
-
-        
\ No newline at end of file
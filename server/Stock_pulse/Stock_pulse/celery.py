@@ -18,6 +18,12 @@ from celery.schedules import crontab
 app = Celery('Stock_pulse', broker='redis://localhost:6379/0', backend='redis://localhost:6379/0')
 app.conf.timezone = 'UTC'
 
+# Long backtests get their own queue so they never starve the scheduled tasks:
+#   celery -A Stock_pulse worker -Q backtests
+app.conf.task_routes = {
+    'InvestmentSection.tasks.run_backtest_job': {'queue': 'backtests'},
+}
+
 # Load task modules from all registered apps (if using Django or similar framework)
 app.autodiscover_tasks()
 
@@ -26,8 +32,26 @@ app.conf.beat_schedule = {
     
     # Task to run every morning at 9 AM
     'refresh-task-every-morning': {
-        'task': 'tasks.download_nasdaq_data',  # Ensure this matches the exact path to your task
+        'task': 'Stock_pulse.tasks.download_nasdaq_data',
         'schedule': crontab(hour=9, minute=0),  # Runs daily at 9:00 AM
     },
+
+    # Pre-warm the local price store for every screener symbol after the download
+    'prewarm-price-store-nightly': {
+        'task': 'Stock_pulse.tasks.prewarm_price_store',
+        'schedule': crontab(hour=9, minute=30),
+    },
+
+    # Extend the stored backtests of saved portfolios by the newly closed day
+    'refresh-saved-backtests-nightly': {
+        'task': 'InvestmentSection.tasks.refresh_saved_backtests',
+        'schedule': crontab(hour=10, minute=30),
+    },
+
+    # Drop backtest job results nobody fetched in time
+    'purge-backtest-jobs-hourly': {
+        'task': 'InvestmentSection.tasks.purge_backtest_jobs',
+        'schedule': crontab(minute=15),
+    },
 }
 
@@ -189,4 +189,51 @@ CORS_ALLOWED_ORIGINS = [
 ]
 
 CELERY_BROKER_URL = 'redis://localhost:6379/0'
-CELERY_RESULT_BACKEND = 'redis://localhost:6379/0'
\ No newline at end of file
+CELERY_RESULT_BACKEND = 'redis://localhost:6379/0'
+
+# Local market data store (see InvestmentSection/price_store.py)
+PRICE_STORE_DIR = BASE_DIR / 'data' / 'prices'
+PRICE_HISTORY_START = '2015-01-01'
+
+# Market-data fetch layer (see InvestmentSection/market_data.py)
+MARKET_DATA_CACHE_SIZE = 512  # (ticker, range) entries
+MARKET_DATA_CACHE_TTL = 300  # seconds
+MARKET_DATA_BATCH_WINDOW = 0.05  # seconds to wait for other tickers to join a download
+MARKET_DATA_WAIT_TIMEOUT = 600  # seconds a request waits for a download another request started (full histories take a while)
+
+# NASDAQ screener snapshot written by Stock_pulse.tasks.download_nasdaq_data
+SCREENER_CSV_PATH = BASE_DIR / 'Stock_pulse' / 'ticker.csv'
+SCREENER_SNAPSHOT_PATH = BASE_DIR / 'Stock_pulse' / 'ticker.npz'  # parsed columns, written next to the CSV
+SCREENER_DOWNLOAD_TIMEOUT = (10, 60)  # connect / read seconds
+SCREENER_USER_AGENT = 'Mozilla/5.0 (compatible; Stock_pulse/1.0)'
+SCREENER_RELOAD_INTERVAL = 5  # seconds between checks of the file for changes
+SCREENER_HISTORY_DIR = BASE_DIR / 'data' / 'screener'  # daily versions (see InvestmentSection/screener_history.py)
+
+# Generated symbol -> sector index, refreshed with the screener (see InvestmentSection/sectors.py)
+SECTOR_INDEX_PATH = BASE_DIR / 'data' / 'sectors.npz'
+SECTOR_INDEX_SEED_PATH = BASE_DIR / 'InvestmentSection' / 'sectors.npz'  # shipped, read-only; used until the first regeneration
+SECTOR_INDEX_RELOAD_INTERVAL = 5  # seconds between checks for a regenerated index
+SECTOR_LOOKUP_MAX_SYMBOLS = 1000
+
+# Nightly price-store pre-warm (see Stock_pulse/tasks.py)
+PREWARM_CHUNK_SIZE = 50
+PREWARM_CHECKPOINT_DIR = BASE_DIR / 'data' / 'prewarm'
+
+# Persisted, incrementally extended backtest results (see InvestmentSection/backtest_cache.py)
+BACKTEST_CACHE_DIR = BASE_DIR / 'data' / 'backtests'
+BACKTEST_CACHE_MAX_ENTRIES = 10000  # least recently used results are evicted beyond this
+
+# Async backtest jobs (see InvestmentSection/tasks.py)
+BACKTEST_JOB_DIR = BASE_DIR / 'data' / 'backtest_jobs'
+BACKTEST_JOB_PROGRESS_CHUNK = 10  # tickers fetched between progress updates
+BACKTEST_JOB_STREAM_TIMEOUT = 300  # seconds an event stream stays open
+BACKTEST_JOB_RESULT_TTL = 6 * 60 * 60  # seconds a result file is kept; shorter than the result backend's expiry
+
+# Indicators kept current by the nightly pre-warm (see InvestmentSection/indicator_state.py)
+TRACKED_INDICATORS = ['sma:10', 'ema:10', 'rsi:14', 'macd:12:26:9']
+
+# Batch indicator endpoint (see InvestmentSection/batch_indicators.py)
+INDICATOR_POOL_WORKERS = None  # defaults to the number of CPUs
+INDICATOR_CHUNK_SIZE = 10  # tickers per worker task
+INDICATOR_POOL_MIN_TICKERS = 100  # smaller batches are computed in-process, the pool round trip costs more
+INDICATOR_BATCH_MAX_TICKERS = 200
@@ -1,14 +1,226 @@
 # app_name/tasks.py
-from celery import shared_task
+import json
+import os
+import tempfile
+import time
+from datetime import date
+
+import pandas as pd
 import requests
+from celery import chord, shared_task
+from celery.utils.log import get_task_logger
+from django.conf import settings
 
-@shared_task
+logger = get_task_logger(__name__)
+
+def _read_json(path):
+    try:
+        with open(path) as handle:
+            return json.load(handle)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+@shared_task(
+    autoretry_for=(requests.RequestException,),
+    retry_backoff=True,
+    retry_kwargs={'max_retries': 3},
+)
 def download_nasdaq_data():
+    """
+    Refresh the NASDAQ screener CSV at `settings.SCREENER_CSV_PATH`.
+
+    The request is conditional (ETag / Last-Modified of the previous download),
+    the body is streamed to a temp file in the same directory and published by
+    atomic rename, so readers never see a half-written file. A parsed binary
+    snapshot is written next to it for the readers, the sector index is
+    regenerated and the day is added to the screener history.
+    """
     url = "https://www.nasdaq.com/market-activity/stocks/screener.csv"
-    response = requests.get(url)
-    if response.status_code == 200:
-        file_path = "ticker.csv"
-        with open(file_path, "wb") as file:
-            file.write(response.content)
-    else:
-        print(f"Failed to download data. Status code: {response.status_code}")
\ No newline at end of file
+    file_path = os.fspath(settings.SCREENER_CSV_PATH)
+    meta_path = f'{file_path}.meta.json'
+    meta = _read_json(meta_path) if os.path.exists(file_path) else {}
+
+    headers = {'User-Agent': settings.SCREENER_USER_AGENT}
+    if meta.get('etag'):
+        headers['If-None-Match'] = meta['etag']
+    if meta.get('last_modified'):
+        headers['If-Modified-Since'] = meta['last_modified']
+
+    with requests.get(url, headers=headers, stream=True, timeout=settings.SCREENER_DOWNLOAD_TIMEOUT) as response:
+        if response.status_code == 304:
+            logger.info("Screener unchanged since %s, skipping download", meta.get('last_modified') or meta.get('etag'))
+            return False
+        if response.status_code >= 500:
+            # Raises requests.HTTPError, so autoretry_for retries it with backoff
+            response.raise_for_status()
+        if response.status_code != 200:
+            logger.warning("Failed to download screener data. Status code: %s", response.status_code)
+            return False
+
+        directory = os.path.dirname(file_path) or '.'
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    file.write(chunk)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        meta = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+        }
+
+    # Parse once here so no reader ever has to parse the CSV
+    from InvestmentSection.screener import write_snapshot
+    from InvestmentSection.screener_history import get_history
+    from InvestmentSection.sectors import regenerate
+    table = write_snapshot(file_path, settings.SCREENER_SNAPSHOT_PATH)
+    regenerate(table)
+    # Keep today's screener as an immutable version for multi-day queries
+    get_history().record(table)
+
+    # Only now that everything derived from the CSV is published: if any step
+    # above fails, the next run must not get a 304 and skip rebuilding it
+    with open(f'{meta_path}.tmp', 'w') as handle:
+        json.dump(meta, handle)
+    os.replace(f'{meta_path}.tmp', meta_path)
+    return True
+
+
+# ---------------------------------------------------------------------------
+# Nightly pre-warm of the local price store for the whole screener universe.
+#
+# The symbol list is split into fixed, sorted chunks that run in parallel on
+# the workers. Every finished chunk drops a small JSON file into the run's
+# checkpoint directory, so re-running the pipeline after a crash skips the
+# chunks that already completed (and the price store itself skips days it
+# already holds).
+# ---------------------------------------------------------------------------
+
+def screener_symbols():
+    """Symbols listed in the NASDAQ screener, sorted and de-duplicated."""
+    from InvestmentSection.screener import get_table
+
+    symbols = pd.Series(get_table().symbol, dtype=str).str.strip()
+    # Preferred shares / units ('ABR^D', 'BRK/A') have no daily bars upstream
+    symbols = symbols[~symbols.str.contains(r'[\^/ ]', regex=True) & (symbols != '')]
+    return sorted(set(symbols))
+
+
+def _checkpoint_dir(run_id):
+    return os.path.join(settings.PREWARM_CHECKPOINT_DIR, run_id)
+
+
+def _chunk_path(run_id, index):
+    return os.path.join(_checkpoint_dir(run_id), f'chunk-{index:05d}.json')
+
+
+@shared_task
+def prewarm_price_store(run_id=None, chunk_size=None):
+    """Fan the screener universe out over `prewarm_price_chunk` tasks."""
+    run_id = run_id or date.today().isoformat()
+    chunk_size = chunk_size or settings.PREWARM_CHUNK_SIZE
+    os.makedirs(_checkpoint_dir(run_id), exist_ok=True)
+
+    # The first start records its wall time and chunk plan. A resumed run reuses
+    # the plan, so checkpoint indices keep meaning the same symbols even if the
+    # screener was reloaded in between.
+    run_path = os.path.join(_checkpoint_dir(run_id), 'run.json')
+    run = _read_json(run_path)
+    if 'chunks' not in run:
+        symbols = screener_symbols()
+        run = {
+            'started': run.get('started', time.time()),
+            'chunks': [symbols[i:i + chunk_size] for i in range(0, len(symbols), chunk_size)],
+        }
+        with open(f'{run_path}.tmp', 'w') as handle:
+            json.dump(run, handle)
+        os.replace(f'{run_path}.tmp', run_path)
+
+    chunks = run['chunks']
+    symbols = [symbol for chunk in chunks for symbol in chunk]
+    pending = [
+        prewarm_price_chunk.s(run_id, index, chunk)
+        for index, chunk in enumerate(chunks)
+        if not os.path.exists(_chunk_path(run_id, index))
+    ]
+
+    logger.info(
+        "Pre-warm %s: %d symbols, %d chunks, %d left to run",
+        run_id, len(symbols), len(chunks), len(pending),
+    )
+    if not pending:
+        return finish_prewarm([], run_id)
+
+    chord(pending)(finish_prewarm.s(run_id))
+    return {'run_id': run_id, 'chunks': len(chunks), 'pending': len(pending)}
+
+
+@shared_task
+def prewarm_price_chunk(run_id, index, symbols):
+    """Fetch the missing daily bars for one chunk of symbols and advance their indicators."""
+    from InvestmentSection.indicator_state import IndicatorStateStore
+    from InvestmentSection.price_store import get_store
+
+    started = time.monotonic()
+    bytes_written = get_store().refresh(symbols, settings.PRICE_HISTORY_START, date.today())
+
+    # Indicator states only consume the bars appended above
+    states = IndicatorStateStore()
+    for symbol in symbols:
+        states.advance(symbol, settings.TRACKED_INDICATORS)
+    stats = {
+        'index': index,
+        'symbols': len(symbols),
+        'bytes': bytes_written,
+        'seconds': time.monotonic() - started,
+    }
+
+    # Write the checkpoint atomically so a half-written file never counts as done
+    path = _chunk_path(run_id, index)
+    with open(f'{path}.tmp', 'w') as handle:
+        json.dump(stats, handle)
+    os.replace(f'{path}.tmp', path)
+    return stats
+
+
+@shared_task
+def finish_prewarm(results, run_id):
+    """Aggregate the per-chunk checkpoints of a run and report throughput."""
+    directory = _checkpoint_dir(run_id)
+    chunks = []
+    for name in sorted(os.listdir(directory)):
+        if name.startswith('chunk-') and name.endswith('.json'):
+            with open(os.path.join(directory, name)) as handle:
+                chunks.append(json.load(handle))
+
+    symbols = sum(chunk['symbols'] for chunk in chunks)
+    bytes_written = sum(chunk['bytes'] for chunk in chunks)
+    # Chunks run in parallel, so worker-seconds overstate wall time; report both
+    worker_seconds = sum(chunk['seconds'] for chunk in chunks)
+    report = {
+        'run_id': run_id,
+        'chunks': len(chunks),
+        'symbols': symbols,
+        'bytes_written': bytes_written,
+        'worker_seconds': round(worker_seconds, 3),
+        'symbols_per_worker_second': round(symbols / worker_seconds, 3) if worker_seconds else None,
+    }
+
+    with open(os.path.join(directory, 'run.json')) as handle:
+        started = json.load(handle)['started']
+    wall_seconds = time.time() - started
+    report['wall_seconds'] = round(wall_seconds, 3)
+    report['symbols_per_second'] = round(symbols / wall_seconds, 3) if wall_seconds else None
+
+    with open(os.path.join(directory, 'report.json'), 'w') as handle:
+        json.dump(report, handle)
+    logger.info("Pre-warm %s finished: %s", run_id, report)
+    return report
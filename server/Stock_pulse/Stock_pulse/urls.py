@@ -16,7 +16,12 @@ Including another URLconf
 """
 from django.contrib import admin
 from django.urls import path,include
-from InvestmentSection.views import PortfolioPerformanceView , MovingAveragesView , TopStocksView 
+from InvestmentSection.views import (
+    PortfolioPerformanceView , PortfolioBatchPerformanceView , MovingAveragesView , BatchIndicatorsView , TopStocksView ,
+    ScreenerQueryView , ScreenerChangeView , ScreenerEntrantsView , BacktestJobView ,
+    BacktestJobStatusView , BacktestJobEventsView , BacktestJobResultView , get_sector ,
+    SectorLookupView , SectorExposureView , SymbolSearchView ,
+)
 from NewsSection.views import ChatSessionView 
 from LearningSection.views import SearchToolAPIView
 
@@ -24,8 +29,21 @@ urlpatterns = [
    path('auth/', include('Auth.urls')),
     path('admin/', admin.site.urls),
     path('backtesting/' , PortfolioPerformanceView.as_view()),
+    path('backtesting/batch/' , PortfolioBatchPerformanceView.as_view()),
+    path('backtesting/jobs/' , BacktestJobView.as_view()),
+    path('backtesting/jobs/<uuid:job_id>/' , BacktestJobStatusView.as_view()),
+    path('backtesting/jobs/<uuid:job_id>/events/' , BacktestJobEventsView.as_view()),
+    path('backtesting/jobs/<uuid:job_id>/result/' , BacktestJobResultView.as_view()),
     path('Movingaverages/' , MovingAveragesView.as_view()),
+    path('Movingaverages/batch/' , BatchIndicatorsView.as_view()),
     path("top-stocks/" , TopStocksView.as_view()),
+    path("screener/" , ScreenerQueryView.as_view()),
+    path("search/" , SymbolSearchView.as_view()),
+    path("screener/history/change/" , ScreenerChangeView.as_view()),
+    path("screener/history/entrants/" , ScreenerEntrantsView.as_view()),
+    path("sector/<str:symbol>/" , get_sector),
+    path("sectors/" , SectorLookupView.as_view()),
+    path("sectors/exposure/" , SectorExposureView.as_view()),
     path('NewsSection/', include('NewsSection.urls')),
     path('Chatsession/' , ChatSessionView.as_view()),
     path("ytlinks/",SearchToolAPIView.as_view())